@@ -0,0 +1,95 @@
+# benchmarks/compression.py
+"""
+Custo de CPU x bytes economizados da compressão das respostas
+
+Payloads representativos (listagem de anúncios, frota de uma loja, planos
+com features) serializados como a API serializa (orjson), comprimidos com
+gzip (níveis 1/6/9) e Brotli (qualidades 1/4/6/11, se instalado).
+
+    python -m benchmarks.compression
+    python -m benchmarks.compression --items 1000 --number 50
+"""
+import argparse
+import timeit
+import uuid
+import zlib
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Tuple
+
+from brasiltransporta.presentation.api.compression import BrotliEncoder, GzipEncoder, brotli
+from brasiltransporta.presentation.api.responses import dumps
+
+REGIONS = ("SP", "PR", "MG", "GO", "MT", "RS")
+BRANDS = ("volvo", "scania", "mercedes-benz", "daf", "iveco", "john deere")
+
+
+def advertisements(items: int) -> List[dict]:
+    start = datetime(2026, 1, 1)
+    return [
+        dict(id=str(uuid.uuid4()), store_id=str(uuid.uuid4()), vehicle_id=str(uuid.uuid4()),
+             title=f"{BRANDS[i % 6].title()} {400 + i % 300} {2015 + i % 10} revisado",
+             description="Caminhão em ótimo estado, pneus novos, revisões na concessionária. " * (1 + i % 3),
+             price_amount=180000.0 + i * 1250.5, price_currency="BRL", status="active",
+             is_featured=i % 7 == 0, views=i * 13 % 5000, region=REGIONS[i % 6],
+             created_at=start + timedelta(hours=i), updated_at=start + timedelta(hours=i, minutes=5))
+        for i in range(items)
+    ]
+
+
+def vehicles(items: int) -> List[dict]:
+    return [
+        dict(id=str(uuid.uuid4()), store_id="6f1c1a52-3f5e-4b7e-9a55-0d4c2b1e8f10", brand=BRANDS[i % 6],
+             model=f"FH {i % 540}", year=2015 + i % 10, plate=f"ABC{i % 10}D{i % 100:02d}",
+             created_at=datetime(2026, 1, 1) + timedelta(minutes=i))
+        for i in range(items)
+    ]
+
+
+def plans(_: int) -> List[dict]:
+    features = ["Anúncios ilimitados", "Destaque na busca", "Relatórios de visualização",
+                "Importação de frota", "Suporte prioritário", "Selo de loja verificada"]
+    return [
+        dict(id=str(uuid.uuid4()), name=name, description=f"Plano {name} para lojas de veículos pesados",
+             price_month=price, max_advertisements=limit, max_featured_ads=limit // 10,
+             features=[{"name": f, "enabled": j <= k} for j, f in enumerate(features)])
+        for k, (name, price, limit) in enumerate([("Básico", 99.9, 10), ("Profissional", 249.9, 50),
+                                                  ("Empresarial", 599.9, 500), ("Frotista", 1299.9, 5000)])
+    ]
+
+
+def encoders() -> Dict[str, Callable[[], object]]:
+    found: Dict[str, Callable[[], object]] = {f"gzip-{level}": (lambda level=level: GzipEncoder(level))
+                                              for level in (1, 6, 9)}
+    if brotli is not None:
+        found.update({f"br-{quality}": (lambda quality=quality: BrotliEncoder(quality))
+                      for quality in (1, 4, 6, 11)})
+    return found
+
+
+def measure(body: bytes, make: Callable[[], object], number: int) -> Tuple[int, float]:
+    size = len(make().finish(body))
+    seconds = timeit.timeit(lambda: make().finish(body), number=number) / number
+    return size, seconds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=200, help="itens por listagem")
+    parser.add_argument("--number", type=int, default=20, help="repetições por medida")
+    args = parser.parse_args()
+
+    if brotli is None:
+        print("brotli não instalado: só gzip (pip install brotli)")
+    print(f"zlib {zlib.ZLIB_VERSION}")
+    for name, build in (("anúncios", advertisements), ("veículos", vehicles), ("planos", plans)):
+        body = dumps(build(args.items))
+        print(f"\n{name}: {len(body) / 1024:.1f} KB")
+        print(f"{'codec':<8} {'tamanho':>10} {'economia':>9} {'ms':>8} {'MB/s':>8}")
+        for codec, make in encoders().items():
+            size, seconds = measure(body, make, args.number)
+            print(f"{codec:<8} {size / 1024:>8.1f}KB {1 - size / len(body):>8.1%} "
+                  f"{seconds * 1000:>8.3f} {len(body) / seconds / 2**20:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+# benchmarks/import_time.py
+"""
+Cold start da API: tempo de import de `presentation.api.app` (-X importtime)
+
+Roda o import num processo novo (como um worker do uvicorn/gunicorn ao
+subir), agrega o relatório do `-X importtime` por pacote e mostra os
+módulos mais caros. Também confere que os clientes de infraestrutura
+(boto3, Celery, httpx, passlib, driver do Postgres) não são carregados
+no import: eles só entram na primeira requisição que os usa.
+
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --runs 5 --top 20 --target-ms 1000
+
+Sai com código 1 se a mediana passar do alvo ou se algum módulo adiado
+for importado, para acompanhar o alvo de cold start no CI.
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+MODULE = "brasiltransporta.presentation.api.app"
+
+# Alvo de cold start (mediana do import, sem o overhead do -X importtime)
+COLD_START_TARGET_MS = 1000
+
+# Carregados sob demanda; não podem aparecer no import da API
+DEFERRED_MODULES = ("boto3", "celery.app", "httpx", "passlib.hash", "psycopg2")
+
+
+def import_ms(module: str) -> float:
+    """Tempo do import num processo novo, em ms (sem a partida do interpretador)"""
+    code = f"import time; t = time.perf_counter(); import {module}; print(time.perf_counter() - t)"
+    proc = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True)
+    return float(proc.stdout.strip().splitlines()[-1]) * 1000
+
+
+def importtime_report(module: str) -> Tuple[List[Tuple[str, int, int]], List[str]]:
+    """Linhas (módulo, próprio µs, acumulado µs) do -X importtime e os módulos adiados carregados"""
+    check = f"import sys, {module}; print(','.join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))"
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", check], check=True, capture_output=True, text=True
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows, [name for name in proc.stdout.strip().split(",") if name]
+
+
+def by_package(rows: List[Tuple[str, int, int]]) -> Dict[str, int]:
+    """Tempo próprio somado por pacote de primeiro nível"""
+    totals: Dict[str, int] = defaultdict(int)
+    for name, self_us, _ in rows:
+        totals[name.split(".")[0]] += self_us
+    return totals
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default=MODULE)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--target-ms", type=float, default=COLD_START_TARGET_MS)
+    args = parser.parse_args()
+
+    walls = [import_ms(args.module) for _ in range(args.runs)]
+    rows, loaded = importtime_report(args.module)
+
+    print(f"import {args.module}: mediana {statistics.median(walls):.0f} ms "
+          f"(min {min(walls):.0f}, max {max(walls):.0f}; {args.runs} processos)")
+
+    print(f"\n{'pacote':<30} {'próprio (ms)':>12}")
+    packages = sorted(by_package(rows).items(), key=lambda item: item[1], reverse=True)
+    for package, self_us in packages[:args.top]:
+        print(f"{package:<30} {self_us / 1000:>12.1f}")
+
+    print(f"\n{'módulo':<60} {'acumulado (ms)':>14}")
+    for name, _, cumulative_us in sorted(rows, key=lambda row: row[2], reverse=True)[:args.top]:
+        print(f"{name:<60} {cumulative_us / 1000:>14.1f}")
+
+    failed = False
+    if loaded:
+        print(f"\nFALHA: módulos adiados carregados no import: {', '.join(loaded)}")
+        failed = True
+    if statistics.median(walls) > args.target_ms:
+        print(f"\nFALHA: cold start acima do alvo de {args.target_ms:.0f} ms")
+        failed = True
+    if not failed:
+        print(f"\nOK: dentro do alvo de {args.target_ms:.0f} ms, sem {', '.join(DEFERRED_MODULES)}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+# benchmarks/json_responses.py
+"""
+Vazão de um endpoint de listagem: serialização padrão do FastAPI x orjson
+
+Compara três caminhos para a mesma lista de VehicleResponse:
+
+- padrão: JSONResponse + response_model (revalida e usa jsonable_encoder)
+- orjson: FastJSONResponse como classe padrão, ainda com response_model
+- tipado: `typed_response` (sem revalidação, direto para orjson)
+
+Mede a requisição completa (TestClient, que tem custo fixo alto) e só a
+etapa de serialização de cada caminho.
+
+    python -m benchmarks.json_responses
+    python -m benchmarks.json_responses --items 500 --requests 300
+"""
+import argparse
+import json
+import time
+import timeit
+import uuid
+from datetime import datetime
+from typing import List
+
+from fastapi import FastAPI
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+from pydantic import TypeAdapter
+
+from brasiltransporta.presentation.api.models.responses.vehicle_responses import VehicleResponse
+from brasiltransporta.presentation.api.responses import FastJSONResponse, dumps, typed_response
+
+
+def build_rows(items: int) -> List[dict]:
+    return [
+        dict(id=str(uuid.uuid4()), store_id=str(uuid.uuid4()), brand="volvo", model=f"FH {i % 540}",
+             year=2015 + i % 10, plate=f"ABC{i % 10}D{i % 100:02d}", created_at=datetime(2026, 1, 1))
+        for i in range(items)
+    ]
+
+
+def build_app(rows: List[dict]) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/default", response_model=List[VehicleResponse], response_class=JSONResponse)
+    def default():
+        return [VehicleResponse(**row) for row in rows]
+
+    @app.get("/orjson", response_model=List[VehicleResponse], response_class=FastJSONResponse)
+    def with_orjson():
+        return [VehicleResponse(**row) for row in rows]
+
+    @app.get("/typed", response_model=List[VehicleResponse])
+    def typed():
+        return typed_response([VehicleResponse(**row) for row in rows])
+
+    return app
+
+
+def run(client: TestClient, path: str, requests: int) -> float:
+    client.get(path)  # aquecimento
+    started = time.perf_counter()
+    for _ in range(requests):
+        client.get(path).content
+    return requests / (time.perf_counter() - started)
+
+
+def serialization_only(rows: List[dict], number: int = 50) -> None:
+    """O que cada caminho faz com o retorno do endpoint"""
+    models = [VehicleResponse(**row) for row in rows]
+    adapter = TypeAdapter(List[VehicleResponse])
+
+    def default() -> bytes:
+        content = adapter.dump_python(adapter.validate_python(models), mode="json")
+        return json.dumps(jsonable_encoder(content)).encode()
+
+    def with_orjson() -> bytes:
+        return dumps(adapter.dump_python(adapter.validate_python(models), mode="json"))
+
+    def typed() -> bytes:
+        return dumps(models)
+
+    baseline = None
+    for name, fn in (("default", default), ("orjson", with_orjson), ("typed", typed)):
+        ms = timeit.timeit(fn, number=number) / number * 1000
+        baseline = baseline or ms
+        print(f"{name:<10} {ms:>8.2f} ms   {baseline / ms:>5.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    rows = build_rows(args.items)
+    print(f"Requisição completa ({args.items} itens por resposta)")
+    client = TestClient(build_app(rows))
+    baseline = None
+    for path in ("/default", "/orjson", "/typed"):
+        rate = run(client, path, args.requests)
+        baseline = baseline or rate
+        print(f"{path:<10} {rate:>8.1f} req/s  {rate / baseline:>5.2f}x")
+    print("Só serialização")
+    serialization_only(rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+# benchmarks/list_projection.py
+"""
+Vazão da listagem de anúncios ativos: entidades hidratadas x projeção
+
+- hidratação: `SQLAlchemyAdvertisementRepository.list_active` (modelo ORM +
+  identity map + `to_domain()` por linha)
+- projeção: as mesmas colunas e o mesmo filtro, com `select_fields` e
+  `rows_as_dicts` (cada tupla vira um dict); a razão compara só o custo de
+  montar as linhas, não o de ler menos colunas
+- card padrão: `SQLAlchemyCatalogQueryRepository.advertisements` com os
+  campos padrão de GET /advertisements (menos colunas, ordenado), para
+  referência
+
+Por padrão usa SQLite em memória com anúncios sintéticos. Com
+`--database-url` lê de um banco existente (só leitura, com os anúncios
+que houver lá).
+
+    python -m benchmarks.list_projection
+    python -m benchmarks.list_projection --rows 50000 --repeat 5
+"""
+import argparse
+import asyncio
+import time
+import uuid
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Callable, Sized
+
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session, sessionmaker
+
+from brasiltransporta.infrastructure.persistence.sqlalchemy.models.advertisement import AdvertisementModel
+from brasiltransporta.infrastructure.persistence.sqlalchemy.projections import rows_as_dicts, select_fields
+from brasiltransporta.infrastructure.persistence.sqlalchemy.repositories.advertisement_repository import (
+    SQLAlchemyAdvertisementRepository,
+)
+from brasiltransporta.infrastructure.persistence.sqlalchemy.repositories.catalog_query_repository import (
+    ADVERTISEMENT_LIST_DEFAULT,
+    SQLAlchemyCatalogQueryRepository,
+    _active,
+)
+
+# Todas as colunas da tabela: as mesmas que o modelo ORM carrega
+ALL_COLUMNS = {column.name: column for column in AdvertisementModel.__table__.c}
+
+
+@compiles(postgresql.UUID, "sqlite")
+def _uuid_as_char(type_, compiler, **kw):
+    return "CHAR(32)"
+
+
+def sqlite_sessions(rows: int) -> Callable[[], Session]:
+    engine = create_engine("sqlite://")
+    # Sem lojas/veículos: o SQLite não valida as FKs por padrão
+    AdvertisementModel.__table__.create(engine)
+    store_id, start = uuid.uuid4(), datetime(2026, 1, 1)
+    with engine.begin() as conn:
+        conn.execute(AdvertisementModel.__table__.insert(), [
+            dict(id=uuid.uuid4(), store_id=store_id, vehicle_id=uuid.uuid4(), title=f"Volvo FH {i % 540} 6x4",
+                 description="Caminhão revisado, pneus novos. " * 20, price_amount=Decimal("450000.00") + i,
+                 price_currency="BRL", status="ativo", is_featured=i % 50 == 0, views=i % 1000,
+                 images=[f"ads/{i}/capa.jpg", f"ads/{i}/lateral.jpg"], videos=[],
+                 created_at=start + timedelta(seconds=i), updated_at=start + timedelta(seconds=i))
+            for i in range(rows)
+        ])
+    return sessionmaker(bind=engine)
+
+
+def project_active(session: Session, limit: int) -> list:
+    """Mesmo SELECT de `list_active` (colunas, filtro, sem ORDER BY), sem hidratar"""
+    names = tuple(ALL_COLUMNS)
+    stmt = select_fields(ALL_COLUMNS, names).where(_active(datetime.utcnow())).limit(limit)
+    return rows_as_dicts(session.execute(stmt), names)
+
+
+def measure(name: str, run: Callable[[Session], Sized], make_session: Callable[[], Session], repeat: int) -> float:
+    best, count = float("inf"), 0
+    for _ in range(repeat):
+        # Sessão nova a cada rodada: o identity map não pode reaproveitar objetos
+        with make_session() as session:
+            started = time.perf_counter()
+            count = len(run(session))
+            best = min(best, time.perf_counter() - started)
+    rate = count / best if best else 0.0
+    print(f"{name:<12} {count:>8,} linhas {best * 1000:>9.1f} ms {rate:>12,.0f} linhas/s")
+    return rate
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--database-url")
+    args = parser.parse_args()
+
+    if args.database_url:
+        make_session = sessionmaker(bind=create_engine(args.database_url))
+    else:
+        make_session = sqlite_sessions(args.rows)
+
+    hydrated = measure(
+        "hidratação",
+        lambda s: asyncio.run(SQLAlchemyAdvertisementRepository(s).list_active(limit=args.rows)),
+        make_session, args.repeat,
+    )
+    projected = measure(
+        "projeção",
+        lambda s: project_active(s, args.rows),
+        make_session, args.repeat,
+    )
+    measure(
+        "card padrão",
+        lambda s: SQLAlchemyCatalogQueryRepository(s).advertisements(ADVERTISEMENT_LIST_DEFAULT, limit=args.rows),
+        make_session, args.repeat,
+    )
+    if hydrated:
+        print(f"projeção/hidratação (mesmas colunas): {projected / hydrated:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
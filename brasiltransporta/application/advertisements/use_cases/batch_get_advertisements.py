@@ -0,0 +1,36 @@
+from dataclasses import dataclass
+from typing import List, Optional
+
+from brasiltransporta.application.advertisements.use_cases.get_advertisement_by_id import (
+    GetAdvertisementByIdOutput,
+    to_output,
+)
+from brasiltransporta.application.service.batch import ordered_results
+
+
+@dataclass(frozen=True)
+class BatchGetAdvertisementItem:
+    id: str
+    found: bool
+    advertisement: Optional[GetAdvertisementByIdOutput] = None
+
+
+class BatchGetAdvertisementsUseCase:
+    """
+    Vários anúncios numa consulta só (favoritos, comparação)
+
+    Não registra visualizações; soma apenas o delta pendente no Redis.
+    """
+
+    def __init__(self, advertisements, view_counter=None):
+        self._advertisements = advertisements
+        self._view_counter = view_counter
+
+    async def execute(self, advertisement_ids: List[str]) -> List[BatchGetAdvertisementItem]:
+        found = await self._advertisements.get_many(advertisement_ids)
+        pending = self._view_counter.pending_many([a.id for a in found]) if self._view_counter and found else {}
+        outputs = [to_output(a, a.views + pending.get(a.id, 0)) for a in found]
+        return [
+            BatchGetAdvertisementItem(id=requested, found=output is not None, advertisement=output)
+            for requested, output in ordered_results(advertisement_ids, outputs)
+        ]
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from typing import Optional
 from brasiltransporta.domain.entities.advertisement import Advertisement
+from brasiltransporta.domain.entities.subscription import QuotaResource
 from brasiltransporta.domain.errors.errors import ValidationError
 
 @dataclass
@@ -16,10 +17,12 @@ class CreateAdvertisementOutput:
     advertisement_id: str
 
 class CreateAdvertisementUseCase:
-    def __init__(self, ad_repo, store_repo=None, vehicle_repo=None):
+    def __init__(self, ad_repo, store_repo=None, vehicle_repo=None, entitlements=None):
         self._ads = ad_repo
         self._stores = store_repo
         self._vehicles = vehicle_repo
+        # Opcional: EntitlementService (cota de anúncios do plano)
+        self._entitlements = entitlements
 
     def execute(self, inp: CreateAdvertisementInput) -> CreateAdvertisementOutput:
         # TODO: Implementar validação de store e vehicle quando os repositórios estiverem prontos
@@ -39,6 +42,14 @@ class CreateAdvertisementUseCase:
             description=inp.description or "",
             price_amount=inp.price_amount,
         )
-        if hasattr(self._ads, "add"):
-            self._ads.add(ad)
+        if self._entitlements is not None:
+            # Verifica e reserva a vaga em uma chamada ao Redis (QuotaExceededError se cheio)
+            self._entitlements.acquire(inp.store_id, QuotaResource.ADS)
+        try:
+            if hasattr(self._ads, "add"):
+                self._ads.add(ad)
+        except Exception:
+            if self._entitlements is not None:
+                self._entitlements.release(inp.store_id, QuotaResource.ADS)
+            raise
         return CreateAdvertisementOutput(advertisement_id=ad.id)
\ No newline at end of file
@@ -18,26 +18,56 @@ class GetAdvertisementByIdOutput:
     updated_at: str
 
 
+def to_output(advertisement, views: Optional[int] = None) -> GetAdvertisementByIdOutput:
+    """Saída a partir da entidade; `views` sobrescreve o valor do banco (com o delta pendente)"""
+    return GetAdvertisementByIdOutput(
+        id=advertisement.id,
+        store_id=advertisement.store_id,
+        vehicle_id=advertisement.vehicle_id,
+        title=advertisement.title,
+        description=advertisement.description,
+        price_amount=advertisement.price_amount,
+        price_currency=advertisement.price_currency,
+        status=advertisement.status.value,
+        is_featured=advertisement.is_featured,
+        views=advertisement.views if views is None else views,
+        created_at=advertisement.created_at.isoformat(),
+        updated_at=advertisement.updated_at.isoformat() if advertisement.updated_at else advertisement.created_at.isoformat()
+    )
+
+
 class GetAdvertisementByIdUseCase:
-    def __init__(self, advertisements):
+    def __init__(self, advertisements, view_counter=None):
         self._advertisements = advertisements
+        # Opcional: contador em Redis gravado em lote (RedisViewCounter)
+        self._view_counter = view_counter
+
+    async def version(self, advertisement_id: str):
+        """Versão do anúncio (AdvertisementVersion) para validar o cache do cliente"""
+        return await self._advertisements.get_version(advertisement_id)
 
-    def execute(self, advertisement_id: str) -> Optional[GetAdvertisementByIdOutput]:
+    def record_view(self, advertisement_id: str, viewer_id: Optional[str] = None) -> None:
+        """Conta a visualização mesmo quando a resposta é um 304"""
+        if self._view_counter is not None:
+            self._view_counter.record(advertisement_id, viewer_id)
+
+    def execute(
+        self,
+        advertisement_id: str,
+        viewer_id: Optional[str] = None,
+        record_view: bool = False,
+    ) -> Optional[GetAdvertisementByIdOutput]:
         advertisement = self._advertisements.get_by_id(advertisement_id)
         if not advertisement:
             return None
+
+        # O banco só recebe as visualizações no próximo flush; soma o delta
+        # pendente para a leitura não ficar atrasada
+        views = advertisement.views
+        if self._view_counter is not None:
+            if record_view:
+                views += self._view_counter.record(advertisement.id, viewer_id)
+            else:
+                views += self._view_counter.pending(advertisement.id)
         
-        return GetAdvertisementByIdOutput(
-            id=advertisement.id,
-            store_id=advertisement.store_id,
-            vehicle_id=advertisement.vehicle_id,
-            title=advertisement.title,
-            description=advertisement.description,
-            price_amount=advertisement.price_amount,
-            price_currency=advertisement.price_currency,
-            status=advertisement.status.value,
-            is_featured=advertisement.is_featured,
-            views=advertisement.views,
-            created_at=advertisement.created_at.isoformat(),
-            updated_at=advertisement.updated_at.isoformat() if advertisement.updated_at else advertisement.created_at.isoformat()
-        )
\ No newline at end of file
+        return to_output(advertisement, views)
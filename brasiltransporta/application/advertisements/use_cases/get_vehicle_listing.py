@@ -0,0 +1,73 @@
+from dataclasses import replace
+from typing import Optional
+
+from brasiltransporta.domain.aggregates.vehicle_listing import VehicleListing
+from brasiltransporta.domain.repositories.vehicle_listing_repository import VehicleListingRepository
+
+
+class GetVehicleListingUseCase:
+    """
+    Página do anúncio (anúncio, veículo, loja e mídias) numa chamada
+
+    Do cache por anúncio quando presente; senão uma única consulta, que
+    passa a ser o conteúdo do cache. As URLs das mídias são assinadas a cada
+    leitura (expiram) e a visualização é registrada como no GET do anúncio.
+    O cache guarda as visualizações do banco; o delta pendente no Redis é
+    somado a cada leitura e o flush invalida o cache dos anúncios gravados.
+    """
+
+    def __init__(
+        self,
+        listings: VehicleListingRepository,
+        cache=None,
+        view_counter=None,
+        file_storage=None,
+        url_expires_in: int = 3600,
+    ):
+        self._listings = listings
+        self._cache = cache
+        self._view_counter = view_counter
+        self._file_storage = file_storage
+        self._url_expires_in = url_expires_in
+
+    def execute(
+        self,
+        advertisement_id: str,
+        viewer_id: Optional[str] = None,
+        record_view: bool = False,
+    ) -> Optional[VehicleListing]:
+        listing = self._load(advertisement_id)
+        if listing is None:
+            return None
+        if self._view_counter is not None:
+            if record_view:
+                pending = self._view_counter.record(listing.id, viewer_id)
+            else:
+                pending = self._view_counter.pending(listing.id)
+            listing = replace(listing, views=listing.views + pending)
+        return self._sign_media(listing)
+
+    def _load(self, advertisement_id: str) -> Optional[VehicleListing]:
+        if self._cache is not None:
+            cached = self._cache.get(advertisement_id)
+            if cached is not None:
+                return VehicleListing.from_dict(cached)
+
+        listing = self._listings.get(advertisement_id)
+        if listing is not None and self._cache is not None:
+            self._cache.set(advertisement_id, listing.to_dict())
+        return listing
+
+    def _sign_media(self, listing: VehicleListing) -> VehicleListing:
+        if self._file_storage is None or not listing.media:
+            return listing
+        results = self._file_storage.generate_presigned_urls(
+            [media.key for media in listing.media],
+            operation="get_object",
+            expires_in=self._url_expires_in,
+        )
+        media = [
+            replace(m, url=results[m.key].url if results[m.key].success else None)
+            for m in listing.media
+        ]
+        return replace(listing, media=media)
@@ -0,0 +1,22 @@
+from typing import Any, Dict, List, Optional, Sequence
+
+
+class ListAdvertisementsUseCase:
+    """
+    Listagem de anúncios (destaques primeiro, depois os mais recentes)
+
+    Devolve dicts só com os campos pedidos, lidos por projeção de colunas:
+    a listagem não monta entidades `Advertisement`.
+    """
+
+    def __init__(self, catalog_queries):
+        self._queries = catalog_queries
+
+    def execute(
+        self,
+        fields: Sequence[str],
+        store_id: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> List[Dict[str, Any]]:
+        return self._queries.advertisements(fields, store_id=store_id, limit=limit, offset=offset)
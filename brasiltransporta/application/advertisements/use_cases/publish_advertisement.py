@@ -18,15 +18,17 @@ class PublishAdvertisementOutput:
     success: bool = True
 
 class PublishAdvertisementUseCase:
-    def __init__(self, repository):
+    def __init__(self, repository, listing_cache=None):
         """
         repository precisa expor: get_by_id(id) -> entidade | None
                                    update(entidade) -> None
         """
         self._repo = repository
+        # Opcional: cache da página do anúncio (RedisVehicleListingCache)
+        self._listing_cache = listing_cache
 
-    def execute(self, input_data: PublishAdvertisementInput) -> PublishAdvertisementOutput:
-        ad = self._repo.get_by_id(input_data.advertisement_id)
+    async def execute(self, input_data: PublishAdvertisementInput) -> PublishAdvertisementOutput:
+        ad = await self._repo.get_by_id(input_data.advertisement_id)
         if not ad:
             raise ValidationError("Anúncio não encontrado")
 
@@ -37,5 +39,7 @@ class PublishAdvertisementUseCase:
             # fallback simples
             setattr(ad, "status", "published")
 
-        self._repo.update(ad)
+        await self._repo.update(ad)
+        if self._listing_cache is not None:
+            self._listing_cache.invalidate(ad.id)
         return PublishAdvertisementOutput(advertisement_id=getattr(ad, "id"))
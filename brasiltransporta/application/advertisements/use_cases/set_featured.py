@@ -0,0 +1,65 @@
+# brasiltransporta/application/advertisements/use_cases/set_featured.py
+from dataclasses import dataclass
+from typing import Optional
+
+from brasiltransporta.domain.entities.subscription import QuotaResource
+from brasiltransporta.domain.errors.errors import ValidationError
+
+
+@dataclass(frozen=True)
+class SetFeaturedInput:
+    advertisement_id: str
+    featured: bool
+
+
+@dataclass(frozen=True)
+class SetFeaturedOutput:
+    advertisement_id: str
+    is_featured: bool
+
+
+class SetAdvertisementFeaturedUseCase:
+    """
+    Coloca ou tira um anúncio do destaque
+
+    Destacar consome a cota `featured` do plano da loja; tirar do
+    destaque devolve a vaga. Repetir a mesma operação não altera a cota.
+    """
+    def __init__(self, repository, entitlements=None, listing_cache=None):
+        self._repo = repository
+        self._entitlements = entitlements
+        # Opcional: cache da página do anúncio (RedisVehicleListingCache)
+        self._listing_cache = listing_cache
+
+    async def execute(self, inp: SetFeaturedInput) -> SetFeaturedOutput:
+        ad = await self._repo.get_by_id(inp.advertisement_id)
+        if not ad:
+            raise ValidationError("Anúncio não encontrado")
+        if ad.is_featured == inp.featured:
+            return SetFeaturedOutput(advertisement_id=ad.id, is_featured=ad.is_featured)
+
+        if inp.featured:
+            self._acquire(ad.store_id)
+            ad.set_featured(True)
+            try:
+                await self._repo.update(ad)
+            except Exception:
+                self._release(ad.store_id)
+                raise
+        else:
+            ad.set_featured(False)
+            await self._repo.update(ad)
+            self._release(ad.store_id)
+
+        if self._listing_cache is not None:
+            self._listing_cache.invalidate(ad.id)
+        return SetFeaturedOutput(advertisement_id=ad.id, is_featured=ad.is_featured)
+
+    def _acquire(self, store_id: str) -> Optional[int]:
+        if self._entitlements is None:
+            return None
+        return self._entitlements.acquire(store_id, QuotaResource.FEATURED)
+
+    def _release(self, store_id: str) -> None:
+        if self._entitlements is not None:
+            self._entitlements.release(store_id, QuotaResource.FEATURED)
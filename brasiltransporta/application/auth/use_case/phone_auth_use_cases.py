@@ -9,16 +9,22 @@ from brasiltransporta.application.auth.use_case.phone_auth_inputs import (
     VerifyPhoneCodeCommand,
     PhoneLoginCommand
 )
-from brasiltransporta.infrastructure.external.sms.sms_service import SMSService
+from brasiltransporta.application.notifications.services.notification_dispatcher import SMS, Notification
+
+PHONE_CODE_MESSAGE = "BrasilTransporta: seu código de verificação é {code}"
 
 class SendPhoneVerificationUseCase:
     def __init__(
         self,
         verification_repo: PhoneVerificationRepository,
-        sms_service: SMSService
+        notification_queue
     ):
+        """
+        notification_queue precisa expor: enqueue_one(Notification) -> job id
+        (ex.: NotificationQueue, que publica na fila `notifications`)
+        """
         self.verification_repo = verification_repo
-        self.sms_service = sms_service
+        self.notification_queue = notification_queue
 
     async def execute(self, command: SendPhoneVerificationCodeCommand) -> bool:
         # Remove verificações anteriores do mesmo número
@@ -28,11 +34,14 @@ class SendPhoneVerificationUseCase:
         verification = PhoneVerification.create(command.phone)
         self.verification_repo.save(verification)
         
-        # Envia SMS (mock em desenvolvimento)
-        return await self.sms_service.send_verification_code(
-            command.phone, 
-            verification.code
-        )
+        # Só enfileira: a resposta não espera o provedor de SMS
+        self.notification_queue.enqueue_one(Notification(
+            channel=SMS,
+            to=command.phone,
+            body=PHONE_CODE_MESSAGE.format(code=verification.code),
+            metadata={"kind": "phone_verification"},
+        ))
+        return True
 
 class VerifyPhoneCodeUseCase:
     def __init__(
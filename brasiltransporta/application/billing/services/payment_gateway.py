@@ -0,0 +1,105 @@
+# brasiltransporta/application/billing/services/payment_gateway.py
+"""
+Contrato dos gateways de pagamento (Stripe, Mercado Pago)
+
+O status de uma cobrança chega por dois caminhos: webhook assinado
+(imediato) e conciliação periódica (rede de segurança para webhooks
+perdidos). Os dois aplicam o mesmo `Transaction.apply_gateway_status`,
+que é idempotente.
+"""
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional, Protocol
+
+from brasiltransporta.domain.entities.transaction import Transaction, TransactionStatus
+
+
+class GatewayError(Exception):
+    """Falha de comunicação ou resposta inesperada do gateway"""
+
+    def __init__(self, message: str, retryable: bool = False):
+        super().__init__(message)
+        self.retryable = retryable
+
+
+class WebhookSignatureError(Exception):
+    """Assinatura do webhook ausente, inválida ou expirada"""
+
+
+@dataclass(frozen=True)
+class GatewayPayment:
+    """Cobrança criada no gateway"""
+    external_id: str
+    status: TransactionStatus
+    # Dados para o cliente concluir o pagamento (client_secret, QR code PIX...)
+    client_data: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class WebhookEvent:
+    """
+    Notificação do gateway já validada
+
+    `status` é None quando o evento não traz o status (ex.: Mercado Pago
+    envia só o id); nesse caso o worker consulta o gateway. `amount` é o
+    valor pago informado pelo gateway (texto decimal), quando existir; o
+    worker só conclui a transação se ele bater com o valor cobrado.
+    """
+    gateway: str
+    external_id: str
+    status: Optional[TransactionStatus] = None
+    event_id: Optional[str] = None
+    amount: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "gateway": self.gateway,
+            "external_id": self.external_id,
+            "status": self.status.value if self.status else None,
+            "event_id": self.event_id,
+            "amount": self.amount,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "WebhookEvent":
+        status = data.get("status")
+        return cls(
+            gateway=data["gateway"],
+            external_id=data["external_id"],
+            status=TransactionStatus(status) if status else None,
+            event_id=data.get("event_id"),
+            amount=data.get("amount"),
+        )
+
+
+class PaymentGateway(Protocol):
+    """Adaptador assíncrono de um gateway (um cliente HTTP com pool por instância)"""
+    name: str
+    # False para gateways sem API de consulta (PIX direto): ficam fora da conciliação
+    supports_lookup: bool
+
+    async def create_payment(self, transaction: Transaction, description: str) -> GatewayPayment: ...
+
+    async def get_payments(self, external_ids: List[str]) -> Dict[str, TransactionStatus]:
+        """Status atual de várias cobranças; ids não encontrados ficam de fora"""
+        ...
+
+    def verify_webhook(self, headers: Mapping[str, str], body: bytes) -> List[WebhookEvent]:
+        """
+        Valida a assinatura e extrai os eventos
+
+        Returns:
+            List[WebhookEvent]: vazia para eventos que não alteram pagamentos
+            (um webhook de PIX pode trazer vários pagamentos)
+
+        Raises:
+            WebhookSignatureError: se a assinatura não confere
+        """
+        ...
+
+    async def aclose(self) -> None: ...
+
+
+class TransactionStatusNotifier(Protocol):
+    """Avisa os clientes conectados (SSE) que o status de uma transação mudou"""
+
+    def publish(self, transaction_id: str, status: str) -> None: ...
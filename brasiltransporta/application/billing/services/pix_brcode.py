@@ -0,0 +1,92 @@
+# brasiltransporta/application/billing/services/pix_brcode.py
+"""
+BR Code do PIX (payload EMV "copia e cola") gerado localmente
+
+Segue o Manual de Padrões para Iniciação do PIX do Banco Central: campos
+TLV (id de 2 dígitos, tamanho de 2 dígitos, valor) terminados pelo CRC16
+do próprio payload. O mesmo texto é o conteúdo do QR code.
+"""
+import re
+import unicodedata
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Optional
+
+GUI_PIX = "br.gov.bcb.pix"
+MAX_TXID_LENGTH = 25
+MAX_NAME_LENGTH = 25
+MAX_CITY_LENGTH = 15
+
+
+def crc16_ccitt(data: str) -> str:
+    """CRC16-CCITT (polinômio 0x1021, inicial 0xFFFF) em 4 dígitos hexadecimais"""
+    crc = 0xFFFF
+    for byte in data.encode("utf-8"):
+        crc ^= byte << 8
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x1021) if crc & 0x8000 else (crc << 1)
+            crc &= 0xFFFF
+    return f"{crc:04X}"
+
+
+def _field(field_id: str, value: str) -> str:
+    if len(value) > 99:
+        raise ValueError(f"Campo {field_id} do BR Code excede 99 caracteres")
+    return f"{field_id}{len(value):02d}{value}"
+
+
+def _ascii(value: str, max_length: int) -> str:
+    # Nome e cidade aceitam apenas ASCII; remove acentos
+    normalized = unicodedata.normalize("NFKD", value).encode("ascii", "ignore").decode()
+    return normalized.strip()[:max_length]
+
+
+def normalize_txid(value: str) -> str:
+    """Identificador da cobrança: até 25 caracteres alfanuméricos"""
+    txid = re.sub(r"[^A-Za-z0-9]", "", value)[:MAX_TXID_LENGTH]
+    return txid or "***"
+
+
+def build_pix_payload(
+    key: str,
+    merchant_name: str,
+    merchant_city: str,
+    amount: Optional[float] = None,
+    txid: str = "***",
+    description: Optional[str] = None,
+) -> str:
+    """
+    Monta o BR Code de uma cobrança PIX
+
+    Args:
+        key: chave PIX do recebedor (e-mail, telefone, CPF/CNPJ ou aleatória)
+        amount: valor em reais; None deixa o valor para o pagador
+        txid: identificador que volta no webhook do PSP ao ser pago
+    """
+    account = _field("00", GUI_PIX) + _field("01", key)
+    if description:
+        account += _field("02", description[:40])
+
+    payload = (
+        _field("00", "01")
+        # 12 = QR de uso único (a cobrança tem txid e valor próprios)
+        + _field("01", "12")
+        + _field("26", account)
+        + _field("52", "0000")
+        + _field("53", "986")  # BRL
+    )
+    if amount is not None:
+        value = Decimal(str(amount)).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        payload += _field("54", str(value))
+    payload += (
+        _field("58", "BR")
+        + _field("59", _ascii(merchant_name, MAX_NAME_LENGTH))
+        + _field("60", _ascii(merchant_city, MAX_CITY_LENGTH))
+        + _field("62", _field("05", normalize_txid(txid)))
+        + "6304"
+    )
+    return payload + crc16_ccitt(payload)
+
+
+def is_valid_pix_payload(payload: str) -> bool:
+    """Confere o CRC de um BR Code"""
+    return len(payload) > 8 and payload[-8:-4] == "6304" and crc16_ccitt(payload[:-4]) == payload[-4:].upper()
@@ -0,0 +1,85 @@
+# brasiltransporta/application/billing/use_cases/process_payment_notification.py
+import logging
+from dataclasses import dataclass
+from decimal import Decimal, InvalidOperation
+from typing import Dict, Optional
+
+from brasiltransporta.application.billing.services.payment_gateway import (
+    PaymentGateway,
+    TransactionStatusNotifier,
+    WebhookEvent,
+)
+from brasiltransporta.domain.entities.transaction import Transaction, TransactionStatus
+from brasiltransporta.domain.repositories.transaction_repository import TransactionRepository
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PaymentNotificationOutput:
+    transaction_id: Optional[str]
+    status: Optional[str]
+    changed: bool
+
+
+class ProcessPaymentNotificationUseCase:
+    """
+    Aplica o status de um webhook já validado à transação
+
+    Webhooks repetidos ou fora de ordem não alteram nada (ver
+    `Transaction.apply_gateway_status`), então a tarefa pode ser
+    reexecutada com segurança.
+    """
+
+    def __init__(
+        self,
+        transactions: TransactionRepository,
+        gateways: Dict[str, PaymentGateway],
+        notifier: Optional[TransactionStatusNotifier] = None,
+    ):
+        self._tx = transactions
+        self._gateways = gateways
+        self._notifier = notifier
+
+    @staticmethod
+    def _amount_matches(tx: Transaction, amount: str) -> bool:
+        cents = Decimal("0.01")
+        try:
+            paid = Decimal(amount).quantize(cents)
+        except InvalidOperation:
+            return False
+        return paid == Decimal(str(tx.amount.amount)).quantize(cents)
+
+    async def execute(self, event: WebhookEvent) -> PaymentNotificationOutput:
+        tx = self._tx.get_by_external_id(event.external_id)
+        if tx is None:
+            logger.warning(f"Webhook {event.gateway} para pagamento desconhecido: {event.external_id}")
+            return PaymentNotificationOutput(None, None, False)
+
+        status = event.status
+        if status is None:
+            # Evento sem status: consulta o gateway
+            statuses = await self._gateways[event.gateway].get_payments([event.external_id])
+            status = statuses.get(event.external_id)
+            if status is None:
+                return PaymentNotificationOutput(tx.id, tx.status.value, False)
+
+        if (
+            status == TransactionStatus.COMPLETED
+            and event.amount is not None
+            and not self._amount_matches(tx, event.amount)
+        ):
+            # Ex.: PIX pago com outro valor (o BR Code pode ser editado no app do banco)
+            logger.warning(
+                f"Webhook {event.gateway} com valor {event.amount} diferente da transação "
+                f"{tx.id} ({tx.amount.amount}): ignorado"
+            )
+            return PaymentNotificationOutput(tx.id, tx.status.value, False)
+
+        changed = tx.apply_gateway_status(status, event.external_id)
+        if changed:
+            self._tx.update(tx)
+            if self._notifier is not None:
+                self._notifier.publish(tx.id, tx.status.value)
+            logger.info(f"Transação {tx.id} -> {tx.status.value} ({event.gateway})")
+        return PaymentNotificationOutput(tx.id, tx.status.value, changed)
@@ -0,0 +1,85 @@
+# brasiltransporta/application/billing/use_cases/reconcile_payments.py
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from brasiltransporta.application.billing.services.payment_gateway import PaymentGateway, TransactionStatusNotifier
+from brasiltransporta.domain.entities.transaction import Transaction
+from brasiltransporta.domain.repositories.transaction_repository import TransactionRepository
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ReconciliationReport:
+    checked: int = 0
+    updated: int = 0
+    unresolved: int = 0  # sem resposta do gateway (tentará no próximo ciclo)
+    by_status: Dict[str, int] = field(default_factory=dict)
+
+
+class ReconcilePaymentsUseCase:
+    """
+    Confere no gateway as transações pendentes há mais de `older_than`
+
+    Cobre webhooks perdidos: as pendentes são lidas em lote e consultadas
+    em paralelo, agrupadas por gateway. Cada transação consultada é marcada
+    (`mark_reconciled`) e volta ao fim da fila; pendentes com mais de
+    `max_age` deixam de ser consultadas (o webhook ainda pode concluí-las)
+    e gateways sem API de consulta ficam de fora.
+    """
+
+    def __init__(
+        self,
+        transactions: TransactionRepository,
+        gateways: Dict[str, PaymentGateway],
+        notifier: Optional[TransactionStatusNotifier] = None,
+    ):
+        self._tx = transactions
+        self._gateways = gateways
+        self._notifier = notifier
+
+    async def execute(
+        self,
+        older_than: timedelta = timedelta(minutes=15),
+        batch_size: int = 200,
+        now: Optional[datetime] = None,
+        max_age: Optional[timedelta] = timedelta(days=3),
+    ) -> ReconciliationReport:
+        report = ReconciliationReport()
+        now = now or datetime.utcnow()
+        queryable = [name for name, gateway in self._gateways.items() if getattr(gateway, "supports_lookup", True)]
+        pending = self._tx.list_pending_for_reconciliation(
+            now - older_than,
+            limit=batch_size,
+            created_after=now - max_age if max_age is not None else None,
+            gateways=queryable,
+        )
+
+        by_gateway: Dict[str, List[Transaction]] = {}
+        for tx in pending:
+            if tx.gateway in self._gateways:
+                by_gateway.setdefault(tx.gateway, []).append(tx)
+            else:
+                report.unresolved += 1
+
+        for name, transactions in by_gateway.items():
+            statuses = await self._gateways[name].get_payments([tx.external_payment_id for tx in transactions])
+            for tx in transactions:
+                report.checked += 1
+                status = statuses.get(tx.external_payment_id)
+                if status is None:
+                    report.unresolved += 1
+                    continue
+                if tx.apply_gateway_status(status):
+                    self._tx.update(tx)
+                    if self._notifier is not None:
+                        self._notifier.publish(tx.id, tx.status.value)
+                    report.updated += 1
+                    report.by_status[tx.status.value] = report.by_status.get(tx.status.value, 0) + 1
+
+        self._tx.mark_reconciled([tx.id for tx in pending], now)
+        if report.updated:
+            logger.info(f"Conciliação: {report.updated} de {report.checked} transações atualizadas")
+        return report
@@ -0,0 +1,27 @@
+"""
+Módulo de notificações (e-mail e SMS) da camada de aplicação
+"""
+
+from brasiltransporta.application.notifications.services.notification_dispatcher import (
+    EMAIL,
+    SMS,
+    Notification,
+    DeliveryResult,
+    NotificationProvider,
+    RetryPolicy,
+    DispatchReport,
+    NotificationDispatcher,
+    is_retryable_status
+)
+
+__all__ = [
+    "EMAIL",
+    "SMS",
+    "Notification",
+    "DeliveryResult",
+    "NotificationProvider",
+    "RetryPolicy",
+    "DispatchReport",
+    "NotificationDispatcher",
+    "is_retryable_status"
+]
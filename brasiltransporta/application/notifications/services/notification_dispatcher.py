@@ -0,0 +1,192 @@
+# brasiltransporta/application/notifications/services/notification_dispatcher.py
+"""
+Envio de notificações (e-mail e SMS) em lotes, fora do ciclo da requisição
+
+A API apenas enfileira as notificações; o worker da fila `notifications`
+agrupa por canal, divide em lotes do tamanho aceito pelo provedor e envia
+respeitando o limite de chamadas simultâneas de cada provedor. Falhas
+temporárias (rede, 429, 5xx) são reenviadas com backoff exponencial e
+jitter.
+"""
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Protocol
+from uuid import uuid4
+
+logger = logging.getLogger(__name__)
+
+EMAIL = "email"
+SMS = "sms"
+
+
+@dataclass(frozen=True)
+class Notification:
+    """Mensagem a ser entregue; `id` identifica a entrega nos provedores e logs"""
+    channel: str  # 'email' ou 'sms'
+    to: str
+    body: str
+    subject: Optional[str] = None  # apenas e-mail
+    id: str = field(default_factory=lambda: str(uuid4()))
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "channel": self.channel,
+            "to": self.to,
+            "body": self.body,
+            "subject": self.subject,
+            "id": self.id,
+            "metadata": self.metadata,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Notification":
+        return cls(**data)
+
+
+@dataclass(frozen=True)
+class DeliveryResult:
+    notification_id: str
+    success: bool
+    retryable: bool = False
+    error: Optional[str] = None
+    provider_message_id: Optional[str] = None
+
+    @classmethod
+    def ok(cls, notification_id: str, provider_message_id: Optional[str] = None) -> "DeliveryResult":
+        return cls(notification_id, True, provider_message_id=provider_message_id)
+
+    @classmethod
+    def failed(cls, notification_id: str, error: str, retryable: bool) -> "DeliveryResult":
+        return cls(notification_id, False, retryable=retryable, error=error)
+
+
+def is_retryable_status(status_code: int) -> bool:
+    """Respostas HTTP que valem nova tentativa (limite de taxa e erros do provedor)"""
+    return status_code == 429 or status_code >= 500
+
+
+class NotificationProvider(Protocol):
+    """Adaptador de um provedor (SendGrid, Twilio, fake...)"""
+    name: str
+    channel: str
+    max_batch_size: int  # notificações por chamada a send_batch
+    max_concurrency: int  # chamadas simultâneas permitidas pelo provedor
+
+    def send_batch(self, notifications: List[Notification]) -> List[DeliveryResult]: ...
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Backoff exponencial com "full jitter": espera aleatória em [0, teto]"""
+    max_attempts: int = 4
+    base_delay: float = 0.5
+    max_delay: float = 10.0
+
+    def delay(self, attempt: int, rng: random.Random) -> float:
+        """Espera antes da tentativa `attempt + 1` (attempt começa em 1)"""
+        cap = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return rng.uniform(0, cap)
+
+
+@dataclass
+class DispatchReport:
+    sent: int = 0
+    failed: int = 0
+    retries: int = 0
+    errors: Dict[str, str] = field(default_factory=dict)  # notification_id -> erro
+
+
+class NotificationDispatcher:
+    """
+    Distribui notificações entre os provedores de cada canal
+
+    Uma instância por processo: os semáforos limitam as chamadas simultâneas
+    a cada provedor somando todas as tarefas do worker.
+    """
+
+    def __init__(
+        self,
+        providers: List[NotificationProvider],
+        retry_policy: Optional[RetryPolicy] = None,
+        sleep: Callable[[float], None] = time.sleep,
+        rng: Optional[random.Random] = None,
+    ):
+        self._providers = {p.channel: p for p in providers}
+        self._semaphores = {p.name: threading.BoundedSemaphore(max(1, p.max_concurrency)) for p in providers}
+        self._retry = retry_policy or RetryPolicy()
+        self._sleep = sleep
+        self._rng = rng or random.Random()
+
+    def dispatch(self, notifications: List[Notification]) -> DispatchReport:
+        report = DispatchReport()
+        by_channel: Dict[str, List[Notification]] = {}
+        for notification in notifications:
+            if notification.channel not in self._providers:
+                report.failed += 1
+                report.errors[notification.id] = f"Canal sem provedor: {notification.channel}"
+                continue
+            by_channel.setdefault(notification.channel, []).append(notification)
+
+        for channel, items in by_channel.items():
+            self._dispatch_channel(self._providers[channel], items, report)
+
+        if report.failed:
+            logger.warning(f"{report.failed} notificações não entregues: {report.errors}")
+        return report
+
+    def _dispatch_channel(self, provider: NotificationProvider, items: List[Notification],
+                          report: DispatchReport) -> None:
+        pending = items
+        for attempt in range(1, self._retry.max_attempts + 1):
+            retryable: List[Notification] = []
+            by_id = {n.id: n for n in pending}
+            for result in self._send_chunks(provider, pending):
+                if result.success:
+                    report.sent += 1
+                elif result.retryable and attempt < self._retry.max_attempts:
+                    retryable.append(by_id[result.notification_id])
+                else:
+                    report.failed += 1
+                    report.errors[result.notification_id] = result.error or "falha no provedor"
+
+            if not retryable:
+                return
+            report.retries += len(retryable)
+            delay = self._retry.delay(attempt, self._rng)
+            logger.info(
+                f"{len(retryable)} notificações via {provider.name} serão reenviadas em {delay:.2f}s "
+                f"(tentativa {attempt + 1}/{self._retry.max_attempts})"
+            )
+            self._sleep(delay)
+            pending = retryable
+
+    def _send_chunks(self, provider: NotificationProvider, items: List[Notification]) -> List[DeliveryResult]:
+        size = max(1, provider.max_batch_size)
+        chunks = [items[i:i + size] for i in range(0, len(items), size)]
+        if len(chunks) == 1:
+            return self._send_chunk(provider, chunks[0])
+
+        with ThreadPoolExecutor(max_workers=min(len(chunks), max(1, provider.max_concurrency))) as pool:
+            results: List[DeliveryResult] = []
+            for chunk_results in pool.map(lambda chunk: self._send_chunk(provider, chunk), chunks):
+                results.extend(chunk_results)
+            return results
+
+    def _send_chunk(self, provider: NotificationProvider, chunk: List[Notification]) -> List[DeliveryResult]:
+        with self._semaphores[provider.name]:
+            try:
+                results = provider.send_batch(chunk)
+            except Exception as e:
+                # Exceção inesperada do adaptador: trata o lote inteiro como temporário
+                logger.exception(f"Erro no provedor {provider.name}: {str(e)}")
+                return [DeliveryResult.failed(n.id, str(e), retryable=True) for n in chunk]
+
+        answered = {r.notification_id for r in results}
+        missing = [DeliveryResult.failed(n.id, "sem resposta do provedor", retryable=True)
+                   for n in chunk if n.id not in answered]
+        return list(results) + missing
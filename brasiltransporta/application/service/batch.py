@@ -0,0 +1,26 @@
+# application/service/batch.py
+import uuid
+from typing import Iterable, List, Optional, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# Ids por chamada dos endpoints batchGet
+MAX_BATCH_IDS = 100
+
+
+def _canonical(value) -> str:
+    try:
+        return str(uuid.UUID(str(value)))
+    except ValueError:
+        return str(value)
+
+
+def ordered_results(requested_ids: Sequence[str], items: Iterable[T]) -> List[Tuple[str, Optional[T]]]:
+    """
+    Pareia cada id pedido com o item encontrado (ou None), na ordem do pedido
+
+    O banco devolve os itens em qualquer ordem; ids repetidos no pedido
+    repetem o item e a comparação ignora a grafia do UUID (maiúsculas, sem hífens).
+    """
+    by_id = {_canonical(item.id): item for item in items}
+    return [(requested, by_id.get(_canonical(requested))) for requested in requested_ids]
@@ -27,6 +27,35 @@ from brasiltransporta.application.storage.use_cases.generate_presigned_url impor
     GeneratePresignedUrlResponse
 )
 
+from brasiltransporta.application.storage.use_cases.list_ad_files import (
+    ListAdFilesUseCase,
+    AdFileInfo
+)
+
+from brasiltransporta.application.storage.use_cases.reconcile_media_index import (
+    ReconcileMediaIndexUseCase,
+    ReconcileMediaIndexResponse
+)
+
+from brasiltransporta.application.storage.use_cases.generate_ad_media_urls import (
+    GenerateAdMediaUrlsUseCase,
+    GenerateAdMediaUrlsRequest,
+    GenerateAdMediaUrlsResponse
+)
+
+from brasiltransporta.application.storage.use_cases.batch_upload_files import (
+    BatchUploadFilesUseCase,
+    BatchUploadItem,
+    BatchUploadItemResult,
+    BatchUploadFilesResponse
+)
+
+from brasiltransporta.application.storage.use_cases.transcode_video import (
+    TranscodeVideoUseCase,
+    TranscodeVideoRequest,
+    TranscodeVideoResponse
+)
+
 __all__ = [
     # Services
     "FileStorageInterface",
@@ -47,5 +76,27 @@ __all__ = [
     # Use Cases - Presigned URL
     "GeneratePresignedUrlUseCase",
     "GeneratePresignedUrlRequest",
-    "GeneratePresignedUrlResponse"
+    "GeneratePresignedUrlResponse",
+    
+    # Use Cases - Índice de mídia
+    "ListAdFilesUseCase",
+    "AdFileInfo",
+    "ReconcileMediaIndexUseCase",
+    "ReconcileMediaIndexResponse",
+    
+    # Use Cases - URLs assinadas do anúncio
+    "GenerateAdMediaUrlsUseCase",
+    "GenerateAdMediaUrlsRequest",
+    "GenerateAdMediaUrlsResponse",
+    
+    # Use Cases - Upload em lote
+    "BatchUploadFilesUseCase",
+    "BatchUploadItem",
+    "BatchUploadItemResult",
+    "BatchUploadFilesResponse",
+    
+    # Use Cases - Transcodificação de vídeo
+    "TranscodeVideoUseCase",
+    "TranscodeVideoRequest",
+    "TranscodeVideoResponse"
 ]
\ No newline at end of file
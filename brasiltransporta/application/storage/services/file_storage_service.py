@@ -1,10 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator
 from dataclasses import dataclass
 
 from brasiltransporta.infrastructure.external.storage.s3_client import S3Client
 from brasiltransporta.infrastructure.external.storage.file_validator import FileValidator
 from brasiltransporta.infrastructure.external.storage.storage_config import S3Config, FileValidationConfig
+from brasiltransporta.infrastructure.external.storage.url_signing import PresignedUrlCache, CloudFrontUrlSigner
 
 
 @dataclass
@@ -62,6 +63,26 @@ class FileStorageInterface(ABC):
         """Gera URL assinada para um arquivo"""
         pass
     
+    def generate_presigned_urls(
+        self,
+        file_keys: List[str],
+        operation: str = "get_object",
+        expires_in: int = 3600
+    ) -> Dict[str, PresignedUrlResult]:
+        """Gera URLs assinadas para vários arquivos (ex.: todas as fotos de um anúncio)"""
+        return {
+            key: self.generate_presigned_url(key, operation, expires_in)
+            for key in file_keys
+        }
+    
+    def generate_signed_cookies(self, prefix: str, expires_in: int = 3600) -> Optional[Dict[str, str]]:
+        """Gera cookies de CDN que liberam todos os arquivos sob o prefixo (se suportado)"""
+        return None
+    
+    def signed_cookie_domain(self) -> Optional[str]:
+        """Domínio dos cookies de CDN (None: apenas o host da API)"""
+        return None
+    
     @abstractmethod
     def delete_file(self, file_key: str) -> bool:
         """Deleta arquivo do storage"""
@@ -71,16 +92,44 @@ class FileStorageInterface(ABC):
     def get_file_url(self, file_key: str) -> Optional[str]:
         """Obtém URL pública do arquivo"""
         pass
+    
+    @abstractmethod
+    def list_files(self, prefix: str) -> Iterator[Dict[str, Any]]:
+        """Lista arquivos do storage (apenas para jobs de reconciliação)"""
+        pass
+    
+    @abstractmethod
+    def get_file_info(self, file_key: str) -> Optional[Dict[str, Any]]:
+        """Obtém tamanho, content type e metadados de um arquivo"""
+        pass
+    
+    @abstractmethod
+    def download_to_path(self, file_key: str, local_path: str) -> bool:
+        """Baixa um arquivo para o disco local (jobs do worker)"""
+        pass
+    
+    @abstractmethod
+    def upload_from_path(self, local_path: str, file_key: str, content_type: Optional[str] = None) -> bool:
+        """Envia um arquivo gerado localmente (variantes, pôsteres)"""
+        pass
 
 
 class S3FileStorageService(FileStorageInterface):
     """Implementação do serviço de storage usando Amazon S3"""
     
-    def __init__(self, s3_config: S3Config, validation_config: FileValidationConfig = None):
+    def __init__(
+        self,
+        s3_config: S3Config,
+        validation_config: FileValidationConfig = None,
+        url_cache: Optional[PresignedUrlCache] = None,
+        cdn_signer: Optional[CloudFrontUrlSigner] = None
+    ):
         self.s3_client = S3Client(s3_config)
         self.validator = FileValidator(validation_config)
         self.bucket_name = s3_config.bucket_name
         self.region = s3_config.region_name
+        self.url_cache = url_cache
+        self.cdn_signer = cdn_signer
     
     def upload_image(
         self, 
@@ -194,9 +243,13 @@ class S3FileStorageService(FileStorageInterface):
     ) -> PresignedUrlResult:
         """Gera URL assinada para um arquivo"""
         try:
-            url = self.s3_client.generate_presigned_url(
-                file_key, operation, expires_in
-            )
+            if self.url_cache is not None:
+                url = self.url_cache.get_or_create(
+                    file_key, operation, expires_in,
+                    lambda: self._sign(file_key, operation, expires_in)
+                )
+            else:
+                url = self._sign(file_key, operation, expires_in)
             
             if url:
                 return PresignedUrlResult(success=True, url=url)
@@ -212,6 +265,24 @@ class S3FileStorageService(FileStorageInterface):
                 error_message=f"Erro ao gerar URL assinada: {str(e)}"
             )
     
+    def _sign(self, file_key: str, operation: str, expires_in: int) -> Optional[str]:
+        # Downloads saem pelo CDN quando configurado; uploads sempre direto no S3
+        if operation == "get_object" and self.cdn_signer is not None:
+            return self.cdn_signer.generate_signed_url(file_key, expires_in)
+        return self.s3_client.generate_presigned_url(file_key, operation, expires_in)
+    
+    def generate_signed_cookies(self, prefix: str, expires_in: int = 3600) -> Optional[Dict[str, str]]:
+        """Gera cookies do CloudFront para o prefixo (None se o CDN não estiver configurado)"""
+        if self.cdn_signer is None:
+            return None
+        return self.cdn_signer.generate_signed_cookies(prefix, expires_in)
+    
+    def signed_cookie_domain(self) -> Optional[str]:
+        """Domínio pai da API e do CDN, para o navegador enviar os cookies ao CDN"""
+        if self.cdn_signer is None:
+            return None
+        return self.cdn_signer.cookie_domain
+    
     def delete_file(self, file_key: str) -> bool:
         """Deleta arquivo do storage"""
         try:
@@ -227,4 +298,20 @@ class S3FileStorageService(FileStorageInterface):
             # Para S3, a URL pública segue este formato
             return f"https://{self.bucket_name}.s3.{self.region}.amazonaws.com/{file_key}"
         except Exception:
-            return None
\ No newline at end of file
+            return None
+    
+    def list_files(self, prefix: str) -> Iterator[Dict[str, Any]]:
+        """Lista arquivos do bucket (apenas para jobs de reconciliação)"""
+        return self.s3_client.list_keys(prefix)
+    
+    def get_file_info(self, file_key: str) -> Optional[Dict[str, Any]]:
+        """Obtém tamanho, content type e metadados de um arquivo"""
+        return self.s3_client.head_file(file_key)
+    
+    def download_to_path(self, file_key: str, local_path: str) -> bool:
+        """Baixa um arquivo para o disco local (jobs do worker)"""
+        return self.s3_client.download_to_path(file_key, local_path)
+    
+    def upload_from_path(self, local_path: str, file_key: str, content_type: Optional[str] = None) -> bool:
+        """Envia um arquivo gerado localmente (variantes, pôsteres)"""
+        return self.s3_client.upload_path(local_path, file_key, content_type)
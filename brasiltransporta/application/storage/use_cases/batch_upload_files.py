@@ -0,0 +1,120 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from brasiltransporta.application.storage.use_cases.upload_file import (
+    UploadFileUseCase,
+    UploadFileRequest,
+    UploadFileResponse
+)
+from brasiltransporta.infrastructure.external.storage.file_validator import FileValidator
+
+
+@dataclass
+class BatchUploadItem:
+    """Arquivo do lote: já lido e validado, ou com o erro da validação"""
+    filename: str
+    request: Optional[UploadFileRequest] = None
+    error_message: Optional[str] = None
+
+
+@dataclass
+class BatchUploadItemResult:
+    """Resultado do upload de um arquivo do lote"""
+    filename: str
+    success: bool
+    file_url: Optional[str] = None
+    file_key: Optional[str] = None
+    file_size: int = 0
+    error_message: Optional[str] = None
+
+
+@dataclass
+class BatchUploadFilesResponse:
+    """DTO para resposta de upload em lote"""
+    success: bool
+    results: List[BatchUploadItemResult] = field(default_factory=list)
+    error_message: Optional[str] = None
+    
+    @property
+    def uploaded(self) -> int:
+        return sum(1 for r in self.results if r.success)
+    
+    @property
+    def failed(self) -> int:
+        return len(self.results) - self.uploaded
+
+
+class BatchUploadFilesUseCase:
+    """
+    Use Case para upload de vários arquivos de um anúncio em paralelo
+    
+    Os PUTs no S3 rodam em threads limitadas por um semáforo; o registro no
+    índice de mídia acontece depois, na thread do chamador, porque a sessão
+    do banco não é thread-safe.
+    """
+    
+    def __init__(
+        self,
+        upload_use_case: UploadFileUseCase,
+        validator: FileValidator = None,
+        media_repository=None,
+        max_concurrency: int = 4
+    ):
+        self.upload_use_case = upload_use_case
+        self.validator = validator or upload_use_case.validator
+        self.media_repository = media_repository
+        self.max_concurrency = max_concurrency
+    
+    async def execute(self, ad_id: str, file_type: str, items: List[BatchUploadItem]) -> BatchUploadFilesResponse:
+        """
+        Faz upload de um lote de arquivos
+        
+        Args:
+            ad_id: ID do anúncio
+            file_type: 'image' ou 'video'
+            items: Arquivos do lote (itens com erro não são enviados)
+            
+        Returns:
+            BatchUploadFilesResponse: resultado por arquivo (sucesso parcial permitido)
+        """
+        if not items:
+            return BatchUploadFilesResponse(success=False, error_message="Nenhum arquivo enviado")
+        
+        # Limite de quantidade verificado uma única vez para o lote inteiro,
+        # contando só os arquivos que passaram na validação (os demais não são enviados)
+        accepted = sum(1 for item in items if item.request is not None)
+        current = self.media_repository.count_by_ad(ad_id, file_type) if self.media_repository else 0
+        is_valid, message = self.validator.validate_quantity(current + accepted, file_type, "set")
+        if not is_valid:
+            return BatchUploadFilesResponse(success=False, error_message=message)
+        
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def upload(item: BatchUploadItem) -> Optional[UploadFileResponse]:
+            if item.request is None:
+                return None
+            async with semaphore:
+                return await asyncio.to_thread(self.upload_use_case.execute, item.request, False)
+        
+        responses = await asyncio.gather(*(upload(item) for item in items))
+        
+        results = []
+        for item, response in zip(items, responses):
+            if response is None:
+                results.append(BatchUploadItemResult(
+                    filename=item.filename, success=False, error_message=item.error_message
+                ))
+                continue
+            if response.success:
+                self.upload_use_case.index_upload(item.request, response.file_key, response.file_size)
+            results.append(BatchUploadItemResult(
+                filename=item.filename,
+                success=response.success,
+                file_url=response.file_url,
+                file_key=response.file_key,
+                file_size=response.file_size,
+                error_message=response.error_message
+            ))
+        
+        return BatchUploadFilesResponse(success=True, results=results)
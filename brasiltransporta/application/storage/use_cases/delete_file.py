@@ -21,8 +21,10 @@ class DeleteFileResponse:
 class DeleteFileUseCase:
     """Use Case para deleção de arquivos"""
     
-    def __init__(self, file_storage: FileStorageInterface):
+    def __init__(self, file_storage: FileStorageInterface, media_repository=None, media_cache=None):
         self.file_storage = file_storage
+        self.media_repository = media_repository
+        self.media_cache = media_cache
     
     def execute(self, request: DeleteFileRequest) -> DeleteFileResponse:
         """
@@ -45,6 +47,7 @@ class DeleteFileUseCase:
             success = self.file_storage.delete_file(request.file_key)
             
             if success:
+                self._remove_from_index(request.file_key)
                 return DeleteFileResponse(success=True)
             else:
                 return DeleteFileResponse(
@@ -56,4 +59,16 @@ class DeleteFileUseCase:
             return DeleteFileResponse(
                 success=False,
                 error_message=f"Erro inesperado na deleção: {str(e)}"
-            )
\ No newline at end of file
+            )
+    
+    def _remove_from_index(self, file_key: str) -> None:
+        """Remove o arquivo do índice media_assets e invalida o cache do anúncio"""
+        if self.media_repository is None:
+            return
+        
+        asset = self.media_repository.get_by_key(file_key)
+        if asset is None:
+            return
+        self.media_repository.delete_by_key(file_key)
+        if self.media_cache is not None:
+            self.media_cache.invalidate(asset.ad_id)
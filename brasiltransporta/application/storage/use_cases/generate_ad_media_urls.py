@@ -0,0 +1,85 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from brasiltransporta.application.storage.services.file_storage_service import FileStorageInterface
+from brasiltransporta.domain.repositories.media_asset_repository import MediaAssetRepository
+
+
+@dataclass
+class GenerateAdMediaUrlsRequest:
+    """DTO para requisição das URLs assinadas de um anúncio"""
+    ad_id: str
+    expires_in: int = 3600
+    file_type: Optional[str] = None  # 'image', 'video' ou None (todos)
+    include_cookies: bool = False
+
+
+@dataclass
+class SignedMediaUrl:
+    """URL assinada de um arquivo do anúncio"""
+    file_key: str
+    file_type: str
+    url: str
+
+
+@dataclass
+class GenerateAdMediaUrlsResponse:
+    """DTO para resposta das URLs assinadas de um anúncio"""
+    success: bool
+    urls: List[SignedMediaUrl] = field(default_factory=list)
+    cookies: Optional[Dict[str, str]] = None
+    cookie_domain: Optional[str] = None
+    error_message: Optional[str] = None
+
+
+class GenerateAdMediaUrlsUseCase:
+    """Use Case que assina todas as mídias de um anúncio em uma única chamada"""
+    
+    def __init__(self, media_repository: MediaAssetRepository, file_storage: FileStorageInterface):
+        self.media_repository = media_repository
+        self.file_storage = file_storage
+    
+    def execute(self, request: GenerateAdMediaUrlsRequest) -> GenerateAdMediaUrlsResponse:
+        """
+        Gera URLs de download assinadas para as mídias do anúncio
+        
+        As URLs vêm do cache de URLs assinadas quando ainda válidas; com
+        CDN configurado, os cookies liberam o prefixo do anúncio inteiro.
+        """
+        try:
+            if not request.ad_id:
+                return GenerateAdMediaUrlsResponse(
+                    success=False,
+                    error_message="ID do anúncio não informado"
+                )
+            
+            assets = self.media_repository.list_by_ad(request.ad_id, request.file_type)
+            results = self.file_storage.generate_presigned_urls(
+                [asset.key for asset in assets],
+                operation="get_object",
+                expires_in=request.expires_in
+            )
+            
+            urls = [
+                SignedMediaUrl(file_key=asset.key, file_type=asset.file_type, url=results[asset.key].url)
+                for asset in assets
+                if results[asset.key].success
+            ]
+            
+            cookies = None
+            cookie_domain = None
+            if request.include_cookies:
+                cookies = self.file_storage.generate_signed_cookies(
+                    f"ads/{request.ad_id}", request.expires_in
+                )
+                cookie_domain = self.file_storage.signed_cookie_domain()
+            
+            return GenerateAdMediaUrlsResponse(
+                success=True, urls=urls, cookies=cookies, cookie_domain=cookie_domain
+            )
+            
+        except Exception as e:
+            return GenerateAdMediaUrlsResponse(
+                success=False,
+                error_message=f"Erro inesperado na geração de URLs: {str(e)}"
+            )
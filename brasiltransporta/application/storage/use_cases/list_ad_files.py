@@ -0,0 +1,69 @@
+from dataclasses import dataclass, asdict, field
+from typing import Dict, List, Optional
+
+from brasiltransporta.application.storage.services.file_storage_service import FileStorageInterface
+from brasiltransporta.domain.repositories.media_asset_repository import MediaAssetRepository
+
+
+@dataclass
+class AdFileInfo:
+    """DTO com os dados de um arquivo do anúncio"""
+    file_key: str
+    file_url: str
+    file_type: str
+    file_size: int
+    mime_type: Optional[str] = None
+    width: Optional[int] = None
+    height: Optional[int] = None
+    duration: Optional[float] = None
+    variants: Dict[str, str] = field(default_factory=dict)
+    uploaded_at: Optional[str] = None
+
+
+class ListAdFilesUseCase:
+    """Use Case para listagem de arquivos de um anúncio a partir do índice"""
+    
+    def __init__(
+        self,
+        media_repository: MediaAssetRepository,
+        file_storage: FileStorageInterface,
+        media_cache=None
+    ):
+        self.media_repository = media_repository
+        self.file_storage = file_storage
+        self.media_cache = media_cache
+    
+    def execute(self, ad_id: str) -> List[AdFileInfo]:
+        """
+        Lista os arquivos do anúncio sem consultar o S3
+        
+        Args:
+            ad_id: ID do anúncio
+            
+        Returns:
+            List[AdFileInfo]: arquivos ordenados por data de upload
+        """
+        if self.media_cache is not None:
+            cached = self.media_cache.get(ad_id)
+            if cached is not None:
+                return [AdFileInfo(**item) for item in cached]
+        
+        files = [
+            AdFileInfo(
+                file_key=asset.key,
+                file_url=self.file_storage.get_file_url(asset.key),
+                file_type=asset.file_type,
+                file_size=asset.size,
+                mime_type=asset.mime_type,
+                width=asset.width,
+                height=asset.height,
+                duration=asset.duration,
+                variants=asset.variants,
+                uploaded_at=asset.created_at.isoformat() if asset.created_at else None
+            )
+            for asset in self.media_repository.list_by_ad(ad_id)
+        ]
+        
+        if self.media_cache is not None:
+            self.media_cache.set(ad_id, [asdict(f) for f in files])
+        return files
@@ -0,0 +1,94 @@
+import logging
+from dataclasses import dataclass
+from typing import Optional, Set
+
+from brasiltransporta.application.storage.services.file_storage_service import FileStorageInterface
+from brasiltransporta.domain.entities.media_asset import MediaAsset
+from brasiltransporta.domain.repositories.media_asset_repository import MediaAssetRepository
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ReconcileMediaIndexResponse:
+    """DTO com o resultado da reconciliação"""
+    scanned: int = 0
+    added: int = 0
+    removed: int = 0
+    skipped: int = 0
+
+
+class ReconcileMediaIndexUseCase:
+    """
+    Use Case que mantém a tabela media_assets consistente com o S3
+    
+    Executado periodicamente (fora do caminho da requisição): insere no
+    índice objetos que existem no bucket mas não foram indexados (ex.:
+    falha após o upload) e remove registros cujo objeto não existe mais.
+    """
+    
+    def __init__(
+        self,
+        file_storage: FileStorageInterface,
+        media_repository: MediaAssetRepository,
+        media_cache=None,
+        prefix: str = "ads/"
+    ):
+        self.file_storage = file_storage
+        self.media_repository = media_repository
+        self.media_cache = media_cache
+        self.prefix = prefix
+    
+    def execute(self) -> ReconcileMediaIndexResponse:
+        result = ReconcileMediaIndexResponse()
+        touched_ads: Set[str] = set()
+        
+        indexed = set(self.media_repository.iter_keys())
+        in_storage: Set[str] = set()
+        
+        for obj in self.file_storage.list_files(self.prefix):
+            key = obj["key"]
+            result.scanned += 1
+            in_storage.add(key)
+            if key in indexed:
+                continue
+            
+            asset = self._asset_from_storage(key, obj.get("size", 0))
+            if asset is None:
+                result.skipped += 1
+                continue
+            self.media_repository.save(asset)
+            touched_ads.add(asset.ad_id)
+            result.added += 1
+        
+        for key in indexed - in_storage:
+            asset = self.media_repository.get_by_key(key)
+            if asset is not None and self.media_repository.delete_by_key(key):
+                touched_ads.add(asset.ad_id)
+                result.removed += 1
+        
+        if self.media_cache is not None:
+            for ad_id in touched_ads:
+                self.media_cache.invalidate(ad_id)
+        
+        logger.info(
+            f"Reconciliação de mídia: {result.scanned} no S3, "
+            f"{result.added} adicionados, {result.removed} removidos"
+        )
+        return result
+    
+    def _asset_from_storage(self, key: str, size: int) -> Optional[MediaAsset]:
+        # Layout das chaves: ads/{ad_id}/{images|videos}/{arquivo}
+        parts = key.split("/")
+        if len(parts) != 4 or parts[2] not in ("images", "videos"):
+            return None
+        
+        info = self.file_storage.get_file_info(key) or {}
+        return MediaAsset.create(
+            key=key,
+            ad_id=parts[1],
+            file_type="image" if parts[2] == "images" else "video",
+            mime_type=info.get("content_type") or "application/octet-stream",
+            size=info.get("size", size)
+        )
@@ -0,0 +1,141 @@
+import logging
+import os
+import posixpath
+import tempfile
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from brasiltransporta.application.storage.services.file_storage_service import FileStorageInterface
+from brasiltransporta.domain.repositories.media_asset_repository import MediaAssetRepository
+from brasiltransporta.infrastructure.external.media.ffmpeg_transcoder import (
+    FFmpegTranscoder,
+    Rendition,
+    TranscodeError,
+    select_renditions
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TranscodeVideoRequest:
+    """DTO para requisição de transcodificação"""
+    file_key: str
+    job_id: Optional[str] = None
+
+
+@dataclass
+class TranscodeVideoResponse:
+    """DTO para resposta de transcodificação"""
+    success: bool
+    variants: Dict[str, str] = field(default_factory=dict)
+    duration: Optional[float] = None
+    error_message: Optional[str] = None
+
+
+class TranscodeVideoUseCase:
+    """
+    Use Case que gera as versões MP4 (H.264/H.265, faststart) e o pôster de um vídeo
+
+    Executado pelo worker. As variantes ficam em
+    ads/{ad_id}/videos/renditions/ e ads/{ad_id}/videos/posters/, e são
+    registradas no índice media_assets junto com duração e dimensões.
+    """
+
+    def __init__(
+        self,
+        media_repository: MediaAssetRepository,
+        file_storage: FileStorageInterface,
+        transcoder: FFmpegTranscoder,
+        progress_store=None,
+        media_cache=None,
+        ladder: Optional[List[Rendition]] = None,
+        work_dir: Optional[str] = None
+    ):
+        self.media_repository = media_repository
+        self.file_storage = file_storage
+        self.transcoder = transcoder
+        self.progress_store = progress_store
+        self.media_cache = media_cache
+        self.ladder = ladder
+        self.work_dir = work_dir
+
+    def execute(self, request: TranscodeVideoRequest) -> TranscodeVideoResponse:
+        asset = self.media_repository.get_by_key(request.file_key)
+        if asset is None or asset.file_type != "video":
+            return self._fail(request.job_id, f"Vídeo não encontrado no índice: {request.file_key}")
+
+        self._start(request.job_id, "download")
+        directory, filename = posixpath.split(asset.key)
+        stem = posixpath.splitext(filename)[0]
+
+        try:
+            with tempfile.TemporaryDirectory(dir=self.work_dir) as tmp:
+                source = os.path.join(tmp, "source" + posixpath.splitext(filename)[1])
+                if not self.file_storage.download_to_path(asset.key, source):
+                    return self._fail(request.job_id, "Falha ao baixar o vídeo original")
+
+                probe = self.transcoder.probe(source)
+                renditions = select_renditions(probe.height, self.ladder)
+                steps = len(renditions) + 1  # + pôster
+
+                for index, rendition in enumerate(renditions):
+                    output = os.path.join(tmp, f"{rendition.name}.mp4")
+                    self.transcoder.transcode(
+                        source, output, rendition, probe.duration,
+                        on_progress=self._progress_callback(request.job_id, index, steps, rendition.name)
+                    )
+                    variant_key = f"{directory}/renditions/{stem}_{rendition.name}.mp4"
+                    self._upload(output, variant_key, "video/mp4")
+                    asset.add_variant(rendition.name, variant_key)
+
+                self._update(request.job_id, (steps - 1) / steps, "poster")
+                poster = os.path.join(tmp, "poster.jpg")
+                self.transcoder.extract_poster(source, poster, at_seconds=min(1.0, probe.duration / 2))
+                poster_key = f"{directory}/posters/{stem}.jpg"
+                self._upload(poster, poster_key, "image/jpeg")
+                asset.add_variant("poster", poster_key)
+        except TranscodeError as e:
+            logger.error(f"Falha ao transcodificar {asset.key}: {str(e)}")
+            return self._fail(request.job_id, str(e))
+
+        asset.duration = probe.duration
+        asset.width = probe.width
+        asset.height = probe.height
+        self.media_repository.save(asset)
+        if self.media_cache is not None:
+            self.media_cache.invalidate(asset.ad_id)
+
+        if self.progress_store is not None and request.job_id:
+            self.progress_store.complete(request.job_id, {"variants": asset.variants, "duration": asset.duration})
+        return TranscodeVideoResponse(success=True, variants=dict(asset.variants), duration=asset.duration)
+
+    def _upload(self, local_path: str, file_key: str, content_type: str) -> None:
+        if not self.file_storage.upload_from_path(local_path, file_key, content_type):
+            raise TranscodeError(f"Falha ao enviar {file_key} para o storage")
+
+    def _progress_callback(self, job_id: Optional[str], index: int, steps: int, stage: str):
+        last = [-1.0]
+
+        def on_progress(fraction: float) -> None:
+            percent = (index + fraction) / steps * 100
+            # Evita uma escrita no Redis a cada linha do ffmpeg
+            if percent - last[0] >= 1:
+                last[0] = percent
+                self._update(job_id, percent / 100, stage)
+
+        return on_progress
+
+    def _start(self, job_id: Optional[str], stage: str) -> None:
+        if self.progress_store is not None and job_id:
+            self.progress_store.start(job_id, stage)
+
+    def _update(self, job_id: Optional[str], fraction: float, stage: str) -> None:
+        if self.progress_store is not None and job_id:
+            self.progress_store.update(job_id, fraction * 100, stage)
+
+    def _fail(self, job_id: Optional[str], message: str) -> TranscodeVideoResponse:
+        if self.progress_store is not None and job_id:
+            self.progress_store.fail(job_id, message)
+        return TranscodeVideoResponse(success=False, error_message=message)
@@ -1,3 +1,5 @@
+import hashlib
+import logging
 from typing import Dict, Any, Optional
 from dataclasses import dataclass
 
@@ -5,7 +7,12 @@ from brasiltransporta.application.storage.services.file_storage_service import (
     FileStorageInterface, 
     UploadResult
 )
-from brasiltransporta.infrastructure.external.storage.file_validator import FileValidator
+from brasiltransporta.domain.entities.media_asset import MediaAsset
+from brasiltransporta.infrastructure.external.storage.file_validator import FileValidator, FileValidationError
+from brasiltransporta.infrastructure.external.storage.media_probe import MediaInfo
+
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -17,6 +24,7 @@ class UploadFileRequest:
     ad_id: str
     file_type: str  # 'image' ou 'video'
     metadata: Optional[Dict[str, str]] = None
+    media_info: Optional[MediaInfo] = None  # já lido pelo validador de stream
 
 
 @dataclass  
@@ -27,21 +35,34 @@ class UploadFileResponse:
     file_key: Optional[str] = None
     error_message: Optional[str] = None
     file_size: int = 0
+    job_id: Optional[str] = None  # transcodificação agendada (vídeos)
 
 
 class UploadFileUseCase:
     """Use Case para upload de arquivos"""
     
-    def __init__(self, file_storage: FileStorageInterface, validator: FileValidator = None):
+    def __init__(
+        self,
+        file_storage: FileStorageInterface,
+        validator: FileValidator = None,
+        media_repository=None,
+        media_cache=None,
+        media_jobs=None
+    ):
         self.file_storage = file_storage
         self.validator = validator or FileValidator()
+        self.media_repository = media_repository
+        self.media_cache = media_cache
+        self.media_jobs = media_jobs
     
-    def execute(self, request: UploadFileRequest) -> UploadFileResponse:
+    def execute(self, request: UploadFileRequest, index: bool = True) -> UploadFileResponse:
         """
         Executa o upload de um arquivo
         
         Args:
             request: Dados do arquivo para upload
+            index: Se False, o chamador registra o arquivo com `index_upload`
+                (usado no upload em lote, onde o upload roda em threads)
             
         Returns:
             UploadFileResponse: Resultado do upload
@@ -89,17 +110,70 @@ class UploadFileUseCase:
                     error_message=f"Tipo de arquivo inválido: {request.file_type}"
                 )
             
+            job_id = None
+            if result.success and index:
+                job_id = self.index_upload(request, result.file_key, result.file_size)
+            
             # Converte o resultado
             return UploadFileResponse(
                 success=result.success,
                 file_url=result.file_url,
                 file_key=result.file_key,
                 error_message=result.error_message,
-                file_size=result.file_size
+                file_size=result.file_size,
+                job_id=job_id
             )
             
         except Exception as e:
             return UploadFileResponse(
                 success=False,
                 error_message=f"Erro inesperado no upload: {str(e)}"
-            )
\ No newline at end of file
+            )
+    
+    def index_upload(self, request: UploadFileRequest, file_key: str, file_size: int) -> Optional[str]:
+        """
+        Registra o arquivo no índice media_assets e invalida o cache do anúncio
+        
+        Returns:
+            str: ID do job de transcodificação agendado (vídeos), se houver
+        """
+        if self.media_repository is None:
+            return None
+        
+        try:
+            info = request.media_info
+            if info is None:
+                info = self.validator.inspect(
+                    [request.file_content], request.file_type, request.filename, request.mime_type
+                )
+        except FileValidationError:
+            info = None
+        
+        try:
+            asset = MediaAsset.create(
+                key=file_key,
+                ad_id=request.ad_id,
+                file_type=request.file_type,
+                mime_type=info.mime_type if info else request.mime_type,
+                size=file_size,
+                width=info.width if info else None,
+                height=info.height if info else None,
+                duration=info.duration if info else None,
+                content_hash=hashlib.sha256(request.file_content).hexdigest()
+            )
+            self.media_repository.save(asset)
+        except Exception as e:
+            # O job de reconciliação corrige o índice a partir do S3
+            logger.error(f"Falha ao indexar {file_key}: {str(e)}")
+            asset = None
+        
+        if self.media_cache is not None:
+            self.media_cache.invalidate(request.ad_id)
+        
+        if asset is None or asset.file_type != "video" or self.media_jobs is None:
+            return None
+        try:
+            return self.media_jobs.enqueue_transcode(file_key, request.ad_id)
+        except Exception as e:
+            logger.error(f"Falha ao agendar transcodificação de {file_key}: {str(e)}")
+            return None
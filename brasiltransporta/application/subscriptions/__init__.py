@@ -0,0 +1,19 @@
+"""
+Assinaturas de planos e cotas (anúncios e destaques) da camada de aplicação
+"""
+
+from brasiltransporta.application.subscriptions.services.entitlements import (
+    QuotaCheck,
+    QuotaCounter,
+    QuotaCounterUnavailable,
+    EntitlementService,
+    free_plan_limits
+)
+
+__all__ = [
+    "QuotaCheck",
+    "QuotaCounter",
+    "QuotaCounterUnavailable",
+    "EntitlementService",
+    "free_plan_limits"
+]
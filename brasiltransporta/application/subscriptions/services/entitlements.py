@@ -0,0 +1,161 @@
+# brasiltransporta/application/subscriptions/services/entitlements.py
+"""
+Cotas do plano (anúncios e destaques) verificadas em uma chamada ao Redis
+
+O uso de cada loja fica em um contador no Redis, verificado e
+incrementado atomicamente. Sem o contador (primeiro acesso ou chave
+expirada), o uso é contado no Postgres uma vez e carregado no Redis. A
+conciliação periódica regrava os contadores a partir do banco, corrigindo
+desvios (anúncios vendidos, expirados ou excluídos não liberam a vaga na
+hora).
+
+Loja sem assinatura ativa usa os limites do plano gratuito
+(`default_limits`, SUBSCRIPTIONS_FREE_*); -1 libera o recurso sem limite.
+"""
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, Optional, Protocol
+
+from brasiltransporta.domain.entities.subscription import QuotaResource, Subscription
+from brasiltransporta.domain.errors.errors import QuotaExceededError
+from brasiltransporta.domain.repositories.subscription_repository import SubscriptionRepository
+
+logger = logging.getLogger(__name__)
+
+
+class QuotaCounterUnavailable(Exception):
+    """Contador fora do ar; a verificação cai para a contagem no banco"""
+
+
+@dataclass(frozen=True)
+class QuotaCheck:
+    """
+    Resultado de uma tentativa de uso
+
+    `allowed` None indica que a loja não está no cache (precisa carregar).
+    """
+    allowed: Optional[bool]
+    used: int = 0
+    limit: int = 0
+
+
+class QuotaCounter(Protocol):
+    def try_acquire(self, store_id: str, resource: QuotaResource, amount: int = 1) -> QuotaCheck: ...
+    def release(self, store_id: str, resource: QuotaResource, amount: int = 1) -> None: ...
+    def prime(self, store_id: str, limits: Dict[QuotaResource, int], usage: Dict[QuotaResource, int],
+              overwrite: bool = False) -> bool: ...
+    def invalidate(self, store_id: str) -> None: ...
+
+
+RESOURCE_LABELS = {
+    QuotaResource.ADS: "anúncios",
+    QuotaResource.FEATURED: "anúncios em destaque",
+}
+
+
+def free_plan_limits(max_ads: int, max_featured_ads: int) -> Dict[QuotaResource, int]:
+    """Limites do plano gratuito a partir da configuração (SubscriptionSettings)"""
+    return {QuotaResource.ADS: max_ads, QuotaResource.FEATURED: max_featured_ads}
+
+
+class EntitlementService:
+    """Verifica e consome as cotas da assinatura ativa de uma loja"""
+
+    def __init__(
+        self,
+        subscriptions: SubscriptionRepository,
+        counter: QuotaCounter,
+        clock: Callable[[], datetime] = datetime.utcnow,
+        default_limits: Optional[Dict[QuotaResource, int]] = None,
+    ):
+        self._subscriptions = subscriptions
+        self._counter = counter
+        self._clock = clock
+        # Plano gratuito; sem configuração, nenhum recurso (exige assinatura)
+        self._default_limits = {resource: (default_limits or {}).get(resource, 0) for resource in QuotaResource}
+
+    def acquire(self, store_id: str, resource: QuotaResource) -> int:
+        """
+        Consome uma unidade da cota
+
+        Returns:
+            int: uso após o consumo
+
+        Raises:
+            QuotaExceededError: limite atingido ou loja sem assinatura ativa
+        """
+        try:
+            check = self._counter.try_acquire(store_id, resource)
+            if check.allowed is None:
+                self._load(store_id)
+                check = self._counter.try_acquire(store_id, resource)
+        except QuotaCounterUnavailable as e:
+            logger.warning(f"Contador de cotas indisponível, contando no banco: {str(e)}")
+            check = self._check_in_database(store_id, resource)
+
+        if not check.allowed:
+            raise self._exceeded(resource, check.limit)
+        return check.used
+
+    def release(self, store_id: str, resource: QuotaResource) -> None:
+        """Devolve uma unidade (anúncio não criado, destaque removido)"""
+        try:
+            self._counter.release(store_id, resource)
+        except QuotaCounterUnavailable as e:
+            # A conciliação corrige o contador
+            logger.warning(f"Não foi possível liberar cota de {store_id}: {str(e)}")
+
+    def reconcile(self, batch_size: int = 500) -> int:
+        """
+        Regrava os contadores das lojas com assinatura ativa a partir do banco
+
+        Returns:
+            int: lojas conciliadas
+        """
+        now = self._clock()
+        reconciled, after_id = 0, None
+        while True:
+            subscriptions = self._subscriptions.list_active(now, limit=batch_size, after_id=after_id)
+            if not subscriptions:
+                break
+            usage = self._subscriptions.count_usage([s.store_id for s in subscriptions])
+            for subscription in subscriptions:
+                self._counter.prime(
+                    subscription.store_id,
+                    subscription.limits(),
+                    usage.get(subscription.store_id, {}),
+                    overwrite=True,
+                )
+            reconciled += len(subscriptions)
+            after_id = subscriptions[-1].id
+            if len(subscriptions) < batch_size:
+                break
+        return reconciled
+
+    def _load(self, store_id: str) -> None:
+        subscription = self._subscriptions.get_active_by_store(store_id, self._clock())
+        limits = self._limits(subscription)
+        usage = self._subscriptions.count_usage([store_id]).get(store_id, {})
+        # Não sobrescreve: outra requisição pode ter carregado e consumido antes
+        self._counter.prime(store_id, limits, usage, overwrite=False)
+
+    def _check_in_database(self, store_id: str, resource: QuotaResource) -> QuotaCheck:
+        subscription = self._subscriptions.get_active_by_store(store_id, self._clock())
+        limit = self._limits(subscription)[resource]
+        used = self._subscriptions.count_usage([store_id]).get(store_id, {}).get(resource, 0)
+        return QuotaCheck(allowed=limit < 0 or used < limit, used=used + 1, limit=limit)
+
+    def _limits(self, subscription: Optional[Subscription]) -> Dict[QuotaResource, int]:
+        # Sem assinatura ativa: limites do plano gratuito
+        if subscription is None:
+            return dict(self._default_limits)
+        return subscription.limits()
+
+    @staticmethod
+    def _exceeded(resource: QuotaResource, limit: int) -> QuotaExceededError:
+        if limit == 0:
+            message = f"Plano sem direito a {RESOURCE_LABELS[resource]}; contrate uma assinatura que inclua o recurso"
+        else:
+            message = f"Limite de {limit} {RESOURCE_LABELS[resource]} do plano atingido"
+        return QuotaExceededError(message, resource=resource.value, limit=limit)
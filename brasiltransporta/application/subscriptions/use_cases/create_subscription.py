@@ -0,0 +1,46 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from brasiltransporta.domain.entities.subscription import Subscription
+from brasiltransporta.domain.errors.errors import ValidationError
+
+
+@dataclass(frozen=True)
+class CreateSubscriptionInput:
+    store_id: str
+    user_id: str
+    plan_id: str
+
+
+@dataclass(frozen=True)
+class CreateSubscriptionOutput:
+    subscription_id: str
+    ends_at: datetime
+
+
+class CreateSubscriptionUseCase:
+    """
+    Contrata um plano para a loja
+
+    A assinatura ativa anterior é cancelada e o contador de cotas da loja
+    é descartado, para ser recarregado com os novos limites.
+    """
+    def __init__(self, subscription_repo, plan_repo, quota_counter) -> None:
+        self._subscriptions = subscription_repo
+        self._plans = plan_repo
+        self._counter = quota_counter
+
+    def execute(self, inp: CreateSubscriptionInput) -> CreateSubscriptionOutput:
+        plan = self._plans.get_by_id(inp.plan_id)
+        if plan is None:
+            raise ValidationError("Plano não encontrado ou inativo")
+
+        current = self._subscriptions.get_active_by_store(inp.store_id, datetime.utcnow())
+        if current is not None:
+            current.cancel()
+            self._subscriptions.update(current)
+
+        subscription = Subscription.create(inp.store_id, inp.user_id, plan)
+        self._subscriptions.add(subscription)
+        self._counter.invalidate(inp.store_id)
+        return CreateSubscriptionOutput(subscription_id=subscription.id, ends_at=subscription.ends_at)
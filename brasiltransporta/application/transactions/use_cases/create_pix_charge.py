@@ -0,0 +1,51 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from brasiltransporta.domain.entities.transaction import PaymentMethod, TransactionStatus
+from brasiltransporta.domain.errors.errors import ValidationError
+
+
+@dataclass(frozen=True)
+class PixChargeOutput:
+    transaction_id: str
+    txid: str
+    brcode: str  # PIX "copia e cola"
+    amount: float
+    qr_code_svg: Optional[str] = None
+
+
+class CreatePixChargeUseCase:
+    """
+    Gera a cobrança PIX (BR Code + QR) de uma transação pendente
+
+    Repetir a chamada devolve o mesmo BR Code: o payload fica salvo no
+    metadata da transação e o txid é derivado do id da transação.
+    """
+    def __init__(self, transaction_repo, pix_gateway) -> None:
+        self._repo = transaction_repo
+        self._gateway = pix_gateway
+
+    async def execute(self, transaction_id: str, description: str = "BrasilTransporta") -> Optional[PixChargeOutput]:
+        tx = self._repo.get_by_id(transaction_id)
+        if tx is None:
+            return None
+        if tx.payment_method != PaymentMethod.PIX:
+            raise ValidationError("Transação não é PIX")
+        if tx.status != TransactionStatus.PENDING:
+            raise ValidationError("Transação não está pendente")
+
+        payment = await self._gateway.create_payment(tx, description)
+        metadata = dict(tx.metadata or {})
+        if tx.external_payment_id != payment.external_id or metadata.get("pix_brcode") != payment.client_data["brcode"]:
+            metadata["pix_brcode"] = payment.client_data["brcode"]
+            tx.metadata = metadata
+            tx.attach_payment(self._gateway.name, payment.external_id)
+            self._repo.update(tx)
+
+        return PixChargeOutput(
+            transaction_id=tx.id,
+            txid=payment.external_id,
+            brcode=payment.client_data["brcode"],
+            amount=float(tx.amount.amount),
+            qr_code_svg=payment.client_data.get("qr_code_svg"),
+        )
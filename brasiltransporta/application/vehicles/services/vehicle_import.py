@@ -0,0 +1,190 @@
+# brasiltransporta/application/vehicles/services/vehicle_import.py
+"""
+Leitura e validação das linhas de uma importação de estoque (CSV ou JSON lines)
+
+O arquivo é lido em streaming, linha a linha, sem carregá-lo inteiro na
+memória. Cada linha passa pelas regras de `Vehicle.create` e pelos enums
+de marca, tipo e condição; valores podem vir pelo valor do enum
+("mercedes_benz") ou pelo nome ("Mercedes-Benz").
+"""
+import csv
+import io
+import itertools
+import json
+import re
+from dataclasses import dataclass
+from decimal import Decimal, InvalidOperation
+from enum import Enum
+from typing import Any, BinaryIO, Dict, Iterator, Optional, Type
+
+from brasiltransporta.application.vehicles.use_cases.create_vehicle import PLATE_RE
+from brasiltransporta.domain.entities.enums import ImplementSegment, VehicleBrand, VehicleCondition, VehicleType
+from brasiltransporta.domain.entities.vehicle import Vehicle
+from brasiltransporta.domain.errors.errors import ValidationError
+
+CSV_FORMAT = "csv"
+NDJSON_FORMAT = "ndjson"
+
+REQUIRED_FIELDS = ("brand", "model", "year", "plate", "vehicle_type", "condition", "price")
+
+_EXTENSIONS = {
+    ".csv": CSV_FORMAT,
+    ".jsonl": NDJSON_FORMAT,
+    ".ndjson": NDJSON_FORMAT,
+}
+# "450.000" / "1.250.000": ponto seguido de exatamente três dígitos é milhar
+_THOUSANDS_RE = re.compile(r"\d{1,3}(\.\d{3})+")
+
+_CONTENT_TYPES = {
+    "text/csv": CSV_FORMAT,
+    "application/csv": CSV_FORMAT,
+    "application/x-ndjson": NDJSON_FORMAT,
+    "application/jsonl": NDJSON_FORMAT,
+}
+
+
+@dataclass(frozen=True)
+class ImportRow:
+    """Linha lida do arquivo; `error` preenchido quando não pôde ser interpretada"""
+    line: int
+    data: Dict[str, Any]
+    error: Optional[str] = None
+
+
+def detect_format(filename: Optional[str], content_type: Optional[str] = None) -> str:
+    """Formato pela extensão do arquivo ou, na falta dela, pelo content type"""
+    name = (filename or "").lower()
+    for extension, fmt in _EXTENSIONS.items():
+        if name.endswith(extension):
+            return fmt
+    fmt = _CONTENT_TYPES.get((content_type or "").split(";")[0].strip().lower())
+    if fmt is None:
+        raise ValidationError("Formato não suportado. Envie um arquivo .csv ou .jsonl")
+    return fmt
+
+
+def read_rows(stream: BinaryIO, fmt: str) -> Iterator[ImportRow]:
+    """Gera as linhas do arquivo sem carregá-lo inteiro"""
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    if fmt == CSV_FORMAT:
+        yield from _read_csv(text)
+    else:
+        yield from _read_ndjson(text)
+
+
+def _read_csv(text: io.TextIOBase) -> Iterator[ImportRow]:
+    header = text.readline()
+    if not header:
+        return
+    # Planilhas exportadas em pt-BR costumam usar ';'
+    delimiter = ";" if header.count(";") > header.count(",") else ","
+    reader = csv.DictReader(itertools.chain([header], text), delimiter=delimiter)
+    reader.fieldnames = [(name or "").strip().lower() for name in reader.fieldnames or []]
+    for record in reader:
+        if not any((value or "").strip() for value in record.values() if isinstance(value, str)):
+            continue
+        yield ImportRow(line=reader.line_num, data={k: v for k, v in record.items() if k})
+
+
+def _read_ndjson(text: io.TextIOBase) -> Iterator[ImportRow]:
+    for number, raw in enumerate(text, start=1):
+        if not raw.strip():
+            continue
+        try:
+            data = json.loads(raw)
+        except ValueError:
+            yield ImportRow(line=number, data={}, error="JSON inválido")
+            continue
+        if not isinstance(data, dict):
+            yield ImportRow(line=number, data={}, error="Cada linha deve ser um objeto JSON")
+            continue
+        yield ImportRow(line=number, data={str(k).strip().lower(): v for k, v in data.items()})
+
+
+def normalize_plate(value: Any) -> str:
+    return str(value or "").upper().replace("-", "").replace(" ", "")
+
+
+def build_vehicle(store_id: str, data: Dict[str, Any]) -> Vehicle:
+    """
+    Cria o Vehicle de uma linha
+
+    Raises:
+        ValueError: linha inválida (mensagem vai para o relatório)
+    """
+    missing = [name for name in REQUIRED_FIELDS if _blank(data.get(name))]
+    if missing:
+        raise ValueError(f"Campos obrigatórios ausentes: {', '.join(missing)}")
+
+    plate = normalize_plate(data["plate"])
+    if not PLATE_RE.match(plate):
+        raise ValueError("Placa inválida. Use formato Mercosul: ABC1D23")
+
+    segment = data.get("implement_segment")
+    return Vehicle.create(
+        store_id=store_id,
+        brand=_parse_enum(VehicleBrand, data["brand"], "brand"),
+        model=str(data["model"]),
+        year=_parse_int(data["year"], "year"),
+        plate=plate,
+        vehicle_type=_parse_enum(VehicleType, data["vehicle_type"], "vehicle_type"),
+        condition=_parse_enum(VehicleCondition, data["condition"], "condition"),
+        price=_parse_decimal(data["price"], "price"),
+        implement_segment=None if _blank(segment) else _parse_enum(ImplementSegment, segment, "implement_segment"),
+        description=_optional_str(data.get("description")),
+        mileage=_parse_mileage(data.get("mileage")),
+        color=_optional_str(data.get("color")),
+        engine_power=_optional_str(data.get("engine_power")),
+        axle_configuration=_optional_str(data.get("axle_configuration")),
+    )
+
+
+def _blank(value: Any) -> bool:
+    return value is None or (isinstance(value, str) and not value.strip())
+
+
+def _optional_str(value: Any) -> Optional[str]:
+    return None if _blank(value) else str(value).strip()
+
+
+def _parse_enum(enum_cls: Type[Enum], value: Any, field: str) -> Enum:
+    key = str(value).strip().lower().replace("-", "_").replace(" ", "_")
+    for member in enum_cls:
+        if key in (member.value, member.name.lower()):
+            return member
+    raise ValueError(f"Valor inválido para {field}: {value}")
+
+
+def _parse_int(value: Any, field: str) -> int:
+    try:
+        return int(str(value).strip())
+    except ValueError:
+        raise ValueError(f"Valor inválido para {field}: {value}") from None
+
+
+def _parse_decimal(value: Any, field: str) -> Decimal:
+    if isinstance(value, (int, float)):
+        return Decimal(str(value))
+    text = str(value).strip().replace("R$", "").replace(" ", "")
+    if "," in text and "." in text and text.rfind(".") > text.rfind(","):
+        # Formato americano: 450,000.00
+        text = text.replace(",", "")
+    elif "," in text:
+        # Formato brasileiro: 450.000,00
+        text = text.replace(".", "").replace(",", ".")
+    elif _THOUSANDS_RE.fullmatch(text):
+        # Só o separador de milhar: 450.000
+        text = text.replace(".", "")
+    try:
+        return Decimal(text)
+    except InvalidOperation:
+        raise ValueError(f"Valor inválido para {field}: {value}") from None
+
+
+def _parse_mileage(value: Any) -> Optional[int]:
+    if _blank(value):
+        return None
+    mileage = _parse_int(value, "mileage")
+    if mileage < 0:
+        raise ValueError("Mileage cannot be negative")
+    return mileage
@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+from typing import List, Optional
+
+from brasiltransporta.application.service.batch import ordered_results
+from brasiltransporta.domain.entities.vehicle import Vehicle
+
+
+@dataclass(frozen=True)
+class BatchGetVehicleItem:
+    id: str
+    found: bool
+    vehicle: Optional[Vehicle] = None
+
+
+class BatchGetVehiclesUseCase:
+    def __init__(self, vehicle_repo) -> None:
+        self._repo = vehicle_repo
+
+    async def execute(self, vehicle_ids: List[str]) -> List[BatchGetVehicleItem]:
+        found = await self._repo.get_many(vehicle_ids)
+        return [
+            BatchGetVehicleItem(id=requested, found=vehicle is not None, vehicle=vehicle)
+            for requested, vehicle in ordered_results(vehicle_ids, found)
+        ]
@@ -0,0 +1,130 @@
+# application/vehicles/use_cases/import_vehicles.py
+import uuid
+from dataclasses import dataclass, field
+from decimal import InvalidOperation
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from brasiltransporta.application.vehicles.services.vehicle_import import ImportRow, build_vehicle, normalize_plate
+from brasiltransporta.domain.entities.vehicle import Vehicle
+from brasiltransporta.domain.errors.errors import ValidationError
+
+# Linhas por INSERT: 2000 x 15 colunas fica abaixo do limite de 65535 parâmetros
+IMPORT_BATCH_SIZE = 2000
+# Erros guardados no relatório (o total continua sendo contado)
+MAX_REPORTED_ERRORS = 1000
+
+
+@dataclass(frozen=True)
+class RowError:
+    line: int
+    message: str
+    plate: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"line": self.line, "plate": self.plate, "message": self.message}
+
+
+@dataclass
+class ImportVehiclesReport:
+    total: int = 0
+    inserted: int = 0
+    duplicates: int = 0
+    invalid: int = 0
+    errors: List[RowError] = field(default_factory=list)
+    errors_truncated: bool = False
+
+    def add_error(self, error: RowError) -> None:
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(error)
+        else:
+            self.errors_truncated = True
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "total": self.total,
+            "inserted": self.inserted,
+            "duplicates": self.duplicates,
+            "invalid": self.invalid,
+            "errors": [e.to_dict() for e in self.errors],
+            "errors_truncated": self.errors_truncated,
+        }
+
+
+class ImportVehiclesUseCase:
+    """
+    Importa o estoque de uma loja a partir das linhas de um arquivo
+
+    Linhas válidas são gravadas em lotes com uma única instrução
+    (INSERT ... ON CONFLICT (plate) DO NOTHING). Placas repetidas no
+    arquivo ou já cadastradas não interrompem a importação: entram no
+    relatório junto com as linhas inválidas.
+
+    A loja é conferida antes da primeira linha: um `store_id` inválido ou
+    inexistente falha a importação inteira, em vez de virar erro de chave
+    estrangeira em cada lote.
+    """
+    def __init__(self, vehicle_repo, store_repo=None, batch_size: int = IMPORT_BATCH_SIZE) -> None:
+        self._repo = vehicle_repo
+        self._stores = store_repo
+        self._batch_size = batch_size
+
+    async def execute(
+        self,
+        store_id: str,
+        rows: Iterable[ImportRow],
+        on_batch: Optional[Callable[[ImportVehiclesReport], None]] = None,
+    ) -> ImportVehiclesReport:
+        """
+        Raises:
+            ValidationError: `store_id` inválido ou loja inexistente
+        """
+        await self._check_store(store_id)
+        report = ImportVehiclesReport()
+        seen: Set[str] = set()
+        batch: List[Tuple[int, Vehicle]] = []
+
+        for row in rows:
+            report.total += 1
+            if row.error:
+                report.invalid += 1
+                report.add_error(RowError(row.line, row.error))
+                continue
+            try:
+                vehicle = build_vehicle(store_id, row.data)
+            except (ValueError, InvalidOperation) as e:
+                report.invalid += 1
+                report.add_error(RowError(row.line, str(e), normalize_plate(row.data.get("plate")) or None))
+                continue
+
+            if vehicle.plate in seen:
+                report.duplicates += 1
+                report.add_error(RowError(row.line, "Placa repetida no arquivo", vehicle.plate))
+                continue
+            seen.add(vehicle.plate)
+            batch.append((row.line, vehicle))
+
+            if len(batch) >= self._batch_size:
+                await self._flush(batch, report)
+                batch = []
+                if on_batch:
+                    on_batch(report)
+
+        if batch:
+            await self._flush(batch, report)
+        return report
+
+    async def _check_store(self, store_id: str) -> None:
+        try:
+            store_uuid = uuid.UUID(str(store_id))
+        except ValueError:
+            raise ValidationError(f"store_id inválido: {store_id}") from None
+        if self._stores is not None and await self._stores.get_by_id(store_uuid) is None:
+            raise ValidationError(f"Loja {store_id} não encontrada")
+
+    async def _flush(self, batch: List[Tuple[int, Vehicle]], report: ImportVehiclesReport) -> None:
+        inserted = set(await self._repo.bulk_insert([vehicle for _, vehicle in batch]))
+        report.inserted += len(inserted)
+        for line, vehicle in batch:
+            if vehicle.plate not in inserted:
+                report.duplicates += 1
+                report.add_error(RowError(line, "Placa já cadastrada", vehicle.plate))
@@ -1,9 +1,13 @@
 import uuid
-from typing import List
+from typing import Any, Dict, List, Sequence
 
 class ListVehiclesByStoreUseCase:
-    def __init__(self, vehicle_repo) -> None:
-        self._repo = vehicle_repo
+    """Estoque da loja só com os campos pedidos (projeção, sem entidades)"""
 
-    def execute(self, store_id: uuid.UUID, *, limit: int = 50, offset: int = 0):
-        return self._repo.list_by_store(store_id, limit=limit, offset=offset)
+    def __init__(self, catalog_queries) -> None:
+        self._queries = catalog_queries
+
+    def execute(
+        self, store_id: uuid.UUID, fields: Sequence[str], *, limit: int = 50, offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        return self._queries.vehicles_by_store(store_id, fields, limit=limit, offset=offset)
@@ -0,0 +1,101 @@
+# brasiltransporta/domain/aggregates/vehicle_listing.py
+"""
+VehicleListing: tudo o que a página de um anúncio mostra
+
+Modelo de leitura (não é persistido como tal): anúncio + especificações do
+veículo + resumo da loja + mídias, montado numa única consulta e guardado
+em cache por anúncio. As escritas continuam nas entidades de cada agregado.
+"""
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+
+def _iso(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+def _parse(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+@dataclass(frozen=True)
+class ListingVehicle:
+    id: str
+    brand: str
+    model: str
+    year: int
+    plate: str
+    vehicle_type: Optional[str] = None
+    condition: Optional[str] = None
+    price: Optional[float] = None
+    implement_segment: Optional[str] = None
+    description: Optional[str] = None
+    mileage: Optional[int] = None
+    color: Optional[str] = None
+    engine_power: Optional[str] = None
+    axle_configuration: Optional[str] = None
+    updated_at: Optional[datetime] = None
+
+
+@dataclass(frozen=True)
+class ListingStore:
+    id: str
+    name: str
+    cnpj: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class ListingMedia:
+    key: str
+    file_type: str
+    mime_type: str
+    width: Optional[int] = None
+    height: Optional[int] = None
+    duration: Optional[float] = None
+    variants: Dict[str, str] = field(default_factory=dict)
+    url: Optional[str] = None  # assinada na leitura, nunca vai para o cache
+
+
+@dataclass(frozen=True)
+class VehicleListing:
+    id: str
+    title: str
+    description: str
+    price_amount: float
+    price_currency: str
+    status: str
+    is_featured: bool
+    views: int
+    created_at: datetime
+    updated_at: datetime
+    vehicle: ListingVehicle
+    store: ListingStore
+    media: List[ListingMedia] = field(default_factory=list)
+    expires_at: Optional[datetime] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Representação para o cache (datas em ISO 8601)"""
+        data = asdict(self)
+        for media in data["media"]:
+            media["url"] = None
+        for name in ("created_at", "updated_at", "expires_at"):
+            data[name] = _iso(data[name])
+        data["vehicle"]["updated_at"] = _iso(data["vehicle"]["updated_at"])
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "VehicleListing":
+        data = dict(data)
+        vehicle = dict(data.pop("vehicle"))
+        vehicle["updated_at"] = _parse(vehicle.get("updated_at"))
+        store = data.pop("store")
+        media = data.pop("media", [])
+        for name in ("created_at", "updated_at", "expires_at"):
+            data[name] = _parse(data.get(name))
+        return cls(
+            **data,
+            vehicle=ListingVehicle(**vehicle),
+            store=ListingStore(**store),
+            media=[ListingMedia(**item) for item in media],
+        )
@@ -7,10 +7,11 @@ from uuid import uuid4
 from enum import Enum
 
 from brasiltransporta.domain.entities.enums import AdvertisementStatus
+from brasiltransporta.domain.events import EventRecorder
 
 
 @dataclass
-class Advertisement:
+class Advertisement(EventRecorder):
     """Entidade Anúncio expandida mantendo compatibilidade"""
     
     id: str
@@ -75,6 +76,11 @@ class Advertisement:
         self.status = AdvertisementStatus.ACTIVE
         self.expires_at = datetime.utcnow() + timedelta(days=30)
         self.updated_at = datetime.utcnow()
+        self.record_event("advertisement.published", {
+            "store_id": self.store_id,
+            "vehicle_id": self.vehicle_id,
+            "expires_at": self.expires_at.isoformat(),
+        })
 
     def mark_as_sold(self) -> None:
         self.status = AdvertisementStatus.SOLD
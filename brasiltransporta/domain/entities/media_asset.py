@@ -0,0 +1,61 @@
+# brasiltransporta/domain/entities/media_asset.py
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Optional
+from uuid import uuid4
+
+
+@dataclass
+class MediaAsset:
+    """Arquivo de mídia (imagem/vídeo) de um anúncio armazenado no S3"""
+
+    id: str
+    key: str
+    ad_id: str
+    file_type: str  # 'image' ou 'video'
+    mime_type: str
+    size: int
+
+    width: Optional[int] = None
+    height: Optional[int] = None
+    duration: Optional[float] = None
+    content_hash: Optional[str] = None
+    variants: Dict[str, str] = field(default_factory=dict)  # nome -> chave S3
+    created_at: datetime = field(default_factory=datetime.utcnow)
+
+    @classmethod
+    def create(
+        cls,
+        key: str,
+        ad_id: str,
+        file_type: str,
+        mime_type: str,
+        size: int,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+        duration: Optional[float] = None,
+        content_hash: Optional[str] = None,
+        variants: Optional[Dict[str, str]] = None
+    ) -> "MediaAsset":
+        if file_type not in ("image", "video"):
+            raise ValueError(f"Tipo de mídia inválido: {file_type}")
+        if size < 0:
+            raise ValueError("Tamanho do arquivo não pode ser negativo")
+
+        return cls(
+            id=str(uuid4()),
+            key=key,
+            ad_id=ad_id,
+            file_type=file_type,
+            mime_type=mime_type,
+            size=size,
+            width=width,
+            height=height,
+            duration=duration,
+            content_hash=content_hash,
+            variants=variants or {}
+        )
+
+    def add_variant(self, name: str, key: str) -> None:
+        """Registra uma versão derivada (thumbnail, rendição de vídeo, poster)"""
+        self.variants[name] = key
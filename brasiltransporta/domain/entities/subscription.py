@@ -0,0 +1,76 @@
+# brasiltransporta/domain/entities/subscription.py
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import Dict, Optional
+from uuid import uuid4
+
+from brasiltransporta.domain.entities.plan import BillingCycle, Plan
+from brasiltransporta.domain.errors.errors import ValidationError
+
+
+class SubscriptionStatus(Enum):
+    ACTIVE = "active"
+    CANCELLED = "cancelled"
+    EXPIRED = "expired"
+
+
+class QuotaResource(Enum):
+    """Recursos limitados pelo plano"""
+    ADS = "ads"  # anúncios ocupando vaga (rascunho, ativo, pausado)
+    FEATURED = "featured"  # anúncios em destaque
+
+
+CYCLE_DAYS = {
+    BillingCycle.MONTHLY: 30,
+    BillingCycle.QUARTERLY: 90,
+    BillingCycle.YEARLY: 365,
+}
+
+
+@dataclass
+class Subscription:
+    """
+    Assinatura de um plano por uma loja
+
+    Os limites são copiados do plano na contratação: mudar o plano depois
+    não altera assinaturas em vigor.
+    """
+    id: str
+    store_id: str
+    user_id: str
+    plan_id: str
+    max_ads: int
+    max_featured_ads: int
+    starts_at: datetime
+    ends_at: datetime
+    status: SubscriptionStatus = SubscriptionStatus.ACTIVE
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    updated_at: Optional[datetime] = None
+
+    @classmethod
+    def create(cls, store_id: str, user_id: str, plan: Plan, starts_at: Optional[datetime] = None) -> "Subscription":
+        if not plan.is_active:
+            raise ValidationError("Plano não encontrado ou inativo")
+        starts_at = starts_at or datetime.utcnow()
+        return cls(
+            id=str(uuid4()),
+            store_id=store_id,
+            user_id=user_id,
+            plan_id=plan.id,
+            max_ads=plan.max_ads,
+            max_featured_ads=plan.max_featured_ads,
+            starts_at=starts_at,
+            ends_at=starts_at + timedelta(days=CYCLE_DAYS[plan.billing_cycle]),
+        )
+
+    def is_active(self, now: Optional[datetime] = None) -> bool:
+        now = now or datetime.utcnow()
+        return self.status == SubscriptionStatus.ACTIVE and self.starts_at <= now < self.ends_at
+
+    def cancel(self) -> None:
+        self.status = SubscriptionStatus.CANCELLED
+        self.updated_at = datetime.utcnow()
+
+    def limits(self) -> Dict[QuotaResource, int]:
+        return {QuotaResource.ADS: self.max_ads, QuotaResource.FEATURED: self.max_featured_ads}
@@ -6,6 +6,7 @@ from datetime import datetime
 
 from brasiltransporta.domain.value_objects.money import Money
 from brasiltransporta.domain.errors.errors import ValidationError
+from brasiltransporta.domain.events import EventRecorder
 
 class TransactionStatus(Enum):
     PENDING = "pending"
@@ -18,7 +19,7 @@ class PaymentMethod(Enum):
     PIX = "pix"  
     
 @dataclass
-class Transaction:
+class Transaction(EventRecorder):
     id: str
     user_id: str
     plan_id: str
@@ -30,6 +31,7 @@ class Transaction:
     metadata: Optional[Dict[str, Any]] = None
     created_at: datetime = field(default_factory=datetime.utcnow)
     updated_at: Optional[datetime] = None
+    gateway: Optional[str] = None  # 'stripe', 'mercadopago'...
 
     @classmethod
     def create(
@@ -59,6 +61,13 @@ class Transaction:
         self.status = TransactionStatus.COMPLETED
         self.external_payment_id = external_id
         self.updated_at = datetime.utcnow()
+        self.record_event("transaction.completed", {
+            "user_id": self.user_id,
+            "plan_id": self.plan_id,
+            "amount": str(self.amount.amount),
+            "currency": self.amount.currency,
+            "external_payment_id": external_id,
+        })
 
     def mark_failed(self) -> None:
         self.status = TransactionStatus.FAILED
@@ -70,3 +79,35 @@ class Transaction:
             raise ValidationError("Apenas transações completadas podem ser reembolsadas")
         self.status = TransactionStatus.REFUNDED
         self.updated_at = datetime.utcnow()
+
+    def attach_payment(self, gateway: str, external_id: str) -> None:
+        """Associa a cobrança criada no gateway (webhooks chegam por este id)"""
+        self.gateway = gateway
+        self.external_payment_id = external_id
+        self.updated_at = datetime.utcnow()
+
+    def apply_gateway_status(self, status: TransactionStatus, external_id: Optional[str] = None) -> bool:
+        """
+        Aplica o status informado pelo gateway (webhook ou conciliação)
+
+        Idempotente: o mesmo status repetido, ou um status que chega fora de
+        ordem (ex.: 'pending' depois de 'completed'), não altera nada.
+
+        Returns:
+            bool: True se a transação mudou de status
+        """
+        if status == self.status:
+            return False
+
+        external_id = external_id or self.external_payment_id
+        if status == TransactionStatus.COMPLETED and self.status in (TransactionStatus.PENDING, TransactionStatus.FAILED):
+            # Aprovação tardia (ex.: PIX pago após a primeira recusa) também vale
+            self.mark_completed(external_id)
+            return True
+        if status == TransactionStatus.FAILED and self.status == TransactionStatus.PENDING:
+            self.mark_failed()
+            return True
+        if status == TransactionStatus.REFUNDED and self.status == TransactionStatus.COMPLETED:
+            self.refund()
+            return True
+        return False
@@ -6,9 +6,10 @@ from uuid import uuid4
 from brasiltransporta.domain.errors.errors import ValidationError
 from brasiltransporta.domain.value_objects.email import Email
 from brasiltransporta.domain.value_objects.phone_number import PhoneNumber
+from brasiltransporta.domain.events import EventRecorder
 
 @dataclass
-class User:
+class User(EventRecorder):
     id: str
     name: str
     email: Email
@@ -63,7 +64,7 @@ class User:
         email_vo = Email(email)
         phone_vo = PhoneNumber(phone) if phone else None
         
-        return cls(
+        user = cls(
             id=str(uuid4()),
             name=name.strip(),
             email=email_vo,
@@ -78,6 +79,12 @@ class User:
             created_at=datetime.utcnow(),
             updated_at=datetime.utcnow()
         )
+        user.record_event("user.registered", {
+            "email": email_vo.value,
+            "name": user.name,
+            "roles": list(roles),
+        })
+        return user
 
     # NOVOS MÉTODOS PARA AUTENTICAÇÃO
     def has_role(self, role: str) -> bool:
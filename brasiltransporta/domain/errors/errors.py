@@ -20,4 +20,11 @@ class SecurityAlertError(DomainError):
     """Security alert - potential token theft detected"""
     pass
 
-# Adicione esta linha se SecurityAlertError não existir
\ No newline at end of file
+# Adicione esta linha se SecurityAlertError não existir
+
+class QuotaExceededError(DomainError):
+    """Limite do plano atingido (ou loja sem assinatura ativa)"""
+    def __init__(self, message: str, resource: str = "", limit: int = 0):
+        self.resource = resource
+        self.limit = limit
+        super().__init__(message)
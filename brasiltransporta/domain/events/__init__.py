@@ -0,0 +1,7 @@
+# brasiltransporta/domain/events/__init__.py
+from .domain_event import DomainEvent, EventRecorder
+
+__all__ = [
+    "DomainEvent",
+    "EventRecorder",
+]
@@ -0,0 +1,48 @@
+# brasiltransporta/domain/events/domain_event.py
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from uuid import uuid4
+
+
+@dataclass(frozen=True)
+class DomainEvent:
+    """
+    Fato de negócio ocorrido em um agregado
+
+    `name` segue o formato "<agregado>.<fato>" (ex.: "advertisement.published")
+    e é usado como routing key na publicação. `id` é a chave de idempotência
+    que os consumidores usam para descartar entregas repetidas.
+    """
+    name: str
+    aggregate_id: str
+    payload: Dict[str, Any] = field(default_factory=dict)
+    id: str = field(default_factory=lambda: str(uuid4()))
+    occurred_at: datetime = field(default_factory=datetime.utcnow)
+
+    @property
+    def aggregate_type(self) -> str:
+        return self.name.split(".", 1)[0]
+
+
+class EventRecorder:
+    """
+    Mixin para entidades que registram eventos de domínio
+
+    Os eventos ficam fora dos campos do dataclass (não afetam __eq__/asdict)
+    e são retirados pelo repositório, que os grava no outbox na mesma
+    transação da alteração do agregado.
+    """
+
+    def record_event(self, name: str, payload: Optional[Dict[str, Any]] = None) -> DomainEvent:
+        event = DomainEvent(name=name, aggregate_id=str(self.id), payload=payload or {})
+        self.__dict__.setdefault("_domain_events", []).append(event)
+        return event
+
+    @property
+    def pending_events(self) -> List[DomainEvent]:
+        return list(self.__dict__.get("_domain_events", []))
+
+    def pull_events(self) -> List[DomainEvent]:
+        """Retorna e limpa os eventos pendentes"""
+        return self.__dict__.pop("_domain_events", [])
@@ -1,9 +1,19 @@
 # domain/repositories/advertisement_repository.py
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional
 from brasiltransporta.domain.entities.advertisement import Advertisement
 from brasiltransporta.domain.entities.enums import AdvertisementStatus
 
+@dataclass(frozen=True)
+class AdvertisementVersion:
+    """Colunas que mudam quando a representação do anúncio muda (validação de cache HTTP)"""
+    store_id: str
+    updated_at: datetime
+    views: int
+
+
 class AdvertisementRepository(ABC):
     
     @abstractmethod
@@ -14,6 +24,16 @@ class AdvertisementRepository(ABC):
     async def get_by_id(self, advertisement_id: str) -> Optional[Advertisement]:
         pass
     
+    @abstractmethod
+    async def get_many(self, advertisement_ids: List[str]) -> List[Advertisement]:
+        """Anúncios encontrados entre os ids, numa só consulta (sem ordem garantida)"""
+        pass
+
+    @abstractmethod
+    async def get_version(self, advertisement_id: str) -> Optional[AdvertisementVersion]:
+        """Só a versão do anúncio, sem carregar a linha inteira"""
+        pass
+
     @abstractmethod
     async def update(self, advertisement: Advertisement) -> Advertisement:
         pass
@@ -56,4 +76,14 @@ class AdvertisementRepository(ABC):
     
     @abstractmethod
     async def increment_views(self, advertisement_id: str) -> bool:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    async def apply_view_deltas(self, deltas: Dict[str, int]) -> int:
+        """Soma deltas de visualizações {advertisement_id: delta}; retorna linhas afetadas"""
+        pass
+
+    @abstractmethod
+    async def expire_due(self, now: datetime, batch_size: int = 500) -> List[str]:
+        """Marca como expirados os anúncios ativos vencidos; retorna os ids"""
+        pass
@@ -0,0 +1,10 @@
+from typing import Protocol, Optional, List, Iterator
+from brasiltransporta.domain.entities.media_asset import MediaAsset
+
+class MediaAssetRepository(Protocol):
+    def save(self, asset: MediaAsset) -> MediaAsset: ...
+    def get_by_key(self, key: str) -> Optional[MediaAsset]: ...
+    def list_by_ad(self, ad_id: str, file_type: Optional[str] = None) -> List[MediaAsset]: ...
+    def count_by_ad(self, ad_id: str, file_type: Optional[str] = None) -> int: ...
+    def delete_by_key(self, key: str) -> bool: ...
+    def iter_keys(self, batch_size: int = 1000) -> Iterator[str]: ...
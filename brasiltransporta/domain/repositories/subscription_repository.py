@@ -0,0 +1,12 @@
+from datetime import datetime
+from typing import Dict, List, Optional, Protocol
+
+from brasiltransporta.domain.entities.subscription import QuotaResource, Subscription
+
+class SubscriptionRepository(Protocol):
+    def add(self, subscription: Subscription) -> None: ...
+    def get_by_id(self, subscription_id: str) -> Optional[Subscription]: ...
+    def get_active_by_store(self, store_id: str, now: datetime) -> Optional[Subscription]: ...
+    def list_active(self, now: datetime, limit: int = 500, after_id: Optional[str] = None) -> List[Subscription]: ...
+    def count_usage(self, store_ids: List[str]) -> Dict[str, Dict[QuotaResource, int]]: ...
+    def update(self, subscription: Subscription) -> None: ...
@@ -1,4 +1,5 @@
-from typing import Protocol, Optional, List
+from datetime import datetime
+from typing import Protocol, Optional, List, Sequence
 from brasiltransporta.domain.entities.transaction import Transaction, TransactionStatus
 
 class TransactionRepository(Protocol):
@@ -7,4 +8,12 @@ class TransactionRepository(Protocol):
     def get_by_external_id(self, external_id: str) -> Optional[Transaction]: ...
     def list_by_user(self, user_id: str, limit: int = 50) -> List[Transaction]: ...
     def list_by_status(self, status: TransactionStatus, limit: int = 50) -> List[Transaction]: ...
+    def list_pending_for_reconciliation(
+        self,
+        created_before: datetime,
+        limit: int = 100,
+        created_after: Optional[datetime] = None,
+        gateways: Optional[Sequence[str]] = None,
+    ) -> List[Transaction]: ...
+    def mark_reconciled(self, transaction_ids: Sequence[str], checked_at: datetime) -> None: ...
     def update(self, transaction: Transaction) -> None: ...
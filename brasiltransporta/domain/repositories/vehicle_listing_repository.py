@@ -0,0 +1,7 @@
+from typing import Optional, Protocol
+
+from brasiltransporta.domain.aggregates.vehicle_listing import VehicleListing
+
+
+class VehicleListingRepository(Protocol):
+    def get(self, advertisement_id: str) -> Optional[VehicleListing]: ...
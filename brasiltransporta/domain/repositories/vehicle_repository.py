@@ -14,6 +14,11 @@ class VehicleRepository(ABC):
     async def get_by_id(self, vehicle_id: str) -> Optional[Vehicle]:
         pass
     
+    @abstractmethod
+    async def get_many(self, vehicle_ids: List[str]) -> List[Vehicle]:
+        """Veículos encontrados entre os ids, numa só consulta (sem ordem garantida)"""
+        pass
+
     @abstractmethod
     async def update(self, vehicle: Vehicle) -> Vehicle:
         pass
@@ -53,4 +58,9 @@ class VehicleRepository(ABC):
     
     @abstractmethod
     async def count_by_store(self, store_id: str) -> int:
+        pass
+
+    @abstractmethod
+    async def bulk_insert(self, vehicles: List[Vehicle]) -> List[str]:
+        """Insere em lote ignorando placas já cadastradas; retorna as placas inseridas"""
         pass
\ No newline at end of file
@@ -1,5 +1,6 @@
 # brasiltransporta/infrastructure/dependencies.py
 from fastapi import Request, HTTPException, status, Depends
+from functools import lru_cache
 from typing import Optional
 
 from brasiltransporta.infrastructure.security.refresh_token_service import RefreshTokenService
@@ -7,7 +8,8 @@ from brasiltransporta.application.service.user_service import UserService
 from brasiltransporta.infrastructure.security.jwt_service import JWTService
 from brasiltransporta.infrastructure.security.password_hasher import BcryptPasswordHasher
 
-from brasiltransporta.infrastructure.external.sms.sms_service import SMSService, MockSMSService
+# SMS (httpx) e fila de notificações (app Celery) são importados no
+# primeiro uso, para não pesar no import da API
 
 from brasiltransporta.domain.repositories.phone_verification_repository import PhoneVerificationRepository
 from brasiltransporta.domain.repositories.user_repository import UserRepository
@@ -45,10 +47,13 @@ def get_refresh_token_service(request: Request) -> Optional[RefreshTokenService]
     
     return refresh_service
 
+# Sem estado por requisição: uma instância por processo (montada no lifespan)
+@lru_cache(maxsize=1)
 def get_jwt_service() -> JWTService:
     """Dependency para JWTService"""
     return JWTService.from_settings()
 
+@lru_cache(maxsize=1)
 def get_password_hasher() -> BcryptPasswordHasher:
     """Dependency para PasswordHasher"""
     return BcryptPasswordHasher()
@@ -82,15 +87,22 @@ def get_phone_verification_repository() -> PhoneVerificationRepository:
     """Dependency para PhoneVerificationRepository com Redis"""
     return RedisPhoneVerificationRepository()
 
-def get_sms_service() -> SMSService:
+@lru_cache(maxsize=1)
+def get_sms_service():
     """Dependency para SMSService (Mock em desenvolvimento)"""
+    from brasiltransporta.infrastructure.external.sms.sms_service import MockSMSService
     return MockSMSService()
 
+def get_notification_queue():
+    """Dependency para NotificationQueue (envio pelo worker de notificações)"""
+    from brasiltransporta.infrastructure.messaging.tasks.notifications import NotificationQueue
+    return NotificationQueue()
+
 def get_send_phone_verification_use_case() -> SendPhoneVerificationUseCase:
     """Dependency para SendPhoneVerificationUseCase"""
     return SendPhoneVerificationUseCase(
         verification_repo=get_phone_verification_repository(),
-        sms_service=get_sms_service()
+        notification_queue=get_notification_queue()
     )
 
 def get_verify_phone_code_use_case() -> VerifyPhoneCodeUseCase:
@@ -0,0 +1,79 @@
+# brasiltransporta/infrastructure/external/email/sendgrid_service.py
+import logging
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+from brasiltransporta.application.notifications.services.notification_dispatcher import (
+    EMAIL,
+    DeliveryResult,
+    Notification,
+    is_retryable_status,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class SendGridEmailProvider:
+    """
+    Envio de e-mails pela API v3 do SendGrid
+
+    Notificações com o mesmo assunto e corpo viram uma única chamada a
+    /mail/send com uma `personalization` por destinatário (até 1000 por
+    chamada); cada destinatário recebe o e-mail individualmente.
+    """
+
+    name = "sendgrid"
+    channel = EMAIL
+    API_URL = "https://api.sendgrid.com/v3/mail/send"
+    MAX_PERSONALIZATIONS = 1000
+
+    def __init__(
+        self,
+        api_key: str,
+        from_email: str,
+        from_name: Optional[str] = None,
+        max_concurrency: int = 4,
+        client: Optional[httpx.Client] = None,
+        timeout: float = 10.0,
+    ):
+        self.max_batch_size = self.MAX_PERSONALIZATIONS
+        self.max_concurrency = max_concurrency
+        self._from = {"email": from_email, **({"name": from_name} if from_name else {})}
+        self._headers = {"Authorization": f"Bearer {api_key}"}
+        # Cliente compartilhado: reaproveita conexões entre lotes
+        self._client = client or httpx.Client(timeout=timeout)
+
+    def send_batch(self, notifications: List[Notification]) -> List[DeliveryResult]:
+        groups: Dict[Tuple[str, str], List[Notification]] = {}
+        for notification in notifications:
+            groups.setdefault((notification.subject or "", notification.body), []).append(notification)
+
+        results: List[DeliveryResult] = []
+        for (subject, body), group in groups.items():
+            results.extend(self._send_group(subject, body, group))
+        return results
+
+    def _send_group(self, subject: str, body: str, group: List[Notification]) -> List[DeliveryResult]:
+        payload = {
+            "personalizations": [
+                {"to": [{"email": n.to}], "custom_args": {"notification_id": n.id}}
+                for n in group
+            ],
+            "from": self._from,
+            "subject": subject,
+            "content": [{"type": "text/plain", "value": body}],
+        }
+        try:
+            response = self._client.post(self.API_URL, json=payload, headers=self._headers)
+        except httpx.HTTPError as e:
+            return [DeliveryResult.failed(n.id, f"Erro de rede no SendGrid: {e}", retryable=True) for n in group]
+
+        if response.status_code == 202:
+            message_id = response.headers.get("X-Message-Id")
+            return [DeliveryResult.ok(n.id, message_id) for n in group]
+
+        error = f"SendGrid respondeu {response.status_code}: {response.text[:200]}"
+        logger.warning(error)
+        retryable = is_retryable_status(response.status_code)
+        return [DeliveryResult.failed(n.id, error, retryable=retryable) for n in group]
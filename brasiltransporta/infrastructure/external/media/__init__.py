@@ -0,0 +1,21 @@
+"""
+Processamento de mídia (transcodificação de vídeos) executado pelo worker
+"""
+
+from brasiltransporta.infrastructure.external.media.ffmpeg_transcoder import (
+    FFmpegTranscoder,
+    Rendition,
+    VideoProbe,
+    TranscodeError,
+    DEFAULT_LADDER,
+    select_renditions
+)
+
+__all__ = [
+    "FFmpegTranscoder",
+    "Rendition",
+    "VideoProbe",
+    "TranscodeError",
+    "DEFAULT_LADDER",
+    "select_renditions"
+]
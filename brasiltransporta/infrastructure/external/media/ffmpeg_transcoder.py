@@ -0,0 +1,213 @@
+"""
+Transcodificação de vídeos com ffmpeg/ffprobe
+
+Roda apenas no worker (nunca no caminho da requisição HTTP). Os binários
+precisam estar no PATH (a imagem docker/worker.Dockerfile instala o ffmpeg).
+"""
+
+import json
+import logging
+import shutil
+import subprocess
+import tempfile
+import threading
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Rendition:
+    """Uma saída da escada de transcodificação"""
+    name: str
+    codec: str  # 'h264' ou 'h265'
+    height: int
+    crf: int
+    preset: str = "veryfast"
+    audio_bitrate: str = "96k"
+
+    @property
+    def encoder(self) -> str:
+        return "libx265" if self.codec == "h265" else "libx264"
+
+
+# H.264 garante reprodução em qualquer aparelho; H.265 reduz o tráfego em
+# navegadores/aparelhos compatíveis
+DEFAULT_LADDER: List[Rendition] = [
+    Rendition("h264_720p", "h264", 720, crf=23),
+    Rendition("h264_480p", "h264", 480, crf=24),
+    Rendition("h265_720p", "h265", 720, crf=28),
+]
+
+
+@dataclass
+class VideoProbe:
+    """Metadados lidos pelo ffprobe"""
+    duration: float
+    width: int
+    height: int
+    codec: Optional[str] = None
+
+
+class TranscodeError(Exception):
+    """Falha ao executar ffmpeg/ffprobe"""
+    pass
+
+
+def select_renditions(source_height: int, ladder: List[Rendition] = None) -> List[Rendition]:
+    """
+    Filtra a escada para não aumentar a resolução do original
+
+    A menor rendição de cada codec é sempre mantida (o vídeo é apenas
+    recomprimido, sem upscale).
+    """
+    ladder = ladder or DEFAULT_LADDER
+    selected = [r for r in ladder if r.height <= source_height]
+    for codec in {r.codec for r in ladder}:
+        if not any(r.codec == codec for r in selected):
+            selected.append(min((r for r in ladder if r.codec == codec), key=lambda r: r.height))
+    return selected
+
+
+def parse_progress_line(line: str, duration: float) -> Optional[float]:
+    """
+    Converte uma linha de `ffmpeg -progress` em fração concluída (0..1)
+
+    Returns:
+        float ou None se a linha não informa a posição atual
+    """
+    key, _, value = line.strip().partition("=")
+    if key not in ("out_time_us", "out_time_ms") or not duration:
+        return None
+    try:
+        # Apesar do nome, out_time_ms também é em microssegundos
+        position = int(value) / 1_000_000
+    except ValueError:
+        return None
+    return max(0.0, min(position / duration, 1.0))
+
+
+class FFmpegTranscoder:
+    """Wrapper de ffmpeg/ffprobe para gerar MP4 com faststart e pôster"""
+
+    def __init__(self, ffmpeg_path: str = "ffmpeg", ffprobe_path: str = "ffprobe", timeout: int = 900):
+        self.ffmpeg_path = ffmpeg_path
+        self.ffprobe_path = ffprobe_path
+        self.timeout = timeout
+
+    @staticmethod
+    def is_available() -> bool:
+        return shutil.which("ffmpeg") is not None and shutil.which("ffprobe") is not None
+
+    def probe(self, source_path: str) -> VideoProbe:
+        """Lê duração e dimensões do primeiro stream de vídeo"""
+        command = [
+            self.ffprobe_path, "-v", "error",
+            "-select_streams", "v:0",
+            "-show_entries", "stream=width,height,codec_name:format=duration",
+            "-of", "json", source_path,
+        ]
+        result = self._run(command)
+        try:
+            data = json.loads(result.stdout)
+            stream = data["streams"][0]
+            return VideoProbe(
+                duration=float(data["format"]["duration"]),
+                width=int(stream["width"]),
+                height=int(stream["height"]),
+                codec=stream.get("codec_name"),
+            )
+        except (KeyError, IndexError, ValueError) as e:
+            raise TranscodeError(f"Saída inesperada do ffprobe: {str(e)}")
+
+    def transcode(
+        self,
+        source_path: str,
+        output_path: str,
+        rendition: Rendition,
+        duration: float = 0,
+        on_progress: Optional[Callable[[float], None]] = None
+    ) -> None:
+        """
+        Gera um MP4 com o átomo moov no início (-movflags +faststart)
+
+        Args:
+            on_progress: recebe a fração concluída (0..1) durante a execução
+        """
+        command = [
+            self.ffmpeg_path, "-y", "-v", "error", "-nostdin",
+            "-i", source_path,
+            # Altura alvo mantendo proporção (largura par, exigência do yuv420p)
+            "-vf", f"scale=-2:'min({rendition.height},ih)'",
+            "-c:v", rendition.encoder, "-preset", rendition.preset, "-crf", str(rendition.crf),
+            "-pix_fmt", "yuv420p",
+            "-c:a", "aac", "-b:a", rendition.audio_bitrate,
+            "-movflags", "+faststart",
+            "-progress", "pipe:1",
+        ]
+        if rendition.codec == "h265":
+            # Tag exigida pelo Safari/iOS para HEVC em MP4
+            command += ["-tag:v", "hvc1"]
+        command.append(output_path)
+
+        # stderr vai para um arquivo: com dois pipes, um stderr cheio travaria
+        # o ffmpeg enquanto lemos o progresso no stdout
+        with tempfile.TemporaryFile(mode="w+") as stderr_file:
+            try:
+                process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=stderr_file, text=True)
+            except FileNotFoundError:
+                raise TranscodeError(f"Executável não encontrado: {command[0]}")
+
+            # Prazo de relógio: encerra o ffmpeg mesmo que ele pare de emitir progresso
+            expired = threading.Event()
+
+            def expire() -> None:
+                expired.set()
+                process.kill()
+
+            watchdog = threading.Timer(self.timeout, expire)
+            watchdog.start()
+            try:
+                for line in process.stdout:
+                    fraction = parse_progress_line(line, duration)
+                    if fraction is not None and on_progress:
+                        on_progress(fraction)
+                process.wait()
+            finally:
+                watchdog.cancel()
+                if process.poll() is None:
+                    process.kill()
+                    process.wait()
+                process.stdout.close()
+
+            if expired.is_set():
+                raise TranscodeError(f"ffmpeg excedeu {self.timeout}s ({rendition.name})")
+            if process.returncode != 0:
+                stderr_file.seek(0)
+                stderr = stderr_file.read()
+                raise TranscodeError(f"ffmpeg falhou ({rendition.name}): {stderr.strip()[-500:]}")
+
+    def extract_poster(self, source_path: str, output_path: str, at_seconds: float = 1.0, height: int = 720) -> None:
+        """Extrai um quadro JPEG para usar como pôster do vídeo"""
+        command = [
+            self.ffmpeg_path, "-y", "-v", "error", "-nostdin",
+            "-ss", f"{at_seconds:.3f}", "-i", source_path,
+            "-frames:v", "1",
+            "-vf", f"scale=-2:'min({height},ih)'",
+            "-q:v", "3",
+            output_path,
+        ]
+        self._run(command)
+
+    def _run(self, command: List[str]) -> subprocess.CompletedProcess:
+        try:
+            result = subprocess.run(command, capture_output=True, text=True, timeout=self.timeout)
+        except FileNotFoundError:
+            raise TranscodeError(f"Executável não encontrado: {command[0]}")
+        except subprocess.TimeoutExpired:
+            raise TranscodeError(f"{command[0]} excedeu {self.timeout}s")
+        if result.returncode != 0:
+            raise TranscodeError(f"{command[0]} falhou: {result.stderr.strip()[-500:]}")
+        return result
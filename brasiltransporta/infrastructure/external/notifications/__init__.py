@@ -0,0 +1,9 @@
+"""
+Provedores de notificação usados pelo worker da fila `notifications`
+"""
+
+from brasiltransporta.infrastructure.external.notifications.fake_provider import FakeNotificationProvider
+
+__all__ = [
+    "FakeNotificationProvider"
+]
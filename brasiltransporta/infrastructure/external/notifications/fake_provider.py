@@ -0,0 +1,50 @@
+# brasiltransporta/infrastructure/external/notifications/fake_provider.py
+import logging
+import threading
+from typing import List
+
+from brasiltransporta.application.notifications.services.notification_dispatcher import (
+    DeliveryResult,
+    Notification,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class FakeNotificationProvider:
+    """
+    Provedor local que apenas registra as mensagens (desenvolvimento e testes)
+
+    `fail_times` simula falhas temporárias nas primeiras chamadas, para
+    exercitar o reenvio do dispatcher.
+    """
+
+    def __init__(self, channel: str, max_batch_size: int = 100, max_concurrency: int = 4, fail_times: int = 0):
+        self.name = f"fake-{channel}"
+        self.channel = channel
+        self.max_batch_size = max_batch_size
+        self.max_concurrency = max_concurrency
+        self.fail_times = fail_times
+        self.sent: List[Notification] = []
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def send_batch(self, notifications: List[Notification]) -> List[DeliveryResult]:
+        with self._lock:
+            self.calls += 1
+            if self.fail_times > 0:
+                self.fail_times -= 1
+                return [DeliveryResult.failed(n.id, "falha simulada", retryable=True) for n in notifications]
+            self.sent.extend(notifications)
+
+        for notification in notifications:
+            logger.info(f"📨 [{self.channel}] para {notification.to}: {notification.body}")
+        return [DeliveryResult.ok(n.id, f"fake-{n.id}") for n in notifications]
+
+    def sent_to(self, to: str) -> List[Notification]:
+        return [n for n in self.sent if n.to == to]
+
+    def clear(self) -> None:
+        with self._lock:
+            self.sent.clear()
+            self.calls = 0
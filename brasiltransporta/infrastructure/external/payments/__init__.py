@@ -0,0 +1,16 @@
+"""
+Gateways de pagamento (Stripe e Mercado Pago) usados pela cobrança
+"""
+
+from brasiltransporta.infrastructure.external.payments.base import HttpPaymentGateway
+from brasiltransporta.infrastructure.external.payments.stripe_gateway import StripePaymentGateway
+from brasiltransporta.infrastructure.external.payments.mercadopago_gateway import MercadoPagoPaymentGateway
+from brasiltransporta.infrastructure.external.payments.pix_gateway import PixPaymentGateway, render_qr_svg
+
+__all__ = [
+    "HttpPaymentGateway",
+    "StripePaymentGateway",
+    "MercadoPagoPaymentGateway",
+    "PixPaymentGateway",
+    "render_qr_svg"
+]
@@ -0,0 +1,115 @@
+# brasiltransporta/infrastructure/external/payments/base.py
+import asyncio
+import hashlib
+from abc import ABC, abstractmethod
+import hmac
+import logging
+from typing import Any, Dict, List, Mapping, Optional
+
+import httpx
+
+from brasiltransporta.application.billing.services.payment_gateway import GatewayError, WebhookSignatureError
+from brasiltransporta.domain.entities.transaction import TransactionStatus
+
+logger = logging.getLogger(__name__)
+
+
+def hmac_sha256(secret: str, message: str) -> str:
+    return hmac.new(secret.encode(), message.encode(), hashlib.sha256).hexdigest()
+
+
+def require_webhook_secret(secret: Optional[str], gateway: str) -> str:
+    """
+    Segredo do webhook ou WebhookSignatureError
+
+    Com segredo vazio qualquer um calcula o HMAC e forja o webhook: sem
+    segredo configurado, todo webhook é recusado.
+    """
+    if not secret:
+        raise WebhookSignatureError(f"Segredo do webhook do {gateway} não configurado")
+    return secret
+
+
+def get_header(headers: Mapping[str, str], name: str) -> Optional[str]:
+    """Busca um cabeçalho sem diferenciar maiúsculas"""
+    for key, value in headers.items():
+        if key.lower() == name:
+            return value
+    return None
+
+
+def parse_signature_header(value: str) -> Dict[str, List[str]]:
+    """Cabeçalhos no formato 'k1=v1,k2=v2' (uma chave pode se repetir)"""
+    parts: Dict[str, List[str]] = {}
+    for item in value.split(","):
+        key, sep, val = item.strip().partition("=")
+        if sep:
+            parts.setdefault(key.strip(), []).append(val.strip())
+    return parts
+
+
+class HttpPaymentGateway(ABC):
+    """
+    Base dos gateways HTTP
+
+    Um `httpx.AsyncClient` por instância mantém as conexões abertas
+    (keep-alive) entre as chamadas; o semáforo limita as consultas
+    simultâneas da conciliação ao tamanho do pool.
+    """
+
+    name = "http"
+    supports_lookup = True
+
+    def __init__(
+        self,
+        base_url: str,
+        headers: Dict[str, str],
+        max_connections: int = 20,
+        timeout: float = 15.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self._client = httpx.AsyncClient(
+            base_url=base_url,
+            headers=headers,
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            transport=transport,
+        )
+        self._max_connections = max(1, max_connections)
+
+    async def _request(self, method: str, path: str, **kwargs) -> Dict[str, Any]:
+        try:
+            response = await self._client.request(method, path, **kwargs)
+        except httpx.HTTPError as e:
+            raise GatewayError(f"Erro de rede no {self.name}: {e}", retryable=True) from e
+
+        if response.status_code >= 400:
+            retryable = response.status_code == 429 or response.status_code >= 500
+            raise GatewayError(
+                f"{self.name} respondeu {response.status_code}: {response.text[:200]}",
+                retryable=retryable,
+            )
+        return response.json()
+
+    @abstractmethod
+    async def get_payment_status(self, external_id: str) -> Optional[TransactionStatus]:
+        """Status atual de uma cobrança no gateway"""
+
+    async def get_payments(self, external_ids: List[str]) -> Dict[str, TransactionStatus]:
+        """Consulta as cobranças em paralelo, no máximo `max_connections` por vez"""
+        semaphore = asyncio.Semaphore(self._max_connections)
+
+        async def fetch(external_id: str):
+            async with semaphore:
+                try:
+                    return external_id, await self.get_payment_status(external_id)
+                except GatewayError as e:
+                    # Uma cobrança com erro não impede a conciliação das demais
+                    logger.warning(f"Falha ao consultar {external_id} no {self.name}: {str(e)}")
+                    return external_id, None
+
+        results = await asyncio.gather(*(fetch(i) for i in dict.fromkeys(external_ids)))
+        return {external_id: status for external_id, status in results if status is not None}
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
@@ -0,0 +1,119 @@
+# brasiltransporta/infrastructure/external/payments/mercadopago_gateway.py
+import hmac
+import json
+import time
+from typing import Callable, List, Mapping, Optional
+
+import httpx
+
+from brasiltransporta.application.billing.services.payment_gateway import (
+    GatewayPayment,
+    WebhookEvent,
+    WebhookSignatureError,
+)
+from brasiltransporta.domain.entities.transaction import PaymentMethod, Transaction, TransactionStatus
+from brasiltransporta.infrastructure.external.payments.base import (
+    HttpPaymentGateway,
+    get_header,
+    hmac_sha256,
+    parse_signature_header,
+    require_webhook_secret,
+)
+
+# Status do pagamento -> status da transação (os demais continuam pendentes)
+MERCADOPAGO_STATUS = {
+    "approved": TransactionStatus.COMPLETED,
+    "rejected": TransactionStatus.FAILED,
+    "cancelled": TransactionStatus.FAILED,
+    "refunded": TransactionStatus.REFUNDED,
+    "charged_back": TransactionStatus.REFUNDED,
+}
+
+
+class MercadoPagoPaymentGateway(HttpPaymentGateway):
+    """
+    Pagamentos (PIX e cartão) pela API v1 do Mercado Pago
+
+    O webhook do Mercado Pago só informa o id do pagamento; o status é
+    consultado pelo worker ao processar a notificação.
+    """
+
+    name = "mercadopago"
+    SIGNATURE_TOLERANCE = 300  # segundos
+
+    def __init__(
+        self,
+        access_token: str,
+        webhook_secret: Optional[str],
+        base_url: str = "https://api.mercadopago.com",
+        max_connections: int = 20,
+        timeout: float = 15.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        super().__init__(
+            base_url,
+            {"Authorization": f"Bearer {access_token}"},
+            max_connections=max_connections,
+            timeout=timeout,
+            transport=transport,
+        )
+        self._webhook_secret = webhook_secret
+        self._clock = clock
+
+    async def create_payment(self, transaction: Transaction, description: str) -> GatewayPayment:
+        payload = {
+            "transaction_amount": round(transaction.amount.amount, 2),
+            "description": description,
+            "external_reference": transaction.id,
+            "payment_method_id": "pix" if transaction.payment_method == PaymentMethod.PIX else None,
+            "payer": (transaction.metadata or {}).get("payer", {}),
+        }
+        data = await self._request(
+            "POST",
+            "/v1/payments",
+            json={k: v for k, v in payload.items() if v is not None},
+            headers={"X-Idempotency-Key": transaction.id},
+        )
+        pix = (data.get("point_of_interaction") or {}).get("transaction_data") or {}
+        return GatewayPayment(
+            external_id=str(data["id"]),
+            status=MERCADOPAGO_STATUS.get(data.get("status"), TransactionStatus.PENDING),
+            client_data={k: pix[k] for k in ("qr_code", "qr_code_base64", "ticket_url") if k in pix},
+        )
+
+    async def get_payment_status(self, external_id: str) -> Optional[TransactionStatus]:
+        data = await self._request("GET", f"/v1/payments/{external_id}")
+        return MERCADOPAGO_STATUS.get(data.get("status"), TransactionStatus.PENDING)
+
+    def verify_webhook(self, headers: Mapping[str, str], body: bytes) -> List[WebhookEvent]:
+        secret = require_webhook_secret(self._webhook_secret, "Mercado Pago")
+        header = get_header(headers, "x-signature")
+        if not header:
+            raise WebhookSignatureError("Cabeçalho x-signature ausente")
+
+        try:
+            event = json.loads(body)
+        except ValueError:
+            raise WebhookSignatureError("Corpo do webhook inválido")
+        data_id = str((event.get("data") or {}).get("id") or "")
+
+        parts = parse_signature_header(header)
+        timestamp = (parts.get("ts") or [""])[0]
+        if not timestamp.isdigit():
+            raise WebhookSignatureError("Timestamp da assinatura inválido")
+        # O Mercado Pago envia `ts` em milissegundos
+        sent_at = int(timestamp) / 1000 if len(timestamp) > 10 else int(timestamp)
+        if abs(self._clock() - sent_at) > self.SIGNATURE_TOLERANCE:
+            raise WebhookSignatureError("Assinatura expirada")
+
+        request_id = get_header(headers, "x-request-id") or ""
+        # Manifesto definido pelo Mercado Pago para a assinatura HMAC
+        manifest = f"id:{data_id.lower()};request-id:{request_id};ts:{timestamp};"
+        expected = hmac_sha256(secret, manifest)
+        if not any(hmac.compare_digest(expected, c) for c in parts.get("v1", [])):
+            raise WebhookSignatureError("Assinatura do Mercado Pago não confere")
+
+        if event.get("type") != "payment" or not data_id:
+            return []
+        return [WebhookEvent(self.name, data_id, status=None, event_id=str(event.get("id") or "") or None)]
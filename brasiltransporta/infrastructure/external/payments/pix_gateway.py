@@ -0,0 +1,99 @@
+# brasiltransporta/infrastructure/external/payments/pix_gateway.py
+import hmac
+import json
+import logging
+from typing import Dict, List, Mapping, Optional
+
+from brasiltransporta.application.billing.services.payment_gateway import (
+    GatewayPayment,
+    WebhookEvent,
+    WebhookSignatureError,
+)
+from brasiltransporta.application.billing.services.pix_brcode import build_pix_payload, normalize_txid
+from brasiltransporta.domain.entities.transaction import Transaction, TransactionStatus
+from brasiltransporta.infrastructure.external.payments.base import get_header, hmac_sha256, require_webhook_secret
+
+try:  # Renderização do QR é opcional (pip install segno)
+    import segno
+except ImportError:  # pragma: no cover - depende do ambiente
+    segno = None
+
+logger = logging.getLogger(__name__)
+
+
+def render_qr_svg(payload: str, scale: int = 4) -> Optional[str]:
+    """SVG do QR code do BR Code; None se o segno não estiver instalado"""
+    if segno is None:
+        return None
+    return segno.make(payload, error="m", micro=False).svg_inline(scale=scale)
+
+
+class PixPaymentGateway:
+    """
+    PIX direto na chave da empresa, sem intermediador
+
+    O BR Code e o QR são gerados localmente (nenhuma chamada HTTP). A
+    confirmação chega pelo webhook do PSP no formato da API PIX do Banco
+    Central (`{"pix": [{"txid", "endToEndId", "valor"}]}`), assinado com
+    HMAC-SHA256 do corpo no cabeçalho `x-webhook-signature`.
+
+    O txid é derivado do id da transação, que o pagador conhece: sem
+    segredo configurado, os webhooks são recusados.
+    """
+
+    name = "pix"
+    supports_lookup = False
+
+    def __init__(self, key: str, merchant_name: str, merchant_city: str, webhook_secret: Optional[str]):
+        self._key = key
+        self._merchant_name = merchant_name
+        self._merchant_city = merchant_city
+        self._webhook_secret = webhook_secret
+
+    async def create_payment(self, transaction: Transaction, description: str) -> GatewayPayment:
+        txid = normalize_txid(transaction.id)
+        payload = build_pix_payload(
+            self._key,
+            self._merchant_name,
+            self._merchant_city,
+            amount=transaction.amount.amount,
+            txid=txid,
+            description=description,
+        )
+        return GatewayPayment(
+            external_id=txid,
+            status=TransactionStatus.PENDING,
+            client_data={"brcode": payload, "qr_code_svg": render_qr_svg(payload)},
+        )
+
+    async def get_payments(self, external_ids: List[str]) -> Dict[str, TransactionStatus]:
+        # Sem API de consulta (supports_lookup = False): as cobranças PIX dependem do webhook
+        return {}
+
+    def verify_webhook(self, headers: Mapping[str, str], body: bytes) -> List[WebhookEvent]:
+        secret = require_webhook_secret(self._webhook_secret, "PIX")
+        signature = get_header(headers, "x-webhook-signature")
+        try:
+            payload = body.decode("utf-8")
+        except UnicodeDecodeError:
+            raise WebhookSignatureError("Corpo do webhook inválido")
+        expected = hmac_sha256(secret, payload)
+        if not signature or not hmac.compare_digest(expected, signature):
+            raise WebhookSignatureError("Assinatura do webhook PIX não confere")
+
+        events = []
+        for item in json.loads(payload).get("pix", []):
+            if not item.get("txid"):
+                continue
+            if not item.get("valor"):
+                # Sem o valor não há como conferir o pagamento
+                logger.warning(f"Webhook PIX sem valor para o txid {item['txid']}: ignorado")
+                continue
+            events.append(WebhookEvent(
+                self.name, item["txid"], TransactionStatus.COMPLETED,
+                event_id=item.get("endToEndId"), amount=str(item["valor"]),
+            ))
+        return events
+
+    async def aclose(self) -> None:
+        return None
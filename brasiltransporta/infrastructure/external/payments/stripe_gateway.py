@@ -0,0 +1,121 @@
+# brasiltransporta/infrastructure/external/payments/stripe_gateway.py
+import hmac
+import json
+import time
+from typing import Callable, List, Mapping, Optional
+
+import httpx
+
+from brasiltransporta.application.billing.services.payment_gateway import (
+    GatewayPayment,
+    WebhookEvent,
+    WebhookSignatureError,
+)
+from brasiltransporta.domain.entities.transaction import Transaction, TransactionStatus
+from brasiltransporta.infrastructure.external.payments.base import (
+    HttpPaymentGateway,
+    get_header,
+    hmac_sha256,
+    parse_signature_header,
+    require_webhook_secret,
+)
+
+# Status do PaymentIntent -> status da transação (os demais continuam pendentes)
+STRIPE_STATUS = {
+    "succeeded": TransactionStatus.COMPLETED,
+    "canceled": TransactionStatus.FAILED,
+}
+
+STRIPE_EVENTS = {
+    "payment_intent.succeeded": TransactionStatus.COMPLETED,
+    "payment_intent.payment_failed": TransactionStatus.FAILED,
+    "payment_intent.canceled": TransactionStatus.FAILED,
+    "charge.refunded": TransactionStatus.REFUNDED,
+}
+
+
+class StripePaymentGateway(HttpPaymentGateway):
+    """
+    Cobranças por PaymentIntent na API do Stripe
+
+    A criação usa a chave de idempotência do Stripe (o id da transação),
+    então reenviar a mesma transação não gera uma segunda cobrança.
+    """
+
+    name = "stripe"
+    SIGNATURE_TOLERANCE = 300  # segundos
+
+    def __init__(
+        self,
+        api_key: str,
+        webhook_secret: Optional[str],
+        base_url: str = "https://api.stripe.com",
+        max_connections: int = 20,
+        timeout: float = 15.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        super().__init__(
+            base_url,
+            {"Authorization": f"Bearer {api_key}"},
+            max_connections=max_connections,
+            timeout=timeout,
+            transport=transport,
+        )
+        self._webhook_secret = webhook_secret
+        self._clock = clock
+
+    async def create_payment(self, transaction: Transaction, description: str) -> GatewayPayment:
+        data = await self._request(
+            "POST",
+            "/v1/payment_intents",
+            data={
+                "amount": str(int(round(transaction.amount.amount * 100))),
+                "currency": transaction.amount.currency.lower(),
+                "description": description,
+                "metadata[transaction_id]": transaction.id,
+            },
+            headers={"Idempotency-Key": transaction.id},
+        )
+        return GatewayPayment(
+            external_id=data["id"],
+            status=STRIPE_STATUS.get(data.get("status"), TransactionStatus.PENDING),
+            client_data={"client_secret": data.get("client_secret")},
+        )
+
+    async def get_payment_status(self, external_id: str) -> Optional[TransactionStatus]:
+        data = await self._request("GET", f"/v1/payment_intents/{external_id}")
+        return STRIPE_STATUS.get(data.get("status"), TransactionStatus.PENDING)
+
+    def verify_webhook(self, headers: Mapping[str, str], body: bytes) -> List[WebhookEvent]:
+        secret = require_webhook_secret(self._webhook_secret, "Stripe")
+        header = get_header(headers, "stripe-signature")
+        if not header:
+            raise WebhookSignatureError("Cabeçalho Stripe-Signature ausente")
+
+        parts = parse_signature_header(header)
+        timestamp = (parts.get("t") or [""])[0]
+        if not timestamp.isdigit():
+            raise WebhookSignatureError("Timestamp da assinatura inválido")
+        if abs(self._clock() - int(timestamp)) > self.SIGNATURE_TOLERANCE:
+            raise WebhookSignatureError("Assinatura expirada")
+
+        try:
+            payload = body.decode("utf-8")
+        except UnicodeDecodeError:
+            raise WebhookSignatureError("Corpo do webhook inválido")
+        expected = hmac_sha256(secret, f"{timestamp}.{payload}")
+        if not any(hmac.compare_digest(expected, candidate) for candidate in parts.get("v1", [])):
+            raise WebhookSignatureError("Assinatura do Stripe não confere")
+
+        event = json.loads(body)
+        status = STRIPE_EVENTS.get(event.get("type"))
+        if status is None:
+            return []
+        obj = event.get("data", {}).get("object", {})
+        # Em charge.refunded o objeto é a Charge; a transação guarda o PaymentIntent
+        external_id = obj.get("payment_intent") if event["type"].startswith("charge.") else obj.get("id")
+        if not external_id:
+            return []
+        return [WebhookEvent(self.name, external_id, status, event_id=event.get("id"))]
+
@@ -1,7 +1,16 @@
 # 📄 brasiltransporta/infrastructure/sms/sms_service.py
-from typing import Protocol
+from typing import List, Optional, Protocol
 import logging
 
+import httpx
+
+from brasiltransporta.application.notifications.services.notification_dispatcher import (
+    SMS,
+    DeliveryResult,
+    Notification,
+    is_retryable_status,
+)
+
 logger = logging.getLogger(__name__)
 
 class SMSService(Protocol):
@@ -27,4 +36,51 @@ class TwilioSMSService:
             return True
         except Exception as e:
             logger.error(f"Erro ao enviar SMS: {e}")
-            return False
\ No newline at end of file
+            return False
+
+class TwilioSMSProvider:
+    """
+    Provedor de SMS do dispatcher de notificações (API REST do Twilio)
+
+    O Twilio não tem endpoint de envio em lote para mensagens diferentes;
+    cada lote reaproveita a mesma conexão HTTP e o dispatcher envia vários
+    lotes em paralelo até `max_concurrency`.
+    """
+
+    name = "twilio"
+    channel = SMS
+    API_URL = "https://api.twilio.com/2010-04-01/Accounts/{account_sid}/Messages.json"
+
+    def __init__(
+        self,
+        account_sid: str,
+        auth_token: str,
+        from_number: str,
+        max_batch_size: int = 20,
+        max_concurrency: int = 8,
+        client: Optional[httpx.Client] = None,
+        timeout: float = 10.0,
+    ):
+        self.max_batch_size = max_batch_size
+        self.max_concurrency = max_concurrency
+        self._url = self.API_URL.format(account_sid=account_sid)
+        self._auth = (account_sid, auth_token)
+        self._from = from_number
+        self._client = client or httpx.Client(timeout=timeout)
+
+    def send_batch(self, notifications: List[Notification]) -> List[DeliveryResult]:
+        return [self._send(n) for n in notifications]
+
+    def _send(self, notification: Notification) -> DeliveryResult:
+        data = {"To": notification.to, "From": self._from, "Body": notification.body}
+        try:
+            response = self._client.post(self._url, data=data, auth=self._auth)
+        except httpx.HTTPError as e:
+            return DeliveryResult.failed(notification.id, f"Erro de rede no Twilio: {e}", retryable=True)
+
+        if response.status_code == 201:
+            return DeliveryResult.ok(notification.id, response.json().get("sid"))
+
+        error = f"Twilio respondeu {response.status_code}: {response.text[:200]}"
+        logger.warning(error)
+        return DeliveryResult.failed(notification.id, error, retryable=is_retryable_status(response.status_code))
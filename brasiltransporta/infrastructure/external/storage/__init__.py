@@ -3,13 +3,24 @@ Módulo de storage para integração com Amazon S3
 """
 
 from brasiltransporta.infrastructure.external.storage.s3_client import S3Client
-from brasiltransporta.infrastructure.external.storage.file_validator import FileValidator, FileValidationError
+from brasiltransporta.infrastructure.external.storage.file_validator import (
+    FileValidator,
+    FileValidationError,
+    StreamingFileValidator
+)
+from brasiltransporta.infrastructure.external.storage.media_probe import MediaInfo, sniff_format
 from brasiltransporta.infrastructure.external.storage.storage_config import S3Config, FileValidationConfig
+from brasiltransporta.infrastructure.external.storage.url_signing import PresignedUrlCache, CloudFrontUrlSigner
 
 __all__ = [
     "S3Client",
     "FileValidator", 
     "FileValidationError",
+    "StreamingFileValidator",
+    "MediaInfo",
+    "sniff_format",
     "S3Config",
-    "FileValidationConfig"
+    "FileValidationConfig",
+    "PresignedUrlCache",
+    "CloudFrontUrlSigner"
 ]
\ No newline at end of file
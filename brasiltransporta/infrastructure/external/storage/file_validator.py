@@ -1,7 +1,18 @@
 import os
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 from dataclasses import dataclass
 from brasiltransporta.infrastructure.external.storage.storage_config import FileValidationConfig
+from brasiltransporta.infrastructure.external.storage.media_probe import (
+    FORMAT_EXTENSIONS,
+    FORMAT_MIMES,
+    SNIFF_LENGTH,
+    IsoBmffProbe,
+    MediaInfo,
+    MediaProbeError,
+    parse_avi_header,
+    parse_image_dimensions,
+    sniff_format,
+)
 
 
 class FileValidationError(Exception):
@@ -9,12 +20,232 @@ class FileValidationError(Exception):
     pass
 
 
+class StreamingFileValidator:
+    """
+    Validador incremental de upload
+    
+    Recebe o arquivo em chunks e aborta (FileValidationError) assim que
+    uma regra é violada: formato real (magic bytes) diferente do declarado,
+    tamanho excedido ou dimensões/duração lidas do cabeçalho acima do limite.
+    Apenas os primeiros KB (ou a caixa 'moov' de MP4/MOV) ficam em memória.
+    """
+    
+    def __init__(
+        self,
+        file_type: str,
+        filename: str,
+        mime_type: Optional[str],
+        config: FileValidationConfig = None
+    ):
+        if file_type not in ("image", "video"):
+            raise FileValidationError(f"Tipo de arquivo inválido: {file_type}")
+        
+        self.config = config or FileValidationConfig()
+        self.file_type = file_type
+        self.filename = filename or ""
+        self.mime_type = mime_type
+        self.bytes_received = 0
+        self.info: Optional[MediaInfo] = None
+        
+        self._header = bytearray()
+        self._header_done = False
+        self._mp4_probe: Optional[IsoBmffProbe] = None
+        
+        if file_type == "image":
+            self._allowed_mimes = self.config.allowed_image_mimes
+            self._max_size = self.config.max_image_size
+        else:
+            self._allowed_mimes = self.config.allowed_video_mimes
+            self._max_size = self.config.max_video_size
+        
+        if mime_type is not None and mime_type not in self._allowed_mimes:
+            allowed = ", ".join(self._allowed_mimes.keys())
+            raise FileValidationError(f"Tipo de arquivo não permitido. Tipos aceitos: {allowed}")
+    
+    def feed(self, chunk: bytes) -> None:
+        """
+        Processa o próximo chunk do arquivo
+        
+        Raises:
+            FileValidationError: assim que o arquivo se mostrar inválido
+        """
+        if not chunk:
+            return
+        
+        self.bytes_received += len(chunk)
+        if self.bytes_received > self._max_size:
+            max_mb = self._max_size / (1024 * 1024)
+            raise FileValidationError(f"Arquivo muito grande. Tamanho máximo: {max_mb}MB")
+        
+        try:
+            if self.info is None:
+                self._header += chunk
+                if len(self._header) < SNIFF_LENGTH:
+                    return
+                self._detect_format()
+                if self._mp4_probe is not None:
+                    pending = bytes(self._header)
+                    self._header = bytearray()
+                    self._mp4_probe.feed(pending)
+                    self._check_mp4()
+                else:
+                    self._check_header(final=False)
+            elif self._mp4_probe is not None:
+                if not self._mp4_probe.moov_parsed:
+                    self._mp4_probe.feed(chunk)
+                    self._check_mp4()
+            elif not self._header_done:
+                self._header += chunk
+                self._check_header(final=False)
+        except MediaProbeError as e:
+            raise FileValidationError(f"Arquivo corrompido: {str(e)}")
+    
+    def finalize(self) -> MediaInfo:
+        """
+        Conclui a validação após o último chunk
+        
+        Returns:
+            MediaInfo: formato real e metadados lidos do cabeçalho
+        """
+        try:
+            if self.info is None:
+                if self.bytes_received == 0:
+                    raise FileValidationError("Conteúdo do arquivo vazio")
+                self._detect_format()
+                if self._mp4_probe is not None:
+                    pending = bytes(self._header)
+                    self._header = bytearray()
+                    self._mp4_probe.feed(pending)
+            
+            if self._mp4_probe is not None:
+                self._mp4_probe.finish()
+                self._check_mp4()
+                if not self._mp4_probe.moov_parsed:
+                    raise FileValidationError("Vídeo sem metadados (caixa moov ausente)")
+            elif not self._header_done:
+                self._check_header(final=True)
+        except MediaProbeError as e:
+            raise FileValidationError(f"Arquivo corrompido: {str(e)}")
+        
+        return self.info
+    
+    def _detect_format(self) -> None:
+        fmt = sniff_format(bytes(self._header[:SNIFF_LENGTH]))
+        if fmt is None:
+            raise FileValidationError("Formato de arquivo não reconhecido")
+        
+        real_mime = FORMAT_MIMES[fmt]
+        if real_mime not in self._allowed_mimes:
+            raise FileValidationError(
+                f"Conteúdo do arquivo ({real_mime}) não é permitido para {self.file_type}"
+            )
+        
+        declared = self._allowed_mimes.get(self.mime_type) if self.mime_type else None
+        if declared is not None and FORMAT_MIMES.get(_normalize_format(declared)) != real_mime:
+            raise FileValidationError(
+                f"Tipo declarado ({self.mime_type}) não corresponde ao conteúdo ({real_mime})"
+            )
+        
+        _, ext = os.path.splitext(self.filename)
+        if ext and ext.lower() not in FORMAT_EXTENSIONS[fmt]:
+            raise FileValidationError(
+                f"Extensão {ext.lower()} não corresponde ao conteúdo ({real_mime})"
+            )
+        
+        self.info = MediaInfo(format=fmt, mime_type=real_mime)
+        if fmt in ("mp4", "mov"):
+            self._mp4_probe = IsoBmffProbe(self.config.max_video_metadata_size)
+    
+    def _check_header(self, final: bool) -> None:
+        data = bytes(self._header)
+        if self.info.format == "avi":
+            parsed = parse_avi_header(data)
+            if parsed is not None:
+                self.info.width, self.info.height, self.info.duration = parsed
+        else:
+            parsed = parse_image_dimensions(self.info.format, data)
+            if parsed is not None:
+                self.info.width, self.info.height = parsed
+        
+        if parsed is None:
+            if final or len(self._header) > self.config.image_header_limit:
+                raise FileValidationError("Não foi possível ler as dimensões do arquivo")
+            return
+        
+        self._header_done = True
+        self._header = bytearray()
+        self._check_limits()
+    
+    def _check_mp4(self) -> None:
+        probe = self._mp4_probe
+        if not probe.moov_parsed:
+            return
+        self.info.width = probe.width
+        self.info.height = probe.height
+        self.info.duration = probe.duration
+        self.info.faststart = probe.faststart
+        self._header = bytearray()
+        self._check_limits()
+    
+    def _check_limits(self) -> None:
+        info = self.info
+        if self.file_type == "image":
+            max_w, max_h = self.config.max_image_width, self.config.max_image_height
+        else:
+            max_w, max_h = self.config.max_video_width, self.config.max_video_height
+            # Aceita vídeos em retrato (ex.: 1080x1920)
+            max_w, max_h = max(max_w, max_h), max(max_w, max_h)
+        
+        if (info.width or 0) > max_w or (info.height or 0) > max_h:
+            raise FileValidationError(
+                f"Dimensões muito grandes ({info.width}x{info.height}). Máximo: {max_w}x{max_h}"
+            )
+        
+        if info.duration is not None and info.duration > self.config.max_video_duration:
+            raise FileValidationError(
+                f"Vídeo muito longo ({int(info.duration)}s). Duração máxima: "
+                f"{self.config.max_video_duration}s"
+            )
+
+
+def _normalize_format(extension: str) -> str:
+    """Converte a extensão do mapa de MIMEs permitidos no nome do formato"""
+    return "jpeg" if extension == "jpg" else extension
+
+
 class FileValidator:
     """Validador de arquivos para upload"""
     
     def __init__(self, config: FileValidationConfig = None):
         self.config = config or FileValidationConfig()
     
+    def create_stream_validator(
+        self,
+        file_type: str,
+        filename: str,
+        mime_type: Optional[str]
+    ) -> StreamingFileValidator:
+        """Cria um validador incremental para um upload recebido em chunks"""
+        return StreamingFileValidator(file_type, filename, mime_type, self.config)
+    
+    def inspect(
+        self,
+        chunks: Iterable[bytes],
+        file_type: str,
+        filename: str,
+        mime_type: Optional[str]
+    ) -> MediaInfo:
+        """
+        Valida um arquivo já disponível em chunks (ou em um único bytes)
+        
+        Raises:
+            FileValidationError: na primeira regra violada
+        """
+        validator = self.create_stream_validator(file_type, filename, mime_type)
+        for chunk in chunks:
+            validator.feed(chunk)
+        return validator.finalize()
+    
     def validate_image(self, file_content: bytes, filename: str, mime_type: str) -> Tuple[bool, str]:
         """
         Valida um arquivo de imagem
@@ -43,6 +274,12 @@ class FileValidator:
             if ext.lower() not in ['.jpg', '.jpeg', '.png', '.webp']:
                 return False, "Extensão de arquivo não permitida para imagens"
             
+            # Valida o conteúdo real (magic bytes + cabeçalho)
+            try:
+                self.inspect([file_content], "image", filename, mime_type)
+            except FileValidationError as e:
+                return False, str(e)
+            
             return True, "Arquivo válido"
             
         except Exception as e:
@@ -68,6 +305,12 @@ class FileValidator:
             if ext.lower() not in ['.mp4', '.mov', '.avi']:
                 return False, "Extensão de arquiva não permitida para vídeos"
             
+            # Valida o conteúdo real (magic bytes + cabeçalho)
+            try:
+                self.inspect([file_content], "video", filename, mime_type)
+            except FileValidationError as e:
+                return False, str(e)
+            
             return True, "Arquivo válido"
             
         except Exception as e:
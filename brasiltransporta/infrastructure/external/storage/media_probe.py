@@ -0,0 +1,343 @@
+"""
+Inspeção de arquivos de mídia a partir dos cabeçalhos (magic bytes)
+
+Nenhuma função deste módulo decodifica a imagem ou o vídeo: apenas os
+primeiros bytes (ou as caixas de metadados do MP4/MOV) são lidos.
+"""
+
+import struct
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+
+# Formato detectado -> tipo MIME real
+FORMAT_MIMES: Dict[str, str] = {
+    "jpeg": "image/jpeg",
+    "png": "image/png",
+    "webp": "image/webp",
+    "mp4": "video/mp4",
+    "mov": "video/quicktime",
+    "avi": "video/x-msvideo",
+}
+
+# Formato detectado -> extensões aceitas
+FORMAT_EXTENSIONS: Dict[str, Tuple[str, ...]] = {
+    "jpeg": (".jpg", ".jpeg"),
+    "png": (".png",),
+    "webp": (".webp",),
+    "mp4": (".mp4", ".m4v"),
+    "mov": (".mov",),
+    "avi": (".avi",),
+}
+
+IMAGE_FORMATS = ("jpeg", "png", "webp")
+VIDEO_FORMATS = ("mp4", "mov", "avi")
+
+# Bytes mínimos para identificar qualquer um dos formatos suportados
+SNIFF_LENGTH = 16
+
+# Caixas QuickTime que podem iniciar um .mov antigo (sem 'ftyp')
+_QUICKTIME_LEADING_BOXES = (b"moov", b"mdat", b"wide", b"free", b"skip", b"pnot")
+
+# Marcadores SOFn do JPEG (exclui DHT/JPG/DAC)
+_JPEG_SOF_MARKERS = {
+    0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7,
+    0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF,
+}
+
+
+@dataclass
+class MediaInfo:
+    """Metadados extraídos do cabeçalho de um arquivo de mídia"""
+    format: str
+    mime_type: str
+    width: Optional[int] = None
+    height: Optional[int] = None
+    duration: Optional[float] = None  # segundos (vídeos)
+    faststart: Optional[bool] = None  # MP4/MOV: 'moov' antes de 'mdat'
+
+    @property
+    def is_image(self) -> bool:
+        return self.format in IMAGE_FORMATS
+
+    @property
+    def is_video(self) -> bool:
+        return self.format in VIDEO_FORMATS
+
+
+class MediaProbeError(Exception):
+    """Cabeçalho malformado ou inconsistente"""
+    pass
+
+
+def sniff_format(header: bytes) -> Optional[str]:
+    """
+    Detecta o formato real a partir dos magic bytes
+
+    Args:
+        header: Primeiros bytes do arquivo (idealmente >= SNIFF_LENGTH)
+
+    Returns:
+        str: 'jpeg', 'png', 'webp', 'mp4', 'mov', 'avi' ou None
+    """
+    if header[:3] == b"\xff\xd8\xff":
+        return "jpeg"
+    if header[:8] == b"\x89PNG\r\n\x1a\n":
+        return "png"
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return "webp"
+    if header[:4] == b"RIFF" and header[8:12] == b"AVI ":
+        return "avi"
+    if header[4:8] == b"ftyp":
+        return "mov" if header[8:12] == b"qt  " else "mp4"
+    if header[4:8] in _QUICKTIME_LEADING_BOXES:
+        return "mov"
+    return None
+
+
+def parse_image_dimensions(fmt: str, data: bytes) -> Optional[Tuple[int, int]]:
+    """
+    Lê largura/altura do cabeçalho de uma imagem
+
+    Returns:
+        (largura, altura) ou None se ainda não há bytes suficientes
+
+    Raises:
+        MediaProbeError: se o cabeçalho for inválido
+    """
+    if fmt == "png":
+        return _parse_png(data)
+    if fmt == "jpeg":
+        return _parse_jpeg(data)
+    if fmt == "webp":
+        return _parse_webp(data)
+    raise MediaProbeError(f"Formato de imagem não suportado: {fmt}")
+
+
+def parse_avi_header(data: bytes) -> Optional[Tuple[int, int, float]]:
+    """
+    Lê largura, altura e duração do cabeçalho 'avih' de um AVI
+
+    Returns:
+        (largura, altura, duração em segundos) ou None se faltam bytes
+    """
+    if len(data) < 72:
+        return None
+    if data[12:16] != b"LIST" or data[20:24] != b"hdrl" or data[24:28] != b"avih":
+        raise MediaProbeError("Cabeçalho AVI inválido")
+
+    usec_per_frame, = struct.unpack_from("<I", data, 32)
+    total_frames, = struct.unpack_from("<I", data, 48)
+    width, height = struct.unpack_from("<II", data, 64)
+    duration = total_frames * usec_per_frame / 1_000_000
+    return width, height, duration
+
+
+def _parse_png(data: bytes) -> Optional[Tuple[int, int]]:
+    if len(data) < 24:
+        return None
+    if data[12:16] != b"IHDR":
+        raise MediaProbeError("PNG sem chunk IHDR")
+    return struct.unpack_from(">II", data, 16)
+
+
+def _parse_webp(data: bytes) -> Optional[Tuple[int, int]]:
+    if len(data) < 30:
+        return None
+    chunk = data[12:16]
+    if chunk == b"VP8 ":
+        if data[23:26] != b"\x9d\x01\x2a":
+            raise MediaProbeError("WebP (VP8) com start code inválido")
+        width, height = struct.unpack_from("<HH", data, 26)
+        return width & 0x3FFF, height & 0x3FFF
+    if chunk == b"VP8L":
+        if data[20] != 0x2F:
+            raise MediaProbeError("WebP (VP8L) com assinatura inválida")
+        bits, = struct.unpack_from("<I", data, 21)
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    if chunk == b"VP8X":
+        width = int.from_bytes(data[24:27], "little") + 1
+        height = int.from_bytes(data[27:30], "little") + 1
+        return width, height
+    raise MediaProbeError("WebP com chunk desconhecido")
+
+
+def _parse_jpeg(data: bytes) -> Optional[Tuple[int, int]]:
+    i = 2
+    size = len(data)
+    while i < size:
+        # Pula bytes de preenchimento 0xFF até o código do marcador
+        if data[i] != 0xFF:
+            raise MediaProbeError("JPEG com marcador inválido")
+        while i < size and data[i] == 0xFF:
+            i += 1
+        if i >= size:
+            return None
+        marker = data[i]
+        i += 1
+
+        if marker == 0x01 or 0xD0 <= marker <= 0xD8:
+            continue  # marcadores sem payload
+        if marker in (0xD9, 0xDA):
+            raise MediaProbeError("JPEG sem cabeçalho SOF")
+
+        if i + 2 > size:
+            return None
+        length, = struct.unpack_from(">H", data, i)
+        if marker in _JPEG_SOF_MARKERS:
+            if i + 7 > size:
+                return None
+            height, width = struct.unpack_from(">HH", data, i + 3)
+            return width, height
+        i += length
+    return None
+
+
+class IsoBmffProbe:
+    """
+    Leitor incremental de caixas ISO BMFF (MP4/MOV)
+
+    Percorre as caixas de primeiro nível à medida que os bytes chegam:
+    o conteúdo de 'mdat' é descartado sem ser armazenado e apenas a caixa
+    'moov' é bufferizada para extrair duração e dimensões.
+    """
+
+    def __init__(self, max_moov_size: int = 8 * 1024 * 1024):
+        self.max_moov_size = max_moov_size
+        self.width: Optional[int] = None
+        self.height: Optional[int] = None
+        self.duration: Optional[float] = None
+        self.moov_parsed = False
+        self.faststart: Optional[bool] = None
+
+        self._header = bytearray()
+        self._box_type: Optional[bytes] = None
+        self._remaining = 0  # bytes restantes do payload da caixa atual
+        self._to_eof = False
+        self._moov = bytearray()
+        self._seen_mdat = False
+
+    def feed(self, chunk: bytes) -> None:
+        view = memoryview(chunk)
+        while view:
+            if self._box_type is None:
+                view = self._read_header(view)
+                continue
+
+            if self._to_eof:
+                take = len(view)
+            else:
+                take = min(self._remaining, len(view))
+            if self._box_type == b"moov":
+                self._moov += view[:take]
+            view = view[take:]
+            self._remaining -= take
+
+            if not self._to_eof and self._remaining == 0:
+                self._close_box()
+
+    def finish(self) -> None:
+        """Sinaliza fim do stream (trata caixa 'moov' que vai até o EOF)"""
+        if self._box_type == b"moov" and self._to_eof:
+            self._close_box()
+
+    def _read_header(self, view: memoryview) -> memoryview:
+        need = 8 if len(self._header) < 8 else 16
+        take = min(need - len(self._header), len(view))
+        self._header += view[:take]
+        view = view[take:]
+        if len(self._header) < 8:
+            return view
+
+        size, = struct.unpack_from(">I", self._header, 0)
+        box_type = bytes(self._header[4:8])
+        header_size = 8
+        if size == 1:
+            if len(self._header) < 16:
+                return view
+            size, = struct.unpack_from(">Q", self._header, 8)
+            header_size = 16
+        elif size != 0 and size < 8:
+            raise MediaProbeError("Caixa MP4 com tamanho inválido")
+
+        self._header.clear()
+        self._box_type = box_type
+        self._to_eof = size == 0
+        self._remaining = 0 if self._to_eof else size - header_size
+
+        if box_type == b"mdat":
+            self._seen_mdat = True
+        if box_type == b"moov":
+            if self.faststart is None:
+                self.faststart = not self._seen_mdat
+            if not self._to_eof and self._remaining > self.max_moov_size:
+                raise MediaProbeError("Metadados do vídeo (moov) muito grandes")
+        if not self._to_eof and self._remaining == 0:
+            self._close_box()
+        return view
+
+    def _close_box(self) -> None:
+        if self._box_type == b"moov":
+            self._parse_moov(bytes(self._moov))
+            self._moov.clear()
+        self._box_type = None
+        self._to_eof = False
+        self._remaining = 0
+
+    def _parse_moov(self, data: bytes) -> None:
+        for box_type, payload in _iter_boxes(data):
+            if box_type == b"mvhd":
+                self.duration = _parse_mvhd(payload)
+            elif box_type == b"trak":
+                for child_type, child in _iter_boxes(payload):
+                    if child_type != b"tkhd":
+                        continue
+                    width, height = _parse_tkhd(child)
+                    if width and height:
+                        self.width = max(self.width or 0, width)
+                        self.height = max(self.height or 0, height)
+        self.moov_parsed = True
+
+
+def _iter_boxes(data: bytes) -> List[Tuple[bytes, bytes]]:
+    boxes = []
+    i = 0
+    while i + 8 <= len(data):
+        size, = struct.unpack_from(">I", data, i)
+        box_type = data[i + 4:i + 8]
+        header = 8
+        if size == 1:
+            if i + 16 > len(data):
+                break
+            size, = struct.unpack_from(">Q", data, i + 8)
+            header = 16
+        elif size == 0:
+            size = len(data) - i
+        if size < header or i + size > len(data):
+            raise MediaProbeError("Caixa MP4 truncada")
+        boxes.append((box_type, data[i + header:i + size]))
+        i += size
+    return boxes
+
+
+def _parse_mvhd(payload: bytes) -> Optional[float]:
+    if not payload:
+        return None
+    if payload[0] == 1:
+        timescale, duration = struct.unpack_from(">IQ", payload, 20)
+    else:
+        timescale, duration = struct.unpack_from(">II", payload, 12)
+    if not timescale:
+        return None
+    return duration / timescale
+
+
+def _parse_tkhd(payload: bytes) -> Tuple[int, int]:
+    # version(1) flags(3) + tempos/ids/duração variam conforme a versão
+    offset = 4 + (32 if payload[0] == 1 else 20)
+    # reserved(8) layer(2) alt_group(2) volume(2) reserved(2) matrix(36)
+    offset += 52
+    if len(payload) < offset + 8:
+        raise MediaProbeError("Caixa tkhd truncada")
+    width, height = struct.unpack_from(">II", payload, offset)
+    return width >> 16, height >> 16
@@ -1,6 +1,5 @@
-import boto3
 from botocore.exceptions import ClientError, NoCredentialsError
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator
 import logging
 
 from brasiltransporta.infrastructure.external.storage.storage_config import S3Config
@@ -20,6 +19,9 @@ class S3Client:
     def client(self):
         """Lazy initialization do cliente S3"""
         if self._client is None:
+            # boto3 só é importado aqui: carregá-lo custa ~100 ms no import da API
+            import boto3
+
             try:
                 self._client = boto3.client(
                     's3',
@@ -41,6 +43,12 @@ class S3Client:
                 logger.error(f"Erro ao inicializar cliente S3: {str(e)}")
                 raise
         return self._client
+
+    def close(self) -> None:
+        """Fecha as conexões keep-alive do cliente (se já foi criado)"""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
     
     def upload_file(
         self, 
@@ -77,6 +85,49 @@ class S3Client:
             logger.error(f"Erro inesperado no upload: {str(e)}")
             return False
     
+    def upload_path(
+        self,
+        local_path: str,
+        s3_key: str,
+        content_type: Optional[str] = None,
+        metadata: Optional[Dict[str, str]] = None
+    ) -> bool:
+        """
+        Faz upload de um arquivo local (multipart automático para arquivos grandes)
+        
+        Returns:
+            bool: True se upload foi bem sucedido
+        """
+        try:
+            self.client.upload_file(
+                local_path,
+                self.config.bucket_name,
+                s3_key,
+                ExtraArgs={
+                    "ContentType": content_type or self._detect_content_type(s3_key),
+                    "Metadata": metadata or {}
+                }
+            )
+            logger.info(f"Arquivo {s3_key} upload com sucesso")
+            return True
+        except (ClientError, OSError) as e:
+            logger.error(f"Erro no upload para S3: {str(e)}")
+            return False
+    
+    def download_to_path(self, s3_key: str, local_path: str) -> bool:
+        """
+        Baixa um objeto para um arquivo local
+        
+        Returns:
+            bool: True se download foi bem sucedido
+        """
+        try:
+            self.client.download_file(self.config.bucket_name, s3_key, local_path)
+            return True
+        except (ClientError, OSError) as e:
+            logger.error(f"Erro ao baixar {s3_key} do S3: {str(e)}")
+            return False
+    
     def generate_presigned_url(
         self, 
         s3_key: str, 
@@ -129,6 +180,48 @@ class S3Client:
             logger.error(f"Erro ao deletar arquivo do S3: {str(e)}")
             return False
     
+    def list_keys(self, prefix: str = "") -> Iterator[Dict[str, Any]]:
+        """
+        Lista objetos do bucket (paginado via list_objects_v2)
+        
+        Uso restrito a jobs de reconciliação: requisições da API devem
+        consultar o índice media_assets.
+        
+        Yields:
+            dict: {'key', 'size', 'last_modified'}
+        """
+        paginator = self.client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.config.bucket_name, Prefix=prefix):
+            for obj in page.get("Contents", []):
+                yield {
+                    "key": obj["Key"],
+                    "size": obj.get("Size", 0),
+                    "last_modified": obj.get("LastModified"),
+                }
+    
+    def head_file(self, s3_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Retorna tamanho, content type e metadados de um objeto
+        
+        Returns:
+            dict ou None se o objeto não existir
+        """
+        try:
+            response = self.client.head_object(
+                Bucket=self.config.bucket_name,
+                Key=s3_key
+            )
+            return {
+                "key": s3_key,
+                "size": response.get("ContentLength", 0),
+                "content_type": response.get("ContentType"),
+                "metadata": response.get("Metadata", {}),
+                "last_modified": response.get("LastModified"),
+            }
+        except ClientError as e:
+            logger.error(f"Erro ao consultar arquivo {s3_key} no S3: {str(e)}")
+            return None
+    
     def _detect_content_type(self, filename: str) -> str:
         """Detecta content type baseado na extensão do arquivo"""
         extension = filename.lower().split('.')[-1]
@@ -20,6 +20,16 @@ class S3Config:
     max_image_size: int = 5 * 1024 * 1024  # 5MB
     max_video_size: int = 50 * 1024 * 1024  # 50MB
     
+    # Uploads simultâneos para o S3 em um mesmo lote
+    max_upload_concurrency: int = 4
+    
+    # URLs assinadas
+    presigned_cache_size: int = 10_000
+    cloudfront_domain: Optional[str] = None  # ex.: d111111abcdef8.cloudfront.net
+    cloudfront_key_pair_id: Optional[str] = None
+    cloudfront_private_key_path: Optional[str] = None
+    cloudfront_cookie_domain: Optional[str] = None  # domínio pai da API e do CDN (cookies assinados)
+    
     @classmethod
     def from_env(cls) -> "S3Config":
         """Cria configuração a partir de variáveis de ambiente"""
@@ -29,6 +39,10 @@ class S3Config:
             region_name=os.getenv("AWS_REGION", "sa-east-1"),
             bucket_name=os.getenv("S3_BUCKET_NAME", "brasiltransporta-uploads"),
             endpoint_url=os.getenv("AWS_ENDPOINT_URL"),  # Para desenvolvimento
+            cloudfront_domain=os.getenv("CLOUDFRONT_DOMAIN"),
+            cloudfront_key_pair_id=os.getenv("CLOUDFRONT_KEY_PAIR_ID"),
+            cloudfront_private_key_path=os.getenv("CLOUDFRONT_PRIVATE_KEY_PATH"),
+            cloudfront_cookie_domain=os.getenv("CLOUDFRONT_COOKIE_DOMAIN"),
         )
 
 
@@ -56,4 +70,17 @@ class FileValidationConfig:
     
     # Limites de quantidade
     max_images_per_ad: int = 10
-    max_videos_per_ad: int = 3
\ No newline at end of file
+    max_videos_per_ad: int = 3
+    
+    # Limites lidos do cabeçalho (sem decodificar o arquivo)
+    max_image_width: int = 8192
+    max_image_height: int = 8192
+    max_video_width: int = 3840
+    max_video_height: int = 2160
+    max_video_duration: int = 5 * 60  # segundos
+    
+    # Quantos bytes do início da imagem podem ser lidos até achar as dimensões
+    image_header_limit: int = 256 * 1024  # 256KB
+    
+    # Tamanho máximo da caixa 'moov' (metadados) de MP4/MOV
+    max_video_metadata_size: int = 8 * 1024 * 1024  # 8MB
\ No newline at end of file
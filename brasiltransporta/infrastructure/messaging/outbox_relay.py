@@ -0,0 +1,225 @@
+# brasiltransporta/infrastructure/messaging/outbox_relay.py
+"""
+Relay do outbox: publica no RabbitMQ os eventos gravados junto com os agregados
+
+Cada lote é lido com `SELECT ... FOR UPDATE SKIP LOCKED`, então várias
+instâncias do relay podem rodar em paralelo sem publicar o mesmo evento ao
+mesmo tempo. A entrega é at-least-once: se o processo cair entre a
+publicação e o commit, o evento é publicado de novo com o mesmo
+`message_id` (chave de idempotência) e o consumidor descarta a repetição.
+"""
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from kombu import Connection, Exchange
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from brasiltransporta.infrastructure.persistence.sqlalchemy.models.outbox import OutboxModel
+
+logger = logging.getLogger(__name__)
+
+# Tamanho máximo do erro gravado em `outbox.last_error`
+MAX_ERROR_LENGTH = 500
+
+
+@dataclass(frozen=True)
+class OutboxMessage:
+    """Evento pronto para publicação"""
+    id: str
+    event_type: str
+    aggregate_type: str
+    aggregate_id: str
+    payload: Dict[str, Any]
+    occurred_at: datetime
+
+    @classmethod
+    def from_model(cls, model: OutboxModel) -> "OutboxMessage":
+        return cls(
+            id=str(model.id),
+            event_type=model.event_type,
+            aggregate_type=model.aggregate_type,
+            aggregate_id=model.aggregate_id,
+            payload=dict(model.payload or {}),
+            occurred_at=model.occurred_at,
+        )
+
+    def body(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "type": self.event_type,
+            "aggregate_type": self.aggregate_type,
+            "aggregate_id": self.aggregate_id,
+            "occurred_at": self.occurred_at.isoformat(),
+            "payload": self.payload,
+        }
+
+
+class KombuEventPublisher:
+    """
+    Publica eventos em um exchange topic (routing key = tipo do evento)
+
+    Com `confirm_publish` o AMQP só retorna após o broker confirmar a
+    mensagem, então um evento só é marcado como publicado se o RabbitMQ
+    realmente o recebeu.
+    """
+
+    def __init__(self, broker_url: str, exchange_name: str = "domain_events"):
+        self._connection = Connection(broker_url, transport_options={"confirm_publish": True})
+        self._exchange = Exchange(exchange_name, type="topic", durable=True)
+        self._producer = None
+
+    def publish(self, message: OutboxMessage) -> None:
+        if self._producer is None:
+            self._producer = self._connection.Producer(serializer="json")
+        self._producer.publish(
+            message.body(),
+            exchange=self._exchange,
+            routing_key=message.event_type,
+            declare=[self._exchange],
+            delivery_mode=2,  # persistente
+            message_id=message.id,
+            headers={"idempotency_key": message.id, "event_type": message.event_type},
+            retry=True,
+            retry_policy={"max_retries": 3, "interval_start": 0, "interval_step": 1},
+        )
+
+    def close(self) -> None:
+        self._producer = None
+        self._connection.release()
+
+
+@dataclass
+class OutboxRelayMetrics:
+    """Contadores de vazão do relay (por processo)"""
+    published_total: int = 0
+    failed_total: int = 0
+    batches_total: int = 0
+    last_batch_size: int = 0
+    last_batch_seconds: float = 0.0
+    # Tempo entre a gravação do evento e a publicação (último lote)
+    last_lag_seconds: float = 0.0
+    started_at: float = field(default_factory=time.monotonic)
+
+    def record_batch(self, published: int, failed: int, seconds: float, lag: float) -> None:
+        self.published_total += published
+        self.failed_total += failed
+        self.batches_total += 1
+        self.last_batch_size = published
+        self.last_batch_seconds = seconds
+        self.last_lag_seconds = lag
+
+    def snapshot(self) -> Dict[str, float]:
+        uptime = max(time.monotonic() - self.started_at, 1e-9)
+        return {
+            "published_total": self.published_total,
+            "failed_total": self.failed_total,
+            "batches_total": self.batches_total,
+            "last_batch_size": self.last_batch_size,
+            "last_batch_seconds": round(self.last_batch_seconds, 4),
+            "last_lag_seconds": round(self.last_lag_seconds, 3),
+            "events_per_second": round(self.published_total / uptime, 2),
+            "uptime_seconds": round(uptime, 1),
+        }
+
+
+def pending_stats(session: Session) -> Tuple[int, Optional[float]]:
+    """Quantidade de eventos pendentes e idade (segundos) do mais antigo"""
+    count, oldest = session.execute(
+        select(func.count(OutboxModel.id), func.min(OutboxModel.created_at))
+        .where(OutboxModel.published_at.is_(None))
+    ).one()
+    age = (datetime.utcnow() - oldest).total_seconds() if oldest else None
+    return int(count or 0), age
+
+
+class OutboxRelay:
+    """Lê eventos pendentes em lotes e publica no broker"""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        publisher,
+        batch_size: int = 100,
+        metrics: Optional[OutboxRelayMetrics] = None,
+        metrics_store=None,
+        instance: str = "relay",
+    ):
+        self._session_factory = session_factory
+        self._publisher = publisher
+        self._batch_size = batch_size
+        self.metrics = metrics or OutboxRelayMetrics()
+        # Opcional: RedisOutboxMetricsStore, para expor as métricas na API
+        self._metrics_store = metrics_store
+        self._instance = instance
+
+    def _select_batch(self):
+        return (
+            select(OutboxModel)
+            .where(OutboxModel.published_at.is_(None))
+            .order_by(OutboxModel.created_at)
+            .limit(self._batch_size)
+            .with_for_update(skip_locked=True)
+        )
+
+    def relay_batch(self) -> int:
+        """
+        Publica um lote de eventos pendentes
+
+        Para no primeiro erro para preservar a ordem: o evento que falhou e
+        os seguintes continuam pendentes e voltam no próximo lote.
+
+        Returns:
+            int: eventos publicados neste lote
+        """
+        started = time.monotonic()
+        session = self._session_factory()
+        published, failed, lag = 0, 0, 0.0
+        try:
+            rows = session.execute(self._select_batch()).scalars().all()
+            if not rows:
+                session.rollback()
+                return 0
+
+            now = datetime.utcnow()
+            for row in rows:
+                try:
+                    self._publisher.publish(OutboxMessage.from_model(row))
+                except Exception as e:
+                    row.attempts = (row.attempts or 0) + 1
+                    row.last_error = str(e)[:MAX_ERROR_LENGTH]
+                    failed = 1
+                    logger.warning(f"Falha ao publicar evento {row.id} ({row.event_type}): {e}")
+                    break
+                row.published_at = now
+                row.attempts = (row.attempts or 0) + 1
+                lag = max(lag, (now - row.created_at).total_seconds())
+                published += 1
+
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+        self.metrics.record_batch(published, failed, time.monotonic() - started, lag)
+        if self._metrics_store is not None:
+            self._metrics_store.save(self._instance, self.metrics.snapshot())
+        return published
+
+    def run(self, poll_interval: float = 1.0, stop: Optional[threading.Event] = None) -> None:
+        """Executa até `stop` ser sinalizado; lotes cheios são emendados sem espera"""
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            try:
+                published = self.relay_batch()
+            except Exception as e:
+                logger.exception(f"Erro no relay do outbox: {str(e)}")
+                published = 0
+            if published < self._batch_size:
+                stop.wait(poll_interval)
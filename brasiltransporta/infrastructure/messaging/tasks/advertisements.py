@@ -0,0 +1,124 @@
+# brasiltransporta/infrastructure/messaging/tasks/advertisements.py
+"""
+Tarefas periódicas de anúncios executadas na fila `maintenance`
+
+As visualizações são acumuladas no Redis (RedisViewCounter) e gravadas
+no Postgres em lote pelo Celery beat, em vez de um UPDATE por página vista.
+A expiração de anúncios também é feita em lotes set-based, nunca linha a
+linha em Python.
+"""
+import asyncio
+import logging
+from datetime import datetime
+from typing import List
+
+from brasiltransporta.worker.celery_app import celery_app, task_options
+
+logger = logging.getLogger(__name__)
+
+# Anúncios drenados por UPDATE (limita o tamanho da lista VALUES)
+VIEW_FLUSH_BATCH_SIZE = 1000
+# Evita que um flush monopolize o worker quando o backlog é grande
+VIEW_FLUSH_MAX_BATCHES = 20
+# Anúncios expirados por UPDATE (mantém cada transação curta)
+EXPIRY_BATCH_SIZE = 500
+EXPIRY_MAX_BATCHES = 50
+
+
+def flush_view_counts(view_counter, repository, batch_size: int = VIEW_FLUSH_BATCH_SIZE,
+                      max_batches: int = VIEW_FLUSH_MAX_BATCHES, listing_cache=None) -> int:
+    """
+    Drena os deltas do Redis e aplica cada lote com um único UPDATE
+
+    Se o banco falhar, os deltas do lote voltam para o Redis e serão
+    gravados no próximo flush. Depois de cada lote gravado, a página em
+    cache (`listing_cache`) dos anúncios do lote é invalidada: o delta saiu
+    do Redis e o valor em cache ainda é o anterior ao flush.
+
+    Returns:
+        int: total de visualizações gravadas
+    """
+    flushed = 0
+    for _ in range(max_batches):
+        deltas = view_counter.drain(batch_size)
+        if not deltas:
+            break
+        try:
+            asyncio.run(repository.apply_view_deltas(deltas))
+        except Exception:
+            view_counter.restore(deltas)
+            raise
+        if listing_cache is not None:
+            listing_cache.invalidate(*deltas)
+        flushed += sum(deltas.values())
+        if len(deltas) < batch_size:
+            break
+    return flushed
+
+
+@celery_app.task(name="maintenance.flush_view_counts", **task_options("maintenance"))
+def flush_view_counts_task() -> int:
+    """Grava no banco as visualizações acumuladas no Redis"""
+    from brasiltransporta.infrastructure.persistence.redis.client import get_redis_client
+    from brasiltransporta.infrastructure.persistence.redis.vehicle_listing_cache import RedisVehicleListingCache
+    from brasiltransporta.infrastructure.persistence.redis.view_counter import RedisViewCounter
+    from brasiltransporta.infrastructure.persistence.sqlalchemy.repositories.advertisement_repository import (
+        SQLAlchemyAdvertisementRepository,
+    )
+    from brasiltransporta.infrastructure.persistence.sqlalchemy.session import get_session
+
+    redis_client = get_redis_client()
+    session = get_session()
+    try:
+        flushed = flush_view_counts(
+            RedisViewCounter(redis_client),
+            SQLAlchemyAdvertisementRepository(session),
+            listing_cache=RedisVehicleListingCache(redis_client),
+        )
+    finally:
+        session.close()
+
+    if flushed:
+        logger.info(f"{flushed} visualizações gravadas no banco")
+    return flushed
+
+
+def expire_advertisements(repository, now: datetime = None, batch_size: int = EXPIRY_BATCH_SIZE,
+                          max_batches: int = EXPIRY_MAX_BATCHES) -> List[str]:
+    """
+    Expira anúncios vencidos em lotes até não restar nenhum (ou `max_batches`)
+
+    Returns:
+        List[str]: ids expirados nesta execução
+    """
+    now = now or datetime.utcnow()
+    expired: List[str] = []
+    for _ in range(max_batches):
+        ids = asyncio.run(repository.expire_due(now, batch_size))
+        expired.extend(ids)
+        if len(ids) < batch_size:
+            break
+    return expired
+
+
+@celery_app.task(name="maintenance.expire_advertisements", **task_options("maintenance"))
+def expire_advertisements_task() -> int:
+    """Marca como expirados os anúncios ativos vencidos"""
+    from brasiltransporta.infrastructure.persistence.sqlalchemy.repositories.advertisement_repository import (
+        SQLAlchemyAdvertisementRepository,
+    )
+    from brasiltransporta.infrastructure.persistence.sqlalchemy.session import get_session
+
+    from brasiltransporta.infrastructure.persistence.redis.client import get_redis_client
+    from brasiltransporta.infrastructure.persistence.redis.vehicle_listing_cache import RedisVehicleListingCache
+
+    session = get_session()
+    try:
+        expired = expire_advertisements(SQLAlchemyAdvertisementRepository(session))
+    finally:
+        session.close()
+
+    if expired:
+        RedisVehicleListingCache(get_redis_client()).invalidate(*expired)
+        logger.info(f"{len(expired)} anúncios expirados")
+    return len(expired)
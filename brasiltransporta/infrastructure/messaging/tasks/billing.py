@@ -0,0 +1,145 @@
+# brasiltransporta/infrastructure/messaging/tasks/billing.py
+"""
+Processamento de pagamentos na fila `billing`
+
+O endpoint de webhook só valida a assinatura e enfileira o evento; a
+atualização da transação (e a consulta ao gateway, quando necessária)
+acontece aqui. A conciliação periódica recupera webhooks perdidos.
+
+Os clientes HTTP são assíncronos e ficam presos ao event loop que os
+criou, por isso cada execução de tarefa monta e fecha seus gateways.
+"""
+import asyncio
+import logging
+from datetime import timedelta
+from typing import Any, Dict, Optional
+
+from brasiltransporta.application.billing.services.payment_gateway import PaymentGateway, WebhookEvent
+from brasiltransporta.infrastructure.config.settings import PaymentSettings
+from brasiltransporta.worker.celery_app import celery_app, task_options
+
+logger = logging.getLogger(__name__)
+
+
+class PaymentWebhookQueue:
+    """Enfileira webhooks validados para o worker de cobrança"""
+
+    def enqueue(self, event: WebhookEvent) -> Optional[str]:
+        result = process_payment_webhook.apply_async(args=[event.to_dict()])
+        return result.id
+
+
+def build_gateways(settings: PaymentSettings) -> Dict[str, PaymentGateway]:
+    """
+    Gateways com credenciais configuradas, indexados pelo nome
+
+    Um gateway sem segredo de webhook continua criando e conciliando
+    cobranças, mas recusa todos os webhooks (`require_webhook_secret`).
+    """
+    from brasiltransporta.infrastructure.external.payments.mercadopago_gateway import MercadoPagoPaymentGateway
+    from brasiltransporta.infrastructure.external.payments.pix_gateway import PixPaymentGateway
+    from brasiltransporta.infrastructure.external.payments.stripe_gateway import StripePaymentGateway
+
+    gateways: Dict[str, PaymentGateway] = {}
+    if settings.stripe_api_key:
+        gateways[StripePaymentGateway.name] = StripePaymentGateway(
+            settings.stripe_api_key,
+            settings.stripe_webhook_secret,
+            base_url=settings.stripe_base_url,
+            max_connections=settings.http_max_connections,
+            timeout=settings.http_timeout,
+        )
+    if settings.mercadopago_access_token:
+        gateways[MercadoPagoPaymentGateway.name] = MercadoPagoPaymentGateway(
+            settings.mercadopago_access_token,
+            settings.mercadopago_webhook_secret,
+            base_url=settings.mercadopago_base_url,
+            max_connections=settings.http_max_connections,
+            timeout=settings.http_timeout,
+        )
+    if settings.pix_key:
+        gateways[PixPaymentGateway.name] = PixPaymentGateway(
+            settings.pix_key,
+            settings.pix_merchant_name,
+            settings.pix_merchant_city,
+            settings.pix_webhook_secret,
+        )
+    for name, secret in (
+        ("stripe", settings.stripe_webhook_secret),
+        ("mercadopago", settings.mercadopago_webhook_secret),
+        ("pix", settings.pix_webhook_secret),
+    ):
+        if name in gateways and not secret:
+            logger.warning(f"Segredo do webhook do {name} não configurado: webhooks serão recusados")
+    return gateways
+
+
+async def _close(gateways: Dict[str, PaymentGateway]) -> None:
+    for gateway in gateways.values():
+        await gateway.aclose()
+
+
+def _status_notifier():
+    from brasiltransporta.infrastructure.persistence.redis.client import get_redis_client
+    from brasiltransporta.infrastructure.persistence.redis.transaction_events import RedisTransactionStatusPublisher
+
+    return RedisTransactionStatusPublisher(get_redis_client())
+
+
+async def process_webhook(event: WebhookEvent, transactions, gateways: Dict[str, PaymentGateway],
+                          notifier=None) -> Dict[str, Any]:
+    from brasiltransporta.application.billing.use_cases.process_payment_notification import (
+        ProcessPaymentNotificationUseCase,
+    )
+
+    output = await ProcessPaymentNotificationUseCase(transactions, gateways, notifier).execute(event)
+    return {"transaction_id": output.transaction_id, "status": output.status, "changed": output.changed}
+
+
+async def reconcile(transactions, gateways: Dict[str, PaymentGateway], settings: PaymentSettings,
+                    notifier=None) -> Dict[str, int]:
+    from brasiltransporta.application.billing.use_cases.reconcile_payments import ReconcilePaymentsUseCase
+
+    report = await ReconcilePaymentsUseCase(transactions, gateways, notifier).execute(
+        older_than=timedelta(minutes=settings.reconcile_after_minutes),
+        batch_size=settings.reconcile_batch_size,
+        max_age=timedelta(hours=settings.reconcile_max_age_hours),
+    )
+    return {"checked": report.checked, "updated": report.updated, "unresolved": report.unresolved}
+
+
+def _run_with_repository(coro_factory) -> Any:
+    from brasiltransporta.infrastructure.persistence.sqlalchemy.repositories.transaction_repository import (
+        SQLAlchemyTransactionRepository,
+    )
+    from brasiltransporta.infrastructure.persistence.sqlalchemy.session import get_session
+
+    settings = PaymentSettings()
+    session = get_session()
+
+    async def run():
+        gateways = build_gateways(settings)
+        try:
+            return await coro_factory(SQLAlchemyTransactionRepository(session), gateways, settings)
+        finally:
+            await _close(gateways)
+
+    try:
+        return asyncio.run(run())
+    finally:
+        session.close()
+
+
+@celery_app.task(name="billing.process_payment_webhook", **task_options("billing"))
+def process_payment_webhook(event: Dict[str, Any]) -> Dict[str, Any]:
+    """Aplica à transação o status informado por um webhook"""
+    webhook = WebhookEvent.from_dict(event)
+    notifier = _status_notifier()
+    return _run_with_repository(lambda repo, gateways, _: process_webhook(webhook, repo, gateways, notifier))
+
+
+@celery_app.task(name="billing.reconcile_payments", **task_options("billing"))
+def reconcile_payments_task() -> Dict[str, int]:
+    """Confere no gateway as transações pendentes há muito tempo"""
+    notifier = _status_notifier()
+    return _run_with_repository(lambda repo, gateways, settings: reconcile(repo, gateways, settings, notifier))
@@ -0,0 +1,128 @@
+# brasiltransporta/infrastructure/messaging/tasks/imports.py
+"""
+Importação em lote do estoque de veículos executada na fila `imports`
+
+A API grava o arquivo enviado no S3 (`imports/vehicles/<job_id>.<ext>`),
+registra o job no Redis e enfileira a tarefa. O worker lê o arquivo em
+streaming, grava os veículos em lotes e publica o progresso e o
+relatório final (linhas inválidas e placas duplicadas) no job.
+"""
+import asyncio
+import logging
+import os
+import tempfile
+from typing import Any, Dict
+
+from brasiltransporta.infrastructure.persistence.redis.job_progress import RedisJobProgressStore
+from brasiltransporta.worker.celery_app import celery_app, task_options
+
+logger = logging.getLogger(__name__)
+
+VEHICLE_IMPORT_JOB_KIND = "import_vehicles"
+IMPORT_KEY_PREFIX = "imports/vehicles/"
+
+_FILE_EXTENSIONS = {"csv": "csv", "ndjson": "jsonl"}
+
+
+class VehicleImportQueue:
+    """Envia o arquivo ao S3 e agenda a importação na fila `imports`"""
+
+    def __init__(self, progress_store: RedisJobProgressStore, storage):
+        self.progress_store = progress_store
+        self.storage = storage
+
+    def enqueue(self, store_id: str, local_path: str, fmt: str) -> str:
+        """
+        Registra o job (status 'queued') e envia a tarefa
+
+        Raises:
+            RuntimeError: falha ao gravar o arquivo no S3
+        """
+        job_id = self.progress_store.create(VEHICLE_IMPORT_JOB_KIND, {"store_id": store_id, "format": fmt})
+        file_key = f"{IMPORT_KEY_PREFIX}{job_id}.{_FILE_EXTENSIONS[fmt]}"
+        if not self.storage.upload_from_path(local_path, file_key):
+            self.progress_store.fail(job_id, "Falha ao armazenar o arquivo de importação")
+            raise RuntimeError("Falha ao armazenar o arquivo de importação")
+        job = {"job_id": job_id, "store_id": store_id, "file_key": file_key, "format": fmt}
+        import_vehicles.apply_async(args=[job], task_id=job_id)
+        return job_id
+
+
+def run_import(
+    job: Dict[str, Any], path: str, vehicle_repo, progress_store: RedisJobProgressStore, store_repo=None
+) -> Dict[str, Any]:
+    """
+    Importa o arquivo local `path`, atualizando o progresso a cada lote
+
+    O progresso é a fração do arquivo já lida (o total de linhas só é
+    conhecido no fim).
+
+    Raises:
+        ValidationError: `store_id` inválido ou loja inexistente
+    """
+    from brasiltransporta.application.vehicles.services.vehicle_import import read_rows
+    from brasiltransporta.application.vehicles.use_cases.import_vehicles import ImportVehiclesUseCase
+
+    job_id = job["job_id"]
+    size = os.path.getsize(path) or 1
+    progress_store.start(job_id, stage="importing")
+    with open(path, "rb") as stream:
+        def on_batch(report) -> None:
+            progress_store.update(job_id, 99.0 * stream.tell() / size)
+
+        report = asyncio.run(
+            ImportVehiclesUseCase(vehicle_repo, store_repo).execute(
+                job["store_id"], read_rows(stream, job["format"]), on_batch
+            )
+        )
+    result = report.to_dict()
+    progress_store.complete(job_id, result)
+    return result
+
+
+@celery_app.task(name="imports.import_vehicles", **task_options("imports"))
+def import_vehicles(job: Dict[str, Any]) -> Dict[str, int]:
+    """Importa o arquivo de estoque enviado por uma loja"""
+    from brasiltransporta.application.storage.services.file_storage_service import S3FileStorageService
+    from brasiltransporta.domain.errors.errors import ValidationError
+    from brasiltransporta.infrastructure.external.storage.storage_config import S3Config
+    from brasiltransporta.infrastructure.persistence.redis.client import get_redis_client
+    from brasiltransporta.infrastructure.persistence.sqlalchemy.repositories.store_repository import (
+        SQLAlchemyStoreRepository,
+    )
+    from brasiltransporta.infrastructure.persistence.sqlalchemy.repositories.vehicle_repository import (
+        SQLAlchemyVehicleRepository,
+    )
+    from brasiltransporta.infrastructure.persistence.sqlalchemy.session import get_session
+
+    progress_store = RedisJobProgressStore(get_redis_client())
+    storage = S3FileStorageService(S3Config.from_env())
+    session = get_session()
+    fd, path = tempfile.mkstemp(suffix=os.path.splitext(job["file_key"])[1])
+    os.close(fd)
+    try:
+        if not storage.download_to_path(job["file_key"], path):
+            raise RuntimeError(f"Arquivo {job['file_key']} não encontrado")
+        result = run_import(
+            job, path, SQLAlchemyVehicleRepository(session), progress_store, SQLAlchemyStoreRepository(session)
+        )
+    except ValidationError as e:
+        # Loja inválida: repetir a tarefa não resolve
+        logger.warning(f"Importação {job['job_id']} recusada: {str(e)}")
+        progress_store.fail(job["job_id"], str(e))
+        return {"total": 0, "inserted": 0, "duplicates": 0, "invalid": 0}
+    except Exception as e:
+        # Inclui SoftTimeLimitExceeded; lotes já gravados permanecem
+        logger.exception(f"Erro na importação {job['job_id']}: {str(e)}")
+        progress_store.fail(job["job_id"], f"Erro inesperado: {str(e)}")
+        raise
+    finally:
+        session.close()
+        os.remove(path)
+        storage.delete_file(job["file_key"])
+
+    logger.info(
+        f"Importação {job['job_id']}: {result['inserted']} inseridos, "
+        f"{result['duplicates']} duplicados, {result['invalid']} inválidos"
+    )
+    return {k: result[k] for k in ("total", "inserted", "duplicates", "invalid")}
@@ -0,0 +1,110 @@
+# brasiltransporta/infrastructure/messaging/tasks/media.py
+"""
+Tarefas de mídia (transcodificação de vídeos) executadas na fila `media`
+
+A API apenas enfileira a tarefa e devolve o `job_id`; o progresso fica no
+Redis (RedisJobProgressStore) e o worker respeita o limite de
+transcodificações simultâneas por nó.
+"""
+import logging
+import socket
+from typing import Any, Dict
+
+import redis
+
+from brasiltransporta.infrastructure.persistence.redis.job_progress import (
+    RedisJobProgressStore,
+    RedisConcurrencyLimiter,
+)
+from brasiltransporta.worker.celery_app import celery_app, task_options
+
+logger = logging.getLogger(__name__)
+
+TRANSCODE_JOB_KIND = "transcode_video"
+# Espera antes de tentar de novo quando o nó já está no limite
+SLOT_RETRY_COUNTDOWN = 30
+
+
+class MediaJobQueue:
+    """Agenda jobs de mídia na fila `media` do Celery"""
+
+    def __init__(self, progress_store: RedisJobProgressStore):
+        self.progress_store = progress_store
+
+    def enqueue_transcode(self, file_key: str, ad_id: str) -> str:
+        """Registra o job (status 'queued') e envia a tarefa"""
+        payload = {"file_key": file_key, "ad_id": ad_id}
+        job_id = self.progress_store.create(TRANSCODE_JOB_KIND, payload)
+        transcode_video.apply_async(args=[{"job_id": job_id, **payload}], task_id=job_id)
+        return job_id
+
+
+def node_limiter(redis_client: redis.Redis, limit: int) -> RedisConcurrencyLimiter:
+    """Limitador de transcodificações simultâneas deste nó (todos os processos)"""
+    return RedisConcurrencyLimiter(redis_client, f"transcode:{socket.gethostname()}", limit)
+
+
+def run_transcode_job(job: Dict[str, Any]) -> bool:
+    """
+    Executa um job de transcodificação com dependências próprias
+
+    Cada job abre sua própria sessão de banco (o worker pode rodar vários
+    processos em paralelo).
+    """
+    from brasiltransporta.application.storage.services.file_storage_service import S3FileStorageService
+    from brasiltransporta.application.storage.use_cases.transcode_video import (
+        TranscodeVideoUseCase,
+        TranscodeVideoRequest,
+    )
+    from brasiltransporta.infrastructure.config.settings import AppSettings
+    from brasiltransporta.infrastructure.external.media.ffmpeg_transcoder import FFmpegTranscoder
+    from brasiltransporta.infrastructure.external.storage.storage_config import S3Config
+    from brasiltransporta.infrastructure.persistence.redis.client import get_redis_client
+    from brasiltransporta.infrastructure.persistence.redis.media_listing_cache import RedisMediaListingCache
+    from brasiltransporta.infrastructure.persistence.sqlalchemy.repositories.media_asset_repository import (
+        SQLAlchemyMediaAssetRepository,
+    )
+    from brasiltransporta.infrastructure.persistence.sqlalchemy.session import get_session
+
+    media = AppSettings().media
+    redis_client = get_redis_client()
+    session = get_session()
+    try:
+        use_case = TranscodeVideoUseCase(
+            SQLAlchemyMediaAssetRepository(session),
+            S3FileStorageService(S3Config.from_env()),
+            FFmpegTranscoder(media.ffmpeg_path, media.ffprobe_path, media.transcode_timeout),
+            progress_store=RedisJobProgressStore(redis_client),
+            media_cache=RedisMediaListingCache(redis_client),
+            work_dir=media.work_dir,
+        )
+        result = use_case.execute(TranscodeVideoRequest(file_key=job["file_key"], job_id=job.get("job_id")))
+    finally:
+        session.close()
+
+    if result.success:
+        logger.info(f"Vídeo {job['file_key']} transcodificado: {sorted(result.variants)}")
+    return result.success
+
+
+@celery_app.task(name="media.transcode_video", bind=True, max_retries=None, **task_options("media"))
+def transcode_video(self, job: Dict[str, Any]) -> bool:
+    """Transcodifica um vídeo respeitando o limite de jobs simultâneos do nó"""
+    from brasiltransporta.infrastructure.config.settings import AppSettings
+    from brasiltransporta.infrastructure.persistence.redis.client import get_redis_client
+
+    redis_client = get_redis_client()
+    limiter = node_limiter(redis_client, AppSettings().media.transcode_concurrency)
+    token = limiter.try_acquire()
+    if token is None:
+        raise self.retry(countdown=SLOT_RETRY_COUNTDOWN)
+    try:
+        return run_transcode_job(job)
+    except Exception as e:
+        # Inclui SoftTimeLimitExceeded: o job aparece como falho para o cliente
+        logger.exception(f"Erro inesperado no job {job.get('job_id')}: {str(e)}")
+        if job.get("job_id"):
+            RedisJobProgressStore(redis_client).fail(job["job_id"], f"Erro inesperado: {str(e)}")
+        raise
+    finally:
+        limiter.release(token)
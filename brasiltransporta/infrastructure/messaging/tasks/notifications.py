@@ -0,0 +1,79 @@
+# brasiltransporta/infrastructure/messaging/tasks/notifications.py
+"""
+Envio de e-mails e SMS na fila `notifications`
+
+A requisição só publica a tarefa; a latência dos provedores fica no
+worker. Cada processo do worker tem um único dispatcher, cujos semáforos
+limitam as chamadas simultâneas a cada provedor entre todas as threads.
+"""
+import logging
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from brasiltransporta.application.notifications.services.notification_dispatcher import (
+    EMAIL,
+    SMS,
+    Notification,
+    NotificationDispatcher,
+    RetryPolicy,
+)
+from brasiltransporta.infrastructure.config.settings import NotificationSettings
+from brasiltransporta.worker.celery_app import celery_app, task_options
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationQueue:
+    """Enfileira notificações para o worker (não espera o provedor)"""
+
+    def enqueue(self, notifications: List[Notification]) -> Optional[str]:
+        if not notifications:
+            return None
+        result = send_notifications.apply_async(args=[[n.to_dict() for n in notifications]])
+        return result.id
+
+    def enqueue_one(self, notification: Notification) -> Optional[str]:
+        return self.enqueue([notification])
+
+
+def build_dispatcher(settings: NotificationSettings) -> NotificationDispatcher:
+    """Monta o dispatcher com os provedores configurados (padrão: fake)"""
+    from brasiltransporta.infrastructure.external.notifications.fake_provider import FakeNotificationProvider
+
+    if settings.email_provider == "sendgrid":
+        from brasiltransporta.infrastructure.external.email.sendgrid_service import SendGridEmailProvider
+        email = SendGridEmailProvider(
+            settings.sendgrid_api_key,
+            settings.email_from,
+            settings.email_from_name,
+            max_concurrency=settings.sendgrid_concurrency,
+        )
+    else:
+        email = FakeNotificationProvider(EMAIL)
+
+    if settings.sms_provider == "twilio":
+        from brasiltransporta.infrastructure.external.sms.sms_service import TwilioSMSProvider
+        sms = TwilioSMSProvider(
+            settings.twilio_account_sid,
+            settings.twilio_auth_token,
+            settings.twilio_from_number,
+            max_concurrency=settings.twilio_concurrency,
+        )
+    else:
+        sms = FakeNotificationProvider(SMS)
+
+    return NotificationDispatcher([email, sms], RetryPolicy(max_attempts=settings.max_attempts))
+
+
+@lru_cache(maxsize=1)
+def get_dispatcher() -> NotificationDispatcher:
+    return build_dispatcher(NotificationSettings())
+
+
+@celery_app.task(name="notifications.send", **task_options("notifications"))
+def send_notifications(items: List[Dict[str, Any]]) -> Dict[str, int]:
+    """Entrega um lote de notificações e devolve o resumo (enviadas/falhas)"""
+    report = get_dispatcher().dispatch([Notification.from_dict(item) for item in items])
+    if report.retries:
+        logger.info(f"Notificações: {report.sent} enviadas, {report.failed} falhas, {report.retries} reenvios")
+    return {"sent": report.sent, "failed": report.failed, "retries": report.retries}
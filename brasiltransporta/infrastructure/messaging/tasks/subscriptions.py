@@ -0,0 +1,43 @@
+# brasiltransporta/infrastructure/messaging/tasks/subscriptions.py
+"""
+Conciliação periódica das cotas de assinatura na fila `maintenance`
+
+Os contadores de uso no Redis são incrementados na criação de anúncios e
+destaques, mas anúncios vendidos, expirados ou excluídos não devolvem a
+vaga na hora. A cada ciclo os contadores das lojas com assinatura ativa
+são regravados a partir de uma contagem agrupada no Postgres.
+"""
+import logging
+
+from brasiltransporta.worker.celery_app import celery_app, task_options
+
+logger = logging.getLogger(__name__)
+
+# Lojas por consulta de contagem
+QUOTA_RECONCILE_BATCH_SIZE = 500
+
+
+@celery_app.task(name="maintenance.reconcile_quota_usage", **task_options("maintenance"))
+def reconcile_quota_usage_task() -> int:
+    """Regrava os contadores de cota das lojas com assinatura ativa"""
+    from brasiltransporta.application.subscriptions.services.entitlements import EntitlementService
+    from brasiltransporta.infrastructure.persistence.redis.client import get_redis_client
+    from brasiltransporta.infrastructure.persistence.redis.quota_counter import RedisQuotaCounter
+    from brasiltransporta.infrastructure.persistence.sqlalchemy.repositories.subscription_repository import (
+        SQLAlchemySubscriptionRepository,
+    )
+    from brasiltransporta.infrastructure.persistence.sqlalchemy.session import get_session
+
+    session = get_session()
+    try:
+        service = EntitlementService(
+            SQLAlchemySubscriptionRepository(session),
+            RedisQuotaCounter(get_redis_client()),
+        )
+        reconciled = service.reconcile(batch_size=QUOTA_RECONCILE_BATCH_SIZE)
+    finally:
+        session.close()
+
+    if reconciled:
+        logger.info(f"Cotas de {reconciled} lojas conciliadas")
+    return reconciled
@@ -0,0 +1,41 @@
+# brasiltransporta/infrastructure/persistence/redis/client.py
+from functools import lru_cache
+
+import redis
+import redis.asyncio
+
+from brasiltransporta.infrastructure.config.settings import AppSettings
+
+
+@lru_cache(maxsize=1)
+def get_redis_client() -> redis.Redis:
+    """
+    Cliente Redis compartilhado pelo processo
+
+    A conexão só é aberta no primeiro comando (o pool do redis-py é lazy).
+    """
+    settings = AppSettings()
+    return redis.Redis.from_url(settings.redis.url, decode_responses=True)
+
+
+@lru_cache(maxsize=1)
+def get_async_redis_client() -> redis.asyncio.Redis:
+    """
+    Cliente assíncrono para rotas que aguardam mensagens (pub/sub, SSE)
+
+    Não bloqueia o event loop enquanto espera; cada assinatura usa uma
+    conexão própria do pool.
+    """
+    settings = AppSettings()
+    return redis.asyncio.Redis.from_url(settings.redis.url, decode_responses=True)
+
+
+async def aclose(resource) -> None:
+    """
+    Fecha um cliente/PubSub de `redis.asyncio`
+
+    `aclose()` só existe a partir do redis-py 5.0.1 (o poetry.lock ainda
+    resolve a 4.x, onde o equivalente é o `close()` assíncrono).
+    """
+    close = getattr(resource, "aclose", None) or resource.close
+    await close()
@@ -0,0 +1,24 @@
+# brasiltransporta/infrastructure/persistence/redis/idempotency.py
+import redis
+
+
+class RedisIdempotencyStore:
+    """
+    Registro de chaves já processadas pelos consumidores de eventos
+
+    A entrega do outbox é at-least-once; o consumidor chama `claim` com o
+    `message_id` do evento e só processa quando a chave é nova.
+    """
+
+    def __init__(self, redis_client: redis.Redis, ttl: int = 7 * 24 * 3600, prefix: str = "idempotency:"):
+        self.redis = redis_client
+        self.ttl = ttl
+        self.prefix = prefix
+
+    def claim(self, key: str) -> bool:
+        """True se a chave ainda não foi processada (e a reserva)"""
+        return bool(self.redis.set(f"{self.prefix}{key}", "1", nx=True, ex=self.ttl))
+
+    def release(self, key: str) -> None:
+        """Libera a chave quando o processamento falha, permitindo nova tentativa"""
+        self.redis.delete(f"{self.prefix}{key}")
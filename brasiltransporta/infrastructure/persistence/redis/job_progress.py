@@ -0,0 +1,160 @@
+# brasiltransporta/infrastructure/persistence/redis/job_progress.py
+import json
+import logging
+import time
+import uuid
+from typing import Any, Dict, Optional
+
+import redis
+
+logger = logging.getLogger(__name__)
+
+
+class JobStatus:
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class RedisJobProgressStore:
+    """
+    Progresso de jobs assíncronos (transcodificação, importação...) no Redis
+
+    Cada job é um hash `job:{id}` com status, progresso (0..100), etapa
+    atual e resultado/erro. O hash expira após `ttl` segundos.
+    """
+
+    def __init__(self, redis_client: redis.Redis, ttl: int = 24 * 3600):
+        self.redis = redis_client
+        self.ttl = ttl
+        self.prefix = "job:"
+
+    def _get_key(self, job_id: str) -> str:
+        return f"{self.prefix}{job_id}"
+
+    def create(self, kind: str, payload: Optional[Dict[str, Any]] = None, job_id: Optional[str] = None) -> str:
+        job_id = job_id or str(uuid.uuid4())
+        self._write(job_id, {
+            "id": job_id,
+            "kind": kind,
+            "status": JobStatus.QUEUED,
+            "progress": 0,
+            "stage": "",
+            "payload": json.dumps(payload or {}),
+            "created_at": time.time(),
+        })
+        return job_id
+
+    def start(self, job_id: str, stage: str = "") -> None:
+        self._write(job_id, {"status": JobStatus.RUNNING, "stage": stage, "started_at": time.time()})
+
+    def update(self, job_id: str, progress: float, stage: Optional[str] = None) -> None:
+        fields: Dict[str, Any] = {"progress": round(max(0.0, min(progress, 100.0)), 1)}
+        if stage is not None:
+            fields["stage"] = stage
+        self._write(job_id, fields)
+
+    def complete(self, job_id: str, result: Optional[Dict[str, Any]] = None) -> None:
+        self._write(job_id, {
+            "status": JobStatus.COMPLETED,
+            "progress": 100,
+            "stage": "",
+            "result": json.dumps(result or {}),
+            "finished_at": time.time(),
+        })
+
+    def fail(self, job_id: str, error: str) -> None:
+        self._write(job_id, {"status": JobStatus.FAILED, "error": error, "finished_at": time.time()})
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        data = self.redis.hgetall(self._get_key(job_id))
+        if not data:
+            return None
+        for field in ("payload", "result"):
+            if field in data:
+                data[field] = json.loads(data[field])
+        data["progress"] = float(data.get("progress", 0))
+        return data
+
+    def _write(self, job_id: str, fields: Dict[str, Any]) -> None:
+        key = self._get_key(job_id)
+        try:
+            pipe = self.redis.pipeline()
+            pipe.hset(key, mapping=fields)
+            pipe.expire(key, self.ttl)
+            pipe.execute()
+        except redis.RedisError as e:
+            # Progresso é informativo: falha no Redis não interrompe o job
+            logger.warning(f"Falha ao atualizar progresso do job {job_id}: {e}")
+
+
+# Remove slots expirados (worker que morreu sem liberar) e reserva um se houver vaga
+_ACQUIRE_SCRIPT = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', ARGV[1])
+if redis.call('ZCARD', KEYS[1]) < tonumber(ARGV[3]) then
+    redis.call('ZADD', KEYS[1], ARGV[2], ARGV[4])
+    redis.call('EXPIRE', KEYS[1], ARGV[5])
+    return 1
+end
+return 0
+"""
+
+
+class ConcurrencyLimitExceeded(Exception):
+    """Sem vaga para executar mais um job neste nó"""
+    pass
+
+
+class RedisConcurrencyLimiter:
+    """
+    Limite de jobs simultâneos por nó, compartilhado entre os processos do worker
+
+    Cada slot é um membro de um sorted set com validade; se um processo
+    morrer sem liberar, o slot expira sozinho após `lease_seconds`.
+    """
+
+    def __init__(self, redis_client: redis.Redis, name: str, limit: int, lease_seconds: int = 1800):
+        self.redis = redis_client
+        self.key = f"concurrency:{name}"
+        self.limit = limit
+        self.lease_seconds = lease_seconds
+        self._acquire = self.redis.register_script(_ACQUIRE_SCRIPT)
+
+    def try_acquire(self) -> Optional[str]:
+        """Reserva um slot; retorna o token ou None se o limite foi atingido"""
+        token = str(uuid.uuid4())
+        now = time.time()
+        acquired = self._acquire(
+            keys=[self.key],
+            args=[now, now + self.lease_seconds, self.limit, token, self.lease_seconds],
+        )
+        return token if acquired else None
+
+    def release(self, token: str) -> None:
+        self.redis.zrem(self.key, token)
+
+    def slot(self) -> "_Slot":
+        """Context manager: `with limiter.slot(): ...`"""
+        return _Slot(self)
+
+    def in_use(self) -> int:
+        self.redis.zremrangebyscore(self.key, "-inf", time.time())
+        return self.redis.zcard(self.key)
+
+
+class _Slot:
+    def __init__(self, limiter: RedisConcurrencyLimiter):
+        self.limiter = limiter
+        self.token: Optional[str] = None
+
+    def __enter__(self) -> str:
+        self.token = self.limiter.try_acquire()
+        if self.token is None:
+            raise ConcurrencyLimitExceeded(
+                f"Limite de {self.limiter.limit} jobs simultâneos atingido ({self.limiter.key})"
+            )
+        return self.token
+
+    def __exit__(self, *exc) -> None:
+        self.limiter.release(self.token)
@@ -0,0 +1,47 @@
+# brasiltransporta/infrastructure/persistence/redis/media_listing_cache.py
+import json
+import logging
+from typing import Any, Dict, List, Optional
+
+import redis
+
+from brasiltransporta.infrastructure.persistence.redis.vehicle_listing_cache import listing_key
+
+logger = logging.getLogger(__name__)
+
+
+class RedisMediaListingCache:
+    """
+    Cache da listagem de arquivos por anúncio
+
+    Falhas no Redis nunca quebram a requisição: a leitura cai para o banco.
+    """
+
+    def __init__(self, redis_client: redis.Redis, ttl: int = 300):
+        self.redis = redis_client
+        self.ttl = ttl
+        self.prefix = "media_listing:"
+
+    def _get_key(self, ad_id: str) -> str:
+        return f"{self.prefix}{ad_id}"
+
+    def get(self, ad_id: str) -> Optional[List[Dict[str, Any]]]:
+        try:
+            data = self.redis.get(self._get_key(ad_id))
+        except redis.RedisError as e:
+            logger.warning(f"Cache de mídia indisponível: {e}")
+            return None
+        return json.loads(data) if data else None
+
+    def set(self, ad_id: str, items: List[Dict[str, Any]]) -> None:
+        try:
+            self.redis.setex(self._get_key(ad_id), self.ttl, json.dumps(items, default=str))
+        except redis.RedisError as e:
+            logger.warning(f"Falha ao gravar cache de mídia: {e}")
+
+    def invalidate(self, ad_id: str) -> None:
+        # As mídias fazem parte da página do anúncio (VehicleListing): cai junto
+        try:
+            self.redis.delete(self._get_key(ad_id), listing_key(ad_id))
+        except redis.RedisError as e:
+            logger.warning(f"Falha ao invalidar cache de mídia: {e}")
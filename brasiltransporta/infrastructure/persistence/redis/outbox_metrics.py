@@ -0,0 +1,39 @@
+# brasiltransporta/infrastructure/persistence/redis/outbox_metrics.py
+import json
+import logging
+from typing import Any, Dict
+
+import redis
+
+logger = logging.getLogger(__name__)
+
+
+class RedisOutboxMetricsStore:
+    """
+    Snapshots das métricas de cada instância do relay do outbox
+
+    Cada instância grava seu snapshot com TTL; instâncias paradas somem
+    sozinhas da listagem.
+    """
+
+    def __init__(self, redis_client: redis.Redis, ttl: int = 300):
+        self.redis = redis_client
+        self.ttl = ttl
+        self.prefix = "outbox:relay:"
+
+    def save(self, instance: str, snapshot: Dict[str, Any]) -> None:
+        try:
+            self.redis.setex(f"{self.prefix}{instance}", self.ttl, json.dumps(snapshot))
+        except redis.RedisError as e:
+            logger.warning(f"Falha ao gravar métricas do relay: {e}")
+
+    def all(self) -> Dict[str, Dict[str, Any]]:
+        snapshots = {}
+        try:
+            for key in self.redis.scan_iter(match=f"{self.prefix}*"):
+                data = self.redis.get(key)
+                if data:
+                    snapshots[key[len(self.prefix):]] = json.loads(data)
+        except redis.RedisError as e:
+            logger.warning(f"Métricas do relay indisponíveis: {e}")
+        return snapshots
@@ -0,0 +1,104 @@
+# brasiltransporta/infrastructure/persistence/redis/quota_counter.py
+import logging
+from typing import Dict
+
+import redis
+
+from brasiltransporta.application.subscriptions.services.entitlements import QuotaCheck, QuotaCounterUnavailable
+from brasiltransporta.domain.entities.subscription import QuotaResource
+
+logger = logging.getLogger(__name__)
+
+# Verifica o limite e incrementa o uso na mesma operação atômica.
+# Retorna {status, usado, limite}: status 1 = ok, 0 = limite atingido,
+# -1 = loja fora do cache. Limite negativo = ilimitado.
+ACQUIRE_SCRIPT = """
+local limit = redis.call('HGET', KEYS[1], 'limit:' .. ARGV[1])
+if not limit then
+  return {-1, 0, 0}
+end
+limit = tonumber(limit)
+local amount = tonumber(ARGV[2])
+local used = tonumber(redis.call('HGET', KEYS[1], 'used:' .. ARGV[1]) or '0')
+if limit >= 0 and used + amount > limit then
+  return {0, used, limit}
+end
+return {1, redis.call('HINCRBY', KEYS[1], 'used:' .. ARGV[1], amount), limit}
+"""
+
+# Decrementa sem ficar negativo
+RELEASE_SCRIPT = """
+local used = tonumber(redis.call('HGET', KEYS[1], 'used:' .. ARGV[1]) or '0')
+local amount = math.min(used, tonumber(ARGV[2]))
+if amount <= 0 then
+  return 0
+end
+return redis.call('HINCRBY', KEYS[1], 'used:' .. ARGV[1], -amount)
+"""
+
+# Carrega limites e uso; ARGV[1] = '1' sobrescreve, '0' só se a chave não existir
+PRIME_SCRIPT = """
+if ARGV[1] == '0' and redis.call('EXISTS', KEYS[1]) == 1 then
+  return 0
+end
+redis.call('DEL', KEYS[1])
+for i = 3, #ARGV, 2 do
+  redis.call('HSET', KEYS[1], ARGV[i], ARGV[i + 1])
+end
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+return 1
+"""
+
+
+class RedisQuotaCounter:
+    """
+    Uso das cotas de cada loja em um hash `quota:{store_id}`
+
+    Campos `limit:<recurso>` e `used:<recurso>`. Cada verificação é uma
+    única chamada EVALSHA. A chave expira após `ttl` segundos; a
+    conciliação periódica a regrava antes disso para lojas ativas.
+    """
+
+    def __init__(self, redis_client: redis.Redis, ttl: int = 3600):
+        self.redis = redis_client
+        self.ttl = ttl
+        self.prefix = "quota:"
+        self._acquire = redis_client.register_script(ACQUIRE_SCRIPT)
+        self._release = redis_client.register_script(RELEASE_SCRIPT)
+        self._prime = redis_client.register_script(PRIME_SCRIPT)
+
+    def _get_key(self, store_id: str) -> str:
+        return f"{self.prefix}{store_id}"
+
+    def try_acquire(self, store_id: str, resource: QuotaResource, amount: int = 1) -> QuotaCheck:
+        try:
+            status, used, limit = self._acquire(keys=[self._get_key(store_id)], args=[resource.value, amount])
+        except redis.RedisError as e:
+            raise QuotaCounterUnavailable(str(e)) from e
+        status = int(status)
+        if status < 0:
+            return QuotaCheck(allowed=None)
+        return QuotaCheck(allowed=status == 1, used=int(used), limit=int(limit))
+
+    def release(self, store_id: str, resource: QuotaResource, amount: int = 1) -> None:
+        try:
+            self._release(keys=[self._get_key(store_id)], args=[resource.value, amount])
+        except redis.RedisError as e:
+            raise QuotaCounterUnavailable(str(e)) from e
+
+    def prime(self, store_id: str, limits: Dict[QuotaResource, int], usage: Dict[QuotaResource, int],
+              overwrite: bool = False) -> bool:
+        args = ["1" if overwrite else "0", self.ttl]
+        for resource in QuotaResource:
+            args += [f"limit:{resource.value}", limits.get(resource, 0)]
+            args += [f"used:{resource.value}", usage.get(resource, 0)]
+        try:
+            return bool(self._prime(keys=[self._get_key(store_id)], args=args))
+        except redis.RedisError as e:
+            raise QuotaCounterUnavailable(str(e)) from e
+
+    def invalidate(self, store_id: str) -> None:
+        try:
+            self.redis.delete(self._get_key(store_id))
+        except redis.RedisError as e:
+            logger.warning(f"Erro ao invalidar cotas da loja {store_id}: {str(e)}")
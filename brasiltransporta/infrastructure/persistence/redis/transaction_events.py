@@ -0,0 +1,74 @@
+# brasiltransporta/infrastructure/persistence/redis/transaction_events.py
+import json
+import logging
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Optional
+
+import redis
+
+from brasiltransporta.infrastructure.persistence.redis.client import aclose
+
+logger = logging.getLogger(__name__)
+
+CHANNEL_PREFIX = "transactions:"
+
+
+def transaction_channel(transaction_id: str) -> str:
+    return f"{CHANNEL_PREFIX}{transaction_id}"
+
+
+class RedisTransactionStatusPublisher:
+    """
+    Publica mudanças de status de transações no Redis (pub/sub)
+
+    Cada instância da API assina apenas os canais dos clientes conectados
+    a ela, então a mudança feita pelo worker chega a qualquer réplica.
+    """
+
+    def __init__(self, redis_client: redis.Redis):
+        self.redis = redis_client
+
+    def publish(self, transaction_id: str, status: str) -> None:
+        message = json.dumps({
+            "transaction_id": transaction_id,
+            "status": status,
+            "at": datetime.utcnow().isoformat(),
+        })
+        try:
+            self.redis.publish(transaction_channel(transaction_id), message)
+        except redis.RedisError as e:
+            # O status já está no banco; o cliente o recebe ao reconectar
+            logger.warning(f"Erro ao publicar status da transação {transaction_id}: {str(e)}")
+
+
+class RedisTransactionStatusSubscriber:
+    """Assina o canal de uma transação (cliente `redis.asyncio`)"""
+
+    def __init__(self, async_redis_client):
+        self.redis = async_redis_client
+
+    async def listen(self, transaction_id: str, poll_timeout: float = 1.0) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        """
+        Gera as mensagens do canal
+
+        O primeiro item é None, logo após a assinatura ficar ativa; depois
+        gera None a cada `poll_timeout` sem mensagem, para o chamador enviar
+        heartbeats ou encerrar.
+        """
+        pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(transaction_channel(transaction_id))
+        try:
+            yield None
+            while True:
+                message = await pubsub.get_message(timeout=poll_timeout)
+                if message is None:
+                    yield None
+                    continue
+                try:
+                    yield json.loads(message["data"])
+                except (TypeError, ValueError):
+                    continue
+        finally:
+            await pubsub.unsubscribe()
+            await aclose(pubsub)
+
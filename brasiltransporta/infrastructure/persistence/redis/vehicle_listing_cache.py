@@ -0,0 +1,52 @@
+# brasiltransporta/infrastructure/persistence/redis/vehicle_listing_cache.py
+import json
+import logging
+from typing import Any, Dict, Optional
+
+import redis
+
+logger = logging.getLogger(__name__)
+
+LISTING_PREFIX = "listing:"
+
+
+def listing_key(advertisement_id: str) -> str:
+    return f"{LISTING_PREFIX}{advertisement_id}"
+
+
+class RedisVehicleListingCache:
+    """
+    Cache da página do anúncio (VehicleListing) por anúncio
+
+    Invalidado nas escritas do anúncio (publicação, destaque, expiração,
+    flush das visualizações) e das mídias; o TTL cobre o que não passa por
+    elas (dados da loja e do veículo).
+    Falhas no Redis nunca quebram a requisição: a leitura cai para o banco.
+    """
+
+    def __init__(self, redis_client: redis.Redis, ttl: int = 300):
+        self.redis = redis_client
+        self.ttl = ttl
+
+    def get(self, advertisement_id: str) -> Optional[Dict[str, Any]]:
+        try:
+            data = self.redis.get(listing_key(advertisement_id))
+        except redis.RedisError as e:
+            logger.warning(f"Cache de anúncios indisponível: {e}")
+            return None
+        return json.loads(data) if data else None
+
+    def set(self, advertisement_id: str, listing: Dict[str, Any]) -> None:
+        try:
+            self.redis.setex(listing_key(advertisement_id), self.ttl, json.dumps(listing, default=str))
+        except redis.RedisError as e:
+            logger.warning(f"Falha ao gravar cache do anúncio: {e}")
+
+    def invalidate(self, *advertisement_ids: str) -> None:
+        keys = [listing_key(i) for i in advertisement_ids]
+        if not keys:
+            return
+        try:
+            self.redis.delete(*keys)
+        except redis.RedisError as e:
+            logger.warning(f"Falha ao invalidar cache do anúncio: {e}")
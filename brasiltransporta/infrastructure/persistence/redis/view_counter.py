@@ -0,0 +1,105 @@
+# brasiltransporta/infrastructure/persistence/redis/view_counter.py
+import logging
+from typing import Dict, List, Optional
+
+import redis
+
+logger = logging.getLogger(__name__)
+
+
+class RedisViewCounter:
+    """
+    Contador de visualizações de anúncios com escrita em lote no banco
+
+    Cada visualização faz INCR em `views:pending:{id}` (delta ainda não
+    gravado), PFADD no HyperLogLog de visitantes únicos e marca o anúncio no
+    conjunto `views:dirty`. Uma tarefa periódica drena os deltas e aplica
+    tudo no Postgres com um único UPDATE.
+    """
+
+    DIRTY_KEY = "views:dirty"
+
+    def __init__(self, redis_client: redis.Redis):
+        self.redis = redis_client
+
+    def _pending_key(self, advertisement_id: str) -> str:
+        return f"views:pending:{advertisement_id}"
+
+    def _unique_key(self, advertisement_id: str) -> str:
+        return f"views:unique:{advertisement_id}"
+
+    def record(self, advertisement_id: str, viewer_id: Optional[str] = None) -> int:
+        """
+        Registra uma visualização
+
+        Returns:
+            int: visualizações ainda não gravadas no banco (inclui esta),
+                ou 0 se o Redis estiver indisponível
+        """
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.incr(self._pending_key(advertisement_id))
+            pipe.sadd(self.DIRTY_KEY, advertisement_id)
+            if viewer_id:
+                pipe.pfadd(self._unique_key(advertisement_id), viewer_id)
+            return int(pipe.execute()[0])
+        except redis.RedisError as e:
+            # Perder uma visualização é aceitável; quebrar a página não
+            logger.warning(f"Falha ao registrar visualização de {advertisement_id}: {e}")
+            return 0
+
+    def pending(self, advertisement_id: str) -> int:
+        """Visualizações registradas e ainda não gravadas no banco"""
+        try:
+            return int(self.redis.get(self._pending_key(advertisement_id)) or 0)
+        except redis.RedisError:
+            return 0
+
+    def pending_many(self, advertisement_ids: List[str]) -> Dict[str, int]:
+        """`pending` de vários anúncios num único MGET"""
+        if not advertisement_ids:
+            return {}
+        try:
+            values = self.redis.mget([self._pending_key(i) for i in advertisement_ids])
+        except redis.RedisError:
+            return {}
+        return {i: int(v or 0) for i, v in zip(advertisement_ids, values)}
+
+    def unique_viewers(self, advertisement_id: str) -> int:
+        """Estimativa de visitantes únicos (HyperLogLog, erro ~0,8%)"""
+        try:
+            return int(self.redis.pfcount(self._unique_key(advertisement_id)))
+        except redis.RedisError:
+            return 0
+
+    def drain(self, batch_size: int = 1000) -> Dict[str, int]:
+        """
+        Retira do Redis os deltas de até `batch_size` anúncios
+
+        Visualizações que chegarem durante a drenagem recriam a chave e
+        marcam o anúncio de novo, ficando para a próxima execução.
+        """
+        ids = self.redis.spop(self.DIRTY_KEY, batch_size) or []
+        if not ids:
+            return {}
+
+        pipe = self.redis.pipeline(transaction=False)
+        for advertisement_id in ids:
+            pipe.getdel(self._pending_key(advertisement_id))
+        values = pipe.execute()
+
+        return {
+            advertisement_id: int(value)
+            for advertisement_id, value in zip(ids, values)
+            if value and int(value) > 0
+        }
+
+    def restore(self, deltas: Dict[str, int]) -> None:
+        """Devolve deltas drenados que não puderam ser gravados no banco"""
+        if not deltas:
+            return
+        pipe = self.redis.pipeline(transaction=False)
+        for advertisement_id, delta in deltas.items():
+            pipe.incrby(self._pending_key(advertisement_id), delta)
+            pipe.sadd(self.DIRTY_KEY, advertisement_id)
+        pipe.execute()
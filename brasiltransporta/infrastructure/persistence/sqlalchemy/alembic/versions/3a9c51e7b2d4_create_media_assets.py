@@ -0,0 +1,45 @@
+"""create media_assets
+
+Revision ID: 3a9c51e7b2d4
+Revises: 0e8d342491eb
+Create Date: 2026-10-19 10:12:31.418220
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3a9c51e7b2d4'
+down_revision: Union[str, None] = '0e8d342491eb'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'media_assets',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('key', sa.String(length=512), nullable=False),
+        sa.Column('ad_id', sa.String(length=64), nullable=False),
+        sa.Column('file_type', sa.String(length=10), nullable=False),
+        sa.Column('mime_type', sa.String(length=100), nullable=False),
+        sa.Column('size', sa.BigInteger(), nullable=False),
+        sa.Column('width', sa.Integer(), nullable=True),
+        sa.Column('height', sa.Integer(), nullable=True),
+        sa.Column('duration', sa.Float(), nullable=True),
+        sa.Column('content_hash', sa.String(length=64), nullable=True),
+        sa.Column('variants', sa.JSON(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('key')
+    )
+    op.create_index('ix_media_assets_ad_id_created_at', 'media_assets', ['ad_id', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_media_assets_ad_id_created_at', table_name='media_assets')
+    op.drop_table('media_assets')
@@ -0,0 +1,50 @@
+"""add subscriptions
+
+Revision ID: 4f0a7d3b92c6
+Revises: d81f3c6a27e9
+Create Date: 2026-10-19 13:05:12.408817
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f0a7d3b92c6'
+down_revision: Union[str, None] = 'd81f3c6a27e9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('subscriptions',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('store_id', sa.UUID(), nullable=False),
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('plan_id', sa.UUID(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('max_ads', sa.Integer(), nullable=False),
+    sa.Column('max_featured_ads', sa.Integer(), nullable=False),
+    sa.Column('starts_at', postgresql.TIMESTAMP(), nullable=False),
+    sa.Column('ends_at', postgresql.TIMESTAMP(), nullable=False),
+    sa.Column('created_at', postgresql.TIMESTAMP(), nullable=False),
+    sa.Column('updated_at', postgresql.TIMESTAMP(), nullable=False),
+    sa.ForeignKeyConstraint(['store_id'], ['stores.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['plan_id'], ['plans.id']),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_subscriptions_store_id_status', 'subscriptions', ['store_id', 'status'], unique=False)
+    op.create_index('ix_subscriptions_status_ends_at', 'subscriptions', ['status', 'ends_at'], unique=False)
+    # Contagem de uso por loja na carga e na conciliação das cotas
+    op.create_index('ix_advertisements_store_id_status', 'advertisements', ['store_id', 'status'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_advertisements_store_id_status', table_name='advertisements')
+    op.drop_index('ix_subscriptions_status_ends_at', table_name='subscriptions')
+    op.drop_index('ix_subscriptions_store_id_status', table_name='subscriptions')
+    op.drop_table('subscriptions')
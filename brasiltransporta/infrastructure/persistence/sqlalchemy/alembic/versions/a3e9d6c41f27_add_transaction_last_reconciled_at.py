@@ -0,0 +1,30 @@
+"""add transaction last_reconciled_at
+
+Revision ID: a3e9d6c41f27
+Revises: e5b7c2a19d40
+Create Date: 2026-10-19 18:05:12.418233
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3e9d6c41f27'
+down_revision: Union[str, None] = 'e5b7c2a19d40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('transactions', sa.Column('last_reconciled_at', sa.DateTime(), nullable=True))
+    op.create_index(
+        'ix_transactions_status_last_reconciled_at', 'transactions', ['status', 'last_reconciled_at'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_transactions_status_last_reconciled_at', table_name='transactions')
+    op.drop_column('transactions', 'last_reconciled_at')
@@ -0,0 +1,37 @@
+"""add advertisement expiry and media
+
+Revision ID: b6e2f08d4c15
+Revises: 7c41d2a9f0b3
+Create Date: 2026-10-19 11:41:09.522870
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6e2f08d4c15'
+down_revision: Union[str, None] = '7c41d2a9f0b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('advertisements', sa.Column('images', sa.JSON(), server_default='[]', nullable=False))
+    op.add_column('advertisements', sa.Column('videos', sa.JSON(), server_default='[]', nullable=False))
+    op.add_column('advertisements', sa.Column('expires_at', sa.DateTime(), nullable=True))
+    # Anúncios já ativos ganham os 30 dias contados da última alteração
+    op.execute(
+        "UPDATE advertisements SET expires_at = updated_at + interval '30 days' "
+        "WHERE status = 'ativo' AND expires_at IS NULL"
+    )
+    op.create_index('ix_advertisements_status_expires_at', 'advertisements', ['status', 'expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_advertisements_status_expires_at', table_name='advertisements')
+    op.drop_column('advertisements', 'expires_at')
+    op.drop_column('advertisements', 'videos')
+    op.drop_column('advertisements', 'images')
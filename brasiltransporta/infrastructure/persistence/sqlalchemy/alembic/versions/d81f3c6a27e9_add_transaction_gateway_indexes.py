@@ -0,0 +1,33 @@
+"""add transaction gateway and indexes
+
+Revision ID: d81f3c6a27e9
+Revises: b6e2f08d4c15
+Create Date: 2026-10-19 12:20:33.184502
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd81f3c6a27e9'
+down_revision: Union[str, None] = 'b6e2f08d4c15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('transactions', sa.Column('gateway', sa.String(length=20), nullable=True))
+    op.create_index(
+        'ix_transactions_external_payment_id', 'transactions', ['external_payment_id'], unique=True,
+        postgresql_where=sa.text('external_payment_id IS NOT NULL')
+    )
+    op.create_index('ix_transactions_status_created_at', 'transactions', ['status', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_transactions_status_created_at', table_name='transactions')
+    op.drop_index('ix_transactions_external_payment_id', table_name='transactions')
+    op.drop_column('transactions', 'gateway')
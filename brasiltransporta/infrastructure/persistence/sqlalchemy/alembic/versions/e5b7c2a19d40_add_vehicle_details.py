@@ -0,0 +1,44 @@
+"""add vehicle details
+
+Revision ID: e5b7c2a19d40
+Revises: 4f0a7d3b92c6
+Create Date: 2026-10-19 15:42:37.120954
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b7c2a19d40'
+down_revision: Union[str, None] = '4f0a7d3b92c6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('vehicles', sa.Column('vehicle_type', sa.String(length=40), nullable=True))
+    op.add_column('vehicles', sa.Column('condition', sa.String(length=20), nullable=True))
+    op.add_column('vehicles', sa.Column('price', sa.Numeric(precision=14, scale=2), nullable=True))
+    op.add_column('vehicles', sa.Column('implement_segment', sa.String(length=40), nullable=True))
+    op.add_column('vehicles', sa.Column('description', sa.Text(), nullable=True))
+    op.add_column('vehicles', sa.Column('mileage', sa.Integer(), nullable=True))
+    op.add_column('vehicles', sa.Column('color', sa.String(length=40), nullable=True))
+    op.add_column('vehicles', sa.Column('engine_power', sa.String(length=40), nullable=True))
+    op.add_column('vehicles', sa.Column('axle_configuration', sa.String(length=20), nullable=True))
+    op.add_column('vehicles', sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('vehicles', 'updated_at')
+    op.drop_column('vehicles', 'axle_configuration')
+    op.drop_column('vehicles', 'engine_power')
+    op.drop_column('vehicles', 'color')
+    op.drop_column('vehicles', 'mileage')
+    op.drop_column('vehicles', 'description')
+    op.drop_column('vehicles', 'implement_segment')
+    op.drop_column('vehicles', 'price')
+    op.drop_column('vehicles', 'condition')
+    op.drop_column('vehicles', 'vehicle_type')
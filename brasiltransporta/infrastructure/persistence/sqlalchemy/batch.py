@@ -0,0 +1,27 @@
+# brasiltransporta/infrastructure/persistence/sqlalchemy/batch.py
+import uuid
+from typing import Iterable, List
+
+from sqlalchemy import any_, bindparam
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
+
+
+def parse_uuids(ids: Iterable[str]) -> List[uuid.UUID]:
+    """UUIDs válidos e sem repetição, na ordem recebida (ids inválidos são ignorados)"""
+    parsed = []
+    for value in ids:
+        try:
+            parsed.append(value if isinstance(value, uuid.UUID) else uuid.UUID(str(value)))
+        except ValueError:
+            continue
+    return list(dict.fromkeys(parsed))
+
+
+def uuid_in(column, ids: List[uuid.UUID]):
+    """
+    `column = ANY(:ids)` com um único parâmetro array
+
+    Diferente do IN, o SQL não muda com a quantidade de ids: o Postgres
+    reaproveita o plano e o cache de statements do SQLAlchemy também.
+    """
+    return column == any_(bindparam("ids", ids, type_=ARRAY(PG_UUID(as_uuid=True))))
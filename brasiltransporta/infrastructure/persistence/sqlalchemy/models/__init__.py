@@ -7,3 +7,6 @@ from .vehicle import VehicleModel        # noqa: F401
 from .advertisement import AdvertisementModel  # noqa: F401
 from .plan import PlanModel              # noqa: F401
 from .transaction import TransactionModel  # noqa: F401
+from .media_asset import MediaAssetModel  # noqa: F401
+from .outbox import OutboxModel  # noqa: F401
+from .subscription import SubscriptionModel  # noqa: F401
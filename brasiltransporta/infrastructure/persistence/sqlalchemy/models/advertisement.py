@@ -1,12 +1,18 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, Text, DateTime, Numeric, ForeignKey, Boolean, Integer
+from sqlalchemy import Column, String, Text, DateTime, Numeric, ForeignKey, Boolean, Integer, JSON, Index
 from sqlalchemy.dialects.postgresql import UUID
 from .base import Base
 
 
 class AdvertisementModel(Base):
     __tablename__ = "advertisements"
+    __table_args__ = (
+        # Listagem de ativos e varredura de expiração (status + expires_at)
+        Index("ix_advertisements_status_expires_at", "status", "expires_at"),
+        # Uso das cotas do plano por loja
+        Index("ix_advertisements_store_id_status", "store_id", "status"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     store_id = Column(UUID(as_uuid=True), ForeignKey("stores.id"), nullable=False)
@@ -18,6 +24,9 @@ class AdvertisementModel(Base):
     status = Column(String(20), nullable=False, default="draft")
     is_featured = Column(Boolean, nullable=False, default=False)
     views = Column(Integer, nullable=False, default=0)
+    images = Column(JSON, nullable=False, default=list)
+    videos = Column(JSON, nullable=False, default=list)
+    expires_at = Column(DateTime, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
@@ -39,6 +48,9 @@ class AdvertisementModel(Base):
             status=AdvertisementStatus(self.status),
             is_featured=self.is_featured,
             views=self.views,
+            images=list(self.images or []),
+            videos=list(self.videos or []),
+            expires_at=self.expires_at,
             created_at=self.created_at,
             updated_at=self.updated_at
         )
@@ -59,6 +71,9 @@ class AdvertisementModel(Base):
             status=advertisement.status.value,
             is_featured=advertisement.is_featured,
             views=advertisement.views,
+            images=list(advertisement.images or []),
+            videos=list(advertisement.videos or []),
+            expires_at=advertisement.expires_at,
             created_at=advertisement.created_at,
             updated_at=advertisement.updated_at or datetime.utcnow()
         )
\ No newline at end of file
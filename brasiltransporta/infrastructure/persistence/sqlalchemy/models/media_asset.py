@@ -0,0 +1,63 @@
+import uuid
+from datetime import datetime
+from sqlalchemy import Column, String, DateTime, BigInteger, Integer, Float, JSON, Index
+from sqlalchemy.dialects.postgresql import UUID
+
+from .base import Base
+
+from brasiltransporta.domain.entities.media_asset import MediaAsset
+
+
+class MediaAssetModel(Base):
+    __tablename__ = "media_assets"
+    __table_args__ = (
+        # Listagem por anúncio ordenada por data de upload
+        Index("ix_media_assets_ad_id_created_at", "ad_id", "created_at"),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    key = Column(String(512), nullable=False, unique=True)
+    # Sem FK: o índice precisa aceitar arquivos de anúncios ainda em criação
+    ad_id = Column(String(64), nullable=False)
+    file_type = Column(String(10), nullable=False)
+    mime_type = Column(String(100), nullable=False)
+    size = Column(BigInteger, nullable=False, default=0)
+    width = Column(Integer, nullable=True)
+    height = Column(Integer, nullable=True)
+    duration = Column(Float, nullable=True)
+    content_hash = Column(String(64), nullable=True)
+    variants = Column(JSON, nullable=False, default=dict)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    @classmethod
+    def from_domain(cls, asset: MediaAsset) -> "MediaAssetModel":
+        return cls(
+            id=uuid.UUID(asset.id) if isinstance(asset.id, str) else asset.id,
+            key=asset.key,
+            ad_id=asset.ad_id,
+            file_type=asset.file_type,
+            mime_type=asset.mime_type,
+            size=asset.size,
+            width=asset.width,
+            height=asset.height,
+            duration=asset.duration,
+            content_hash=asset.content_hash,
+            variants=asset.variants or {},
+            created_at=asset.created_at,
+        )
+
+    def to_domain(self) -> MediaAsset:
+        return MediaAsset(
+            id=str(self.id),
+            key=self.key,
+            ad_id=self.ad_id,
+            file_type=self.file_type,
+            mime_type=self.mime_type,
+            size=self.size,
+            width=self.width,
+            height=self.height,
+            duration=self.duration,
+            content_hash=self.content_hash,
+            variants=dict(self.variants or {}),
+            created_at=self.created_at,
+        )
@@ -0,0 +1,46 @@
+import uuid
+from datetime import datetime
+from sqlalchemy import Column, String, DateTime, Integer, Text, JSON, Index, text
+from sqlalchemy.dialects.postgresql import UUID
+
+from .base import Base
+
+from brasiltransporta.domain.events import DomainEvent
+
+
+class OutboxModel(Base):
+    """Eventos de domínio gravados na mesma transação do agregado"""
+    __tablename__ = "outbox"
+    __table_args__ = (
+        # O relay só lê eventos pendentes, em ordem de criação
+        Index(
+            "ix_outbox_pending_created_at",
+            "created_at",
+            postgresql_where=text("published_at IS NULL"),
+        ),
+    )
+
+    # Também é a chave de idempotência enviada aos consumidores
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    event_type = Column(String(100), nullable=False)
+    aggregate_type = Column(String(50), nullable=False)
+    aggregate_id = Column(String(64), nullable=False)
+    payload = Column(JSON, nullable=False, default=dict)
+    occurred_at = Column(DateTime, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    published_at = Column(DateTime, nullable=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(Text, nullable=True)
+
+    @classmethod
+    def from_event(cls, event: DomainEvent) -> "OutboxModel":
+        return cls(
+            id=uuid.UUID(event.id),
+            event_type=event.name,
+            aggregate_type=event.aggregate_type,
+            aggregate_id=event.aggregate_id,
+            payload=event.payload,
+            occurred_at=event.occurred_at,
+            created_at=datetime.utcnow(),
+            attempts=0,
+        )
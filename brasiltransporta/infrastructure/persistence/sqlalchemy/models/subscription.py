@@ -0,0 +1,62 @@
+import uuid
+from datetime import datetime
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID
+
+from .base import Base
+
+from brasiltransporta.domain.entities.subscription import Subscription, SubscriptionStatus
+
+
+class SubscriptionModel(Base):
+    __tablename__ = "subscriptions"
+    __table_args__ = (
+        # Assinatura ativa da loja (verificação de cotas)
+        Index("ix_subscriptions_store_id_status", "store_id", "status"),
+        # Conciliação percorre as ativas que ainda não venceram
+        Index("ix_subscriptions_status_ends_at", "status", "ends_at"),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    store_id = Column(UUID(as_uuid=True), ForeignKey("stores.id", ondelete="CASCADE"), nullable=False)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    plan_id = Column(UUID(as_uuid=True), ForeignKey("plans.id"), nullable=False)
+    status = Column(String(20), nullable=False, default="active")
+    # Limites copiados do plano na contratação
+    max_ads = Column(Integer, nullable=False)
+    max_featured_ads = Column(Integer, nullable=False)
+    starts_at = Column(DateTime, nullable=False)
+    ends_at = Column(DateTime, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    @classmethod
+    def from_domain(cls, s: Subscription) -> "SubscriptionModel":
+        return cls(
+            id=uuid.UUID(str(s.id)),
+            store_id=uuid.UUID(str(s.store_id)),
+            user_id=uuid.UUID(str(s.user_id)),
+            plan_id=uuid.UUID(str(s.plan_id)),
+            status=s.status.value,
+            max_ads=s.max_ads,
+            max_featured_ads=s.max_featured_ads,
+            starts_at=s.starts_at,
+            ends_at=s.ends_at,
+            created_at=s.created_at,
+            updated_at=s.updated_at or datetime.utcnow(),
+        )
+
+    def to_domain(self) -> Subscription:
+        return Subscription(
+            id=str(self.id),
+            store_id=str(self.store_id),
+            user_id=str(self.user_id),
+            plan_id=str(self.plan_id),
+            max_ads=self.max_ads,
+            max_featured_ads=self.max_featured_ads,
+            starts_at=self.starts_at,
+            ends_at=self.ends_at,
+            status=SubscriptionStatus(self.status),
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+        )
@@ -1,12 +1,26 @@
 import uuid
 from datetime import datetime
+from decimal import Decimal
 from sqlalchemy import DateTime
-from sqlalchemy import Column, String, DateTime, Numeric, ForeignKey, JSON
+from sqlalchemy import Column, String, DateTime, Numeric, ForeignKey, JSON, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from .base import Base
 
 class TransactionModel(Base):
     __tablename__ = "transactions"
+    __table_args__ = (
+        # Webhooks localizam a transação pelo id do gateway
+        Index(
+            "ix_transactions_external_payment_id",
+            "external_payment_id",
+            unique=True,
+            postgresql_where=text("external_payment_id IS NOT NULL"),
+        ),
+        # Conciliação: pendentes mais antigas primeiro
+        Index("ix_transactions_status_created_at", "status", "created_at"),
+        # Conciliação: pendentes conferidas há mais tempo (ou nunca) primeiro
+        Index("ix_transactions_status_last_reconciled_at", "status", "last_reconciled_at"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
@@ -16,6 +30,52 @@ class TransactionModel(Base):
     payment_method = Column(String(20), nullable=False)
     status = Column(String(20), nullable=False, default="pending")
     external_payment_id = Column(String(100), nullable=True)
+    gateway = Column(String(20), nullable=True)
     payment_metadata = Column(JSON, nullable=False, default=dict)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    # Última consulta ao gateway pela conciliação (controle interno, fora do domínio)
+    last_reconciled_at = Column(DateTime, nullable=True)
+
+    def to_domain(self):
+        """
+        Converte o TransactionModel para uma entidade Transaction do domínio.
+        """
+        # Importação local para evitar circularidade
+        from brasiltransporta.domain.entities.transaction import Transaction, TransactionStatus, PaymentMethod
+        from brasiltransporta.domain.value_objects.money import Money
+
+        return Transaction(
+            id=str(self.id),
+            user_id=str(self.user_id),
+            plan_id=str(self.plan_id),
+            amount=Money(float(self.amount), self.currency),
+            payment_method=PaymentMethod(self.payment_method),
+            status=TransactionStatus(self.status),
+            currency=self.currency,
+            external_payment_id=self.external_payment_id,
+            metadata=dict(self.payment_metadata or {}),
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+            gateway=self.gateway,
+        )
+
+    @classmethod
+    def from_domain(cls, transaction):
+        """
+        Cria um TransactionModel a partir de uma entidade Transaction do domínio.
+        """
+        return cls(
+            id=uuid.UUID(str(transaction.id)),
+            user_id=uuid.UUID(str(transaction.user_id)),
+            plan_id=uuid.UUID(str(transaction.plan_id)),
+            amount=Decimal(str(transaction.amount.amount)),
+            currency=transaction.amount.currency,
+            payment_method=transaction.payment_method.value,
+            status=transaction.status.value,
+            external_payment_id=transaction.external_payment_id,
+            gateway=transaction.gateway,
+            payment_metadata=transaction.metadata or {},
+            created_at=transaction.created_at,
+            updated_at=transaction.updated_at or datetime.utcnow(),
+        )
@@ -1,10 +1,24 @@
 import uuid
-from sqlalchemy import Column, String, Integer, ForeignKey, DateTime, func
+from sqlalchemy import Column, String, Integer, Numeric, Text, ForeignKey, DateTime, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
 from .base import Base
 
+
+def _enum(enum_cls, value):
+    """Valor do banco como enum; cadastros antigos (nulo ou fora da lista) passam como estão"""
+    if value is None:
+        return None
+    try:
+        return enum_cls(value)
+    except ValueError:
+        try:
+            return enum_cls(value.strip().lower())
+        except ValueError:
+            return value
+
+
 class VehicleModel(Base):
     __tablename__ = "vehicles"
 
@@ -16,6 +30,79 @@ class VehicleModel(Base):
     year = Column(Integer, nullable=False)
     plate = Column(String(10), nullable=False, unique=True)
 
+    # Detalhes de veículos pesados (opcionais para os cadastros antigos)
+    vehicle_type = Column(String(40), nullable=True)
+    condition = Column(String(20), nullable=True)
+    price = Column(Numeric(14, 2), nullable=True)
+    implement_segment = Column(String(40), nullable=True)
+    description = Column(Text, nullable=True)
+    mileage = Column(Integer, nullable=True)
+    color = Column(String(40), nullable=True)
+    engine_power = Column(String(40), nullable=True)
+    axle_configuration = Column(String(20), nullable=True)
+
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), nullable=True)
 
     store = relationship("StoreModel", back_populates="vehicles")
+
+    def to_domain(self):
+        """
+        Converte o VehicleModel para uma entidade Vehicle do domínio.
+        """
+        # Importação local para evitar circularidade
+        from brasiltransporta.domain.entities.enums import (
+            ImplementSegment,
+            VehicleBrand,
+            VehicleCondition,
+            VehicleType,
+        )
+        from brasiltransporta.domain.entities.vehicle import Vehicle
+
+        return Vehicle(
+            id=str(self.id),
+            store_id=str(self.store_id),
+            brand=_enum(VehicleBrand, self.brand),
+            model=self.model,
+            year=self.year,
+            plate=self.plate,
+            vehicle_type=_enum(VehicleType, self.vehicle_type),
+            condition=_enum(VehicleCondition, self.condition),
+            price=self.price,
+            implement_segment=_enum(ImplementSegment, self.implement_segment),
+            description=self.description,
+            mileage=self.mileage,
+            color=self.color,
+            engine_power=self.engine_power,
+            axle_configuration=self.axle_configuration,
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+        )
+
+    @classmethod
+    def from_domain(cls, vehicle):
+        """
+        Cria um VehicleModel a partir de uma entidade Vehicle do domínio.
+        """
+        return cls(**cls.row_from_domain(vehicle), created_at=vehicle.created_at, updated_at=vehicle.updated_at)
+
+    @staticmethod
+    def row_from_domain(vehicle) -> dict:
+        """Valores de INSERT para um Vehicle (inserções em lote via Core)"""
+        return {
+            "id": uuid.UUID(str(vehicle.id)),
+            "store_id": uuid.UUID(str(vehicle.store_id)),
+            "brand": vehicle.brand.value,
+            "model": vehicle.model,
+            "year": vehicle.year,
+            "plate": vehicle.plate,
+            "vehicle_type": vehicle.vehicle_type.value,
+            "condition": vehicle.condition.value,
+            "price": vehicle.price,
+            "implement_segment": vehicle.implement_segment.value if vehicle.implement_segment else None,
+            "description": vehicle.description,
+            "mileage": vehicle.mileage,
+            "color": vehicle.color,
+            "engine_power": vehicle.engine_power,
+            "axle_configuration": vehicle.axle_configuration,
+        }
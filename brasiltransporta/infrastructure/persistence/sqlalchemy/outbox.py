@@ -0,0 +1,23 @@
+# brasiltransporta/infrastructure/persistence/sqlalchemy/outbox.py
+from sqlalchemy.orm import Session
+
+from brasiltransporta.infrastructure.persistence.sqlalchemy.models.outbox import OutboxModel
+
+
+def stage_events(session: Session, entity) -> int:
+    """
+    Adiciona ao outbox os eventos pendentes da entidade
+
+    Deve ser chamado antes do commit do repositório: evento e alteração do
+    agregado são gravados (ou descartados) juntos.
+
+    Returns:
+        int: quantidade de eventos adicionados
+    """
+    pull_events = getattr(entity, "pull_events", None)
+    if pull_events is None:
+        return 0
+    events = pull_events()
+    for event in events:
+        session.add(OutboxModel.from_event(event))
+    return len(events)
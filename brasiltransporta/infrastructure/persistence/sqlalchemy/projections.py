@@ -0,0 +1,20 @@
+# brasiltransporta/infrastructure/persistence/sqlalchemy/projections.py
+"""
+Projeções de leitura: colunas explícitas mapeadas direto para dicts
+
+As listagens não precisam do modelo ORM nem da entidade de domínio: o
+SELECT traz só as colunas pedidas e cada tupla vira um dict posicionalmente,
+sem identity map, conversões ou validações por linha.
+"""
+from typing import Any, Dict, List, Mapping, Sequence
+
+from sqlalchemy import Select, select
+
+
+def select_fields(columns: Mapping[str, Any], names: Sequence[str]) -> Select:
+    """SELECT só das colunas `names`, na ordem pedida"""
+    return select(*(columns[name] for name in names))
+
+
+def rows_as_dicts(result, names: Sequence[str]) -> List[Dict[str, Any]]:
+    return [dict(zip(names, row)) for row in result]
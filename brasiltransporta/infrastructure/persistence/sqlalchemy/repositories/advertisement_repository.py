@@ -1,12 +1,24 @@
 # infrastructure/persistence/sqlalchemy/repositories/advertisement_repository.py
-from typing import Optional, List
+from datetime import datetime
+from typing import Dict, Optional, List
+from uuid import UUID
 from sqlalchemy.orm import Session
-from sqlalchemy import select, update
+from sqlalchemy import Integer, column, or_, select, update, values
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 
 from brasiltransporta.domain.entities.advertisement import Advertisement
 from brasiltransporta.domain.entities.enums import AdvertisementStatus
-from brasiltransporta.domain.repositories.advertisement_repository import AdvertisementRepository
+from brasiltransporta.domain.events import DomainEvent
+from brasiltransporta.domain.repositories.advertisement_repository import AdvertisementRepository, AdvertisementVersion
+from brasiltransporta.infrastructure.persistence.sqlalchemy.batch import parse_uuids, uuid_in
 from brasiltransporta.infrastructure.persistence.sqlalchemy.models.advertisement import AdvertisementModel
+from brasiltransporta.infrastructure.persistence.sqlalchemy.models.outbox import OutboxModel
+from brasiltransporta.infrastructure.persistence.sqlalchemy.outbox import stage_events
+
+def _not_expired(now: datetime):
+    """Filtro SQL: anúncio sem validade ou ainda dentro dela"""
+    return or_(AdvertisementModel.expires_at.is_(None), AdvertisementModel.expires_at > now)
+
 
 class SQLAlchemyAdvertisementRepository(AdvertisementRepository):
     def __init__(self, session: Session) -> None:
@@ -17,6 +29,7 @@ class SQLAlchemyAdvertisementRepository(AdvertisementRepository):
         """Cria um novo anúncio (substitui add)"""
         model = AdvertisementModel.from_domain(advertisement)
         self._session.add(model)
+        stage_events(self._session, advertisement)
         self._session.commit()
         return model.to_domain()
 
@@ -25,6 +38,23 @@ class SQLAlchemyAdvertisementRepository(AdvertisementRepository):
         row = self._session.execute(stmt).scalar_one_or_none()
         return row.to_domain() if row else None
 
+    async def get_many(self, advertisement_ids: List[str]) -> List[Advertisement]:
+        ids = parse_uuids(advertisement_ids)
+        if not ids:
+            return []
+        stmt = select(AdvertisementModel).where(uuid_in(AdvertisementModel.id, ids))
+        return [row.to_domain() for row in self._session.execute(stmt).scalars()]
+
+    async def get_version(self, advertisement_id: str) -> Optional[AdvertisementVersion]:
+        """Lê só store_id, updated_at e views (ETag/Last-Modified sem hidratar o anúncio)"""
+        stmt = select(
+            AdvertisementModel.store_id, AdvertisementModel.updated_at, AdvertisementModel.views
+        ).where(AdvertisementModel.id == advertisement_id)
+        row = self._session.execute(stmt).first()
+        if row is None:
+            return None
+        return AdvertisementVersion(store_id=str(row[0]), updated_at=row[1], views=row[2] or 0)
+
     async def update(self, advertisement: Advertisement) -> Advertisement:
         """Atualiza todos os campos do anúncio"""
         stmt = select(AdvertisementModel).where(AdvertisementModel.id == advertisement.id)
@@ -45,7 +75,8 @@ class SQLAlchemyAdvertisementRepository(AdvertisementRepository):
         model.videos = advertisement.videos  # ← NOVO CAMPO
         model.expires_at = advertisement.expires_at  # ← NOVO CAMPO
         model.updated_at = advertisement.updated_at
-        
+
+        stage_events(self._session, advertisement)
         self._session.commit()
         return model.to_domain()
 
@@ -82,8 +113,10 @@ class SQLAlchemyAdvertisementRepository(AdvertisementRepository):
         return [m.to_domain() for m in rows]
 
     async def list_active(self, region: Optional[str] = None, limit: int = 50) -> List[Advertisement]:
+        # Vencidos ainda não varridos também ficam de fora
         stmt = select(AdvertisementModel).where(
-            AdvertisementModel.status == AdvertisementStatus.ACTIVE.value  # ← Corrigido
+            AdvertisementModel.status == AdvertisementStatus.ACTIVE.value,  # ← Corrigido
+            _not_expired(datetime.utcnow())
         ).limit(limit)
         
         rows = self._session.execute(stmt).scalars().all()
@@ -92,7 +125,8 @@ class SQLAlchemyAdvertisementRepository(AdvertisementRepository):
     async def list_featured(self, limit: int = 20) -> List[Advertisement]:
         stmt = select(AdvertisementModel).where(
             AdvertisementModel.status == AdvertisementStatus.ACTIVE.value,  # ← Corrigido
-            AdvertisementModel.is_featured == True
+            AdvertisementModel.is_featured == True,
+            _not_expired(datetime.utcnow())
         ).limit(limit)
         
         rows = self._session.execute(stmt).scalars().all()
@@ -126,6 +160,74 @@ class SQLAlchemyAdvertisementRepository(AdvertisementRepository):
         self._session.commit()
         return result.rowcount > 0
 
+    async def apply_view_deltas(self, deltas: Dict[str, int]) -> int:
+        """
+        Soma visualizações acumuladas de vários anúncios em um único UPDATE
+
+        UPDATE advertisements SET views = views + v.delta
+        FROM (VALUES (...), ...) AS v(id, delta) WHERE advertisements.id = v.id
+        """
+        if not deltas:
+            return 0
+
+        pending = values(
+            column("id", PG_UUID(as_uuid=True)),
+            column("delta", Integer),
+            name="v",
+        ).data([(UUID(str(ad_id)), delta) for ad_id, delta in deltas.items()])
+
+        stmt = (
+            update(AdvertisementModel)
+            .where(AdvertisementModel.id == pending.c.id)
+            .values(views=AdvertisementModel.views + pending.c.delta)
+        )
+        result = self._session.execute(stmt)
+        self._session.commit()
+        return result.rowcount
+
+    async def expire_due(self, now: datetime, batch_size: int = 500) -> List[str]:
+        """
+        Expira um lote de anúncios ativos vencidos com um único UPDATE
+
+        UPDATE advertisements SET status = 'expirado' WHERE id IN (
+            SELECT id ... WHERE status = 'ativo' AND expires_at < now
+            LIMIT n FOR UPDATE SKIP LOCKED
+        ) RETURNING id, store_id, expires_at
+
+        Os eventos `advertisement.expired` vão para o outbox na mesma
+        transação. Retorna os ids expirados (lista vazia = nada a fazer).
+        """
+        due = (
+            select(AdvertisementModel.id)
+            .where(
+                AdvertisementModel.status == AdvertisementStatus.ACTIVE.value,
+                AdvertisementModel.expires_at < now,
+            )
+            .order_by(AdvertisementModel.expires_at)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(AdvertisementModel)
+            .where(AdvertisementModel.id.in_(due.scalar_subquery()))
+            .values(status=AdvertisementStatus.EXPIRED.value, updated_at=now)
+            .returning(AdvertisementModel.id, AdvertisementModel.store_id, AdvertisementModel.expires_at)
+            .execution_options(synchronize_session=False)
+        )
+        rows = self._session.execute(stmt).all()
+
+        self._session.add_all([
+            OutboxModel.from_event(DomainEvent(
+                name="advertisement.expired",
+                aggregate_id=str(row.id),
+                payload={"store_id": str(row.store_id), "expires_at": row.expires_at.isoformat()},
+                occurred_at=now,
+            ))
+            for row in rows
+        ])
+        self._session.commit()
+        return [str(row.id) for row in rows]
+
     async def search_ads(self, query: str, category: Optional[str] = None) -> List[Advertisement]:
         search_term = f"%{query}%"
         stmt = select(AdvertisementModel).where(
@@ -0,0 +1,98 @@
+# infrastructure/persistence/sqlalchemy/repositories/catalog_query_repository.py
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from brasiltransporta.domain.entities.enums import AdvertisementStatus
+from brasiltransporta.infrastructure.persistence.sqlalchemy.projections import rows_as_dicts, select_fields
+from brasiltransporta.infrastructure.persistence.sqlalchemy.models.advertisement import AdvertisementModel
+from brasiltransporta.infrastructure.persistence.sqlalchemy.models.vehicle import VehicleModel
+
+AD = AdvertisementModel.__table__.c
+VEHICLE = VehicleModel.__table__.c
+ACTIVE = AdvertisementStatus.ACTIVE.value
+
+# Campo da API -> coluna. `thumbnail` é a primeira imagem do anúncio, extraída
+# no próprio banco (images ->> 0) para não trazer a lista inteira.
+ADVERTISEMENT_LIST_COLUMNS = {
+    "id": AD.id,
+    "store_id": AD.store_id,
+    "vehicle_id": AD.vehicle_id,
+    "title": AD.title,
+    "description": AD.description,
+    "price_amount": AD.price_amount,
+    "price_currency": AD.price_currency,
+    "status": AD.status,
+    "is_featured": AD.is_featured,
+    "views": AD.views,
+    "thumbnail": AD.images[0].as_string().label("thumbnail"),
+    "expires_at": AD.expires_at,
+    "created_at": AD.created_at,
+    "updated_at": AD.updated_at,
+}
+ADVERTISEMENT_LIST_DEFAULT = ("id", "title", "price_amount", "price_currency", "thumbnail", "is_featured", "created_at")
+
+VEHICLE_LIST_COLUMNS = {
+    name: VEHICLE[name]
+    for name in (
+        "id", "store_id", "brand", "model", "year", "plate", "vehicle_type", "condition", "price",
+        "implement_segment", "description", "mileage", "color", "engine_power", "axle_configuration",
+        "created_at", "updated_at",
+    )
+}
+# Mesmo formato de antes do `fields` (VehicleResponse)
+VEHICLE_LIST_DEFAULT = ("id", "store_id", "brand", "model", "year", "plate", "created_at")
+
+
+def _active(now: datetime):
+    """Ativos e dentro da validade (vencidos ainda não varridos também ficam de fora)"""
+    return (AD.status == ACTIVE) & or_(AD.expires_at.is_(None), AD.expires_at > now)
+
+
+class SQLAlchemyCatalogQueryRepository:
+    """
+    Listagens do catálogo com projeção de colunas
+
+    Seleciona só as colunas dos campos pedidos e devolve dicts prontos
+    para a resposta, sem carregar o modelo ORM nem montar a entidade.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    def advertisements(
+        self,
+        fields: Sequence[str],
+        store_id: Optional[str] = None,
+        status: Optional[str] = ACTIVE,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> List[Dict[str, Any]]:
+        stmt = select_fields(ADVERTISEMENT_LIST_COLUMNS, fields)
+        if store_id is not None:
+            stmt = stmt.where(AD.store_id == UUID(str(store_id)))
+        if status == ACTIVE:
+            stmt = stmt.where(_active(datetime.utcnow()))
+        elif status is not None:
+            stmt = stmt.where(AD.status == status)
+        stmt = stmt.order_by(AD.is_featured.desc(), AD.created_at.desc(), AD.id).limit(limit).offset(offset)
+        return rows_as_dicts(self._session.execute(stmt), fields)
+
+    def vehicles_by_store(
+        self,
+        store_id: str,
+        fields: Sequence[str],
+        limit: int = 50,
+        offset: int = 0,
+    ) -> List[Dict[str, Any]]:
+        stmt = (
+            select_fields(VEHICLE_LIST_COLUMNS, fields)
+            .where(VEHICLE.store_id == UUID(str(store_id)))
+            .order_by(VEHICLE.created_at.desc(), VEHICLE.id)
+            .limit(limit)
+            .offset(offset)
+        )
+        return rows_as_dicts(self._session.execute(stmt), fields)
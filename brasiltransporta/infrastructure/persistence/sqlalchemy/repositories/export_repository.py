@@ -0,0 +1,89 @@
+# infrastructure/persistence/sqlalchemy/repositories/export_repository.py
+from datetime import datetime
+from typing import Any, Iterator, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import Select, select
+from sqlalchemy.orm import Session
+
+from brasiltransporta.infrastructure.persistence.sqlalchemy.models.advertisement import AdvertisementModel
+from brasiltransporta.infrastructure.persistence.sqlalchemy.models.store import StoreModel
+from brasiltransporta.infrastructure.persistence.sqlalchemy.models.transaction import TransactionModel
+from brasiltransporta.infrastructure.persistence.sqlalchemy.models.vehicle import VehicleModel
+
+# Linhas buscadas por ida ao cursor do servidor
+EXPORT_FETCH_SIZE = 2000
+
+VEHICLE_EXPORT_COLUMNS = (
+    "id", "store_id", "brand", "model", "year", "plate", "vehicle_type", "condition",
+    "price", "mileage", "color", "created_at",
+)
+ADVERTISEMENT_EXPORT_COLUMNS = (
+    "id", "store_id", "vehicle_id", "title", "price_amount", "price_currency", "status",
+    "is_featured", "views", "expires_at", "created_at", "updated_at",
+)
+TRANSACTION_EXPORT_COLUMNS = (
+    "id", "user_id", "plan_id", "amount", "currency", "payment_method", "status",
+    "gateway", "external_payment_id", "created_at", "updated_at",
+)
+
+
+class SQLAlchemyExportRepository:
+    """
+    Leitura em streaming para exportações completas
+
+    As consultas selecionam só as colunas exportadas (sem montar entidades)
+    e usam cursor no servidor (`yield_per`): o Postgres envia as linhas em
+    blocos de EXPORT_FETCH_SIZE e a memória fica constante, qualquer que
+    seja o tamanho do resultado. A sessão deve ficar aberta até o fim da
+    iteração.
+    """
+
+    def __init__(self, session: Session, fetch_size: int = EXPORT_FETCH_SIZE) -> None:
+        self._session = session
+        self._fetch_size = fetch_size
+
+    def store_owner(self, store_id: str) -> Optional[str]:
+        """Dono da loja (None se a loja não existe), para checar o acesso à exportação"""
+        owner_id = self._session.execute(
+            select(StoreModel.owner_id).where(StoreModel.id == UUID(str(store_id)))
+        ).scalar_one_or_none()
+        return str(owner_id) if owner_id is not None else None
+
+    def vehicles_by_store(self, store_id: str) -> Iterator[Tuple[Any, ...]]:
+        stmt = (
+            self._select(VehicleModel, VEHICLE_EXPORT_COLUMNS)
+            .where(VehicleModel.store_id == UUID(str(store_id)))
+            .order_by(VehicleModel.created_at, VehicleModel.id)
+        )
+        return self._stream(stmt)
+
+    def advertisements_by_store(self, store_id: str) -> Iterator[Tuple[Any, ...]]:
+        stmt = (
+            self._select(AdvertisementModel, ADVERTISEMENT_EXPORT_COLUMNS)
+            .where(AdvertisementModel.store_id == UUID(str(store_id)))
+            .order_by(AdvertisementModel.created_at, AdvertisementModel.id)
+        )
+        return self._stream(stmt)
+
+    def transactions(self, created_from: Optional[datetime] = None,
+                     created_to: Optional[datetime] = None) -> Iterator[Tuple[Any, ...]]:
+        stmt = self._select(TransactionModel, TRANSACTION_EXPORT_COLUMNS)
+        if created_from is not None:
+            stmt = stmt.where(TransactionModel.created_at >= created_from)
+        if created_to is not None:
+            stmt = stmt.where(TransactionModel.created_at < created_to)
+        return self._stream(stmt.order_by(TransactionModel.created_at, TransactionModel.id))
+
+    @staticmethod
+    def _select(model, columns: Sequence[str]) -> Select:
+        return select(*[getattr(model, name) for name in columns])
+
+    def _stream(self, stmt: Select) -> Iterator[Tuple[Any, ...]]:
+        result = self._session.execute(stmt.execution_options(yield_per=self._fetch_size))
+        try:
+            for partition in result.partitions():
+                for row in partition:
+                    yield tuple(row)
+        finally:
+            result.close()
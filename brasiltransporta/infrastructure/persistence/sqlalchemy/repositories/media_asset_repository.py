@@ -0,0 +1,82 @@
+# infrastructure/persistence/sqlalchemy/repositories/media_asset_repository.py
+from typing import Iterator, List, Optional
+from sqlalchemy.orm import Session
+from sqlalchemy import select, delete, func
+
+from brasiltransporta.domain.entities.media_asset import MediaAsset
+from brasiltransporta.domain.repositories.media_asset_repository import MediaAssetRepository
+from brasiltransporta.infrastructure.persistence.sqlalchemy.models.media_asset import MediaAssetModel
+
+
+class SQLAlchemyMediaAssetRepository(MediaAssetRepository):
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    def save(self, asset: MediaAsset) -> MediaAsset:
+        """Insere ou atualiza (pela chave S3) o registro do arquivo"""
+        stmt = select(MediaAssetModel).where(MediaAssetModel.key == asset.key)
+        model = self._session.execute(stmt).scalar_one_or_none()
+
+        if model is None:
+            model = MediaAssetModel.from_domain(asset)
+            self._session.add(model)
+        else:
+            # Reupload com o mesmo nome sobrescreve o objeto no S3
+            model.ad_id = asset.ad_id
+            model.file_type = asset.file_type
+            model.mime_type = asset.mime_type
+            model.size = asset.size
+            model.width = asset.width
+            model.height = asset.height
+            model.duration = asset.duration
+            model.content_hash = asset.content_hash
+            model.variants = asset.variants or {}
+
+        self._session.flush()
+        self._session.commit()
+        return model.to_domain()
+
+    def get_by_key(self, key: str) -> Optional[MediaAsset]:
+        stmt = select(MediaAssetModel).where(MediaAssetModel.key == key)
+        row = self._session.execute(stmt).scalar_one_or_none()
+        return row.to_domain() if row else None
+
+    def list_by_ad(self, ad_id: str, file_type: Optional[str] = None) -> List[MediaAsset]:
+        stmt = select(MediaAssetModel).where(MediaAssetModel.ad_id == str(ad_id))
+        if file_type:
+            stmt = stmt.where(MediaAssetModel.file_type == file_type)
+        stmt = stmt.order_by(MediaAssetModel.created_at)
+
+        rows = self._session.execute(stmt).scalars().all()
+        return [m.to_domain() for m in rows]
+
+    def count_by_ad(self, ad_id: str, file_type: Optional[str] = None) -> int:
+        stmt = select(func.count()).select_from(MediaAssetModel).where(
+            MediaAssetModel.ad_id == str(ad_id)
+        )
+        if file_type:
+            stmt = stmt.where(MediaAssetModel.file_type == file_type)
+        return int(self._session.execute(stmt).scalar_one())
+
+    def delete_by_key(self, key: str) -> bool:
+        result = self._session.execute(
+            delete(MediaAssetModel).where(MediaAssetModel.key == key)
+        )
+        self._session.commit()
+        return result.rowcount > 0
+
+    def iter_keys(self, batch_size: int = 1000) -> Iterator[str]:
+        """Percorre todas as chaves indexadas (keyset pagination)"""
+        last_key = ""
+        while True:
+            stmt = (
+                select(MediaAssetModel.key)
+                .where(MediaAssetModel.key > last_key)
+                .order_by(MediaAssetModel.key)
+                .limit(batch_size)
+            )
+            keys = self._session.execute(stmt).scalars().all()
+            if not keys:
+                return
+            yield from keys
+            last_key = keys[-1]
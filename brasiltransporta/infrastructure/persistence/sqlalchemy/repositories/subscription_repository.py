@@ -0,0 +1,99 @@
+# infrastructure/persistence/sqlalchemy/repositories/subscription_repository.py
+from datetime import datetime
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import and_, func, select
+from sqlalchemy.orm import Session
+
+from brasiltransporta.domain.entities.enums import AdvertisementStatus
+from brasiltransporta.domain.entities.subscription import QuotaResource, Subscription, SubscriptionStatus
+from brasiltransporta.domain.repositories.subscription_repository import SubscriptionRepository
+from brasiltransporta.infrastructure.persistence.sqlalchemy.models.advertisement import AdvertisementModel
+from brasiltransporta.infrastructure.persistence.sqlalchemy.models.subscription import SubscriptionModel
+
+# Anúncios que ocupam vaga do plano
+QUOTA_AD_STATUSES = (
+    AdvertisementStatus.DRAFT.value,
+    AdvertisementStatus.ACTIVE.value,
+    AdvertisementStatus.PAUSED.value,
+)
+
+
+def _active(now: datetime):
+    return and_(
+        SubscriptionModel.status == SubscriptionStatus.ACTIVE.value,
+        SubscriptionModel.starts_at <= now,
+        SubscriptionModel.ends_at > now,
+    )
+
+
+class SQLAlchemySubscriptionRepository(SubscriptionRepository):
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    def add(self, subscription: Subscription) -> None:
+        self._session.add(SubscriptionModel.from_domain(subscription))
+        self._session.commit()
+
+    def get_by_id(self, subscription_id: str) -> Optional[Subscription]:
+        stmt = select(SubscriptionModel).where(SubscriptionModel.id == subscription_id)
+        row = self._session.execute(stmt).scalar_one_or_none()
+        return row.to_domain() if row else None
+
+    def get_active_by_store(self, store_id: str, now: datetime) -> Optional[Subscription]:
+        stmt = (
+            select(SubscriptionModel)
+            .where(SubscriptionModel.store_id == store_id, _active(now))
+            .order_by(SubscriptionModel.starts_at.desc())
+            .limit(1)
+        )
+        row = self._session.execute(stmt).scalar_one_or_none()
+        return row.to_domain() if row else None
+
+    def list_active(self, now: datetime, limit: int = 500, after_id: Optional[str] = None) -> List[Subscription]:
+        """Assinaturas ativas em ordem de id (paginação por chave)"""
+        stmt = select(SubscriptionModel).where(_active(now))
+        if after_id is not None:
+            stmt = stmt.where(SubscriptionModel.id > UUID(str(after_id)))
+        rows = self._session.execute(stmt.order_by(SubscriptionModel.id).limit(limit)).scalars().all()
+        return [m.to_domain() for m in rows]
+
+    def count_usage(self, store_ids: List[str]) -> Dict[str, Dict[QuotaResource, int]]:
+        """
+        Uso das cotas de várias lojas em uma consulta
+
+        SELECT store_id, count(*), count(*) FILTER (WHERE is_featured)
+        FROM advertisements WHERE store_id IN (...) AND status IN (...)
+        GROUP BY store_id
+        """
+        if not store_ids:
+            return {}
+        stmt = (
+            select(
+                AdvertisementModel.store_id,
+                func.count().label("ads"),
+                func.count().filter(AdvertisementModel.is_featured.is_(True)).label("featured"),
+            )
+            .where(
+                AdvertisementModel.store_id.in_([UUID(str(s)) for s in store_ids]),
+                AdvertisementModel.status.in_(QUOTA_AD_STATUSES),
+            )
+            .group_by(AdvertisementModel.store_id)
+        )
+        usage = {
+            str(row.store_id): {QuotaResource.ADS: row.ads, QuotaResource.FEATURED: row.featured}
+            for row in self._session.execute(stmt)
+        }
+        for store_id in store_ids:
+            usage.setdefault(str(store_id), {QuotaResource.ADS: 0, QuotaResource.FEATURED: 0})
+        return usage
+
+    def update(self, subscription: Subscription) -> None:
+        stmt = select(SubscriptionModel).where(SubscriptionModel.id == subscription.id)
+        model = self._session.execute(stmt).scalar_one_or_none()
+        if model:
+            model.status = subscription.status.value
+            model.ends_at = subscription.ends_at
+            model.updated_at = subscription.updated_at or datetime.utcnow()
+            self._session.commit()
@@ -1,11 +1,15 @@
 # infrastructure/persistence/sqlalchemy/repositories/transaction_repository.py
-from typing import Optional, List
+import uuid
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional, List, Sequence
 from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy import select, update
 
 from brasiltransporta.domain.entities.transaction import Transaction, TransactionStatus
 from brasiltransporta.domain.repositories.transaction_repository import TransactionRepository
 from brasiltransporta.infrastructure.persistence.sqlalchemy.models.transaction import TransactionModel
+from brasiltransporta.infrastructure.persistence.sqlalchemy.outbox import stage_events
 
 class SQLAlchemyTransactionRepository(TransactionRepository):
     def __init__(self, session: Session) -> None:
@@ -14,6 +18,8 @@ class SQLAlchemyTransactionRepository(TransactionRepository):
     def add(self, transaction: Transaction) -> None:
         model = TransactionModel.from_domain(transaction)
         self._session.add(model)
+        stage_events(self._session, transaction)
+        self._session.commit()
 
     def get_by_id(self, transaction_id: str) -> Optional[Transaction]:
         stmt = select(TransactionModel).where(TransactionModel.id == transaction_id)
@@ -21,6 +27,7 @@ class SQLAlchemyTransactionRepository(TransactionRepository):
         return row.to_domain() if row else None
 
     def get_by_external_id(self, external_id: str) -> Optional[Transaction]:
+        # Usa o índice único ix_transactions_external_payment_id
         stmt = select(TransactionModel).where(TransactionModel.external_payment_id == external_id)
         row = self._session.execute(stmt).scalar_one_or_none()
         return row.to_domain() if row else None
@@ -41,14 +48,60 @@ class SQLAlchemyTransactionRepository(TransactionRepository):
         rows = self._session.execute(stmt).scalars().all()
         return [m.to_domain() for m in rows]
 
+    def list_pending_for_reconciliation(
+        self,
+        created_before: datetime,
+        limit: int = 100,
+        created_after: Optional[datetime] = None,
+        gateways: Optional[Sequence[str]] = None,
+    ) -> List[Transaction]:
+        """
+        Pendentes já enviadas a um gateway e sem retorno há algum tempo
+
+        Nunca conferidas primeiro, depois as conferidas há mais tempo: uma
+        cobrança que o gateway continua informando como pendente vai para o
+        fim da fila e não impede a conciliação das mais novas.
+        """
+        stmt = select(TransactionModel).where(
+            TransactionModel.status == TransactionStatus.PENDING.value,
+            TransactionModel.external_payment_id.is_not(None),
+            TransactionModel.created_at < created_before,
+        )
+        if created_after is not None:
+            stmt = stmt.where(TransactionModel.created_at >= created_after)
+        if gateways is not None:
+            stmt = stmt.where(TransactionModel.gateway.in_(list(gateways)))
+        stmt = stmt.order_by(
+            TransactionModel.last_reconciled_at.asc().nulls_first(),
+            TransactionModel.created_at,
+        ).limit(limit)
+
+        rows = self._session.execute(stmt).scalars().all()
+        return [m.to_domain() for m in rows]
+
+    def mark_reconciled(self, transaction_ids: Sequence[str], checked_at: datetime) -> None:
+        """Registra a consulta ao gateway (move as transações para o fim da fila)"""
+        if not transaction_ids:
+            return
+        self._session.execute(
+            update(TransactionModel)
+            .where(TransactionModel.id.in_([uuid.UUID(str(i)) for i in transaction_ids]))
+            .values(last_reconciled_at=checked_at)
+        )
+        self._session.commit()
+
     def update(self, transaction: Transaction) -> None:
         stmt = select(TransactionModel).where(TransactionModel.id == transaction.id)
         model = self._session.execute(stmt).scalar_one_or_none()
         if model:
-            model.amount = transaction.amount.amount
+            model.amount = Decimal(str(transaction.amount.amount))
             model.currency = transaction.amount.currency
             model.payment_method = transaction.payment_method.value
             model.status = transaction.status.value
             model.external_payment_id = transaction.external_payment_id
-            model.metadata = transaction.metadata
+            model.gateway = transaction.gateway
+            # `metadata` é reservado pelo SQLAlchemy; a coluna é payment_metadata
+            model.payment_metadata = transaction.metadata or {}
             model.updated_at = transaction.updated_at
+            stage_events(self._session, transaction)
+            self._session.commit()
@@ -11,6 +11,7 @@ from brasiltransporta.domain.entities.user import User
 from brasiltransporta.domain.errors.errors import ValidationError
 from brasiltransporta.domain.repositories.user_repository import UserRepository
 from brasiltransporta.infrastructure.persistence.sqlalchemy.models.user import UserModel
+from brasiltransporta.infrastructure.persistence.sqlalchemy.outbox import stage_events
 
 
 class SQLAlchemyUserRepository(UserRepository):
@@ -33,6 +34,7 @@ class SQLAlchemyUserRepository(UserRepository):
         model.email = email_lc
 
         self._session.add(model)
+        stage_events(self._session, user)
         self._session.flush()
         self._session.refresh(model)
         self._session.commit()
@@ -74,6 +76,7 @@ class SQLAlchemyUserRepository(UserRepository):
 
         try:
             self._session.add(db_obj)
+            stage_events(self._session, user)
             self._session.flush()
             self._session.refresh(db_obj)
             self._session.commit()
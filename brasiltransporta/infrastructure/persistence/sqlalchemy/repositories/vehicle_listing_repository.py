@@ -0,0 +1,96 @@
+# infrastructure/persistence/sqlalchemy/repositories/vehicle_listing_repository.py
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from brasiltransporta.domain.aggregates.vehicle_listing import (
+    ListingMedia,
+    ListingStore,
+    ListingVehicle,
+    VehicleListing,
+)
+from brasiltransporta.infrastructure.persistence.sqlalchemy.models.advertisement import AdvertisementModel
+from brasiltransporta.infrastructure.persistence.sqlalchemy.models.media_asset import MediaAssetModel
+from brasiltransporta.infrastructure.persistence.sqlalchemy.models.store import StoreModel
+from brasiltransporta.infrastructure.persistence.sqlalchemy.models.vehicle import VehicleModel
+
+AD = AdvertisementModel.__table__.c
+VEHICLE = VehicleModel.__table__.c
+STORE = StoreModel.__table__.c
+MEDIA = MediaAssetModel.__table__.c
+
+VEHICLE_COLUMNS = (
+    "id", "brand", "model", "year", "plate", "vehicle_type", "condition", "price", "implement_segment",
+    "description", "mileage", "color", "engine_power", "axle_configuration", "updated_at",
+)
+MEDIA_COLUMNS = ("key", "file_type", "mime_type", "width", "height", "duration", "variants")
+
+
+def _media(row) -> ListingMedia:
+    media = {name: row[f"media_{name}"] for name in MEDIA_COLUMNS}
+    media["variants"] = dict(media["variants"] or {})
+    return ListingMedia(**media)
+
+
+class SQLAlchemyVehicleListingRepository:
+    """
+    Página do anúncio numa única consulta
+
+    anúncio ⋈ veículo ⋈ loja ⟕ mídias: uma linha por mídia (ou uma só, sem
+    mídia). Só as colunas exibidas, sem hidratar as entidades.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    @staticmethod
+    def _query(advertisement_id: UUID):
+        return (
+            select(
+                AD.id, AD.title, AD.description, AD.price_amount, AD.price_currency, AD.status,
+                AD.is_featured, AD.views, AD.created_at, AD.updated_at, AD.expires_at,
+                *(VEHICLE[name].label(f"vehicle_{name}") for name in VEHICLE_COLUMNS),
+                STORE.id.label("store_id"), STORE.name.label("store_name"), STORE.cnpj.label("store_cnpj"),
+                *(MEDIA[name].label(f"media_{name}") for name in MEDIA_COLUMNS),
+            )
+            .select_from(AdvertisementModel.__table__)
+            .join(VehicleModel.__table__, VEHICLE.id == AD.vehicle_id)
+            .join(StoreModel.__table__, STORE.id == AD.store_id)
+            # media_assets.ad_id é texto e sem FK: compara com o id já conhecido
+            # (usa ix_media_assets_ad_id_created_at)
+            .outerjoin(MediaAssetModel.__table__, MEDIA.ad_id == str(advertisement_id))
+            .where(AD.id == advertisement_id)
+            .order_by(MEDIA.created_at)
+        )
+
+    def get(self, advertisement_id: str) -> Optional[VehicleListing]:
+        try:
+            ad_uuid = UUID(str(advertisement_id))
+        except ValueError:
+            return None
+        rows = self._session.execute(self._query(ad_uuid)).mappings().all()
+        if not rows:
+            return None
+
+        first = rows[0]
+        vehicle = {name: first[f"vehicle_{name}"] for name in VEHICLE_COLUMNS}
+        vehicle["id"] = str(vehicle["id"])
+        vehicle["price"] = float(vehicle["price"]) if vehicle["price"] is not None else None
+        return VehicleListing(
+            id=str(first["id"]),
+            title=first["title"],
+            description=first["description"],
+            price_amount=float(first["price_amount"]),
+            price_currency=first["price_currency"],
+            status=first["status"],
+            is_featured=first["is_featured"],
+            views=first["views"] or 0,
+            created_at=first["created_at"],
+            updated_at=first["updated_at"],
+            expires_at=first["expires_at"],
+            vehicle=ListingVehicle(**vehicle),
+            store=ListingStore(id=str(first["store_id"]), name=first["store_name"], cnpj=first["store_cnpj"]),
+            media=[_media(row) for row in rows if row["media_key"] is not None],
+        )
@@ -3,10 +3,12 @@ from typing import Optional, List
 from uuid import UUID
 from sqlalchemy.orm import Session
 from sqlalchemy import select, and_
+from sqlalchemy.dialects.postgresql import insert
 
 from brasiltransporta.domain.entities.vehicle import Vehicle
 from brasiltransporta.domain.entities.enums import VehicleBrand, VehicleType, VehicleCondition
 from brasiltransporta.domain.repositories.vehicle_repository import VehicleRepository
+from brasiltransporta.infrastructure.persistence.sqlalchemy.batch import parse_uuids, uuid_in
 from brasiltransporta.infrastructure.persistence.sqlalchemy.models.vehicle import VehicleModel
 
 class SQLAlchemyVehicleRepository(VehicleRepository):  # ← AGORA IMPLEMENTA A INTERFACE
@@ -30,6 +32,13 @@ class SQLAlchemyVehicleRepository(VehicleRepository):  # ← AGORA IMPLEMENTA A
         model = self._session.get(VehicleModel, vehicle_uuid)
         return model.to_domain() if model else None
 
+    async def get_many(self, vehicle_ids: List[str]) -> List[Vehicle]:
+        ids = parse_uuids(vehicle_ids)
+        if not ids:
+            return []
+        stmt = select(VehicleModel).where(uuid_in(VehicleModel.id, ids))
+        return [model.to_domain() for model in self._session.execute(stmt).scalars()]
+
     async def update(self, vehicle: Vehicle) -> Vehicle:
         """Atualiza todos os campos do veículo"""
         try:
@@ -160,6 +169,25 @@ class SQLAlchemyVehicleRepository(VehicleRepository):  # ← AGORA IMPLEMENTA A
         
         return count
 
+    async def bulk_insert(self, vehicles: List[Vehicle]) -> List[str]:
+        """
+        Insere um lote com um único INSERT ... ON CONFLICT (plate) DO NOTHING
+
+        Returns:
+            List[str]: placas efetivamente inseridas (as demais já existiam)
+        """
+        if not vehicles:
+            return []
+        stmt = (
+            insert(VehicleModel)
+            .values([VehicleModel.row_from_domain(v) for v in vehicles])
+            .on_conflict_do_nothing(index_elements=[VehicleModel.plate])
+            .returning(VehicleModel.plate)
+        )
+        plates = list(self._session.execute(stmt).scalars())
+        self._session.commit()
+        return plates
+
     # --- MÉTODO DE COMPATIBILIDADE ---
     async def get_by_plate(self, plate: str) -> Optional[Vehicle]:
         model = self._session.query(VehicleModel)\
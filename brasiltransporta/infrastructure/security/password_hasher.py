@@ -1,7 +1,20 @@
 from __future__ import annotations
-from passlib.hash import bcrypt # type: ignore
 from brasiltransporta.application.users.use_cases.register_user import PasswordHasher
 
+
+def _bcrypt():
+    # passlib é carregado no primeiro hash/verify, não no import da API
+    from passlib.hash import bcrypt # type: ignore
+    return bcrypt
+
+
+def __getattr__(name: str):
+    # `password_hasher.bcrypt` continua acessível (sob demanda)
+    if name == "bcrypt":
+        return _bcrypt()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 class BcryptPasswordHasher(PasswordHasher):  # Agora implementa a interface
     """Implementação real de hashing de senha usando passlib/bcrypt."""
 
@@ -9,8 +22,12 @@ class BcryptPasswordHasher(PasswordHasher):  # Agora implementa a interface
         if not raw_password or len(raw_password) < 6:
             # regra simples de segurança mínima; ajuste conforme sua política
             raise ValueError("Senha deve ter pelo menos 6 caracteres.")
-        return bcrypt.hash(raw_password)
+        return _bcrypt().hash(raw_password)
 
     def verify(self, raw_password: str, hashed_password: str) -> bool:
         """Útil para fluxos de login/autenticação (opcional aqui)."""
-        return bcrypt.verify(raw_password, hashed_password)
\ No newline at end of file
+        return _bcrypt().verify(raw_password, hashed_password)
+
+    def warmup(self) -> None:
+        """Carrega o backend do bcrypt antes do primeiro login"""
+        _bcrypt().get_backend()
\ No newline at end of file
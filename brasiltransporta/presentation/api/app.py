@@ -1,7 +1,6 @@
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
-import redis # type: ignore
 
 from brasiltransporta.presentation.api.controllers.users import router as users_router
 from brasiltransporta.presentation.api.controllers.vehicles import router as vehicles_router 
@@ -11,14 +10,27 @@ from brasiltransporta.presentation.api.controllers.plans import router as plans_
 from brasiltransporta.presentation.api.controllers.advertisements import router as advertisements_router
 from brasiltransporta.presentation.api.controllers.auth import router as auth_router
 
-from brasiltransporta.domain.errors.errors import ValidationError, DomainError, SecurityAlertError
-from brasiltransporta.infrastructure.security.refresh_token_service import RefreshTokenService
+from brasiltransporta.domain.errors.errors import ValidationError, DomainError, SecurityAlertError, QuotaExceededError
 from brasiltransporta.infrastructure.config.settings import AppSettings
 from brasiltransporta.presentation.api.controllers.file_uploads import router as storage_router
+from brasiltransporta.presentation.api.controllers.outbox import router as outbox_router
+from brasiltransporta.presentation.api.controllers.payments import router as payments_router
+from brasiltransporta.presentation.api.controllers.exports import router as exports_router
+from brasiltransporta.presentation.api.controllers.health import router as health_router
+from brasiltransporta.presentation.api.compression import CompressionMiddleware
+from brasiltransporta.presentation.api.http_cache import ConditionalGetMiddleware
+from brasiltransporta.presentation.api.lifespan import lifespan
+from brasiltransporta.presentation.api.responses import FastJSONResponse
 
 
 def create_app() -> FastAPI:
-    app = FastAPI(title="BrasilTransporta API", version="0.1.0")
+    # Recursos compartilhados (banco, Redis, S3, JWT) montados e aquecidos no lifespan
+    app = FastAPI(
+        title="BrasilTransporta API",
+        version="0.1.0",
+        default_response_class=FastJSONResponse,
+        lifespan=lifespan,
+    )
 
     # CORS básico (ajuste conforme seus frontends)
     app.add_middleware(
@@ -28,49 +40,32 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
         allow_credentials=True,
     )
+    # ETag pelo hash do corpo para GETs sem validador próprio (/plans, /stores/{id}, ...)
+    app.add_middleware(ConditionalGetMiddleware)
 
-    # Healthcheck
-    @app.get("/health")
-    def health():
-        return {"status": "ok"}
-    
-    @app.on_event("startup")
-    async def startup_event():
-        """Initialize services on startup"""
-        settings = AppSettings()
-        
-        # Configura Redis client
-        try:
-            redis_client = redis.Redis.from_url(
-                settings.redis.url,
-                decode_responses=True  # Para trabalhar com strings ao invés de bytes
-            )
-            
-            # Test Redis connection
-            redis_client.ping()
-            print("✅ Redis connected successfully")
-            
-            # Inicializa serviço de refresh tokens
-            app.state.refresh_token_service = RefreshTokenService(redis_client)
-            print("✅ RefreshTokenService initialized")
-            
-        except redis.ConnectionError as e:
-            print(f"❌ Failed to connect to Redis: {e}")
-            # Em desenvolvimento, podemos continuar sem Redis por enquanto
-            if settings.environment == "production":
-                raise
-            else:
-                print("⚠️  Continuing without Redis (development mode)")
-                app.state.refresh_token_service = None
-        except Exception as e:
-            print(f"❌ Error initializing Redis: {e}")
-            app.state.refresh_token_service = None
+    # Compressão por fora do ETag: o hash do corpo é calculado sem compressão
+    compression = AppSettings().compression
+    if compression.enabled:
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=compression.minimum_size,
+            gzip_level=compression.gzip_level,
+            brotli_quality=compression.brotli_quality,
+            content_types=compression.content_types,
+        )
 
     # Exception mapping (Domínio → HTTP)
     @app.exception_handler(ValidationError)
     async def handle_validation_error(_: Request, exc: ValidationError):
         return JSONResponse(status_code=422, content={"detail": str(exc)})
 
+    @app.exception_handler(QuotaExceededError)
+    async def handle_quota_exceeded(_: Request, exc: QuotaExceededError):
+        return JSONResponse(
+            status_code=403,
+            content={"detail": str(exc), "resource": exc.resource, "limit": exc.limit},
+        )
+
     @app.exception_handler(DomainError)
     async def handle_domain_error(_: Request, exc: DomainError):
         return JSONResponse(status_code=400, content={"detail": str(exc)})
@@ -95,6 +90,11 @@ def create_app() -> FastAPI:
     app.include_router(advertisements_router)   
     app.include_router(auth_router)
     app.include_router(storage_router)
+    app.include_router(outbox_router)
+    app.include_router(payments_router)
+    app.include_router(exports_router)
+    # /health, /health/live e /health/ready (probes do banco, Redis e S3)
+    app.include_router(health_router)
   
     
     return app
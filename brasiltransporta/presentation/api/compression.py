@@ -0,0 +1,199 @@
+# brasiltransporta/presentation/api/compression.py
+"""
+Compressão das respostas (Brotli ou gzip, conforme o Accept-Encoding)
+
+`CompressionMiddleware` é ASGI puro, então também comprime
+StreamingResponse bloco a bloco: o encoder começa no primeiro bloco e
+cada bloco sai com flush, para o cliente receber os dados à medida que
+saem (o tamanho total de um stream não é conhecido, então o
+`minimum_size` vale só para corpos em uma mensagem). Ficam de fora:
+
+- corpos menores que `minimum_size` (o cabeçalho gzip e a CPU não compensam);
+- tipos fora da allowlist (imagens, PDFs, QR codes já são comprimidos);
+- Server-Sent Events (text/event-stream): eventos pequenos e espaçados,
+  que o EventSource e proxies esperam sem codificação;
+- respostas que já têm Content-Encoding (ex.: exportações em gzip) ou
+  `Cache-Control: no-transform`.
+
+Brotli é opcional (pip install brotli); sem ele, só gzip.
+"""
+import zlib
+from typing import Optional, Sequence
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:  # Brotli é opcional (pip install brotli)
+    import brotli
+except ImportError:  # pragma: no cover - depende do ambiente
+    brotli = None
+
+GZIP = "gzip"
+BROTLI = "br"
+
+DEFAULT_CONTENT_TYPES = ("application/json", "application/x-ndjson", "application/problem+json", "text/")
+# Nunca comprimidos, mesmo dentro da allowlist (ex.: "text/")
+EXCLUDED_CONTENT_TYPES = ("text/event-stream",)
+
+
+class GzipEncoder:
+    def __init__(self, level: int) -> None:
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def chunk(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self, data: bytes = b"") -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush()
+
+
+class BrotliEncoder:
+    def __init__(self, quality: int) -> None:
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def chunk(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.flush()
+
+    def finish(self, data: bytes = b"") -> bytes:
+        return self._compressor.process(data) + self._compressor.finish()
+
+
+def _accepted(accept_encoding: str) -> dict:
+    """{codificação: q} do Accept-Encoding"""
+    accepted = {}
+    for item in (accept_encoding or "").split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[name] = q
+    return accepted
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """Brotli quando aceito (e instalado), senão gzip; None sem compressão aceitável"""
+    accepted = _accepted(accept_encoding)
+    wildcard = accepted.get("*", 0.0)
+    candidates = [BROTLI, GZIP] if brotli is not None else [GZIP]
+    best, best_q = None, 0.0
+    for name in candidates:
+        q = accepted.get(name, wildcard)
+        if q > best_q:
+            best, best_q = name, q
+    return best
+
+
+def _weak(etag: str) -> str:
+    """O corpo comprimido é outra representação: o ETag forte vira fraco"""
+    return etag if etag.startswith("W/") else f"W/{etag}"
+
+
+class CompressionMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        content_types: Sequence[str] = DEFAULT_CONTENT_TYPES,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.content_types = tuple(content_types)
+
+    def _encoder(self, encoding: str):
+        if encoding == BROTLI:
+            return BrotliEncoder(self.brotli_quality)
+        return GzipEncoder(self.gzip_level)
+
+    def _compressible(self, message: Message) -> bool:
+        headers = Headers(raw=message["headers"])
+        status = message["status"]
+        content_type = headers.get("content-type", "")
+        return (
+            status >= 200
+            and status not in (204, 206, 304)
+            and "content-encoding" not in headers
+            and "no-transform" not in headers.get("cache-control", "")
+            and content_type.startswith(self.content_types)
+            and not content_type.startswith(EXCLUDED_CONTENT_TYPES)
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Optional[Message] = None
+        encoder = None
+        passthrough = False
+
+        async def send_start(compress: bool, streaming: bool, body: bytes = b"") -> None:
+            headers = MutableHeaders(raw=list(start["headers"]))
+            headers.add_vary_header("Accept-Encoding")
+            if compress:
+                headers["Content-Encoding"] = encoding
+                if "etag" in headers:
+                    headers["ETag"] = _weak(headers["etag"])
+                if streaming:
+                    if "content-length" in headers:
+                        del headers["content-length"]
+                else:
+                    headers["Content-Length"] = str(len(body))
+            await send({**start, "headers": headers.raw})
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, encoder, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                start = message
+                if not self._compressible(message):
+                    passthrough = True
+                    await send(message)
+                return
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if encoder is not None:
+                # Já em streaming comprimido
+                data = encoder.chunk(body) if more_body else encoder.finish(body)
+                await send({"type": "http.response.body", "body": data, "more_body": more_body})
+                return
+
+            if not more_body:
+                # Corpo completo em uma mensagem: aplica o limite mínimo
+                if len(body) < self.minimum_size:
+                    await send_start(False, False)
+                    await send({"type": "http.response.body", "body": body})
+                    return
+                data = self._encoder(encoding).finish(body)
+                await send_start(True, False, data)
+                await send({"type": "http.response.body", "body": data})
+                return
+
+            # Streaming: comprime desde o primeiro bloco, sem segurar dados
+            encoder = self._encoder(encoding)
+            await send_start(True, True)
+            await send({"type": "http.response.body", "body": encoder.chunk(body), "more_body": True})
+
+        await self.app(scope, receive, send_wrapper)
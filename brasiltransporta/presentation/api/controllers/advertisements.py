@@ -1,5 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException
-from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from typing import List, Optional, Tuple
+from uuid import UUID
 
 from brasiltransporta.application.advertisements.use_cases.create_advertisement import CreateAdvertisementInput, CreateAdvertisementOutput
 from brasiltransporta.application.advertisements.use_cases.get_advertisement_by_id import GetAdvertisementByIdOutput
@@ -18,12 +19,33 @@ from brasiltransporta.presentation.api.models.requests.advertisement_requests im
 )
 
 from brasiltransporta.application.advertisements.use_cases.publish_advertisement import PublishAdvertisementInput, PublishAdvertisementUseCase
+from brasiltransporta.application.advertisements.use_cases.set_featured import SetFeaturedInput
+from brasiltransporta.domain.aggregates.vehicle_listing import VehicleListing
+from brasiltransporta.domain.errors.errors import QuotaExceededError, ValidationError
+from brasiltransporta.presentation.api.models.requests.advertisement_requests import BatchGetAdvertisementsRequest, SetFeaturedRequest
+from brasiltransporta.presentation.api.models.responses.advertisement_responses import (
+    AdvertisementListItem,
+    BatchGetAdvertisementsResponse,
+    SetFeaturedResponse,
+)
+from brasiltransporta.infrastructure.persistence.sqlalchemy.repositories.catalog_query_repository import (
+    ADVERTISEMENT_LIST_COLUMNS,
+    ADVERTISEMENT_LIST_DEFAULT,
+)
+from brasiltransporta.presentation.api.fields import fields_query
+
+from brasiltransporta.presentation.api.http_cache import PUBLIC_REVALIDATE, cache_headers, conditional, make_etag
+from brasiltransporta.presentation.api.responses import typed_response
 
 # Importe as dependências do di
 from brasiltransporta.presentation.api.di.dependencies import (
     get_create_advertisement_uc, 
     get_get_advertisement_by_id_uc, 
-    get_publish_advertisement_uc
+    get_batch_get_advertisements_uc,
+    get_get_vehicle_listing_uc,
+    get_list_advertisements_uc,
+    get_publish_advertisement_uc,
+    get_set_featured_uc
 )
 
 router = APIRouter(prefix="/advertisements", tags=["advertisements"])
@@ -43,24 +65,96 @@ async def create_advertisement(
         )
         result = use_case.execute(input_data)
         return CreateAdvertisementOutput(advertisement_id=result.advertisement_id)
+    except QuotaExceededError:
+        raise
     except Exception as e:
         raise HTTPException(status_code=422, detail=str(e))
 
+@router.get("/", response_model=List[AdvertisementListItem], response_model_exclude_unset=True)
+def list_advertisements(
+    store_id: Optional[UUID] = None,
+    limit: int = Query(50, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    fields: Tuple[str, ...] = Depends(fields_query(tuple(ADVERTISEMENT_LIST_COLUMNS), ADVERTISEMENT_LIST_DEFAULT)),
+    use_case = Depends(get_list_advertisements_uc)
+):
+    """Anúncios ativos (destaques primeiro); `fields` escolhe as colunas lidas do banco"""
+    return typed_response(use_case.execute(fields, store_id=store_id, limit=limit, offset=offset))
+
+@router.post(":batchGet", response_model=BatchGetAdvertisementsResponse)
+async def batch_get_advertisements(
+    request: BatchGetAdvertisementsRequest,
+    use_case = Depends(get_batch_get_advertisements_uc)
+):
+    """Vários anúncios numa consulta, na ordem pedida (`found: false` para ids inexistentes)"""
+    items = await use_case.execute(request.ids)
+    return typed_response({"items": items})
+
 @router.get("/{advertisement_id}", response_model=GetAdvertisementByIdOutput)
 async def get_advertisement(
     advertisement_id: str,
+    request: Request,
     use_case = Depends(get_get_advertisement_by_id_uc)
 ):
-    result = use_case.execute(advertisement_id)
+    # Visitante único aproximado pelo IP (HyperLogLog não guarda o valor)
+    viewer_id = request.client.host if request.client else None
+
+    # Versão lida sem carregar o anúncio: o 304 não hidrata nem serializa nada
+    version = await use_case.version(advertisement_id)
+    if version is None:
+        raise HTTPException(status_code=404, detail="Advertisement not found")
+    headers = cache_headers(
+        make_etag("advertisement", advertisement_id, version.updated_at.isoformat(), version.views),
+        last_modified=version.updated_at,
+        cache_control=PUBLIC_REVALIDATE,
+        surrogate_keys=(f"advertisement-{advertisement_id}", f"store-{version.store_id}"),
+    )
+    cached = conditional(request, headers)
+    if cached is not None:
+        use_case.record_view(advertisement_id, viewer_id)
+        return cached
+
+    result = use_case.execute(advertisement_id, viewer_id=viewer_id, record_view=True)
     if not result:
         raise HTTPException(status_code=404, detail="Advertisement not found")
-    return result
+    return typed_response(result, headers=headers)
+
+@router.get("/{advertisement_id}/listing", response_model=VehicleListing)
+def get_advertisement_listing(
+    advertisement_id: str,
+    request: Request,
+    use_case = Depends(get_get_vehicle_listing_uc)
+):
+    """Página do anúncio: anúncio, especificações do veículo, loja e mídias numa chamada"""
+    viewer_id = request.client.host if request.client else None
+    listing = use_case.execute(advertisement_id, viewer_id=viewer_id, record_view=True)
+    if listing is None:
+        raise HTTPException(status_code=404, detail="Advertisement not found")
+    return typed_response(listing)
 
 @router.post("/{advertisement_id}/publish", response_model=PublishAdvertisementResponse)
-def publish_advertisement(
+async def publish_advertisement(
     advertisement_id: str,
-    use_case: PublishAdvertisementUseCase = Depends(),
+    use_case: PublishAdvertisementUseCase = Depends(get_publish_advertisement_uc),
 ):
     input_data = PublishAdvertisementInput(advertisement_id=advertisement_id)
-    result = use_case.execute(input_data)
-    return PublishAdvertisementResponse(**result.dict())
\ No newline at end of file
+    try:
+        result = await use_case.execute(input_data)
+    except ValidationError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        # Só rascunhos podem ser publicados
+        raise HTTPException(status_code=409, detail=str(e))
+    return PublishAdvertisementResponse(success=result.success)
+
+@router.put("/{advertisement_id}/featured", response_model=SetFeaturedResponse)
+async def set_featured(
+    advertisement_id: str,
+    request: SetFeaturedRequest,
+    use_case = Depends(get_set_featured_uc)
+):
+    try:
+        result = await use_case.execute(SetFeaturedInput(advertisement_id=advertisement_id, featured=request.featured))
+    except ValidationError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    return SetFeaturedResponse(advertisement_id=result.advertisement_id, is_featured=result.is_featured)
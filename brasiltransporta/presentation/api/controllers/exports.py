@@ -0,0 +1,93 @@
+import uuid
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from sqlalchemy.orm import Session
+
+from brasiltransporta.infrastructure.persistence.sqlalchemy.repositories.export_repository import (
+    ADVERTISEMENT_EXPORT_COLUMNS,
+    TRANSACTION_EXPORT_COLUMNS,
+    VEHICLE_EXPORT_COLUMNS,
+    SQLAlchemyExportRepository,
+)
+from brasiltransporta.infrastructure.persistence.sqlalchemy.session import get_session
+from brasiltransporta.presentation.api.dependencies.authz import require_roles
+from brasiltransporta.presentation.api.streaming import export_response
+
+router = APIRouter(prefix="/exports", tags=["exports"])
+
+FORMAT_QUERY = Query("ndjson", alias="format", pattern="^(ndjson|csv)$", description="ndjson ou csv")
+
+
+def get_export_session() -> Session:
+    """
+    Sessão própria da exportação
+
+    Não é fechada pelo FastAPI: o streaming continua depois que o endpoint
+    retorna, então `_closing` a fecha ao fim da iteração.
+    """
+    return get_session()
+
+
+def _require_store_access(session: Session, store_id: uuid.UUID, user: Dict[str, Any]) -> None:
+    """
+    Vendedor só exporta as próprias lojas; admin exporta qualquer uma
+
+    Loja de outro dono responde 404, como loja inexistente, para não
+    revelar quais ids existem.
+    """
+    if "admin" in (user.get("roles") or []):
+        return
+    owner_id = SQLAlchemyExportRepository(session).store_owner(str(store_id))
+    if owner_id is None or owner_id != str(user.get("id")):
+        session.close()
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Loja não encontrada.")
+
+
+def _closing(session: Session, rows: Iterable[Any]) -> Iterator[Any]:
+    try:
+        yield from rows
+    finally:
+        session.close()
+
+
+@router.get("/stores/{store_id}/vehicles")
+def export_store_vehicles(
+    store_id: uuid.UUID,
+    fmt: str = FORMAT_QUERY,
+    accept_encoding: str = Header(""),
+    user: Dict[str, Any] = Depends(require_roles("seller", "admin")),
+    session: Session = Depends(get_export_session),
+):
+    _require_store_access(session, store_id, user)
+    rows = SQLAlchemyExportRepository(session).vehicles_by_store(str(store_id))
+    return export_response(VEHICLE_EXPORT_COLUMNS, _closing(session, rows), fmt,
+                           f"vehicles-{store_id}", accept_encoding)
+
+
+@router.get("/stores/{store_id}/advertisements")
+def export_store_advertisements(
+    store_id: uuid.UUID,
+    fmt: str = FORMAT_QUERY,
+    accept_encoding: str = Header(""),
+    user: Dict[str, Any] = Depends(require_roles("seller", "admin")),
+    session: Session = Depends(get_export_session),
+):
+    _require_store_access(session, store_id, user)
+    rows = SQLAlchemyExportRepository(session).advertisements_by_store(str(store_id))
+    return export_response(ADVERTISEMENT_EXPORT_COLUMNS, _closing(session, rows), fmt,
+                           f"advertisements-{store_id}", accept_encoding)
+
+
+@router.get("/transactions", dependencies=[Depends(require_roles("admin"))])
+def export_transactions(
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    fmt: str = FORMAT_QUERY,
+    accept_encoding: str = Header(""),
+    session: Session = Depends(get_export_session),
+):
+    rows = SQLAlchemyExportRepository(session).transactions(created_from, created_to)
+    return export_response(TRANSACTION_EXPORT_COLUMNS, _closing(session, rows), fmt,
+                           "transactions", accept_encoding)
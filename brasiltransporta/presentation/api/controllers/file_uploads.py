@@ -1,10 +1,25 @@
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Depends, status
-from typing import List, Optional
+from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Depends, Query, Response, status
+from typing import List, Optional, Tuple
 import uuid
 
 from brasiltransporta.application.storage.use_cases.upload_file import UploadFileUseCase, UploadFileRequest
 from brasiltransporta.application.storage.use_cases.delete_file import DeleteFileUseCase, DeleteFileRequest
 from brasiltransporta.application.storage.use_cases.generate_presigned_url import GeneratePresignedUrlUseCase, GeneratePresignedUrlRequest
+from brasiltransporta.application.storage.use_cases.list_ad_files import ListAdFilesUseCase
+from brasiltransporta.application.storage.use_cases.batch_upload_files import (
+    BatchUploadFilesUseCase,
+    BatchUploadItem
+)
+from brasiltransporta.application.storage.use_cases.generate_ad_media_urls import (
+    GenerateAdMediaUrlsUseCase,
+    GenerateAdMediaUrlsRequest
+)
+from brasiltransporta.infrastructure.external.storage.file_validator import (
+    FileValidator,
+    FileValidationError,
+    StreamingFileValidator
+)
+from brasiltransporta.infrastructure.external.storage.media_probe import MediaInfo
 
 from brasiltransporta.presentation.api.models.requests.file_uploads import (
     PresignedUrlRequest,
@@ -14,20 +29,64 @@ from brasiltransporta.presentation.api.models.responses.file_uploads import (
     UploadResponse,
     PresignedUrlResponse,
     BatchUploadResponse,
+    BatchUploadItemResponse,
+    JobStatusResponse,
     FileInfoResponse,
+    AdMediaUrlsResponse,
+    SignedMediaUrlResponse,
     ErrorResponse
 )
 from brasiltransporta.presentation.api.dependencies.file_uploads import (
     get_file_storage_service,
+    get_file_validator,
     get_upload_use_case,
     get_delete_use_case,
-    get_presigned_url_use_case
+    get_presigned_url_use_case,
+    get_list_ad_files_use_case,
+    get_ad_media_urls_use_case,
+    get_batch_upload_use_case,
+    get_job_progress_store
 )
+from brasiltransporta.infrastructure.persistence.redis.job_progress import RedisJobProgressStore
 from brasiltransporta.presentation.api.dependencies.authz import get_current_user
 
 
 router = APIRouter(prefix="/api/v1/storage", tags=["storage"])
 
+# Tamanho dos chunks lidos do upload (a validação ocorre a cada chunk)
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+
+async def _read_stream(file: UploadFile, validator: StreamingFileValidator) -> Tuple[bytes, MediaInfo]:
+    """
+    Lê o upload em chunks validando o conteúdo à medida que chega
+    
+    Arquivos inválidos (formato real, tamanho, dimensões, duração) são
+    rejeitados no primeiro chunk que viola a regra, sem ler o restante.
+    
+    Raises:
+        FileValidationError: se o conteúdo violar alguma regra
+    """
+    content = bytearray()
+    while True:
+        chunk = await file.read(UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        validator.feed(chunk)
+        content += chunk
+    return bytes(content), validator.finalize()
+
+
+async def _read_validated(file: UploadFile, validator: StreamingFileValidator) -> Tuple[bytes, MediaInfo]:
+    """Lê e valida o upload, convertendo erros de validação em HTTP 400"""
+    try:
+        return await _read_stream(file, validator)
+    except FileValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
 
 @router.post(
     "/ads/{ad_id}/images",
@@ -40,7 +99,8 @@ async def upload_ad_image(
     ad_id: str,
     file: UploadFile = File(..., description="Arquivo de imagem (JPEG, PNG, WebP) até 5MB"),
     current_user: dict = Depends(get_current_user),
-    upload_use_case: UploadFileUseCase = Depends(get_upload_use_case)
+    upload_use_case: UploadFileUseCase = Depends(get_upload_use_case),
+    file_validator: FileValidator = Depends(get_file_validator)
 ) -> UploadResponse:
     """
     Upload de imagem para anúncio
@@ -50,8 +110,14 @@ async def upload_ad_image(
     - Retorna URL do arquivo upload
     """
     try:
-        # Lê o conteúdo do arquivo
-        file_content = await file.read()
+        # Lê o conteúdo do arquivo validando cada chunk
+        try:
+            validator = file_validator.create_stream_validator(
+                "image", file.filename, file.content_type
+            )
+        except FileValidationError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        file_content, media_info = await _read_validated(file, validator)
         
         # Prepara a requisição
         request = UploadFileRequest(
@@ -60,6 +126,7 @@ async def upload_ad_image(
             mime_type=file.content_type,
             ad_id=ad_id,
             file_type="image",
+            media_info=media_info,
             metadata={
                 "uploaded_by": current_user.get("user_id", "unknown"),
                 "original_filename": file.filename
@@ -92,6 +159,83 @@ async def upload_ad_image(
         )
 
 
+@router.post(
+    "/ads/{ad_id}/images/batch",
+    response_model=BatchUploadResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Upload de várias imagens para anúncio",
+    description="Faz upload de várias imagens em paralelo, com resultado por arquivo"
+)
+async def upload_ad_images_batch(
+    ad_id: str,
+    response: Response,
+    files: List[UploadFile] = File(..., description="Arquivos de imagem (JPEG, PNG, WebP) até 5MB cada"),
+    current_user: dict = Depends(get_current_user),
+    batch_use_case: BatchUploadFilesUseCase = Depends(get_batch_upload_use_case),
+    file_validator: FileValidator = Depends(get_file_validator)
+) -> BatchUploadResponse:
+    """
+    Upload de várias imagens para anúncio
+    
+    - **ad_id**: ID do anúncio
+    - **files**: Arquivos de imagem (máx 5MB cada)
+    - Arquivos inválidos não impedem o envio dos demais (HTTP 207 em sucesso parcial)
+    """
+    items = []
+    for file in files:
+        try:
+            validator = file_validator.create_stream_validator("image", file.filename, file.content_type)
+            file_content, media_info = await _read_stream(file, validator)
+        except FileValidationError as e:
+            items.append(BatchUploadItem(filename=file.filename, error_message=str(e)))
+            continue
+        
+        items.append(BatchUploadItem(
+            filename=file.filename,
+            request=UploadFileRequest(
+                file_content=file_content,
+                filename=file.filename,
+                mime_type=file.content_type,
+                ad_id=ad_id,
+                file_type="image",
+                media_info=media_info,
+                metadata={
+                    "uploaded_by": current_user.get("user_id", "unknown"),
+                    "original_filename": file.filename
+                }
+            )
+        ))
+    
+    result = await batch_use_case.execute(ad_id, "image", items)
+    
+    if not result.success:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=result.error_message
+        )
+    
+    if result.failed:
+        response.status_code = status.HTTP_207_MULTI_STATUS
+    
+    return BatchUploadResponse(
+        success=result.uploaded > 0,
+        results=[
+            BatchUploadItemResponse(
+                filename=r.filename,
+                success=r.success,
+                file_url=r.file_url,
+                file_key=r.file_key,
+                file_size=r.file_size if r.success else None,
+                error=r.error_message
+            )
+            for r in result.results
+        ],
+        uploaded=result.uploaded,
+        failed=result.failed,
+        message=f"{result.uploaded} de {len(result.results)} arquivos enviados"
+    )
+
+
 @router.post(
     "/ads/{ad_id}/videos",
     response_model=UploadResponse,
@@ -103,7 +247,8 @@ async def upload_ad_video(
     ad_id: str,
     file: UploadFile = File(..., description="Arquivo de vídeo (MP4, MOV, AVI) até 50MB"),
     current_user: dict = Depends(get_current_user),
-    upload_use_case: UploadFileUseCase = Depends(get_upload_use_case)
+    upload_use_case: UploadFileUseCase = Depends(get_upload_use_case),
+    file_validator: FileValidator = Depends(get_file_validator)
 ) -> UploadResponse:
     """
     Upload de vídeo para anúncio
@@ -113,8 +258,14 @@ async def upload_ad_video(
     - Retorna URL do arquivo upload
     """
     try:
-        # Lê o conteúdo do arquivo
-        file_content = await file.read()
+        # Lê o conteúdo do arquivo validando cada chunk
+        try:
+            validator = file_validator.create_stream_validator(
+                "video", file.filename, file.content_type
+            )
+        except FileValidationError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        file_content, media_info = await _read_validated(file, validator)
         
         # Prepara a requisição
         request = UploadFileRequest(
@@ -123,6 +274,7 @@ async def upload_ad_video(
             mime_type=file.content_type,
             ad_id=ad_id,
             file_type="video",
+            media_info=media_info,
             metadata={
                 "uploaded_by": current_user.get("user_id", "unknown"),
                 "original_filename": file.filename
@@ -138,6 +290,7 @@ async def upload_ad_video(
                 file_url=result.file_url,
                 file_key=result.file_key,
                 file_size=result.file_size,
+                job_id=result.job_id,
                 message="Vídeo upload com sucesso"
             )
         else:
@@ -260,16 +413,94 @@ async def delete_file(
 )
 async def list_ad_files(
     ad_id: str,
-    current_user: dict = Depends(get_current_user)
+    current_user: dict = Depends(get_current_user),
+    list_use_case: ListAdFilesUseCase = Depends(get_list_ad_files_use_case)
 ) -> List[FileInfoResponse]:
     """
     Lista arquivos de um anúncio
     
     - **ad_id**: ID do anúncio
-    - Retorna lista de arquivos com URLs
+    - Retorna lista de arquivos com URLs e metadados
+    """
+    try:
+        # Lê do índice media_assets (com cache), sem chamadas LIST ao S3
+        files = list_use_case.execute(ad_id)
+        return [FileInfoResponse(**vars(f)) for f in files]
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Erro ao listar arquivos: {str(e)}"
+        )
+
+
+@router.get(
+    "/ads/{ad_id}/urls",
+    response_model=AdMediaUrlsResponse,
+    summary="URLs assinadas das mídias do anúncio",
+    description="Assina todas as imagens/vídeos de um anúncio em uma única chamada"
+)
+async def get_ad_media_urls(
+    ad_id: str,
+    response: Response,
+    expires_in: int = Query(3600, ge=60, le=7 * 24 * 3600, description="Validade das URLs em segundos"),
+    file_type: Optional[str] = Query(None, pattern="^(image|video)$", description="Filtra por tipo"),
+    cookies: bool = Query(False, description="Também define cookies assinados do CDN para o anúncio"),
+    current_user: dict = Depends(get_current_user),
+    urls_use_case: GenerateAdMediaUrlsUseCase = Depends(get_ad_media_urls_use_case)
+) -> AdMediaUrlsResponse:
     """
-    # Nota: Esta é uma implementação simplificada
-    # Em produção, precisaríamos de um serviço para listar arquivos do S3
-    # Por enquanto retornamos lista vazia - será implementado posteriormente
+    Gera URLs de download assinadas para todas as mídias de um anúncio
     
-    return []
\ No newline at end of file
+    - **ad_id**: ID do anúncio
+    - **expires_in**: Tempo de expiração em segundos (padrão: 3600)
+    - **cookies**: Com CDN configurado, define cookies que liberam o anúncio inteiro
+    """
+    result = urls_use_case.execute(GenerateAdMediaUrlsRequest(
+        ad_id=ad_id,
+        expires_in=expires_in,
+        file_type=file_type,
+        include_cookies=cookies
+    ))
+    
+    if not result.success:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=result.error_message
+        )
+    
+    for name, value in (result.cookies or {}).items():
+        response.set_cookie(
+            name, value, max_age=expires_in, domain=result.cookie_domain,
+            secure=True, httponly=True, samesite="none"
+        )
+    
+    return AdMediaUrlsResponse(
+        ad_id=ad_id,
+        expires_in=expires_in,
+        urls=[SignedMediaUrlResponse(**vars(u)) for u in result.urls]
+    )
+
+
+@router.get(
+    "/jobs/{job_id}",
+    response_model=JobStatusResponse,
+    summary="Progresso de job de mídia",
+    description="Retorna status e progresso de um job assíncrono (ex.: transcodificação de vídeo)"
+)
+async def get_job_status(
+    job_id: str,
+    current_user: dict = Depends(get_current_user),
+    progress_store: RedisJobProgressStore = Depends(get_job_progress_store)
+) -> JobStatusResponse:
+    """
+    Consulta o progresso de um job
+    
+    - **job_id**: ID retornado no upload do vídeo
+    """
+    job = progress_store.get(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job não encontrado"
+        )
+    return JobStatusResponse(**job)
@@ -0,0 +1,44 @@
+import time
+from typing import Optional
+
+from fastapi import APIRouter, Request
+
+from brasiltransporta.presentation.api.lifespan import ResourceContainer
+from brasiltransporta.presentation.api.responses import typed_response
+
+router = APIRouter(prefix="/health", tags=["health"])
+
+# Probes não podem ser servidos por cache intermediário
+NO_STORE = {"Cache-Control": "no-store"}
+
+
+@router.get("")
+def health():
+    """Compatibilidade: mesmo que /health/live"""
+    return typed_response({"status": "ok"}, headers=NO_STORE)
+
+
+@router.get("/live")
+def live():
+    """Processo no ar (liveness): não consulta dependências"""
+    return typed_response({"status": "ok"}, headers=NO_STORE)
+
+
+@router.get("/ready")
+async def ready(request: Request):
+    """
+    Pronto para tráfego (readiness): banco, Redis e S3 respondendo
+
+    503 durante o aquecimento, no shutdown ou se algum probe falhar; o
+    resultado dos probes vem do cache do `HealthChecker` (HEALTH_CACHE_TTL_SECONDS).
+    """
+    resources: Optional[ResourceContainer] = getattr(request.app.state, "resources", None)
+    if resources is None or not resources.ready:
+        return typed_response({"status": "starting"}, status_code=503, headers=NO_STORE)
+
+    report = await resources.health.check()
+    return typed_response(
+        report.to_dict(time.monotonic()),
+        status_code=200 if report.ok else 503,
+        headers=NO_STORE,
+    )
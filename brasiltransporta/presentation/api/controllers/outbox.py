@@ -0,0 +1,29 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+from brasiltransporta.infrastructure.messaging.outbox_relay import pending_stats
+from brasiltransporta.infrastructure.persistence.redis.client import get_redis_client
+from brasiltransporta.infrastructure.persistence.redis.outbox_metrics import RedisOutboxMetricsStore
+from brasiltransporta.infrastructure.persistence.sqlalchemy.session import get_session
+from brasiltransporta.presentation.api.dependencies.authz import require_roles
+from brasiltransporta.presentation.api.models.responses.outbox_responses import OutboxMetricsResponse
+
+router = APIRouter(prefix="/outbox", tags=["outbox"])
+
+
+def get_outbox_metrics_store() -> RedisOutboxMetricsStore:
+    return RedisOutboxMetricsStore(get_redis_client())
+
+
+@router.get("/metrics", response_model=OutboxMetricsResponse, dependencies=[Depends(require_roles("admin"))])
+def outbox_metrics(
+    db: Session = Depends(get_session),
+    metrics_store: RedisOutboxMetricsStore = Depends(get_outbox_metrics_store),
+):
+    """Backlog do outbox e vazão de cada relay"""
+    pending, oldest = pending_stats(db)
+    return OutboxMetricsResponse(
+        pending=pending,
+        oldest_pending_seconds=oldest,
+        relays=metrics_store.all(),
+    )
@@ -0,0 +1,54 @@
+from functools import lru_cache
+from typing import Dict
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+
+from brasiltransporta.application.billing.services.payment_gateway import PaymentGateway, WebhookSignatureError
+from brasiltransporta.infrastructure.config.settings import PaymentSettings
+
+router = APIRouter(prefix="/payments", tags=["payments"])
+
+
+# Os módulos de tarefa carregam a app Celery e os gateways (httpx): são
+# importados na primeira requisição, não ao registrar o router
+
+@lru_cache(maxsize=1)
+def get_webhook_gateways() -> Dict[str, PaymentGateway]:
+    from brasiltransporta.infrastructure.messaging.tasks.billing import build_gateways
+
+    # Na API os gateways só validam assinaturas (nenhuma chamada HTTP)
+    return build_gateways(PaymentSettings())
+
+
+def get_payment_webhook_queue():
+    from brasiltransporta.infrastructure.messaging.tasks.billing import PaymentWebhookQueue
+
+    return PaymentWebhookQueue()
+
+
+@router.post("/webhooks/{gateway}", status_code=status.HTTP_202_ACCEPTED)
+async def payment_webhook(
+    gateway: str,
+    request: Request,
+    gateways: Dict[str, PaymentGateway] = Depends(get_webhook_gateways),
+    queue = Depends(get_payment_webhook_queue),
+):
+    """
+    Recebe a notificação do gateway, valida a assinatura e enfileira
+
+    Responde 202 rapidamente: o gateway reenvia webhooks que demoram ou
+    falham, e o processamento no worker é idempotente.
+    """
+    adapter = gateways.get(gateway)
+    if adapter is None:
+        raise HTTPException(status_code=404, detail="Gateway não suportado")
+
+    body = await request.body()
+    try:
+        events = adapter.verify_webhook(request.headers, body)
+    except WebhookSignatureError as e:
+        raise HTTPException(status_code=401, detail=str(e))
+
+    for event in events:
+        queue.enqueue(event)
+    return {"accepted": len(events)}
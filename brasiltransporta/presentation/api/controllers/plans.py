@@ -14,6 +14,7 @@ from brasiltransporta.application.plans.use_cases.list_active_plans import (
     ListActivePlansUseCase,
 )
 from brasiltransporta.presentation.api.dependencies.authz import require_roles
+from brasiltransporta.presentation.api.responses import typed_response
 
 # estes são os símbolos que o teste patcha
 from brasiltransporta.presentation.api.di.get_create_plan_uc import get_create_plan_uc
@@ -84,4 +85,4 @@ def list_plans(
                 features=list(getattr(p, "features", []) or []),
             )
         )
-    return ListPlansResponse(plans=items)
+    return typed_response(ListPlansResponse(plans=items))
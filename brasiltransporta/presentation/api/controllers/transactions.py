@@ -1,9 +1,14 @@
 ﻿# brasiltransporta/presentation/api/controllers/transactions.py
 
-from dataclasses import asdict, is_dataclass
-from typing import Any, Dict
+import json
+import time
+from dataclasses import asdict, fields, is_dataclass
+from functools import partial
+from typing import Any, AsyncIterator, Callable, Dict, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
 
 # Schemas (requests/responses)
 from brasiltransporta.presentation.api.models.requests.transaction_requests import (
@@ -11,6 +16,7 @@ from brasiltransporta.presentation.api.models.requests.transaction_requests impo
 )
 from brasiltransporta.presentation.api.models.responses.transaction_responses import (
     CreateTransactionResponse,
+    PixChargeResponse,
     TransactionDetailResponse,
 )
 
@@ -24,6 +30,15 @@ from brasiltransporta.application.transactions.use_cases.get_transaction_by_id i
     GetTransactionByIdUseCase,
     GetTransactionByIdInput,
 )
+from brasiltransporta.application.transactions.use_cases.create_pix_charge import CreatePixChargeUseCase
+from brasiltransporta.infrastructure.persistence.redis.client import get_async_redis_client
+from brasiltransporta.infrastructure.persistence.redis.transaction_events import RedisTransactionStatusSubscriber
+from brasiltransporta.infrastructure.persistence.sqlalchemy.repositories.transaction_repository import (
+    SQLAlchemyTransactionRepository,
+)
+from brasiltransporta.infrastructure.persistence.sqlalchemy.session import get_session
+from brasiltransporta.presentation.api.di.get_create_pix_charge_uc import get_create_pix_charge_uc
+from brasiltransporta.presentation.api.responses import typed_response
 
 # DI Providers
 try:
@@ -47,6 +62,30 @@ except Exception:
 
 router = APIRouter(prefix="/transactions", tags=["transactions"])
 
+# Status após os quais o stream de eventos é encerrado
+TERMINAL_STATUSES = {"completed", "failed", "refunded"}
+SSE_HEARTBEAT_SECONDS = 15.0
+SSE_MAX_SECONDS = 15 * 60.0
+
+
+def get_transaction_status_subscriber() -> RedisTransactionStatusSubscriber:
+    return RedisTransactionStatusSubscriber(get_async_redis_client())
+
+
+def get_transaction_status_reader() -> Callable[[str], Optional[str]]:
+    """
+    Lê o status da transação numa sessão própria, fechada a cada leitura
+
+    O stream SSE dura até SSE_MAX_SECONDS; uma sessão da requisição
+    seguraria uma conexão do pool durante todo esse tempo.
+    """
+    def read(transaction_id: str) -> Optional[str]:
+        with get_session() as session:
+            tx = SQLAlchemyTransactionRepository(session).get_by_id(transaction_id)
+            return _normalize_enum(_to_dict(tx).get("status")) if tx else None
+
+    return read
+
 
 def _to_dict(obj: Any) -> Dict[str, Any]:
     """
@@ -59,7 +98,8 @@ def _to_dict(obj: Any) -> Dict[str, Any]:
         return obj
 
     if is_dataclass(obj):
-        return asdict(obj)
+        # Cópia rasa: asdict() copiaria recursivamente metadata, Money etc.
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
 
     # ✅ CORREÇÃO: Apenas tenta acessar atributos que sabemos que existem
     # em objetos Transaction, sem assumir atributos que não existem
@@ -202,7 +242,7 @@ def get_transaction_by_id(
         data = _to_dict(out)
         amt = _normalize_amount_currency(data)
 
-        return TransactionDetailResponse(
+        return typed_response(TransactionDetailResponse(
             id=str(data.get("id", "")),
             user_id=str(data.get("user_id", "")),
             plan_id=str(data.get("plan_id", "")),
@@ -211,7 +251,7 @@ def get_transaction_by_id(
             payment_method=_normalize_enum(data.get("payment_method")),
             status=_normalize_enum(data.get("status")),
             external_payment_id=data.get("external_payment_id"),
-        )
+        ))
     except HTTPException:
         raise
     except Exception as e:
@@ -219,3 +259,99 @@ def get_transaction_by_id(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Erro ao buscar transação: {e}",
         ) from e
+
+
+@router.post(
+    "/{transaction_id}/pix",
+    response_model=PixChargeResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_pix_charge(
+    transaction_id: str,
+    uc: CreatePixChargeUseCase = Depends(get_create_pix_charge_uc),
+):
+    """
+    Gera o BR Code (copia e cola) e o QR code PIX da transação.
+    """
+    try:
+        out = await uc.execute(transaction_id)
+    except ValidationError as ve:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(ve)) from ve
+    if out is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Transação não encontrada.")
+    return PixChargeResponse(**asdict(out))
+
+
+def _sse(event: str, data: Dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+async def _status_events(
+    transaction_id: str,
+    load_status: Callable[[], Optional[str]],
+    subscriber: RedisTransactionStatusSubscriber,
+    request: Request,
+    heartbeat: float = SSE_HEARTBEAT_SECONDS,
+    max_seconds: float = SSE_MAX_SECONDS,
+) -> AsyncIterator[str]:
+    """
+    Eventos SSE do status de uma transação
+
+    Assina o canal antes de reler o status no banco, para não perder uma
+    confirmação que chegue entre a leitura e a assinatura.
+    """
+    started = last_sent = time.monotonic()
+    current: Optional[str] = None
+    messages = subscriber.listen(transaction_id)
+    try:
+        async for message in messages:
+            if current is None:
+                # Primeiro item: assinatura ativa, lê o status atual
+                current = await run_in_threadpool(load_status) or ""
+                yield _sse("status", {"transaction_id": transaction_id, "status": current})
+                last_sent = time.monotonic()
+                if current in TERMINAL_STATUSES:
+                    return
+
+            if message is not None and message.get("status") != current:
+                current = message["status"]
+                yield _sse("status", {"transaction_id": transaction_id, "status": current})
+                last_sent = time.monotonic()
+                if current in TERMINAL_STATUSES:
+                    return
+
+            now = time.monotonic()
+            if now - started > max_seconds or await request.is_disconnected():
+                return
+            if now - last_sent >= heartbeat:
+                # Comentário SSE: mantém a conexão viva em proxies
+                yield ": ping\n\n"
+                last_sent = now
+    finally:
+        await messages.aclose()
+
+
+@router.get("/{transaction_id}/events")
+async def transaction_events(
+    transaction_id: str,
+    request: Request,
+    read_status: Callable[[str], Optional[str]] = Depends(get_transaction_status_reader),
+    subscriber: RedisTransactionStatusSubscriber = Depends(get_transaction_status_subscriber),
+):
+    """
+    Server-Sent Events com as mudanças de status da transação.
+
+    Substitui o polling de GET /transactions/{id}: o cliente recebe o
+    status atual e depois cada mudança (ex.: PIX confirmado pelo webhook),
+    publicada pelo worker no Redis. O stream termina no status final.
+    """
+    load_status = partial(read_status, transaction_id)
+
+    if await run_in_threadpool(load_status) is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Transação não encontrada.")
+
+    return StreamingResponse(
+        _status_events(transaction_id, load_status, subscriber, request),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache, no-transform", "X-Accel-Buffering": "no"},
+    )
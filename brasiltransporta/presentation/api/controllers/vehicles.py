@@ -1,18 +1,43 @@
+import os
+import tempfile
 import uuid
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Tuple
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
 from datetime import datetime  
 
 from brasiltransporta.application.vehicles.use_cases.create_vehicle import CreateVehicleInput
 from brasiltransporta.presentation.api.di.get_create_vehicle_uc import get_create_vehicle_uc
 from brasiltransporta.presentation.api.di.get_vehicle_by_id_uc import get_vehicle_by_id_uc
+from brasiltransporta.presentation.api.di.get_batch_get_vehicles_uc import get_batch_get_vehicles_uc
 from brasiltransporta.presentation.api.di.list_vehicles_by_store_uc import get_list_vehicles_by_store_uc
+from brasiltransporta.presentation.api.di.get_vehicle_import_queue import get_vehicle_import_queue
+from brasiltransporta.presentation.api.di.get_store_repo import get_store_repo
+from brasiltransporta.application.vehicles.services.vehicle_import import detect_format
 
-from brasiltransporta.presentation.api.models.requests.vehicle_requests import CreateVehicleRequest
-from brasiltransporta.presentation.api.models.responses.vehicle_responses import VehicleResponse
+from brasiltransporta.presentation.api.models.requests.vehicle_requests import BatchGetVehiclesRequest, CreateVehicleRequest
+from brasiltransporta.presentation.api.models.responses.vehicle_responses import (
+    BatchGetVehiclesResponse,
+    VehicleBatchItem,
+    VehicleImportResponse,
+    VehicleListItem,
+    VehicleResponse,
+)
 from brasiltransporta.domain.errors.errors import ValidationError
+from brasiltransporta.infrastructure.persistence.sqlalchemy.repositories.catalog_query_repository import (
+    VEHICLE_LIST_COLUMNS,
+    VEHICLE_LIST_DEFAULT,
+)
+from brasiltransporta.presentation.api.fields import fields_query
+from brasiltransporta.presentation.api.http_cache import PUBLIC_SHORT, cache_headers, conditional, make_etag
+from brasiltransporta.presentation.api.responses import typed_response
 
 router = APIRouter(tags=["vehicles"])
 
+# Tamanho máximo do arquivo de importação (~100 mil veículos em CSV)
+MAX_IMPORT_BYTES = 50 * 1024 * 1024
+IMPORT_CHUNK_SIZE = 1024 * 1024
+
 @router.post("/stores/{store_id}/vehicles", status_code=status.HTTP_201_CREATED)
 async def create_vehicle(
     store_id: uuid.UUID,
@@ -33,41 +58,111 @@ async def create_vehicle(
     except ValidationError as e:
         raise HTTPException(status_code=422, detail=str(e))
 
+def _to_response(v) -> VehicleResponse:
+    return VehicleResponse(
+        id=str(v.id),
+        store_id=str(v.store_id),
+        brand=getattr(v.brand, "value", v.brand),
+        model=v.model,
+        year=v.year,
+        plate=v.plate,
+        created_at=getattr(v, "created_at", None) or datetime.now(),
+    )
+
+@router.post("/vehicles:batchGet", response_model=BatchGetVehiclesResponse)
+async def batch_get_vehicles(
+    payload: BatchGetVehiclesRequest,
+    uc = Depends(get_batch_get_vehicles_uc),
+):
+    """Vários veículos numa consulta, na ordem pedida (`found: false` para ids inexistentes)"""
+    items = await uc.execute(payload.ids)
+    return typed_response(BatchGetVehiclesResponse(items=[
+        VehicleBatchItem(id=item.id, found=item.found,
+                         vehicle=_to_response(item.vehicle) if item.found else None)
+        for item in items
+    ]))
+
 @router.get("/vehicles/{vehicle_id}", response_model=VehicleResponse)
 def get_vehicle_by_id(
     vehicle_id: uuid.UUID,
+    request: Request,
     uc = Depends(get_vehicle_by_id_uc),
 ):
     v = uc.execute(vehicle_id)
     if not v:
         raise HTTPException(status_code=404, detail="Veículo não encontrado.")
-    return VehicleResponse(
-        id=str(v.id),
-        store_id=str(v.store_id),
-        brand=v.brand,
-        model=v.model,
-        year=v.year,
-        plate=v.plate,
-        created_at=datetime.now(),  
+    body = _to_response(v)
+    modified_at = getattr(v, "updated_at", None) or body.created_at
+    headers = cache_headers(
+        make_etag("vehicle", v.id, modified_at.isoformat()),
+        last_modified=modified_at,
+        cache_control=PUBLIC_SHORT,
+        surrogate_keys=(f"vehicle-{v.id}", f"store-{v.store_id}"),
     )
+    cached = conditional(request, headers)
+    if cached is not None:
+        return cached
+    return typed_response(body, headers=headers)
 
-@router.get("/stores/{store_id}/vehicles", response_model=list[VehicleResponse])
+@router.get(
+    "/stores/{store_id}/vehicles",
+    response_model=list[VehicleListItem],
+    response_model_exclude_unset=True,
+)
 def list_vehicles_by_store(
     store_id: uuid.UUID,
-    limit: int = 50,
-    offset: int = 0,
+    limit: int = Query(50, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    fields: Tuple[str, ...] = Depends(fields_query(tuple(VEHICLE_LIST_COLUMNS), VEHICLE_LIST_DEFAULT)),
     uc = Depends(get_list_vehicles_by_store_uc),
 ):
-    rows = uc.execute(store_id, limit=limit, offset=offset)
-    return [
-        VehicleResponse(
-            id=str(v.id),
-            store_id=str(v.store_id),
-            brand=v.brand,
-            model=v.model,
-            year=v.year,
-            plate=v.plate,
-            created_at=datetime.now(),
-        )
-        for v in rows
-    ]
\ No newline at end of file
+    """Estoque da loja; `fields` escolhe as colunas lidas do banco"""
+    return typed_response(uc.execute(store_id, fields, limit=limit, offset=offset))
+
+@router.post(
+    "/stores/{store_id}/vehicles/import",
+    response_model=VehicleImportResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def import_vehicles(
+    store_id: uuid.UUID,
+    file: UploadFile = File(..., description="Arquivo .csv ou .jsonl (um veículo por linha)"),
+    queue = Depends(get_vehicle_import_queue),
+    stores = Depends(get_store_repo),
+):
+    """
+    Importa o estoque da loja em segundo plano
+
+    O arquivo é copiado em blocos para o disco (sem carregar na memória) e
+    processado pelo worker; acompanhe o job em `status_url`.
+    """
+    try:
+        fmt = detect_format(file.filename, file.content_type)
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    # Loja inexistente falharia só no worker, como erro de chave estrangeira
+    if await stores.get_by_id(store_id) is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Loja não encontrada")
+
+    fd, path = tempfile.mkstemp(prefix="vehicle-import-")
+    try:
+        size = 0
+        with os.fdopen(fd, "wb") as out:
+            while chunk := await file.read(IMPORT_CHUNK_SIZE):
+                size += len(chunk)
+                if size > MAX_IMPORT_BYTES:
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=f"Arquivo excede {MAX_IMPORT_BYTES // (1024 * 1024)} MB",
+                    )
+                out.write(chunk)
+        if size == 0:
+            raise HTTPException(status_code=422, detail="Arquivo vazio")
+        try:
+            job_id = await run_in_threadpool(queue.enqueue, str(store_id), path, fmt)
+        except RuntimeError as e:
+            raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
+    finally:
+        os.remove(path)
+
+    return VehicleImportResponse(job_id=job_id, status_url=f"/api/v1/storage/jobs/{job_id}")
@@ -1,11 +1,31 @@
+from functools import lru_cache
+from typing import Optional
+
 from fastapi import Depends
+from sqlalchemy.orm import Session
+
 from brasiltransporta.infrastructure.external.storage.storage_config import S3Config
 from brasiltransporta.infrastructure.external.storage.s3_client import S3Client
 from brasiltransporta.infrastructure.external.storage.file_validator import FileValidator
+from brasiltransporta.infrastructure.external.storage.url_signing import (
+    PresignedUrlCache,
+    CloudFrontUrlSigner,
+    create_cloudfront_signer
+)
 from brasiltransporta.application.storage.services.file_storage_service import S3FileStorageService
 from brasiltransporta.application.storage.use_cases.upload_file import UploadFileUseCase
 from brasiltransporta.application.storage.use_cases.delete_file import DeleteFileUseCase
 from brasiltransporta.application.storage.use_cases.generate_presigned_url import GeneratePresignedUrlUseCase
+from brasiltransporta.application.storage.use_cases.list_ad_files import ListAdFilesUseCase
+from brasiltransporta.application.storage.use_cases.generate_ad_media_urls import GenerateAdMediaUrlsUseCase
+from brasiltransporta.application.storage.use_cases.batch_upload_files import BatchUploadFilesUseCase
+from brasiltransporta.infrastructure.persistence.sqlalchemy.session import get_session
+from brasiltransporta.infrastructure.persistence.sqlalchemy.repositories.media_asset_repository import (
+    SQLAlchemyMediaAssetRepository
+)
+from brasiltransporta.infrastructure.persistence.redis.client import get_redis_client
+from brasiltransporta.infrastructure.persistence.redis.media_listing_cache import RedisMediaListingCache
+from brasiltransporta.infrastructure.persistence.redis.job_progress import RedisJobProgressStore
 
 
 def get_s3_config() -> S3Config:
@@ -23,31 +43,115 @@ def get_file_validator() -> FileValidator:
     return FileValidator()
 
 
-def get_file_storage_service(
-    s3_client: S3Client = Depends(get_s3_client),
-    config: S3Config = Depends(get_s3_config)
-) -> S3FileStorageService:
+@lru_cache(maxsize=1)
+def get_presigned_url_cache() -> PresignedUrlCache:
+    """Cache de URLs assinadas compartilhado pelo processo"""
+    return PresignedUrlCache(S3Config.from_env().presigned_cache_size)
+
+
+@lru_cache(maxsize=1)
+def get_cdn_signer() -> Optional[CloudFrontUrlSigner]:
+    """Assinador do CloudFront (chave privada carregada uma única vez)"""
+    return create_cloudfront_signer(S3Config.from_env())
+
+
+@lru_cache(maxsize=1)
+def get_shared_file_storage_service() -> S3FileStorageService:
+    """
+    Serviço de storage do processo
+
+    Um único cliente boto3 (thread-safe) para todas as requisições: o pool
+    de conexões keep-alive com o S3 é reaproveitado em vez de recriado.
+    """
+    return S3FileStorageService(
+        S3Config.from_env(),
+        url_cache=get_presigned_url_cache(),
+        cdn_signer=get_cdn_signer()
+    )
+
+
+def get_file_storage_service() -> S3FileStorageService:
     """Retorna serviço de storage configurado"""
-    return S3FileStorageService(config)
+    return get_shared_file_storage_service()
+
+
+def get_media_asset_repository(db: Session = Depends(get_session)) -> SQLAlchemyMediaAssetRepository:
+    """Retorna repositório do índice de mídia"""
+    return SQLAlchemyMediaAssetRepository(db)
+
+
+def get_media_listing_cache() -> RedisMediaListingCache:
+    """Retorna cache da listagem de arquivos por anúncio"""
+    return RedisMediaListingCache(get_redis_client())
+
+
+def get_job_progress_store() -> RedisJobProgressStore:
+    """Retorna store de progresso de jobs assíncronos"""
+    return RedisJobProgressStore(get_redis_client())
+
+
+def get_media_job_queue(
+    progress_store: RedisJobProgressStore = Depends(get_job_progress_store)
+):
+    """Retorna fila de jobs de mídia (transcodificação)"""
+    # Importada no primeiro uso: o módulo da tarefa carrega a app Celery
+    from brasiltransporta.infrastructure.messaging.tasks.media import MediaJobQueue
+
+    return MediaJobQueue(progress_store)
 
 
 def get_upload_use_case(
     storage_service: S3FileStorageService = Depends(get_file_storage_service),
-    validator: FileValidator = Depends(get_file_validator)
+    validator: FileValidator = Depends(get_file_validator),
+    media_repository: SQLAlchemyMediaAssetRepository = Depends(get_media_asset_repository),
+    media_cache: RedisMediaListingCache = Depends(get_media_listing_cache),
+    media_jobs = Depends(get_media_job_queue)
 ) -> UploadFileUseCase:
     """Retorna use case de upload configurado"""
-    return UploadFileUseCase(storage_service, validator)
+    return UploadFileUseCase(storage_service, validator, media_repository, media_cache, media_jobs)
 
 
 def get_delete_use_case(
-    storage_service: S3FileStorageService = Depends(get_file_storage_service)
+    storage_service: S3FileStorageService = Depends(get_file_storage_service),
+    media_repository: SQLAlchemyMediaAssetRepository = Depends(get_media_asset_repository),
+    media_cache: RedisMediaListingCache = Depends(get_media_listing_cache)
 ) -> DeleteFileUseCase:
     """Retorna use case de deleção configurado"""
-    return DeleteFileUseCase(storage_service)
+    return DeleteFileUseCase(storage_service, media_repository, media_cache)
+
+
+def get_list_ad_files_use_case(
+    storage_service: S3FileStorageService = Depends(get_file_storage_service),
+    media_repository: SQLAlchemyMediaAssetRepository = Depends(get_media_asset_repository),
+    media_cache: RedisMediaListingCache = Depends(get_media_listing_cache)
+) -> ListAdFilesUseCase:
+    """Retorna use case de listagem de arquivos do anúncio"""
+    return ListAdFilesUseCase(media_repository, storage_service, media_cache)
 
 
 def get_presigned_url_use_case(
     storage_service: S3FileStorageService = Depends(get_file_storage_service)
 ) -> GeneratePresignedUrlUseCase:
     """Retorna use case de URL assinada configurado"""
-    return GeneratePresignedUrlUseCase(storage_service)
\ No newline at end of file
+    return GeneratePresignedUrlUseCase(storage_service)
+
+
+def get_ad_media_urls_use_case(
+    storage_service: S3FileStorageService = Depends(get_file_storage_service),
+    media_repository: SQLAlchemyMediaAssetRepository = Depends(get_media_asset_repository)
+) -> GenerateAdMediaUrlsUseCase:
+    """Retorna use case de URLs assinadas das mídias do anúncio"""
+    return GenerateAdMediaUrlsUseCase(media_repository, storage_service)
+
+
+def get_batch_upload_use_case(
+    upload_use_case: UploadFileUseCase = Depends(get_upload_use_case),
+    media_repository: SQLAlchemyMediaAssetRepository = Depends(get_media_asset_repository),
+    config: S3Config = Depends(get_s3_config)
+) -> BatchUploadFilesUseCase:
+    """Retorna use case de upload em lote configurado"""
+    return BatchUploadFilesUseCase(
+        upload_use_case,
+        media_repository=media_repository,
+        max_concurrency=config.max_upload_concurrency
+    )
@@ -2,28 +2,84 @@ from fastapi import Depends
 from sqlalchemy.orm import Session
 
 from brasiltransporta.infrastructure.persistence.sqlalchemy.session import get_session
+from brasiltransporta.infrastructure.persistence.redis.client import get_redis_client
+from brasiltransporta.infrastructure.persistence.redis.view_counter import RedisViewCounter
+from brasiltransporta.infrastructure.persistence.redis.vehicle_listing_cache import RedisVehicleListingCache
+from brasiltransporta.infrastructure.persistence.sqlalchemy.repositories.vehicle_listing_repository import SQLAlchemyVehicleListingRepository
+from brasiltransporta.infrastructure.persistence.sqlalchemy.repositories.catalog_query_repository import SQLAlchemyCatalogQueryRepository
+from brasiltransporta.application.storage.services.file_storage_service import S3FileStorageService
+from brasiltransporta.presentation.api.dependencies.file_uploads import get_file_storage_service
+from brasiltransporta.infrastructure.persistence.redis.quota_counter import RedisQuotaCounter
+from brasiltransporta.infrastructure.persistence.sqlalchemy.repositories.subscription_repository import SQLAlchemySubscriptionRepository
+from brasiltransporta.application.subscriptions.services.entitlements import EntitlementService, free_plan_limits
+from brasiltransporta.infrastructure.config.settings import get_settings
 from brasiltransporta.infrastructure.persistence.sqlalchemy.repositories.advertisement_repository import SQLAlchemyAdvertisementRepository
 from brasiltransporta.application.advertisements.use_cases.create_advertisement import CreateAdvertisementUseCase
 from brasiltransporta.application.advertisements.use_cases.get_advertisement_by_id import GetAdvertisementByIdUseCase
+from brasiltransporta.application.advertisements.use_cases.batch_get_advertisements import BatchGetAdvertisementsUseCase
+from brasiltransporta.application.advertisements.use_cases.get_vehicle_listing import GetVehicleListingUseCase
+from brasiltransporta.application.advertisements.use_cases.list_advertisements import ListAdvertisementsUseCase
 from brasiltransporta.application.advertisements.use_cases.publish_advertisement import PublishAdvertisementUseCase
+from brasiltransporta.application.advertisements.use_cases.set_featured import SetAdvertisementFeaturedUseCase
 
 # Provider do repositório (já existe no get_advertisement_repo.py)
 def get_advertisement_repo(db: Session = Depends(get_session)) -> SQLAlchemyAdvertisementRepository:
     return SQLAlchemyAdvertisementRepository(db)
 
+def get_view_counter() -> RedisViewCounter:
+    return RedisViewCounter(get_redis_client())
+
+def get_vehicle_listing_cache() -> RedisVehicleListingCache:
+    return RedisVehicleListingCache(get_redis_client())
+
+def get_entitlement_service(db: Session = Depends(get_session)) -> EntitlementService:
+    free = get_settings().subscriptions
+    return EntitlementService(
+        SQLAlchemySubscriptionRepository(db),
+        RedisQuotaCounter(get_redis_client()),
+        default_limits=free_plan_limits(free.free_max_ads, free.free_max_featured_ads),
+    )
+
 # Providers dos use cases
 def get_create_advertisement_uc(
-    repo: SQLAlchemyAdvertisementRepository = Depends(get_advertisement_repo)
+    repo: SQLAlchemyAdvertisementRepository = Depends(get_advertisement_repo),
+    entitlements: EntitlementService = Depends(get_entitlement_service)
 ) -> CreateAdvertisementUseCase:
     # Para testes, podemos passar None para store_repo e vehicle_repo temporariamente
-    return CreateAdvertisementUseCase(repo, None, None)
+    return CreateAdvertisementUseCase(repo, None, None, entitlements)
 
 def get_get_advertisement_by_id_uc(
-    repo: SQLAlchemyAdvertisementRepository = Depends(get_advertisement_repo)
+    repo: SQLAlchemyAdvertisementRepository = Depends(get_advertisement_repo),
+    view_counter: RedisViewCounter = Depends(get_view_counter)
 ) -> GetAdvertisementByIdUseCase:
-    return GetAdvertisementByIdUseCase(repo)
+    return GetAdvertisementByIdUseCase(repo, view_counter)
+
+def get_batch_get_advertisements_uc(
+    repo: SQLAlchemyAdvertisementRepository = Depends(get_advertisement_repo),
+    view_counter: RedisViewCounter = Depends(get_view_counter)
+) -> BatchGetAdvertisementsUseCase:
+    return BatchGetAdvertisementsUseCase(repo, view_counter)
+
+def get_get_vehicle_listing_uc(
+    db: Session = Depends(get_session),
+    cache: RedisVehicleListingCache = Depends(get_vehicle_listing_cache),
+    view_counter: RedisViewCounter = Depends(get_view_counter),
+    file_storage: S3FileStorageService = Depends(get_file_storage_service)
+) -> GetVehicleListingUseCase:
+    return GetVehicleListingUseCase(SQLAlchemyVehicleListingRepository(db), cache, view_counter, file_storage)
+
+def get_list_advertisements_uc(db: Session = Depends(get_session)) -> ListAdvertisementsUseCase:
+    return ListAdvertisementsUseCase(SQLAlchemyCatalogQueryRepository(db))
 
 def get_publish_advertisement_uc(
-    repo: SQLAlchemyAdvertisementRepository = Depends(get_advertisement_repo)
+    repo: SQLAlchemyAdvertisementRepository = Depends(get_advertisement_repo),
+    listing_cache: RedisVehicleListingCache = Depends(get_vehicle_listing_cache)
 ) -> PublishAdvertisementUseCase:
-    return PublishAdvertisementUseCase(repo)
\ No newline at end of file
+    return PublishAdvertisementUseCase(repo, listing_cache)
+
+def get_set_featured_uc(
+    repo: SQLAlchemyAdvertisementRepository = Depends(get_advertisement_repo),
+    entitlements: EntitlementService = Depends(get_entitlement_service),
+    listing_cache: RedisVehicleListingCache = Depends(get_vehicle_listing_cache)
+) -> SetAdvertisementFeaturedUseCase:
+    return SetAdvertisementFeaturedUseCase(repo, entitlements, listing_cache)
@@ -0,0 +1,8 @@
+from brasiltransporta.application.vehicles.use_cases.batch_get_vehicles import BatchGetVehiclesUseCase
+from brasiltransporta.infrastructure.persistence.sqlalchemy.repositories import SQLAlchemyVehicleRepository
+from brasiltransporta.infrastructure.persistence.sqlalchemy.session import get_session
+
+def get_batch_get_vehicles_uc():
+    s = get_session()
+    repo = SQLAlchemyVehicleRepository(s)
+    return BatchGetVehiclesUseCase(repo)
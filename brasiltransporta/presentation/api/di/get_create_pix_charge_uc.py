@@ -0,0 +1,24 @@
+from fastapi import Depends, HTTPException, status
+from sqlalchemy.orm import Session
+
+from brasiltransporta.application.transactions.use_cases.create_pix_charge import CreatePixChargeUseCase
+from brasiltransporta.infrastructure.config.settings import PaymentSettings
+from brasiltransporta.infrastructure.persistence.sqlalchemy.repositories.transaction_repository import (
+    SQLAlchemyTransactionRepository,
+)
+from brasiltransporta.infrastructure.persistence.sqlalchemy.session import get_session
+
+def get_create_pix_charge_uc(db: Session = Depends(get_session)) -> CreatePixChargeUseCase:
+    settings = PaymentSettings()
+    if not settings.pix_key:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="PIX não configurado")
+    # Importado no primeiro uso: o pacote de gateways carrega o httpx
+    from brasiltransporta.infrastructure.external.payments.pix_gateway import PixPaymentGateway
+
+    gateway = PixPaymentGateway(
+        settings.pix_key,
+        settings.pix_merchant_name,
+        settings.pix_merchant_city,
+        settings.pix_webhook_secret,
+    )
+    return CreatePixChargeUseCase(SQLAlchemyTransactionRepository(db), gateway)
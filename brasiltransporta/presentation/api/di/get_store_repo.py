@@ -0,0 +1,12 @@
+from typing import Iterator
+
+from brasiltransporta.infrastructure.persistence.sqlalchemy.repositories.store_repository import SQLAlchemyStoreRepository
+from brasiltransporta.infrastructure.persistence.sqlalchemy.session import get_session
+
+def get_store_repo() -> Iterator[SQLAlchemyStoreRepository]:
+    """Repositório de lojas com uma sessão fechada ao fim da requisição"""
+    session = get_session()
+    try:
+        yield SQLAlchemyStoreRepository(session)
+    finally:
+        session.close()
@@ -0,0 +1,14 @@
+from fastapi import Depends
+
+from brasiltransporta.application.storage.services.file_storage_service import S3FileStorageService
+from brasiltransporta.infrastructure.persistence.redis.job_progress import RedisJobProgressStore
+from brasiltransporta.presentation.api.dependencies.file_uploads import get_file_storage_service, get_job_progress_store
+
+def get_vehicle_import_queue(
+    progress_store: RedisJobProgressStore = Depends(get_job_progress_store),
+    storage: S3FileStorageService = Depends(get_file_storage_service),
+):
+    # Importada no primeiro uso: o módulo da tarefa carrega a app Celery
+    from brasiltransporta.infrastructure.messaging.tasks.imports import VehicleImportQueue
+
+    return VehicleImportQueue(progress_store, storage)
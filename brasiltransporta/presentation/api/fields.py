@@ -0,0 +1,37 @@
+# brasiltransporta/presentation/api/fields.py
+"""
+Seleção de campos (sparse fieldsets) nas listagens: `?fields=id,title,price_amount`
+
+Os campos escolhidos viram as colunas do SELECT no repositório, então
+campos pesados (ex.: `description`) só saem do banco quando pedidos.
+`id` sempre vem.
+"""
+from typing import Callable, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, Query
+
+
+def parse_fields(raw: Optional[str], allowed: Sequence[str], default: Sequence[str]) -> Tuple[str, ...]:
+    """Campos pedidos, na ordem de `allowed`; 400 para campos desconhecidos"""
+    if not raw or not raw.strip():
+        requested = set(default)
+    else:
+        requested = {name.strip() for name in raw.split(",") if name.strip()}
+        unknown = sorted(requested - set(allowed))
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail={"message": f"Campos inválidos: {', '.join(unknown)}", "allowed": list(allowed)},
+            )
+    requested.add("id")
+    return tuple(name for name in allowed if name in requested)
+
+
+def fields_query(allowed: Sequence[str], default: Sequence[str]) -> Callable[..., Tuple[str, ...]]:
+    """Dependência FastAPI que lê e valida o parâmetro `fields`"""
+    description = f"Campos separados por vírgula. Disponíveis: {', '.join(allowed)}. Padrão: {', '.join(default)}"
+
+    def dependency(fields: Optional[str] = Query(None, description=description)) -> Tuple[str, ...]:
+        return parse_fields(fields, allowed, default)
+
+    return dependency
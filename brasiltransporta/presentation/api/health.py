@@ -0,0 +1,110 @@
+# brasiltransporta/presentation/api/health.py
+"""
+Health checks: probes das dependências com timeout e resultado em cache
+
+`HealthChecker` roda os probes (banco, Redis, S3) em paralelo, cada um
+numa thread (os clientes são síncronos) e limitado por `timeout`. O
+resultado fica em cache por `ttl` segundos e requisições simultâneas
+esperam a mesma rodada: o load balancer pode consultar /health/ready a
+cada segundo sem que isso vire carga nas dependências.
+
+Um probe que estoura o timeout conta como falha na hora, mas a thread
+continua até o cliente desistir; com o cache, no máximo uma rodada fica
+pendurada por vez.
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+OK = "ok"
+ERROR = "error"
+TIMEOUT = "timeout"
+
+Probe = Callable[[], Any]
+
+
+@dataclass(frozen=True)
+class ProbeResult:
+    status: str
+    latency_ms: float
+
+    @property
+    def ok(self) -> bool:
+        return self.status == OK
+
+
+@dataclass(frozen=True)
+class HealthReport:
+    checks: Dict[str, ProbeResult]
+    checked_at: float  # relógio monotônico
+
+    @property
+    def ok(self) -> bool:
+        return all(result.ok for result in self.checks.values())
+
+    def to_dict(self, now: float) -> Dict[str, Any]:
+        """Corpo da resposta; o detalhe das falhas fica só no log"""
+        return {
+            "status": OK if self.ok else "fail",
+            "age_seconds": round(max(now - self.checked_at, 0.0), 3),
+            "checks": {
+                name: {"status": result.status, "latency_ms": result.latency_ms}
+                for name, result in self.checks.items()
+            },
+        }
+
+
+class HealthChecker:
+    def __init__(
+        self,
+        probes: Dict[str, Probe],
+        timeout: float,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.probes = probes
+        self.timeout = timeout
+        self.ttl = ttl
+        self._clock = clock
+        self._report: Optional[HealthReport] = None
+        self._lock = asyncio.Lock()
+
+    def _fresh(self) -> Optional[HealthReport]:
+        report = self._report
+        if report is not None and self._clock() - report.checked_at < self.ttl:
+            return report
+        return None
+
+    async def check(self) -> HealthReport:
+        """Último resultado se ainda válido; senão uma rodada nova (uma por vez)"""
+        report = self._fresh()
+        if report is not None:
+            return report
+        async with self._lock:
+            # Quem esperou o lock recebe a rodada que acabou de terminar
+            report = self._fresh()
+            if report is None:
+                report = await self._run()
+                self._report = report
+            return report
+
+    async def _run(self) -> HealthReport:
+        results = await asyncio.gather(*(self._probe(name, probe) for name, probe in self.probes.items()))
+        return HealthReport(checks=dict(zip(self.probes, results)), checked_at=self._clock())
+
+    async def _probe(self, name: str, probe: Probe) -> ProbeResult:
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(asyncio.to_thread(probe), self.timeout)
+            result = OK
+        except asyncio.TimeoutError:
+            logger.warning(f"Health check de {name}: sem resposta em {self.timeout}s")
+            result = TIMEOUT
+        except Exception as e:
+            logger.warning(f"Health check de {name} falhou: {e}")
+            result = ERROR
+        return ProbeResult(status=result, latency_ms=round((time.perf_counter() - start) * 1000, 2))
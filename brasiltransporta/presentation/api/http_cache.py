@@ -0,0 +1,194 @@
+# brasiltransporta/presentation/api/http_cache.py
+"""
+Cache HTTP: ETag/Last-Modified, GET condicional (304) e cabeçalhos para CDN
+
+Dois caminhos:
+
+- por rota: o endpoint monta o ETag a partir de colunas de versão
+  (`updated_at`, contadores) lidas numa consulta mínima e, se o cliente já
+  tem a versão (`If-None-Match`/`If-Modified-Since`), responde 304 sem
+  carregar a linha nem serializar o corpo;
+- `ConditionalGetMiddleware`: para GETs JSON sem ETag da rota, calcula o
+  ETag pelo hash do corpo. Ainda consulta o banco, mas o 304 economiza a
+  transferência (o que importa para o app móvel).
+
+`Surrogate-Key` agrupa as respostas no CDN para purga por chave
+(ex.: `advertisement-<id>`, `store-<id>`).
+"""
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+from fastapi import Request, Response
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Cacheável também no CDN, mas sempre revalidado na origem (a revalidação
+# é barata e mantém a contagem de visualizações)
+PUBLIC_REVALIDATE = "public, no-cache"
+# Cacheável no CDN por alguns minutos, servindo a cópia antiga enquanto revalida
+PUBLIC_SHORT = "public, max-age=60, s-maxage=300, stale-while-revalidate=60"
+# Respostas autenticadas: só o cliente guarda, sempre revalidando
+PRIVATE_REVALIDATE = "private, no-cache"
+
+# Corpos maiores que isso passam pelo middleware sem ETag
+MAX_HASHED_BODY = 1024 * 1024
+
+
+def make_etag(*parts: Any) -> str:
+    """ETag fraco a partir dos valores que identificam a versão"""
+    raw = "|".join("" if part is None else str(part) for part in parts)
+    return f'W/"{hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()}"'
+
+
+def body_etag(body: bytes) -> str:
+    """ETag forte pelo conteúdo do corpo"""
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def _opaque(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Comparação fraca (RFC 9110 §13.1.2), inclusive `*`"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return _opaque(etag) in {_opaque(tag) for tag in if_none_match.split(",")}
+
+
+def http_date(value: datetime) -> str:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def _not_modified_since(if_modified_since: Optional[str], last_modified: Optional[str]) -> bool:
+    if not if_modified_since or not last_modified:
+        return False
+    try:
+        return parsedate_to_datetime(last_modified) <= parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+
+
+def is_fresh(request_headers: Headers, response_headers: Dict[str, str]) -> bool:
+    """
+    O cliente já tem esta versão?
+
+    `If-None-Match` tem precedência; `If-Modified-Since` só vale sem ele.
+    """
+    if_none_match = request_headers.get("if-none-match")
+    if if_none_match is not None:
+        return "ETag" in response_headers and etag_matches(if_none_match, response_headers["ETag"])
+    return _not_modified_since(request_headers.get("if-modified-since"), response_headers.get("Last-Modified"))
+
+
+def cache_headers(
+    etag: str,
+    last_modified: Optional[datetime] = None,
+    cache_control: str = PRIVATE_REVALIDATE,
+    surrogate_keys: Iterable[str] = (),
+) -> Dict[str, str]:
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+    keys = " ".join(surrogate_keys)
+    if keys:
+        headers["Surrogate-Key"] = keys
+    return headers
+
+
+def not_modified(headers: Dict[str, str]) -> Response:
+    """304 sem corpo, repetindo os validadores e a política de cache"""
+    return Response(status_code=304, headers=headers)
+
+
+def conditional(request: Request, headers: Dict[str, str]) -> Optional[Response]:
+    """304 se o cliente já tem a versão; None para seguir com a resposta completa"""
+    if request.method in ("GET", "HEAD") and is_fresh(request.headers, headers):
+        return not_modified(headers)
+    return None
+
+
+class ConditionalGetMiddleware:
+    """
+    ETag pelo hash do corpo para GET 200 JSON sem ETag da rota
+
+    Respostas com ETag (definido pela rota), Content-Encoding (já
+    comprimidas) ou em streaming maiores que MAX_HASHED_BODY passam
+    intactas. Sem Cache-Control da rota, aplica `PRIVATE_REVALIDATE`.
+    """
+
+    def __init__(self, app: ASGIApp, max_body: int = MAX_HASHED_BODY) -> None:
+        self.app = app
+        self.max_body = max_body
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # HEAD não tem corpo para calcular o hash
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        start: Optional[Message] = None
+        chunks: List[bytes] = []
+        size = 0
+        passthrough = False
+
+        async def flush(more_body: bool = True) -> None:
+            nonlocal passthrough
+            passthrough = True
+            await send(start)
+            if chunks:
+                await send({"type": "http.response.body", "body": b"".join(chunks), "more_body": more_body})
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, size
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                start = message
+                headers = Headers(raw=message["headers"])
+                if not (
+                    message["status"] == 200
+                    and "etag" not in headers
+                    and "content-encoding" not in headers
+                    and headers.get("content-type", "").startswith("application/json")
+                ):
+                    await flush()
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            chunks.append(body)
+            size += len(body)
+            if size > self.max_body:
+                await flush(more_body)
+                return
+            if more_body:
+                return
+            await self._finish(start, b"".join(chunks), request_headers, send)
+
+        await self.app(scope, receive, send_wrapper)
+
+    async def _finish(self, start: Message, body: bytes, request_headers: Headers, send: Send) -> None:
+        headers = MutableHeaders(raw=list(start["headers"]))
+        etag = body_etag(body)
+        headers["ETag"] = etag
+        if "cache-control" not in headers:
+            headers["Cache-Control"] = PRIVATE_REVALIDATE
+        if etag_matches(request_headers.get("if-none-match"), etag):
+            for name in ("content-length", "content-type"):
+                if name in headers:
+                    del headers[name]
+            await send({"type": "http.response.start", "status": 304, "headers": headers.raw})
+            await send({"type": "http.response.body", "body": b""})
+            return
+        await send({**start, "headers": headers.raw})
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,183 @@
+# brasiltransporta/presentation/api/lifespan.py
+"""
+Recursos de longa duração da API, geridos pelo lifespan do FastAPI
+
+`ResourceContainer` reúne as instâncias compartilhadas pelo processo
+(engine, Redis, storage S3, JWT, hasher) e as aquece antes de a API
+receber tráfego: abre conexões do pool do banco, faz PING no Redis, abre
+a conexão keep-alive com o bucket e carrega o backend do bcrypt. O
+uvicorn só aceita conexões depois do startup do lifespan, e `ready` só
+fica verdadeiro ao fim do aquecimento, limitado a STARTUP_TIMEOUT_SECONDS.
+
+`health` reusa as mesmas instâncias nos probes de /health/ready.
+
+Os providers de DI continuam devolvendo as mesmas instâncias (são
+singletons em cache), então as requisições usam os pools já aquecidos.
+No shutdown, conexões e pools são fechados.
+"""
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Callable, Dict, Optional
+
+import redis
+from fastapi import FastAPI
+from sqlalchemy import Engine, text
+
+from brasiltransporta.application.storage.services.file_storage_service import S3FileStorageService
+from brasiltransporta.infrastructure.config.settings import AppSettings
+from brasiltransporta.infrastructure.dependencies import get_jwt_service, get_password_hasher
+from brasiltransporta.infrastructure.persistence.redis.client import aclose, get_async_redis_client, get_redis_client
+from brasiltransporta.infrastructure.persistence.sqlalchemy.session import get_engine
+from brasiltransporta.infrastructure.security.jwt_service import JWTService
+from brasiltransporta.infrastructure.security.password_hasher import BcryptPasswordHasher
+from brasiltransporta.infrastructure.security.refresh_token_service import RefreshTokenService
+from brasiltransporta.presentation.api.dependencies.file_uploads import get_shared_file_storage_service
+from brasiltransporta.presentation.api.health import HealthChecker
+
+logger = logging.getLogger(__name__)
+
+# Sem eles a API não atende; S3 e bcrypt só degradam (uploads, primeiro login)
+REQUIRED_WARMUPS = ("database", "redis")
+
+
+@dataclass
+class ResourceContainer:
+    settings: AppSettings
+    engine: Engine
+    redis: redis.Redis
+    storage: S3FileStorageService
+    jwt_service: JWTService
+    password_hasher: BcryptPasswordHasher
+    refresh_tokens: Optional[RefreshTokenService] = None
+    ready: bool = False
+    warmup_errors: Dict[str, str] = field(default_factory=dict)
+    health: Optional[HealthChecker] = None
+
+    def __post_init__(self) -> None:
+        if self.health is None:
+            self.health = HealthChecker(
+                {
+                    "database": self._probe_database,
+                    "redis": self.redis.ping,
+                    "storage": self._head_bucket,
+                },
+                timeout=self.settings.health.probe_timeout_seconds,
+                ttl=self.settings.health.cache_ttl_seconds,
+            )
+
+    @classmethod
+    def build(cls, settings: AppSettings) -> "ResourceContainer":
+        """Monta o container com as instâncias compartilhadas dos providers"""
+        return cls(
+            settings=settings,
+            engine=get_engine(),
+            redis=get_redis_client(),
+            storage=get_shared_file_storage_service(),
+            jwt_service=get_jwt_service(),
+            password_hasher=get_password_hasher(),
+        )
+
+    # --- aquecimento (roda em threads: os clientes são síncronos) ---
+
+    def _warm_database(self) -> None:
+        pool_size = getattr(self.engine.pool, "size", None)
+        count = self.settings.database.warm_connections
+        if callable(pool_size):
+            count = min(count, pool_size())
+        connections = []
+        try:
+            for _ in range(max(count, 1)):
+                connection = self.engine.connect()
+                connections.append(connection)
+                connection.execute(text("SELECT 1"))
+        finally:
+            # Voltam ao pool já abertas
+            for connection in connections:
+                connection.close()
+
+    def _warm_redis(self) -> None:
+        self.redis.ping()
+        self.refresh_tokens = RefreshTokenService(self.redis)
+
+    def _head_bucket(self) -> None:
+        self.storage.s3_client.client.head_bucket(Bucket=self.storage.bucket_name)
+
+    def _warm_password_hasher(self) -> None:
+        self.password_hasher.warmup()
+
+    # --- probes do /health/ready ---
+
+    def _probe_database(self) -> None:
+        with self.engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+
+    async def start(self) -> None:
+        """
+        Aquece os recursos em paralelo e marca o container como pronto
+
+        O aquecimento todo tem até `startup_timeout_seconds`; o que não
+        terminou conta como falha (a thread segue até o cliente desistir).
+        Em produção a falha de um recurso de REQUIRED_WARMUPS interrompe o
+        startup (o orquestrador reinicia o processo); as demais, e todas
+        nos outros ambientes, deixam a API subir degradada, com as falhas
+        em `warmup_errors`.
+        """
+        warmups: Dict[str, Callable[[], None]] = {
+            "database": self._warm_database,
+            "redis": self._warm_redis,
+            "storage": self._head_bucket,
+            "password_hasher": self._warm_password_hasher,
+        }
+        timeout = self.settings.startup_timeout_seconds
+        tasks = {name: asyncio.ensure_future(asyncio.to_thread(warm)) for name, warm in warmups.items()}
+        _, pending = await asyncio.wait(tasks.values(), timeout=timeout)
+        for name, task in tasks.items():
+            if task in pending:
+                task.cancel()
+                self.warmup_errors[name] = f"sem resposta em {timeout}s"
+            elif task.exception() is not None:
+                self.warmup_errors[name] = str(task.exception())
+            else:
+                continue
+            logger.warning(f"Falha ao aquecer {name}: {self.warmup_errors[name]}")
+
+        fatal = [name for name in REQUIRED_WARMUPS if name in self.warmup_errors]
+        if fatal and self.settings.environment == "production":
+            raise RuntimeError(f"Recursos indisponíveis no startup: {', '.join(fatal)}")
+        self.ready = True
+        logger.info("Recursos da API prontos")
+
+    async def close(self) -> None:
+        """Fecha conexões e pools (cada um independente dos demais)"""
+        self.ready = False
+        closers: Dict[str, Callable[[], object]] = {
+            "storage": self.storage.s3_client.close,
+            "redis": self.redis.close,
+            "database": self.engine.dispose,
+        }
+        for name, close in closers.items():
+            try:
+                await asyncio.to_thread(close)
+            except Exception as e:
+                logger.warning(f"Falha ao fechar {name}: {e}")
+        if get_async_redis_client.cache_info().currsize:
+            try:
+                await aclose(get_async_redis_client())
+            except Exception as e:
+                logger.warning(f"Falha ao fechar redis assíncrono: {e}")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    resources = ResourceContainer.build(AppSettings())
+    app.state.resources = resources
+    await resources.start()
+    # Usado por get_refresh_token_service (None se o Redis não respondeu)
+    app.state.refresh_token_service = resources.refresh_tokens
+    try:
+        yield
+    finally:
+        await resources.close()
+
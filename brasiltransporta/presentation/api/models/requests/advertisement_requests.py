@@ -1,9 +1,19 @@
+from typing import List
+
 from pydantic import BaseModel, Field
 
+from brasiltransporta.application.service.batch import MAX_BATCH_IDS
+
 class CreateAdvertisementRequest(BaseModel):
     store_id: str = Field(..., description="ID da loja")
     vehicle_id: str = Field(..., description="ID do veículo")
     title: str = Field(..., min_length=5, max_length=200, description="Título do anúncio")
     description: str = Field(..., min_length=10, description="Descrição do anúncio")
     price_amount: float = Field(..., gt=0, description="Preço do veículo")
-    price_currency: str = Field("BRL", description="Moeda (padrão: BRL)")
\ No newline at end of file
+    price_currency: str = Field("BRL", description="Moeda (padrão: BRL)")
+
+class SetFeaturedRequest(BaseModel):
+    featured: bool = Field(..., description="True destaca o anúncio (consome a cota do plano)")
+
+class BatchGetAdvertisementsRequest(BaseModel):
+    ids: List[str] = Field(..., min_length=1, max_length=MAX_BATCH_IDS, description="IDs dos anúncios, na ordem desejada")
@@ -1,7 +1,14 @@
+from typing import List
+
 from pydantic import BaseModel, Field
 
+from brasiltransporta.application.service.batch import MAX_BATCH_IDS
+
 class CreateVehicleRequest(BaseModel):
     brand: str = Field(..., min_length=1, max_length=80)
     model: str = Field(..., min_length=1, max_length=120)
     year: int
     plate: str = Field(..., min_length=5, max_length=10)
+
+class BatchGetVehiclesRequest(BaseModel):
+    ids: List[str] = Field(..., min_length=1, max_length=MAX_BATCH_IDS)
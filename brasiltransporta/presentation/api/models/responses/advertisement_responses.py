@@ -1,4 +1,7 @@
 # presentation/api/models/responses/advertisement_responses.py
+from datetime import datetime
+from typing import List, Optional
+
 from pydantic import BaseModel
 
 class CreateAdvertisementResponse(BaseModel):
@@ -20,3 +23,32 @@ class AdvertisementDetailResponse(BaseModel):
 
 class PublishAdvertisementResponse(BaseModel):
     success: bool
+
+class SetFeaturedResponse(BaseModel):
+    advertisement_id: str
+    is_featured: bool
+
+class AdvertisementBatchItem(BaseModel):
+    id: str
+    found: bool
+    advertisement: Optional[AdvertisementDetailResponse] = None
+
+class BatchGetAdvertisementsResponse(BaseModel):
+    items: List[AdvertisementBatchItem]
+
+class AdvertisementListItem(BaseModel):
+    """Item da listagem: só vêm os campos pedidos em `fields` (`id` sempre)"""
+    id: str
+    store_id: Optional[str] = None
+    vehicle_id: Optional[str] = None
+    title: Optional[str] = None
+    description: Optional[str] = None
+    price_amount: Optional[float] = None
+    price_currency: Optional[str] = None
+    status: Optional[str] = None
+    is_featured: Optional[bool] = None
+    views: Optional[int] = None
+    thumbnail: Optional[str] = None
+    expires_at: Optional[datetime] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional, List
+from typing import Dict, Optional, List
 
 
 class UploadResponse(BaseModel):
@@ -9,6 +9,7 @@ class UploadResponse(BaseModel):
     file_url: Optional[str] = Field(None, description="URL pública do arquivo")
     file_key: Optional[str] = Field(None, description="Chave interna do arquivo no S3")
     file_size: Optional[int] = Field(None, description="Tamanho do arquivo em bytes")
+    job_id: Optional[str] = Field(None, description="Job de transcodificação agendado (vídeos)")
     message: Optional[str] = Field(None, description="Mensagem descritiva")
     
     class Config:
@@ -49,6 +50,11 @@ class FileInfoResponse(BaseModel):
     file_url: str = Field(..., description="URL pública do arquivo")
     file_type: str = Field(..., description="Tipo do arquivo: image ou video")
     file_size: int = Field(..., description="Tamanho do arquivo em bytes")
+    mime_type: Optional[str] = Field(None, description="Tipo MIME detectado no upload")
+    width: Optional[int] = Field(None, description="Largura em pixels")
+    height: Optional[int] = Field(None, description="Altura em pixels")
+    duration: Optional[float] = Field(None, description="Duração em segundos (vídeos)")
+    variants: Dict[str, str] = Field(default_factory=dict, description="Variantes geradas (nome -> chave)")
     uploaded_at: Optional[str] = Field(None, description="Data do upload")
     
     class Config:
@@ -63,26 +69,102 @@ class FileInfoResponse(BaseModel):
         }
 
 
+class SignedMediaUrlResponse(BaseModel):
+    """URL assinada de um arquivo do anúncio"""
+    
+    file_key: str = Field(..., description="Chave do arquivo no S3")
+    file_type: str = Field(..., description="Tipo do arquivo: image ou video")
+    url: str = Field(..., description="URL assinada para download")
+
+
+class AdMediaUrlsResponse(BaseModel):
+    """Modelo de response com as URLs assinadas de todas as mídias de um anúncio"""
+    
+    ad_id: str = Field(..., description="ID do anúncio")
+    expires_in: int = Field(..., description="Tempo de expiração em segundos")
+    urls: List[SignedMediaUrlResponse] = Field(default_factory=list, description="URLs assinadas")
+    
+    class Config:
+        schema_extra = {
+            "example": {
+                "ad_id": "123",
+                "expires_in": 3600,
+                "urls": [
+                    {
+                        "file_key": "ads/123/images/photo.jpg",
+                        "file_type": "image",
+                        "url": "https://d111111abcdef8.cloudfront.net/ads/123/images/photo.jpg?Expires=...&Signature=...&Key-Pair-Id=..."
+                    }
+                ]
+            }
+        }
+
+
+class BatchUploadItemResponse(BaseModel):
+    """Resultado do upload de um arquivo do lote"""
+    
+    filename: str = Field(..., description="Nome do arquivo enviado")
+    success: bool = Field(..., description="Indica se o upload deste arquivo foi bem sucedido")
+    file_url: Optional[str] = Field(None, description="URL pública do arquivo")
+    file_key: Optional[str] = Field(None, description="Chave interna do arquivo no S3")
+    file_size: Optional[int] = Field(None, description="Tamanho do arquivo em bytes")
+    error: Optional[str] = Field(None, description="Motivo da falha")
+
+
 class BatchUploadResponse(BaseModel):
     """Modelo de response para upload em lote"""
     
     success: bool = Field(..., description="Indica se a operação foi bem sucedida")
-    urls: List[PresignedUrlResponse] = Field(..., description="Lista de URLs assinadas geradas")
+    urls: List[PresignedUrlResponse] = Field(default_factory=list, description="Lista de URLs assinadas geradas")
+    results: List[BatchUploadItemResponse] = Field(default_factory=list, description="Resultado por arquivo")
+    uploaded: int = Field(0, description="Quantidade de arquivos enviados com sucesso")
+    failed: int = Field(0, description="Quantidade de arquivos com falha")
     message: Optional[str] = Field(None, description="Mensagem descritiva")
     
     class Config:
         schema_extra = {
             "example": {
                 "success": True,
-                "urls": [
+                "results": [
                     {
+                        "filename": "frente.jpg",
                         "success": True,
-                        "url": "https://brasiltransporta-uploads.s3.sa-east-1.amazonaws.com/ads/123/images/photo1.jpg?AWSAccessKeyId=...",
-                        "expires_in": 3600,
-                        "message": "URL assinada gerada com sucesso"
+                        "file_url": "https://brasiltransporta-uploads.s3.sa-east-1.amazonaws.com/ads/123/images/frente.jpg",
+                        "file_key": "ads/123/images/frente.jpg",
+                        "file_size": 1024000
+                    },
+                    {
+                        "filename": "painel.png",
+                        "success": False,
+                        "error": "Dimensões da imagem excedem o limite"
                     }
                 ],
-                "message": "URLs assinadas geradas com sucesso"
+                "uploaded": 1,
+                "failed": 1,
+                "message": "1 de 2 arquivos enviados"
+            }
+        }
+
+
+class JobStatusResponse(BaseModel):
+    """Modelo de response com o progresso de um job assíncrono"""
+    
+    id: str = Field(..., description="ID do job")
+    kind: Optional[str] = Field(None, description="Tipo do job (ex.: transcode_video)")
+    status: str = Field(..., description="queued, running, completed ou failed")
+    progress: float = Field(0, description="Progresso em porcentagem (0-100)")
+    stage: Optional[str] = Field(None, description="Etapa atual")
+    result: Optional[dict] = Field(None, description="Resultado do job concluído")
+    error: Optional[str] = Field(None, description="Motivo da falha")
+    
+    class Config:
+        schema_extra = {
+            "example": {
+                "id": "8c8f3f4e-3c1a-4b7d-9d55-2f6a4f0d9b21",
+                "kind": "transcode_video",
+                "status": "running",
+                "progress": 42.5,
+                "stage": "h264_480p"
             }
         }
 
@@ -0,0 +1,9 @@
+# presentation/api/models/responses/outbox_responses.py
+from pydantic import BaseModel
+from typing import Any, Dict, Optional
+
+class OutboxMetricsResponse(BaseModel):
+    pending: int
+    oldest_pending_seconds: Optional[float] = None
+    # Snapshot de cada instância ativa do relay (OutboxRelayMetrics.snapshot)
+    relays: Dict[str, Dict[str, Any]]
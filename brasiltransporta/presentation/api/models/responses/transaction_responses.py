@@ -20,3 +20,10 @@ class TransactionDetailResponse(BaseModel):
     payment_method: str
     status: str
     external_payment_id: Optional[str] = None
+
+class PixChargeResponse(BaseModel):
+    transaction_id: str
+    txid: str
+    brcode: str
+    amount: float
+    qr_code_svg: Optional[str] = None
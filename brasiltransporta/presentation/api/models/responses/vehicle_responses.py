@@ -1,3 +1,5 @@
+from typing import List, Optional
+
 from pydantic import BaseModel
 from datetime import datetime
 
@@ -9,3 +11,39 @@ class VehicleResponse(BaseModel):
     year: int
     plate: str
     created_at: datetime
+
+
+class VehicleListItem(BaseModel):
+    """Item da listagem: só vêm os campos pedidos em `fields` (`id` sempre)"""
+    id: str
+    store_id: Optional[str] = None
+    brand: Optional[str] = None
+    model: Optional[str] = None
+    year: Optional[int] = None
+    plate: Optional[str] = None
+    vehicle_type: Optional[str] = None
+    condition: Optional[str] = None
+    price: Optional[float] = None
+    implement_segment: Optional[str] = None
+    description: Optional[str] = None
+    mileage: Optional[int] = None
+    color: Optional[str] = None
+    engine_power: Optional[str] = None
+    axle_configuration: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
+class VehicleImportResponse(BaseModel):
+    job_id: str
+    status_url: str
+
+
+class VehicleBatchItem(BaseModel):
+    id: str
+    found: bool
+    vehicle: Optional[VehicleResponse] = None
+
+
+class BatchGetVehiclesResponse(BaseModel):
+    items: List[VehicleBatchItem]
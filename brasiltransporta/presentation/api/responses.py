@@ -0,0 +1,64 @@
+# brasiltransporta/presentation/api/responses.py
+"""
+Serialização JSON das respostas com orjson
+
+`FastJSONResponse` é a classe de resposta padrão da aplicação: serializa
+UUID, datetime, dataclasses e enums nativamente (Decimal como número) e
+modelos Pydantic pelos próprios campos (ou `model_dump` quando o modelo
+tem aliases ou serializers).
+
+Endpoints que já montam o modelo de resposta tipado podem devolver
+`typed_response(modelo)`: por ser uma Response, o FastAPI não revalida o
+modelo contra o `response_model` nem passa por `jsonable_encoder` (o
+`response_model` continua valendo para a documentação OpenAPI).
+"""
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Dict, Optional, Type
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
+
+@lru_cache(maxsize=None)
+def _plain_model(cls: Type[BaseModel]) -> bool:
+    """Modelo sem aliases, serializers, campos computados ou extras: `__dict__` basta"""
+    decorators = cls.__pydantic_decorators__
+    return not (
+        decorators.field_serializers
+        or decorators.model_serializers
+        or cls.model_computed_fields
+        or cls.model_config.get("extra") == "allow"
+        or any(f.alias or f.serialization_alias for f in cls.model_fields.values())
+    )
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        # __dict__ evita a conversão campo a campo do model_dump (~3x mais rápido);
+        # modelos aninhados voltam para cá
+        return value.__dict__ if _plain_model(type(value)) else value.model_dump(mode="json", by_alias=True)
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Tipo não serializável: {type(value).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(content, default=_default, option=ORJSON_OPTIONS)
+
+
+class FastJSONResponse(JSONResponse):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def typed_response(content: Any, status_code: int = 200, headers: Optional[Dict[str, str]] = None) -> FastJSONResponse:
+    """Resposta pronta para um conteúdo já tipado (sem revalidação do FastAPI)"""
+    return FastJSONResponse(content, status_code=status_code, headers=headers)
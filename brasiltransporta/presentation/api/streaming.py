@@ -0,0 +1,118 @@
+# brasiltransporta/presentation/api/streaming.py
+"""
+Respostas em streaming para exportações (NDJSON ou CSV, opcionalmente gzip)
+
+As linhas são serializadas à medida que chegam do cursor e agrupadas em
+blocos de STREAM_CHUNK_SIZE: nada além de um bloco fica em memória.
+"""
+import csv
+import io
+import json
+import zlib
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Iterable, Iterator, Sequence
+from uuid import UUID
+
+from fastapi.responses import StreamingResponse
+
+NDJSON = "ndjson"
+CSV = "csv"
+
+STREAM_CHUNK_SIZE = 64 * 1024
+GZIP_LEVEL = 6
+
+MEDIA_TYPES = {
+    NDJSON: "application/x-ndjson",
+    CSV: "text/csv; charset=utf-8",
+}
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        # Texto: preços e valores sem arredondamento de ponto flutuante
+        return str(value)
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Tipo não serializável: {type(value).__name__}")
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def ndjson_chunks(columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> Iterator[bytes]:
+    """Um objeto JSON por linha"""
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write(json.dumps(dict(zip(columns, row)), default=_json_default,
+                                ensure_ascii=False, separators=(",", ":")))
+        buffer.write("\n")
+        if buffer.tell() >= STREAM_CHUNK_SIZE:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def csv_chunks(columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> Iterator[bytes]:
+    """CSV com cabeçalho"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for row in rows:
+        writer.writerow([_csv_value(value) for value in row])
+        if buffer.tell() >= STREAM_CHUNK_SIZE:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def gzip_chunks(chunks: Iterable[bytes], level: int = GZIP_LEVEL) -> Iterator[bytes]:
+    """Comprime o fluxo em formato gzip sem acumular a saída"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    for item in (accept_encoding or "").split(","):
+        name, _, params = item.strip().partition(";")
+        if name.strip().lower() in ("gzip", "*"):
+            return params.replace(" ", "") not in ("q=0", "q=0.0")
+    return False
+
+
+def export_response(
+    columns: Sequence[str],
+    rows: Iterable[Sequence[Any]],
+    fmt: str,
+    filename: str,
+    accept_encoding: str = "",
+) -> StreamingResponse:
+    """StreamingResponse para download (`filename` sem extensão)"""
+    chunks = ndjson_chunks(columns, rows) if fmt == NDJSON else csv_chunks(columns, rows)
+    headers = {"Content-Disposition": f'attachment; filename="{filename}.{fmt}"', "Vary": "Accept-Encoding"}
+    if accepts_gzip(accept_encoding):
+        chunks = gzip_chunks(chunks)
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(chunks, media_type=MEDIA_TYPES[fmt], headers=headers)
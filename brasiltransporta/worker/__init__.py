@@ -0,0 +1,3 @@
+"""
+Workers Celery (mídia, notificações, cobrança e manutenção)
+"""
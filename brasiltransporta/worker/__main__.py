@@ -0,0 +1,21 @@
+"""
+Inicia o worker dedicado a uma fila com o perfil de `QUEUE_PROFILES`
+
+Uso:
+    python -m brasiltransporta.worker media|notifications|billing|imports|maintenance
+"""
+import sys
+
+from brasiltransporta.worker.celery_app import QUEUE_PROFILES, celery_app, worker_argv
+
+
+def main(argv=None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] not in QUEUE_PROFILES:
+        print(f"Uso: python -m brasiltransporta.worker [{'|'.join(QUEUE_PROFILES)}]")
+        raise SystemExit(2)
+    celery_app.worker_main(worker_argv(argv[0]) + argv[1:])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+# brasiltransporta/worker/celery_app.py
+"""
+Aplicação Celery dos workers
+
+Cada fila tem um worker dedicado com pool e prefetch próprios (ver
+`QUEUE_PROFILES`): mídia é CPU-bound (prefork, uma tarefa por processo),
+notificações e cobrança são I/O-bound (threads). Iniciar um worker:
+
+    python -m brasiltransporta.worker media
+    celery -A brasiltransporta.worker.celery_app worker -Q media -P prefork -c 2 --prefetch-multiplier 1
+
+Tarefas periódicas (`BEAT_SCHEDULE`) precisam de um único processo beat:
+
+    celery -A brasiltransporta.worker.celery_app beat
+"""
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from celery import Celery
+from kombu import Exchange, Queue
+
+from brasiltransporta.infrastructure.config.settings import CelerySettings
+
+
+@dataclass(frozen=True)
+class QueueProfile:
+    """Configuração do worker e das tarefas de uma fila"""
+    queue: str
+    pool: str  # 'prefork', 'threads' ou 'gevent'
+    concurrency: int
+    prefetch_multiplier: int
+    soft_time_limit: int  # segundos (SoftTimeLimitExceeded dentro da tarefa)
+    time_limit: int  # segundos (processo/thread é encerrado)
+    max_tasks_per_child: Optional[int] = None  # apenas prefork
+
+
+QUEUE_PROFILES: Dict[str, QueueProfile] = {
+    # Transcodificação: longa e CPU-bound; prefetch 1 evita que um processo
+    # reserve vídeos enquanto outro fica ocioso
+    "media": QueueProfile("media", "prefork", 2, 1, soft_time_limit=1800, time_limit=1900, max_tasks_per_child=50),
+    # E-mail/SMS: chamadas HTTP curtas, muitas em paralelo
+    "notifications": QueueProfile("notifications", "threads", 32, 8, soft_time_limit=30, time_limit=60),
+    # Gateways de pagamento: I/O, mas com mais tempo e menos paralelismo
+    "billing": QueueProfile("billing", "threads", 8, 2, soft_time_limit=120, time_limit=180),
+    # Importação de estoque: lê o arquivo e grava lotes grandes no Postgres;
+    # poucos processos para não disputar o banco com a API
+    "imports": QueueProfile("imports", "prefork", 2, 1, soft_time_limit=900, time_limit=960, max_tasks_per_child=20),
+    # Tarefas periódicas internas (flush de contadores, limpezas)
+    "maintenance": QueueProfile("maintenance", "threads", 2, 1, soft_time_limit=120, time_limit=180),
+}
+
+DEFAULT_QUEUE = "notifications"
+
+# Tarefas são nomeadas "<fila>.<tarefa>" e roteadas pelo prefixo
+TASK_ROUTES = {f"{name}.*": {"queue": name, "routing_key": name} for name in QUEUE_PROFILES}
+
+TASK_MODULES = [
+    "brasiltransporta.infrastructure.messaging.tasks.media",
+    "brasiltransporta.infrastructure.messaging.tasks.advertisements",
+    "brasiltransporta.infrastructure.messaging.tasks.notifications",
+    "brasiltransporta.infrastructure.messaging.tasks.billing",
+    "brasiltransporta.infrastructure.messaging.tasks.subscriptions",
+    "brasiltransporta.infrastructure.messaging.tasks.imports",
+]
+
+BEAT_SCHEDULE: Dict[str, Dict[str, Any]] = {
+    "flush-view-counts": {
+        "task": "maintenance.flush_view_counts",
+        "schedule": 30.0,
+        # Um flush atrasado é substituído pelo próximo
+        "options": {"expires": 25},
+    },
+    "expire-advertisements": {
+        "task": "maintenance.expire_advertisements",
+        "schedule": 300.0,
+        "options": {"expires": 290},
+    },
+    "reconcile-payments": {
+        "task": "billing.reconcile_payments",
+        "schedule": 600.0,
+        "options": {"expires": 590},
+    },
+    "reconcile-quota-usage": {
+        "task": "maintenance.reconcile_quota_usage",
+        "schedule": 600.0,
+        "options": {"expires": 590},
+    },
+}
+
+
+def task_options(queue: str) -> Dict[str, Any]:
+    """Opções de `@celery_app.task` para tarefas de uma fila"""
+    profile = QUEUE_PROFILES[queue]
+    return {
+        "queue": queue,
+        "acks_late": True,
+        "reject_on_worker_lost": True,
+        "soft_time_limit": profile.soft_time_limit,
+        "time_limit": profile.time_limit,
+    }
+
+
+def worker_argv(queue: str, loglevel: str = "info") -> List[str]:
+    """Argumentos de linha de comando do worker dedicado a uma fila"""
+    profile = QUEUE_PROFILES[queue]
+    argv = [
+        "worker",
+        "-Q", profile.queue,
+        "-P", profile.pool,
+        "-c", str(profile.concurrency),
+        "--prefetch-multiplier", str(profile.prefetch_multiplier),
+        "-n", f"{profile.queue}@%h",
+        f"--loglevel={loglevel}",
+    ]
+    if profile.max_tasks_per_child and profile.pool == "prefork":
+        argv += ["--max-tasks-per-child", str(profile.max_tasks_per_child)]
+    return argv
+
+
+def create_celery_app(settings: Optional[CelerySettings] = None) -> Celery:
+    settings = settings or CelerySettings()
+    app = Celery("brasiltransporta", include=TASK_MODULES)
+
+    exchange = Exchange("brasiltransporta", type="direct")
+    app.conf.update(
+        broker_url="memory://" if settings.task_always_eager else settings.broker_url,
+        result_backend=settings.result_backend,
+        task_ignore_result=settings.result_backend is None,
+        task_queues=[Queue(name, exchange, routing_key=name) for name in QUEUE_PROFILES],
+        task_default_queue=DEFAULT_QUEUE,
+        task_default_exchange=exchange.name,
+        task_default_routing_key=DEFAULT_QUEUE,
+        task_routes=TASK_ROUTES,
+        beat_schedule=BEAT_SCHEDULE,
+        # Confirma a mensagem só após a execução: tarefas de um worker que
+        # morreu voltam para a fila (as tarefas devem ser idempotentes)
+        task_acks_late=True,
+        task_reject_on_worker_lost=True,
+        worker_prefetch_multiplier=1,
+        task_serializer="json",
+        accept_content=["json"],
+        result_serializer="json",
+        timezone="UTC",
+        enable_utc=True,
+        broker_connection_retry_on_startup=True,
+        task_always_eager=settings.task_always_eager,
+        task_eager_propagates=settings.task_always_eager,
+    )
+    return app
+
+
+celery_app = create_celery_app()
+# `celery -A brasiltransporta.worker.celery_app` procura o atributo `app`
+app = celery_app
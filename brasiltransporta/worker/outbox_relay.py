@@ -0,0 +1,49 @@
+"""
+Processo do relay do outbox (eventos de domínio → RabbitMQ)
+
+Uso:
+    python -m brasiltransporta.worker.outbox_relay
+
+Pode rodar em mais de uma réplica: os lotes são reservados com
+`FOR UPDATE SKIP LOCKED`.
+"""
+import logging
+import signal
+import socket
+import threading
+
+from brasiltransporta.infrastructure.config.settings import AppSettings
+from brasiltransporta.infrastructure.messaging.outbox_relay import KombuEventPublisher, OutboxRelay
+from brasiltransporta.infrastructure.persistence.redis.client import get_redis_client
+from brasiltransporta.infrastructure.persistence.redis.outbox_metrics import RedisOutboxMetricsStore
+from brasiltransporta.infrastructure.persistence.sqlalchemy.session import get_session
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    settings = AppSettings()
+    publisher = KombuEventPublisher(settings.celery.broker_url, settings.outbox.exchange)
+    relay = OutboxRelay(
+        get_session,
+        publisher,
+        batch_size=settings.outbox.batch_size,
+        metrics_store=RedisOutboxMetricsStore(get_redis_client(), ttl=settings.outbox.metrics_ttl),
+        instance=socket.gethostname(),
+    )
+
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
+
+    logger.info(f"Relay do outbox iniciado (lote de {settings.outbox.batch_size})")
+    try:
+        relay.run(poll_interval=settings.outbox.poll_interval, stop=stop)
+    finally:
+        publisher.close()
+        logger.info(f"Relay do outbox encerrado: {relay.metrics.snapshot()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""
+Reconcilia a tabela media_assets com o conteúdo do bucket S3
+
+Uso:
+    python scripts/reconcile_media_index.py
+"""
+from dotenv import load_dotenv
+
+
+def main() -> int:
+    load_dotenv()
+
+    from brasiltransporta.application.storage.services.file_storage_service import S3FileStorageService
+    from brasiltransporta.application.storage.use_cases.reconcile_media_index import ReconcileMediaIndexUseCase
+    from brasiltransporta.infrastructure.external.storage.storage_config import S3Config
+    from brasiltransporta.infrastructure.persistence.redis.client import get_redis_client
+    from brasiltransporta.infrastructure.persistence.redis.media_listing_cache import RedisMediaListingCache
+    from brasiltransporta.infrastructure.persistence.sqlalchemy.repositories.media_asset_repository import (
+        SQLAlchemyMediaAssetRepository
+    )
+    from brasiltransporta.infrastructure.persistence.sqlalchemy.session import get_session
+
+    session = get_session()
+    try:
+        use_case = ReconcileMediaIndexUseCase(
+            S3FileStorageService(S3Config.from_env()),
+            SQLAlchemyMediaAssetRepository(session),
+            RedisMediaListingCache(get_redis_client())
+        )
+        result = use_case.execute()
+    finally:
+        session.close()
+
+    print(f"✅ {result.scanned} objetos no S3 | {result.added} adicionados | "
+          f"{result.removed} removidos | {result.skipped} ignorados")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
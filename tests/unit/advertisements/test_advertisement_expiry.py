@@ -0,0 +1,101 @@
+# tests/unit/advertisements/test_advertisement_expiry.py
+import asyncio
+import uuid
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from sqlalchemy.dialects import postgresql
+
+from brasiltransporta.domain.entities.advertisement import Advertisement
+from brasiltransporta.infrastructure.messaging.tasks.advertisements import expire_advertisements
+from brasiltransporta.infrastructure.persistence.sqlalchemy.models.advertisement import AdvertisementModel
+from brasiltransporta.infrastructure.persistence.sqlalchemy.models.outbox import OutboxModel
+from brasiltransporta.infrastructure.persistence.sqlalchemy.repositories.advertisement_repository import (
+    SQLAlchemyAdvertisementRepository,
+)
+
+
+class RecordingSession:
+    def __init__(self, rows=()):
+        self.rows = list(rows)
+        self.statements, self.added = [], []
+        self.committed = False
+
+    def execute(self, stmt):
+        self.statements.append(stmt)
+        return SimpleNamespace(
+            all=lambda: self.rows,
+            scalars=lambda: SimpleNamespace(all=lambda: []),
+        )
+
+    def add_all(self, models):
+        self.added.extend(models)
+
+    def commit(self):
+        self.committed = True
+
+
+def _sql(stmt):
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+class FakeRepository:
+    def __init__(self, due):
+        self.due = list(due)
+        self.batches = []
+
+    async def expire_due(self, now, batch_size=500):
+        batch, self.due = self.due[:batch_size], self.due[batch_size:]
+        self.batches.append(batch)
+        return batch
+
+
+class TestExpireDue:
+    def test_single_set_based_update_with_outbox_events(self):
+        now = datetime(2026, 1, 31)
+        row = SimpleNamespace(id=uuid.uuid4(), store_id=uuid.uuid4(), expires_at=now - timedelta(days=1))
+        session = RecordingSession([row])
+
+        ids = asyncio.run(SQLAlchemyAdvertisementRepository(session).expire_due(now, batch_size=100))
+
+        assert ids == [str(row.id)]
+        sql = _sql(session.statements[0])
+        assert sql.startswith("UPDATE advertisements SET status=")
+        assert "WHERE advertisements.id IN (SELECT advertisements.id" in sql
+        assert "FOR UPDATE SKIP LOCKED" in sql
+        assert "RETURNING advertisements.id, advertisements.store_id, advertisements.expires_at" in sql
+
+        assert session.committed
+        event = session.added[0]
+        assert isinstance(event, OutboxModel)
+        assert (event.event_type, event.aggregate_id) == ("advertisement.expired", str(row.id))
+
+    def test_list_active_filters_expired_in_sql(self):
+        session = RecordingSession()
+        asyncio.run(SQLAlchemyAdvertisementRepository(session).list_active())
+        sql = _sql(session.statements[0])
+        assert "advertisements.expires_at IS NULL OR advertisements.expires_at >" in sql
+
+
+class TestExpireAdvertisementsTask:
+    def test_drains_in_chunks(self):
+        repo = FakeRepository([f"ad{i}" for i in range(5)])
+        assert expire_advertisements(repo, batch_size=2) == [f"ad{i}" for i in range(5)]
+        assert [len(b) for b in repo.batches] == [2, 2, 1]
+
+    def test_stops_at_max_batches(self):
+        repo = FakeRepository([f"ad{i}" for i in range(10)])
+        assert len(expire_advertisements(repo, batch_size=2, max_batches=2)) == 4
+
+
+class TestAdvertisementModelMapping:
+    def test_media_and_expiry_round_trip(self):
+        ad = Advertisement.create(
+            store_id=str(uuid.uuid4()), vehicle_id=str(uuid.uuid4()), title="Carreta graneleira",
+            description="Carreta em ótimo estado", price_amount=90000, images=["a.jpg"], videos=["b.mp4"],
+        )
+        ad.publish()
+
+        restored = AdvertisementModel.from_domain(ad).to_domain()
+        assert (restored.images, restored.videos) == (["a.jpg"], ["b.mp4"])
+        assert restored.expires_at == ad.expires_at
@@ -0,0 +1,82 @@
+# tests/unit/advertisements/test_advertisement_projection.py
+import asyncio
+import uuid
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+
+from brasiltransporta.infrastructure.persistence.sqlalchemy.models.advertisement import AdvertisementModel
+from brasiltransporta.infrastructure.persistence.sqlalchemy.repositories.advertisement_repository import (
+    SQLAlchemyAdvertisementRepository,
+)
+from brasiltransporta.infrastructure.persistence.sqlalchemy.repositories.catalog_query_repository import (
+    ADVERTISEMENT_LIST_DEFAULT,
+    SQLAlchemyCatalogQueryRepository,
+)
+from brasiltransporta.presentation.api.responses import dumps
+
+STORE = uuid.UUID("5f0c1d2e-3a4b-4c5d-8e6f-708192a3b4c5")
+
+
+@compiles(postgresql.UUID, "sqlite")
+def _uuid_as_char(type_, compiler, **kw):
+    return "CHAR(32)"
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    AdvertisementModel.__table__.create(engine)
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    session = sessionmaker(bind=engine)()
+    now = datetime.utcnow()
+
+    def add(title, status="ativo", featured=False, expires_at=None, images=("ads/capa.jpg",)):
+        session.add(AdvertisementModel(
+            id=uuid.uuid4(), store_id=STORE, vehicle_id=uuid.uuid4(), title=title, description="Revisado",
+            price_amount=Decimal("449000.00"), status=status, is_featured=featured, views=3,
+            images=list(images), videos=[], expires_at=expires_at, created_at=now,
+        ))
+
+    add("Volvo FH 540", featured=True)
+    add("Scania R450", images=())
+    add("Rascunho", status="rascunho")
+    add("Vencido", expires_at=now - timedelta(days=1))
+    session.commit()
+    statements.clear()
+    session.statements = statements
+    return session
+
+
+def test_list_projection_matches_hydrated_entities(session):
+    hydrated = asyncio.run(SQLAlchemyAdvertisementRepository(session).list_active())
+    projected = SQLAlchemyCatalogQueryRepository(session).advertisements(ADVERTISEMENT_LIST_DEFAULT)
+
+    assert {a["title"] for a in projected} == {a.title for a in hydrated} == {"Volvo FH 540", "Scania R450"}
+    assert set(projected[0]) == set(ADVERTISEMENT_LIST_DEFAULT)
+    assert projected[0]["title"] == "Volvo FH 540"
+    assert projected[0]["thumbnail"] == "ads/capa.jpg"
+    assert projected[1]["thumbnail"] is None
+    assert projected[0]["price_amount"] == Decimal("449000.00")
+
+
+def test_projection_reads_only_requested_columns(session):
+    SQLAlchemyCatalogQueryRepository(session).advertisements(("id", "title", "is_featured"))
+
+    sql = session.statements[0]
+    assert "description" not in sql
+    assert "videos" not in sql
+    assert "advertisements.status = ?" in sql
+
+
+def test_projected_rows_serialize_without_conversion(session):
+    row = SQLAlchemyCatalogQueryRepository(session).advertisements(("id", "store_id", "price_amount"))[0]
+
+    assert b'"price_amount":449000.0' in dumps(row)
+    assert f'"store_id":"{STORE}"'.encode() in dumps(row)
@@ -0,0 +1,217 @@
+# tests/unit/advertisements/test_vehicle_listing.py
+import asyncio
+import uuid
+from datetime import datetime
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from brasiltransporta.application.advertisements.use_cases.get_vehicle_listing import GetVehicleListingUseCase
+from brasiltransporta.application.advertisements.use_cases.publish_advertisement import (
+    PublishAdvertisementInput,
+    PublishAdvertisementUseCase,
+)
+from brasiltransporta.application.advertisements.use_cases.set_featured import (
+    SetAdvertisementFeaturedUseCase,
+    SetFeaturedInput,
+)
+from brasiltransporta.domain.aggregates.vehicle_listing import VehicleListing
+from brasiltransporta.infrastructure.messaging.tasks.advertisements import flush_view_counts
+from brasiltransporta.infrastructure.persistence.redis.media_listing_cache import RedisMediaListingCache
+from brasiltransporta.infrastructure.persistence.redis.vehicle_listing_cache import RedisVehicleListingCache
+from brasiltransporta.infrastructure.persistence.sqlalchemy.models.advertisement import AdvertisementModel
+from brasiltransporta.infrastructure.persistence.sqlalchemy.models.media_asset import MediaAssetModel
+from brasiltransporta.infrastructure.persistence.sqlalchemy.models.store import StoreModel
+from brasiltransporta.infrastructure.persistence.sqlalchemy.models.vehicle import VehicleModel
+from brasiltransporta.infrastructure.persistence.sqlalchemy.repositories.vehicle_listing_repository import (
+    SQLAlchemyVehicleListingRepository,
+)
+from brasiltransporta.presentation.api.controllers.advertisements import router
+from brasiltransporta.presentation.api.di.dependencies import get_get_vehicle_listing_uc
+from brasiltransporta.presentation.api.responses import FastJSONResponse
+
+AD = uuid.UUID("0b6f2a1c-7d3e-4f5a-9b8c-1d2e3f4a5b6c")
+STORE = uuid.UUID("5f0c1d2e-3a4b-4c5d-8e6f-708192a3b4c5")
+VEHICLE = uuid.UUID("9a8b7c6d-5e4f-4a3b-8c2d-1e0f9a8b7c6d")
+
+
+@compiles(postgresql.UUID, "sqlite")
+def _uuid_as_char(type_, compiler, **kw):
+    return "CHAR(32)"
+
+
+@pytest.fixture
+def session():
+    # StaticPool: o endpoint roda em outra thread e precisa da mesma base em memória
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    for model in (StoreModel, VehicleModel, AdvertisementModel, MediaAssetModel):
+        model.__table__.create(engine)
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    session = sessionmaker(bind=engine)()
+    session.add(StoreModel(id=STORE, owner_id=uuid.uuid4(), name="Pesados do Sul", cnpj="12.345.678/0001-90"))
+    session.add(VehicleModel(id=VEHICLE, store_id=STORE, brand="volvo", model="FH 540", year=2022,
+                             plate="ABC1D23", price=Decimal("450000.50"), axle_configuration="6x4"))
+    session.add(AdvertisementModel(
+        id=AD, store_id=STORE, vehicle_id=VEHICLE, title="Volvo FH 540 6x4", description="Revisado",
+        price_amount=Decimal("449000.00"), status="active", views=7, images=[], videos=[],
+    ))
+    for i in range(2):
+        session.add(MediaAssetModel(
+            key=f"ads/{AD}/images/{i}.jpg", ad_id=str(AD), file_type="image", mime_type="image/jpeg",
+            size=100, width=1600, height=1200, variants={"thumb": f"ads/{AD}/images/{i}_thumb.webp"},
+            created_at=datetime(2026, 1, 1, 12, i),
+        ))
+    session.commit()
+    statements.clear()
+    session.statements = statements
+    return session
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def setex(self, key, ttl, value):
+        self.data[key] = value
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+
+class FakeStorage:
+    def generate_presigned_urls(self, keys, operation="get_object", expires_in=3600):
+        return {key: SimpleNamespace(success=True, url=f"https://cdn.example/{key}?sig=1") for key in keys}
+
+
+def test_repository_loads_listing_in_one_query(session):
+    listing = SQLAlchemyVehicleListingRepository(session).get(str(AD))
+
+    assert len(session.statements) == 1
+    assert listing.title == "Volvo FH 540 6x4"
+    assert listing.vehicle.plate == "ABC1D23"
+    assert listing.vehicle.price == 450000.5
+    assert listing.store.name == "Pesados do Sul"
+    assert [m.key for m in listing.media] == [f"ads/{AD}/images/0.jpg", f"ads/{AD}/images/1.jpg"]
+    assert SQLAlchemyVehicleListingRepository(session).get(str(uuid.uuid4())) is None
+    assert SQLAlchemyVehicleListingRepository(session).get("invalido") is None
+
+
+def test_listing_round_trips_through_cache_dict(session):
+    listing = SQLAlchemyVehicleListingRepository(session).get(str(AD))
+
+    assert VehicleListing.from_dict(listing.to_dict()) == listing
+
+
+def test_use_case_caches_and_signs_media_per_read(session):
+    cache = RedisVehicleListingCache(FakeRedis())
+    use_case = GetVehicleListingUseCase(SQLAlchemyVehicleListingRepository(session), cache,
+                                        file_storage=FakeStorage())
+
+    first = use_case.execute(str(AD))
+    second = use_case.execute(str(AD))
+
+    assert len(session.statements) == 1
+    assert first == second
+    assert second.media[0].url == f"https://cdn.example/ads/{AD}/images/0.jpg?sig=1"
+    assert all(m["url"] is None for m in cache.get(str(AD))["media"])
+
+
+def test_writes_invalidate_cached_listing(session):
+    redis_client = FakeRedis()
+    cache = RedisVehicleListingCache(redis_client)
+    use_case = GetVehicleListingUseCase(SQLAlchemyVehicleListingRepository(session), cache)
+
+    use_case.execute(str(AD))
+    RedisMediaListingCache(redis_client).invalidate(str(AD))
+    assert cache.get(str(AD)) is None
+
+    use_case.execute(str(AD))
+    ad = SimpleNamespace(id=str(AD), store_id=str(STORE), is_featured=False)
+    ad.set_featured = lambda value: setattr(ad, "is_featured", value)
+    repo = SimpleNamespace(get_by_id=_returning(ad), update=_returning(None))
+    featured = SetAdvertisementFeaturedUseCase(repo, listing_cache=cache)
+
+    asyncio.run(featured.execute(SetFeaturedInput(advertisement_id=str(AD), featured=True)))
+    assert cache.get(str(AD)) is None
+
+    use_case.execute(str(AD))
+    draft = SimpleNamespace(id=str(AD), publish=lambda: None)
+    publish = PublishAdvertisementUseCase(SimpleNamespace(get_by_id=_returning(draft), update=_returning(None)),
+                                          listing_cache=cache)
+    asyncio.run(publish.execute(PublishAdvertisementInput(advertisement_id=str(AD))))
+    assert cache.get(str(AD)) is None
+
+
+def test_cached_listing_adds_pending_views_and_flush_invalidates(session):
+    redis_client = FakeRedis()
+    cache = RedisVehicleListingCache(redis_client)
+    pending = {str(AD): 0}
+
+    def record(ad_id, viewer_id=None):
+        pending[ad_id] += 1
+        return pending[ad_id]
+
+    counter = SimpleNamespace(record=record, pending=lambda ad_id: pending[ad_id])
+    use_case = GetVehicleListingUseCase(SQLAlchemyVehicleListingRepository(session), cache, view_counter=counter)
+
+    assert use_case.execute(str(AD), record_view=True).views == 8
+    assert use_case.execute(str(AD), record_view=True).views == 9  # do cache + delta
+    assert use_case.execute(str(AD)).views == 9
+    assert cache.get(str(AD))["views"] == 7  # o cache guarda só o valor do banco
+
+    # Flush: delta gravado no banco e removido do Redis
+    class Repository:
+        async def apply_view_deltas(self, deltas):
+            session.query(AdvertisementModel).filter_by(id=AD).update(
+                {AdvertisementModel.views: AdvertisementModel.views + deltas[str(AD)]}
+            )
+            session.commit()
+
+    class Counter:
+        def drain(self, batch_size):
+            deltas = {ad_id: n for ad_id, n in pending.items() if n}
+            pending.update({ad_id: 0 for ad_id in deltas})
+            return deltas
+
+    assert flush_view_counts(Counter(), Repository(), listing_cache=cache) == 2
+    assert cache.get(str(AD)) is None
+    assert use_case.execute(str(AD)).views == 9
+
+
+def _returning(value):
+    async def call(*_):
+        return value
+    return call
+
+
+def test_listing_endpoint(session):
+    views = []
+    counter = SimpleNamespace(record=lambda ad_id, viewer_id=None: views.append(ad_id) or len(views))
+    app = FastAPI(default_response_class=FastJSONResponse)
+    app.include_router(router)
+    app.dependency_overrides[get_get_vehicle_listing_uc] = lambda: GetVehicleListingUseCase(
+        SQLAlchemyVehicleListingRepository(session), view_counter=counter, file_storage=FakeStorage(),
+    )
+    client = TestClient(app)
+
+    body = client.get(f"/advertisements/{AD}/listing").json()
+
+    assert body["vehicle"]["axle_configuration"] == "6x4"
+    assert body["store"] == {"id": str(STORE), "name": "Pesados do Sul", "cnpj": "12.345.678/0001-90"}
+    assert body["media"][1]["variants"] == {"thumb": f"ads/{AD}/images/1_thumb.webp"}
+    assert body["media"][1]["url"].startswith("https://cdn.example/")
+    assert views == [str(AD)]
+    assert client.get(f"/advertisements/{uuid.uuid4()}/listing").status_code == 404
@@ -0,0 +1,180 @@
+# tests/unit/advertisements/test_view_counter.py
+import asyncio
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+import redis
+from sqlalchemy.dialects import postgresql
+
+from brasiltransporta.application.advertisements.use_cases.get_advertisement_by_id import (
+    GetAdvertisementByIdUseCase,
+)
+from brasiltransporta.domain.entities.enums import AdvertisementStatus
+from brasiltransporta.infrastructure.messaging.tasks.advertisements import flush_view_counts
+from brasiltransporta.infrastructure.persistence.redis.view_counter import RedisViewCounter
+from brasiltransporta.infrastructure.persistence.sqlalchemy.repositories.advertisement_repository import (
+    SQLAlchemyAdvertisementRepository,
+)
+
+
+class FakeRedis:
+    """Subconjunto de comandos do Redis usado pelo contador (sem fakeredis)"""
+
+    def __init__(self):
+        self.data, self.sets = {}, {}
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def incr(self, key):
+        return self.incrby(key, 1)
+
+    def incrby(self, key, amount):
+        self.data[key] = int(self.data.get(key, 0)) + amount
+        return self.data[key]
+
+    def get(self, key):
+        value = self.data.get(key)
+        return None if value is None else str(value)
+
+    def getdel(self, key):
+        value = self.get(key)
+        self.data.pop(key, None)
+        return value
+
+    def sadd(self, key, member):
+        self.sets.setdefault(key, set()).add(member)
+
+    def spop(self, key, count):
+        members = self.sets.get(key, set())
+        popped = sorted(members)[:count]
+        members.difference_update(popped)
+        return popped
+
+    def pfadd(self, key, value):
+        self.sets.setdefault(key, set()).add(value)
+
+    def pfcount(self, key):
+        return len(self.sets.get(key, set()))
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client, self.calls = client, []
+
+    def __getattr__(self, name):
+        return lambda *args: self.calls.append((name, args))
+
+    def execute(self):
+        return [getattr(self.client, name)(*args) for name, args in self.calls]
+
+
+class BrokenRedis:
+    def pipeline(self, transaction=True):
+        raise redis.ConnectionError("sem redis")
+
+    def get(self, key):
+        raise redis.ConnectionError("sem redis")
+
+
+class RecordingRepository:
+    def __init__(self, fail=False):
+        self.fail, self.calls = fail, []
+
+    async def apply_view_deltas(self, deltas):
+        if self.fail:
+            raise RuntimeError("banco fora")
+        self.calls.append(dict(deltas))
+        return len(deltas)
+
+
+class TestRedisViewCounter:
+    def test_record_returns_pending_and_tracks_unique_viewers(self):
+        counter = RedisViewCounter(FakeRedis())
+        assert counter.record("ad1", "1.1.1.1") == 1
+        assert counter.record("ad1", "1.1.1.1") == 2
+        counter.record("ad1", "2.2.2.2")
+
+        assert counter.pending("ad1") == 3
+        assert counter.unique_viewers("ad1") == 2
+
+    def test_drain_removes_deltas_and_restore_puts_them_back(self):
+        counter = RedisViewCounter(FakeRedis())
+        for _ in range(3):
+            counter.record("ad1")
+        counter.record("ad2")
+
+        deltas = counter.drain()
+        assert deltas == {"ad1": 3, "ad2": 1}
+        assert counter.pending("ad1") == 0
+        assert counter.drain() == {}
+
+        counter.restore(deltas)
+        assert counter.drain() == deltas
+
+    def test_redis_outage_does_not_break_reads(self):
+        counter = RedisViewCounter(BrokenRedis())
+        assert counter.record("ad1", "x") == 0
+        assert counter.pending("ad1") == 0
+
+
+class TestFlushViewCounts:
+    def test_flushes_in_batches(self):
+        counter, repo = RedisViewCounter(FakeRedis()), RecordingRepository()
+        for ad_id in ("a", "b", "c"):
+            counter.record(ad_id)
+        counter.record("a")
+
+        assert flush_view_counts(counter, repo, batch_size=2) == 4
+        assert repo.calls == [{"a": 2, "b": 1}, {"c": 1}]
+
+    def test_database_failure_restores_deltas(self):
+        counter = RedisViewCounter(FakeRedis())
+        counter.record("a")
+
+        with pytest.raises(RuntimeError):
+            flush_view_counts(counter, RecordingRepository(fail=True))
+        assert counter.pending("a") == 1
+
+
+class TestApplyViewDeltas:
+    def test_single_update_from_values(self):
+        session = SimpleNamespace(statements=[])
+        session.execute = lambda stmt: session.statements.append(stmt) or SimpleNamespace(rowcount=2)
+        session.commit = lambda: None
+        repo = SQLAlchemyAdvertisementRepository(session)
+
+        ids = [str(uuid.uuid4()), str(uuid.uuid4())]
+        assert asyncio.run(repo.apply_view_deltas({ids[0]: 5, ids[1]: 1})) == 2
+
+        assert len(session.statements) == 1
+        sql = str(session.statements[0].compile(dialect=postgresql.dialect()))
+        assert "UPDATE advertisements SET views=(advertisements.views + v.delta)" in sql
+        assert "FROM (VALUES" in sql and "AS v (id, delta)" in sql
+
+    def test_empty_deltas_skip_database(self):
+        repo = SQLAlchemyAdvertisementRepository(session=None)
+        assert asyncio.run(repo.apply_view_deltas({})) == 0
+
+
+class TestGetAdvertisementMergesPendingViews:
+    def _repo(self, views=10):
+        advertisement = SimpleNamespace(
+            id="ad1", store_id="s", vehicle_id="v", title="Caminhão", description="",
+            price_amount=1.0, price_currency="BRL", status=AdvertisementStatus.ACTIVE,
+            is_featured=False, views=views, created_at=datetime(2024, 1, 1), updated_at=None,
+        )
+        return SimpleNamespace(get_by_id=lambda advertisement_id: advertisement)
+
+    def test_view_is_recorded_and_merged(self):
+        counter = RedisViewCounter(FakeRedis())
+        counter.record("ad1")
+        use_case = GetAdvertisementByIdUseCase(self._repo(), counter)
+
+        assert use_case.execute("ad1", viewer_id="ip", record_view=True).views == 12
+        assert use_case.execute("ad1").views == 12
+
+    def test_without_counter_uses_database_value(self):
+        assert GetAdvertisementByIdUseCase(self._repo()).execute("ad1").views == 10
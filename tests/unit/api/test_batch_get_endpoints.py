@@ -0,0 +1,176 @@
+# tests/unit/api/test_batch_get_endpoints.py
+import asyncio
+import uuid
+from datetime import datetime
+from decimal import Decimal
+from types import SimpleNamespace
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from brasiltransporta.application.advertisements.use_cases.batch_get_advertisements import (
+    BatchGetAdvertisementsUseCase,
+)
+from brasiltransporta.application.service.batch import ordered_results
+from brasiltransporta.application.vehicles.use_cases.batch_get_vehicles import BatchGetVehiclesUseCase
+from brasiltransporta.domain.entities.enums import AdvertisementStatus, VehicleBrand, VehicleCondition, VehicleType
+from brasiltransporta.domain.entities.vehicle import Vehicle
+from brasiltransporta.infrastructure.persistence.sqlalchemy.models.vehicle import VehicleModel
+from brasiltransporta.infrastructure.persistence.sqlalchemy.repositories.advertisement_repository import (
+    SQLAlchemyAdvertisementRepository,
+)
+from brasiltransporta.infrastructure.persistence.sqlalchemy.repositories.vehicle_repository import (
+    SQLAlchemyVehicleRepository,
+)
+from brasiltransporta.presentation.api.controllers.advertisements import router as advertisements_router
+from brasiltransporta.presentation.api.controllers.vehicles import router as vehicles_router
+from brasiltransporta.presentation.api.di.dependencies import get_batch_get_advertisements_uc
+from brasiltransporta.presentation.api.di.get_batch_get_vehicles_uc import get_batch_get_vehicles_uc
+from brasiltransporta.presentation.api.responses import FastJSONResponse
+
+AD1, AD2, MISSING = (str(uuid.uuid4()) for _ in range(3))
+
+
+@compiles(postgresql.UUID, "sqlite")
+def _uuid_as_char(type_, compiler, **kw):
+    return "CHAR(32)"
+
+
+def _advertisement(ad_id, views=10):
+    return SimpleNamespace(
+        id=ad_id, store_id="s1", vehicle_id="v1", title="Caminhão", description="Em ótimo estado",
+        price_amount=1.0, price_currency="BRL", status=AdvertisementStatus.ACTIVE,
+        is_featured=False, views=views, created_at=datetime(2026, 1, 1), updated_at=None,
+    )
+
+
+class FakeRepo:
+    def __init__(self, items):
+        self.items, self.calls = items, []
+
+    async def get_many(self, ids):
+        self.calls.append(list(ids))
+        # ordem do banco diferente da pedida
+        return [item for item in reversed(self.items) if item.id in ids]
+
+
+class FakeViewCounter:
+    def pending_many(self, ids):
+        return {AD1: 5}
+
+
+def _client(ad_repo, vehicle_repo):
+    app = FastAPI(default_response_class=FastJSONResponse)
+    app.include_router(advertisements_router)
+    app.include_router(vehicles_router)
+    app.dependency_overrides[get_batch_get_advertisements_uc] = (
+        lambda: BatchGetAdvertisementsUseCase(ad_repo, FakeViewCounter())
+    )
+    app.dependency_overrides[get_batch_get_vehicles_uc] = lambda: BatchGetVehiclesUseCase(vehicle_repo)
+    return TestClient(app)
+
+
+def test_ordered_results_keeps_request_order_duplicates_and_uuid_spelling():
+    items = [SimpleNamespace(id=AD2), SimpleNamespace(id=AD1)]
+
+    pairs = ordered_results([AD1.upper(), MISSING, AD2, AD1], items)
+
+    assert [(requested, item and item.id) for requested, item in pairs] == [
+        (AD1.upper(), AD1), (MISSING, None), (AD2, AD2), (AD1, AD1),
+    ]
+
+
+def test_advertisements_batch_get_in_one_query_with_not_found_markers():
+    repo = FakeRepo([_advertisement(AD1), _advertisement(AD2, views=3)])
+    client = _client(repo, FakeRepo([]))
+
+    response = client.post("/advertisements:batchGet", json={"ids": [AD2, MISSING, AD1]})
+
+    assert response.status_code == 200
+    items = response.json()["items"]
+    assert [(i["id"], i["found"]) for i in items] == [(AD2, True), (MISSING, False), (AD1, True)]
+    assert items[1]["advertisement"] is None
+    assert items[0]["advertisement"]["views"] == 3
+    assert items[2]["advertisement"]["views"] == 15  # delta pendente do Redis
+    assert repo.calls == [[AD2, MISSING, AD1]]
+
+
+def test_vehicles_batch_get():
+    vehicle = SimpleNamespace(id="v1", store_id="s1", brand="volvo", model="FH 540", year=2022,
+                              plate="ABC1D23", created_at=datetime(2026, 1, 1))
+    client = _client(FakeRepo([]), FakeRepo([vehicle]))
+
+    items = client.post("/vehicles:batchGet", json={"ids": ["nope", "v1"]}).json()["items"]
+
+    assert items[0] == {"id": "nope", "found": False, "vehicle": None}
+    assert items[1]["found"] is True
+    assert items[1]["vehicle"]["plate"] == "ABC1D23"
+
+
+def test_batch_size_is_validated():
+    client = _client(FakeRepo([]), FakeRepo([]))
+
+    assert client.post("/advertisements:batchGet", json={"ids": []}).status_code == 422
+    assert client.post("/vehicles:batchGet", json={"ids": ["x"] * 101}).status_code == 422
+
+
+def test_get_many_uses_single_any_array_parameter():
+    statements = []
+    session = SimpleNamespace(
+        execute=lambda stmt: statements.append(stmt) or SimpleNamespace(scalars=lambda: []),
+    )
+    ids = [str(uuid.uuid4()) for _ in range(3)]
+
+    assert asyncio.run(SQLAlchemyAdvertisementRepository(session).get_many(ids + [ids[0], "invalido"])) == []
+    assert asyncio.run(SQLAlchemyVehicleRepository(session).get_many(ids)) == []
+
+    for stmt in statements:
+        compiled = stmt.compile(dialect=postgresql.dialect())
+        assert str(compiled).endswith("id = ANY (%(ids)s::UUID[])")
+        assert [str(i) for i in compiled.params["ids"]] == ids
+
+
+def test_get_many_without_valid_ids_skips_database():
+    assert asyncio.run(SQLAlchemyVehicleRepository(session=None).get_many(["invalido"])) == []
+
+
+class RowBackedVehicleRepository(SQLAlchemyVehicleRepository):
+    """get_many pelo get_by_id: o ANY(array) do Postgres não existe no SQLite"""
+
+    async def get_many(self, vehicle_ids):
+        found = [await self.get_by_id(vehicle_id) for vehicle_id in vehicle_ids]
+        return [vehicle for vehicle in found if vehicle is not None]
+
+
+def test_vehicles_batch_get_maps_real_rows():
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    VehicleModel.__table__.create(engine)
+    session = sessionmaker(bind=engine)()
+    store_id = str(uuid.uuid4())
+    vehicle = Vehicle.create(store_id, VehicleBrand.SCANIA, "R 450", 2021, "xyz9a87",
+                             VehicleType.TRACTOR_TRUCK, VehicleCondition.USED, Decimal("389900.00"),
+                             axle_configuration="6x2")
+    session.add(VehicleModel.from_domain(vehicle))
+    legacy_id = uuid.uuid4()  # cadastro antigo: sem tipo, condição e preço, marca fora do enum
+    session.add(VehicleModel(id=legacy_id, store_id=uuid.UUID(store_id), brand="Randon", model="SR BA",
+                             year=2015, plate="LEG1A23"))
+    session.commit()
+    repo = RowBackedVehicleRepository(session)
+
+    loaded = asyncio.run(repo.get_by_id(vehicle.id))
+    assert loaded.brand is VehicleBrand.SCANIA and loaded.vehicle_type is VehicleType.TRACTOR_TRUCK
+    assert loaded.condition is VehicleCondition.USED and loaded.price == Decimal("389900.00")
+    assert loaded.plate == "XYZ9A87" and loaded.store_id == store_id
+
+    client = _client(FakeRepo([]), repo)
+    response = client.post("/vehicles:batchGet", json={"ids": [str(legacy_id), vehicle.id]})
+
+    assert response.status_code == 200
+    items = response.json()["items"]
+    assert [item["vehicle"]["brand"] for item in items] == ["Randon", "scania"]
+    assert items[1]["vehicle"]["plate"] == "XYZ9A87"
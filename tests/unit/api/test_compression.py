@@ -0,0 +1,156 @@
+# tests/unit/api/test_compression.py
+import asyncio
+import gzip
+import json
+import zlib
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from brasiltransporta.presentation.api import compression
+from brasiltransporta.presentation.api.compression import CompressionMiddleware, choose_encoding
+from brasiltransporta.presentation.api.http_cache import ConditionalGetMiddleware
+from brasiltransporta.presentation.api.responses import FastJSONResponse
+
+ADS = [{"id": i, "title": f"Caminhão Volvo FH {i}", "region": "SP"} for i in range(200)]
+
+
+def _client():
+    app = FastAPI(default_response_class=FastJSONResponse)
+    app.add_middleware(ConditionalGetMiddleware)
+    app.add_middleware(CompressionMiddleware, minimum_size=500)
+
+    @app.get("/ads")
+    def ads():
+        return ADS
+
+    @app.get("/small")
+    def small():
+        return {"status": "ok"}
+
+    @app.get("/image")
+    def image():
+        return Response(b"\x89PNG" * 500, media_type="image/png")
+
+    @app.get("/export")
+    def export():
+        return Response(gzip.compress(b"{}\n" * 500), media_type="application/x-ndjson",
+                        headers={"Content-Encoding": "gzip"})
+
+    @app.get("/stream")
+    def stream():
+        lines = (json.dumps(ad).encode() + b"\n" for ad in ADS)
+        return StreamingResponse(lines, media_type="application/x-ndjson")
+
+    @app.get("/events")
+    def events():
+        chunks = (f"data: {json.dumps(ad)}\n\n".encode() for ad in ADS)
+        return StreamingResponse(chunks, media_type="text/event-stream")
+
+    return TestClient(app)
+
+
+def _raw(client, path, accept_encoding):
+    """Bytes como vieram do servidor (sem a descompressão automática do httpx)"""
+    with client.stream("GET", path, headers={"Accept-Encoding": accept_encoding}) as response:
+        return response, b"".join(response.iter_raw())
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("gzip, deflate, br", "br" if compression.brotli else "gzip"),
+    ("gzip;q=1.0, br;q=0.5", "gzip"),
+    ("br;q=0, gzip", "gzip"),
+    ("*", "br" if compression.brotli else "gzip"),
+    ("identity", None),
+    ("", None),
+])
+def test_choose_encoding(header, expected):
+    assert choose_encoding(header) == expected
+
+
+def test_gzip_json_body():
+    response, raw = _raw(_client(), "/ads", "gzip")
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) == len(raw)
+    assert json.loads(gzip.decompress(raw)) == ADS
+    # o ETag do corpo sem compressão continua válido, mas fraco
+    assert response.headers["etag"].startswith('W/"')
+
+
+def test_brotli_json_body():
+    brotli = pytest.importorskip("brotli")
+
+    response, raw = _raw(_client(), "/ads", "br, gzip")
+
+    assert response.headers["content-encoding"] == "br"
+    assert json.loads(brotli.decompress(raw)) == ADS
+
+
+def test_conditional_get_still_works_through_compression():
+    client = _client()
+    etag = _raw(client, "/ads", "gzip")[0].headers["etag"]
+
+    response = client.get("/ads", headers={"Accept-Encoding": "gzip", "If-None-Match": etag})
+
+    assert response.status_code == 304
+
+
+def test_small_non_allowlisted_and_encoded_bodies_pass_through():
+    client = _client()
+
+    response, raw = _raw(client, "/small", "gzip")
+    assert "content-encoding" not in response.headers
+    assert json.loads(raw) == {"status": "ok"}
+
+    response, _ = _raw(client, "/image", "gzip")
+    assert "content-encoding" not in response.headers
+
+    response, raw = _raw(client, "/export", "br, gzip")
+    assert response.headers["content-encoding"] == "gzip"
+    assert gzip.decompress(raw) == b"{}\n" * 500
+
+
+def test_streaming_response_is_compressed_incrementally():
+    response, raw = _raw(_client(), "/stream", "gzip")
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    lines = zlib.decompress(raw, 16 + zlib.MAX_WBITS).splitlines()
+    assert [json.loads(line) for line in lines] == ADS
+
+
+def test_server_sent_events_are_never_compressed():
+    response, raw = _raw(_client(), "/events", "br, gzip")
+
+    assert "content-encoding" not in response.headers
+    assert raw.startswith(b"data: ")
+
+
+def test_first_small_stream_chunk_is_flushed_immediately():
+    sent = []
+    first_chunk_out = []
+
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200,
+                    "headers": [(b"content-type", b"application/x-ndjson")]})
+        await send({"type": "http.response.body", "body": b'{"status": "pending"}\n', "more_body": True})
+        # O bloco pequeno já saiu antes do próximo (sem esperar minimum_size)
+        first_chunk_out.append([m for m in sent if m["type"] == "http.response.body"])
+        await send({"type": "http.response.body", "body": b'{"status": "paid"}\n', "more_body": False})
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "method": "GET", "headers": [(b"accept-encoding", b"gzip")]}
+    asyncio.run(CompressionMiddleware(app, minimum_size=500)(scope, None, send))
+
+    (first,) = first_chunk_out[0]
+    decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    assert decoder.decompress(first["body"]) == b'{"status": "pending"}\n'
+    assert dict(sent[0]["headers"])[b"content-encoding"] == b"gzip"
+    rest = b"".join(m["body"] for m in sent[2:])
+    assert decoder.decompress(rest) == b'{"status": "paid"}\n'
@@ -0,0 +1,98 @@
+# tests/unit/api/test_fast_json_responses.py
+import json
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from decimal import Decimal
+from enum import Enum
+from typing import List
+
+from fastapi import FastAPI
+from fastapi.encoders import jsonable_encoder
+from fastapi.testclient import TestClient
+from pydantic import BaseModel, Field
+
+from brasiltransporta.domain.entities.transaction import PaymentMethod, Transaction
+from brasiltransporta.presentation.api.controllers.transactions import _to_dict
+from brasiltransporta.presentation.api.models.responses.vehicle_responses import VehicleResponse
+from brasiltransporta.presentation.api.responses import FastJSONResponse, dumps, typed_response
+
+
+class Color(Enum):
+    WHITE = "branco"
+
+
+@dataclass
+class Item:
+    id: uuid.UUID
+    price: Decimal
+    color: Color
+
+
+class Page(BaseModel):
+    items: List[VehicleResponse]
+
+
+def _vehicles(count=3):
+    return [
+        VehicleResponse(id=str(uuid.uuid4()), store_id="s1", brand="volvo", model=f"FH {i}",
+                        year=2020, plate=f"ABC1D2{i}", created_at=datetime(2026, 1, 1, 12, 30, 0, 123456))
+        for i in range(count)
+    ]
+
+
+def test_dumps_serializes_native_types():
+    item_id = uuid.uuid4()
+    body = json.loads(dumps({
+        "item": Item(item_id, Decimal("450000.50"), Color.WHITE),
+        "at": datetime(2026, 1, 1, tzinfo=timezone.utc),
+        1: {"a"},
+    }))
+
+    assert body == {
+        "item": {"id": str(item_id), "price": 450000.5, "color": "branco"},
+        "at": "2026-01-01T00:00:00Z",
+        "1": ["a"],
+    }
+
+
+def test_output_matches_default_encoder_for_response_models():
+    page = Page(items=_vehicles())
+
+    assert json.loads(dumps(page)) == jsonable_encoder(page)
+
+
+def test_models_with_aliases_use_model_dump():
+    class Aliased(BaseModel):
+        store_id: str = Field(serialization_alias="storeId")
+
+    assert json.loads(dumps([Aliased(store_id="s1")])) == [{"storeId": "s1"}]
+
+
+def test_typed_response_skips_response_model_validation():
+    app = FastAPI(default_response_class=FastJSONResponse)
+
+    @app.get("/vehicles", response_model=List[VehicleResponse])
+    def list_vehicles():
+        # model_construct não valida: a resposta sai exatamente como montada
+        return typed_response([VehicleResponse.model_construct(id="v1", year="2020")])
+
+    @app.get("/default", response_model=List[VehicleResponse])
+    def list_default():
+        return _vehicles(2)
+
+    client = TestClient(app)
+
+    assert client.get("/vehicles").json() == [{"id": "v1", "year": "2020"}]
+    response = client.get("/default")
+    assert response.headers["content-type"] == "application/json"
+    assert [v["model"] for v in response.json()] == ["FH 0", "FH 1"]
+
+
+def test_transaction_to_dict_is_shallow():
+    tx = Transaction.create(user_id="u1", plan_id="p1", amount=149.9, payment_method=PaymentMethod.PIX)
+
+    data = _to_dict(tx)
+
+    assert data["metadata"] is tx.metadata
+    assert data["amount"] is tx.amount
@@ -0,0 +1,144 @@
+# tests/unit/api/test_health_endpoints.py
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+
+from brasiltransporta.infrastructure.config.settings import AppSettings
+from brasiltransporta.presentation.api.controllers.health import router
+from brasiltransporta.presentation.api.health import HealthChecker
+from brasiltransporta.presentation.api.lifespan import ResourceContainer, lifespan
+
+
+class FakeRedis:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.pings = 0
+
+    def ping(self):
+        self.pings += 1
+        if self.fail:
+            raise ConnectionError("redis fora do ar")
+        return True
+
+    def close(self):
+        pass
+
+
+def _container(redis_client):
+    engine = create_engine(
+        "sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False}
+    )
+    s3_client = SimpleNamespace(client=SimpleNamespace(head_bucket=lambda Bucket: None), close=lambda: None)
+    return ResourceContainer(
+        settings=AppSettings(),
+        engine=engine,
+        redis=redis_client,
+        storage=SimpleNamespace(s3_client=s3_client, bucket_name="brasiltransporta-uploads"),
+        jwt_service=object(),
+        password_hasher=SimpleNamespace(warmup=lambda: None),
+    )
+
+
+def _app(monkeypatch, resources):
+    monkeypatch.setattr(ResourceContainer, "build", classmethod(lambda cls, settings: resources))
+    app = FastAPI(lifespan=lifespan)
+    app.include_router(router)
+    return app
+
+
+def test_concurrent_checks_share_one_cached_run():
+    calls = []
+    now = [100.0]
+    checker = HealthChecker(
+        {"database": lambda: calls.append(1)}, timeout=1.0, ttl=5.0, clock=lambda: now[0]
+    )
+
+    async def burst():
+        return await asyncio.gather(*(checker.check() for _ in range(20)))
+
+    reports = asyncio.run(burst())
+    assert len(calls) == 1
+    assert all(report is reports[0] for report in reports)
+    assert reports[0].ok
+
+    now[0] += 4.9
+    asyncio.run(checker.check())
+    assert len(calls) == 1  # ainda no TTL
+
+    now[0] += 0.2
+    asyncio.run(checker.check())
+    assert len(calls) == 2
+
+
+def test_slow_probe_times_out_without_blocking_the_others():
+    release = threading.Event()
+    checker = HealthChecker(
+        {"database": lambda: None, "storage": release.wait}, timeout=0.05, ttl=5.0
+    )
+
+    async def check():
+        try:
+            return await checker.check()
+        finally:
+            # Libera a thread do probe antes de o asyncio.run esperar o executor
+            release.set()
+
+    start = time.perf_counter()
+    report = asyncio.run(check())
+
+    assert time.perf_counter() - start < 1.0
+    assert not report.ok
+    assert report.checks["database"].status == "ok"
+    assert report.checks["storage"].status == "timeout"
+    assert report.checks["storage"].latency_ms >= 50
+
+
+def test_live_and_ready_before_startup():
+    app = FastAPI()
+    app.include_router(router)
+    client = TestClient(app)
+
+    live = client.get("/health/live")
+    assert live.status_code == 200
+    assert live.json() == {"status": "ok"}
+    assert live.headers["cache-control"] == "no-store"
+
+    ready = client.get("/health/ready")
+    assert ready.status_code == 503
+    assert ready.json() == {"status": "starting"}
+
+
+def test_ready_reports_each_dependency(monkeypatch):
+    resources = _container(FakeRedis())
+    with TestClient(_app(monkeypatch, resources)) as client:
+        response = client.get("/health/ready")
+        client.get("/health/ready")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "ok"
+    assert set(body["checks"]) == {"database", "redis", "storage"}
+    assert all(check["status"] == "ok" for check in body["checks"].values())
+    assert all(check["latency_ms"] >= 0 for check in body["checks"].values())
+    assert resources.redis.pings == 2  # aquecimento + uma rodada de probes (segunda em cache)
+
+
+def test_ready_fails_when_a_dependency_is_down(monkeypatch):
+    resources = _container(FakeRedis(fail=True))
+    with TestClient(_app(monkeypatch, resources)) as client:
+        response = client.get("/health/ready")
+        live = client.get("/health/live")
+
+    assert response.status_code == 503
+    body = response.json()
+    assert body["status"] == "fail"
+    assert body["checks"]["redis"]["status"] == "error"
+    assert body["checks"]["database"]["status"] == "ok"
+    assert "redis fora do ar" not in response.text  # detalhe só no log
+    assert live.status_code == 200
@@ -0,0 +1,177 @@
+# tests/unit/api/test_http_cache.py
+import asyncio
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+
+from brasiltransporta.application.advertisements.use_cases.get_advertisement_by_id import (
+    GetAdvertisementByIdOutput,
+)
+from brasiltransporta.domain.repositories.advertisement_repository import AdvertisementVersion
+from brasiltransporta.infrastructure.persistence.sqlalchemy.repositories.advertisement_repository import (
+    SQLAlchemyAdvertisementRepository,
+)
+from brasiltransporta.presentation.api.controllers.advertisements import router as advertisements_router
+from brasiltransporta.presentation.api.di.dependencies import get_get_advertisement_by_id_uc
+from brasiltransporta.presentation.api.http_cache import (
+    PRIVATE_REVALIDATE,
+    ConditionalGetMiddleware,
+    etag_matches,
+    make_etag,
+)
+from brasiltransporta.presentation.api.responses import FastJSONResponse
+
+UPDATED_AT = datetime(2026, 3, 1, 12, 0, 0)
+
+
+def test_etag_matching_is_weak_and_accepts_lists_and_wildcard():
+    etag = make_etag("advertisement", "ad1", UPDATED_AT.isoformat(), 10)
+
+    assert etag.startswith('W/"')
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", {etag[2:]}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"other"', etag)
+    assert not etag_matches(None, etag)
+    assert make_etag("advertisement", "ad1", UPDATED_AT.isoformat(), 11) != etag
+
+
+class TestConditionalGetMiddleware:
+    def _client(self, calls):
+        app = FastAPI(default_response_class=FastJSONResponse)
+        app.add_middleware(ConditionalGetMiddleware)
+
+        @app.get("/plans")
+        def plans():
+            calls.append("plans")
+            return [{"id": "p1", "name": "Básico"}]
+
+        @app.get("/own-etag")
+        def own_etag():
+            return FastJSONResponse({"a": 1}, headers={"ETag": '"v1"'})
+
+        @app.get("/compressed")
+        def compressed():
+            return Response(b"\x1f\x8b", media_type="application/json", headers={"Content-Encoding": "gzip"})
+
+        @app.get("/text")
+        def text():
+            return PlainTextResponse("ok")
+
+        return TestClient(app)
+
+    def test_hash_etag_and_304(self):
+        calls = []
+        client = self._client(calls)
+
+        first = client.get("/plans")
+        etag = first.headers["etag"]
+        assert first.json() == [{"id": "p1", "name": "Básico"}]
+        assert first.headers["cache-control"] == PRIVATE_REVALIDATE
+
+        second = client.get("/plans", headers={"If-None-Match": etag})
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second.headers["etag"] == etag
+
+        assert client.get("/plans", headers={"If-None-Match": '"stale"'}).status_code == 200
+
+    def test_skips_route_etags_encoded_and_non_json_bodies(self):
+        client = self._client([])
+
+        assert client.get("/own-etag").headers["etag"] == '"v1"'
+        assert client.get("/compressed").headers["content-encoding"] == "gzip"
+        assert "etag" not in client.get("/compressed").headers
+        assert "etag" not in client.get("/text").headers
+
+
+class FakeAdvertisementUseCase:
+    def __init__(self):
+        self.executed, self.views = 0, []
+
+    async def version(self, advertisement_id):
+        if advertisement_id != "ad1":
+            return None
+        return AdvertisementVersion(store_id="s1", updated_at=UPDATED_AT, views=10)
+
+    def record_view(self, advertisement_id, viewer_id=None):
+        self.views.append(advertisement_id)
+
+    def execute(self, advertisement_id, viewer_id=None, record_view=False):
+        self.executed += 1
+        if record_view:
+            self.record_view(advertisement_id, viewer_id)
+        return GetAdvertisementByIdOutput(
+            id="ad1", store_id="s1", vehicle_id="v1", title="Caminhão", description="Em ótimo estado",
+            price_amount=1.0, price_currency="BRL", status="active", is_featured=False, views=10,
+            created_at=UPDATED_AT.isoformat(), updated_at=UPDATED_AT.isoformat(),
+        )
+
+
+class TestAdvertisementConditionalGet:
+    def _client(self):
+        use_case = FakeAdvertisementUseCase()
+        app = FastAPI(default_response_class=FastJSONResponse)
+        app.add_middleware(ConditionalGetMiddleware)
+        app.include_router(advertisements_router)
+        app.dependency_overrides[get_get_advertisement_by_id_uc] = lambda: use_case
+        return TestClient(app), use_case
+
+    def test_full_response_carries_validators_and_cdn_headers(self):
+        client, _ = self._client()
+
+        response = client.get("/advertisements/ad1")
+
+        assert response.status_code == 200
+        assert response.json()["id"] == "ad1"
+        assert response.headers["etag"].startswith('W/"')
+        assert response.headers["last-modified"] == "Sun, 01 Mar 2026 12:00:00 GMT"
+        assert response.headers["cache-control"] == "public, no-cache"
+        assert response.headers["surrogate-key"] == "advertisement-ad1 store-s1"
+
+    def test_if_none_match_returns_304_without_loading_and_counts_view(self):
+        client, use_case = self._client()
+        etag = client.get("/advertisements/ad1").headers["etag"]
+
+        response = client.get("/advertisements/ad1", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert use_case.executed == 1
+        assert use_case.views == ["ad1", "ad1"]
+
+    def test_if_modified_since(self):
+        client, use_case = self._client()
+
+        fresh = client.get("/advertisements/ad1", headers={"If-Modified-Since": "Sun, 01 Mar 2026 12:00:00 GMT"})
+        stale = client.get("/advertisements/ad1", headers={"If-Modified-Since": "Sun, 01 Mar 2026 11:59:59 GMT"})
+
+        assert fresh.status_code == 304
+        assert stale.status_code == 200
+        assert use_case.executed == 1
+
+    def test_missing_advertisement_is_404(self):
+        client, _ = self._client()
+
+        assert client.get("/advertisements/nope").status_code == 404
+
+
+def test_get_version_selects_only_version_columns():
+    statements = []
+    session = SimpleNamespace(
+        execute=lambda stmt: statements.append(stmt) or SimpleNamespace(first=lambda: ("s1", UPDATED_AT, 7)),
+    )
+    repo = SQLAlchemyAdvertisementRepository(session)
+
+    version = asyncio.run(repo.get_version(str(uuid.uuid4())))
+
+    assert version == AdvertisementVersion(store_id="s1", updated_at=UPDATED_AT, views=7)
+    sql = str(statements[0].compile(dialect=postgresql.dialect()))
+    assert sql.startswith(
+        "SELECT advertisements.store_id, advertisements.updated_at, advertisements.views \nFROM advertisements"
+    )
@@ -0,0 +1,31 @@
+# tests/unit/api/test_import_time.py
+import subprocess
+import sys
+
+MODULE = "brasiltransporta.presentation.api.app"
+# Clientes de infraestrutura carregados só no primeiro uso
+DEFERRED_MODULES = ("boto3", "celery.app", "httpx", "passlib.hash", "psycopg2")
+
+
+def test_app_import_defers_infrastructure_clients():
+    code = (
+        f"import sys, {MODULE}\n"
+        "from brasiltransporta.infrastructure.persistence.sqlalchemy import session\n"
+        "from brasiltransporta.infrastructure.config import settings\n"
+        f"print(','.join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))\n"
+        "print(session.get_engine.cache_info().currsize, settings.get_settings.cache_info().currsize)\n"
+    )
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    loaded, created = proc.stdout.splitlines()
+    assert loaded == ""
+    assert created == "0 0"
+
+
+def test_lazy_module_attributes_are_created_on_first_access():
+    from brasiltransporta.infrastructure.config import settings
+    from brasiltransporta.infrastructure.persistence.sqlalchemy import session
+
+    assert settings.settings is settings.get_settings()
+    assert session.SessionLocal is session.get_sessionmaker()
+    assert session.SessionLocal.kw["bind"] is session.engine
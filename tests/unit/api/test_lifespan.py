@@ -0,0 +1,140 @@
+# tests/unit/api/test_lifespan.py
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.pool import QueuePool
+
+from brasiltransporta.infrastructure.config.settings import AppSettings
+from brasiltransporta.presentation.api.lifespan import ResourceContainer, lifespan
+
+
+class FakeRedis:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.closed = False
+
+    def ping(self):
+        if self.fail:
+            raise ConnectionError("redis fora do ar")
+        return True
+
+    def close(self):
+        self.closed = True
+
+
+class FakeS3Client:
+    def __init__(self):
+        self.buckets = []
+        self.closed = False
+        self.client = SimpleNamespace(head_bucket=lambda Bucket: self.buckets.append(Bucket))
+
+    def close(self):
+        self.closed = True
+
+
+def _container(environment="development", redis_client=None, startup_timeout=30.0):
+    engine = create_engine("sqlite://", poolclass=QueuePool, pool_size=3)
+    engine.connects = []
+    event.listen(engine, "connect", lambda *args: engine.connects.append(1))
+    storage = SimpleNamespace(s3_client=FakeS3Client(), bucket_name="brasiltransporta-uploads")
+    hasher = SimpleNamespace(warmed=False)
+    hasher.warmup = lambda: setattr(hasher, "warmed", True)
+    return ResourceContainer(
+        settings=AppSettings(environment=environment, startup_timeout_seconds=startup_timeout),
+        engine=engine,
+        redis=redis_client or FakeRedis(),
+        storage=storage,
+        jwt_service=object(),
+        password_hasher=hasher,
+    )
+
+
+def test_start_warms_every_resource_before_ready():
+    resources = _container()
+
+    asyncio.run(resources.start())
+
+    assert resources.ready
+    assert resources.warmup_errors == {}
+    assert len(resources.engine.connects) == 3  # warm_connections limitado ao pool
+    assert resources.engine.pool.checkedin() == 3
+    assert resources.storage.s3_client.buckets == ["brasiltransporta-uploads"]
+    assert resources.password_hasher.warmed
+    assert resources.refresh_tokens is not None
+
+
+def test_failed_warmup_is_fatal_only_in_production():
+    degraded = _container(redis_client=FakeRedis(fail=True))
+    asyncio.run(degraded.start())
+    assert degraded.ready
+    assert degraded.warmup_errors == {"redis": "redis fora do ar"}
+    assert degraded.refresh_tokens is None
+
+    production = _container("production", redis_client=FakeRedis(fail=True))
+    with pytest.raises(RuntimeError, match="redis"):
+        asyncio.run(production.start())
+    assert not production.ready
+
+
+def test_storage_failure_is_not_fatal_in_production():
+    resources = _container("production")
+
+    def head_bucket(Bucket):
+        raise ConnectionError("s3 fora do ar")
+
+    resources.storage.s3_client.client.head_bucket = head_bucket
+    asyncio.run(resources.start())
+
+    assert resources.ready
+    assert resources.warmup_errors == {"storage": "s3 fora do ar"}
+
+
+def test_warmup_is_bounded_by_startup_timeout():
+    release = threading.Event()
+    slow = _container("production", startup_timeout=0.05)
+    slow.storage.s3_client.client.head_bucket = lambda Bucket: release.wait()
+    stuck = _container("production", startup_timeout=0.05)
+    stuck.redis.ping = release.wait
+
+    async def start(container):
+        try:
+            await container.start()
+        finally:
+            # Libera as threads antes de o asyncio.run esperar o executor
+            release.set()
+
+    asyncio.run(start(slow))
+    assert slow.ready
+    assert slow.warmup_errors == {"storage": "sem resposta em 0.05s"}
+
+    release.clear()
+    with pytest.raises(RuntimeError, match="redis"):
+        asyncio.run(start(stuck))
+    assert not stuck.ready
+
+
+def test_lifespan_exposes_resources_and_closes_them(monkeypatch):
+    resources = _container()
+    monkeypatch.setattr(ResourceContainer, "build", classmethod(lambda cls, settings: resources))
+    app = FastAPI(lifespan=lifespan)
+
+    @app.get("/ping")
+    def ping(request: Request):
+        container = getattr(request.app.state, "resources", None)
+        return {"ready": bool(container and container.ready)}
+
+    assert TestClient(app).get("/ping").json() == {"ready": False}  # sem lifespan
+
+    with TestClient(app) as client:
+        assert client.get("/ping").json() == {"ready": True}
+        assert app.state.refresh_token_service is resources.refresh_tokens
+
+    assert not resources.ready
+    assert resources.redis.closed
+    assert resources.storage.s3_client.closed
+    assert resources.engine.pool.checkedin() == 0
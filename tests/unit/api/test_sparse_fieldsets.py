@@ -0,0 +1,146 @@
+# tests/unit/api/test_sparse_fieldsets.py
+import uuid
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from brasiltransporta.application.advertisements.use_cases.list_advertisements import ListAdvertisementsUseCase
+from brasiltransporta.application.vehicles.use_cases.list_vehicles_by_store_uc import ListVehiclesByStoreUseCase
+from brasiltransporta.domain.entities.enums import AdvertisementStatus
+from brasiltransporta.infrastructure.persistence.sqlalchemy.models.advertisement import AdvertisementModel
+from brasiltransporta.infrastructure.persistence.sqlalchemy.models.store import StoreModel
+from brasiltransporta.infrastructure.persistence.sqlalchemy.models.vehicle import VehicleModel
+from brasiltransporta.infrastructure.persistence.sqlalchemy.repositories.catalog_query_repository import (
+    SQLAlchemyCatalogQueryRepository,
+)
+from brasiltransporta.presentation.api.controllers.advertisements import router as advertisements_router
+from brasiltransporta.presentation.api.controllers.vehicles import router as vehicles_router
+from brasiltransporta.presentation.api.di.dependencies import get_list_advertisements_uc
+from brasiltransporta.presentation.api.di.list_vehicles_by_store_uc import get_list_vehicles_by_store_uc
+from brasiltransporta.presentation.api.responses import FastJSONResponse
+
+STORE = uuid.UUID("5f0c1d2e-3a4b-4c5d-8e6f-708192a3b4c5")
+
+
+@compiles(postgresql.UUID, "sqlite")
+def _uuid_as_char(type_, compiler, **kw):
+    return "CHAR(32)"
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    for model in (StoreModel, VehicleModel, AdvertisementModel):
+        model.__table__.create(engine)
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    session = sessionmaker(bind=engine)()
+    session.add(StoreModel(id=STORE, owner_id=uuid.uuid4(), name="Pesados do Sul"))
+    now = datetime(2026, 1, 1)
+    for i in range(3):
+        vehicle_id = uuid.uuid4()
+        session.add(VehicleModel(id=vehicle_id, store_id=STORE, brand="volvo", model=f"FH {i}", year=2020 + i,
+                                 plate=f"ABC1D2{i}", price=Decimal("400000"), created_at=now + timedelta(days=i)))
+        session.add(AdvertisementModel(
+            id=uuid.uuid4(), store_id=STORE, vehicle_id=vehicle_id, title=f"Volvo FH {i}",
+            description="Descrição longa " * 50, price_amount=Decimal("399000.00"), status="ativo",
+            is_featured=(i == 0), images=[f"ads/{i}/capa.jpg", f"ads/{i}/lateral.jpg"], videos=[],
+            created_at=now + timedelta(days=i),
+        ))
+    session.add(AdvertisementModel(
+        id=uuid.uuid4(), store_id=STORE, vehicle_id=vehicle_id, title="Vencido", description="",
+        price_amount=Decimal("1"), status="ativo", images=[], videos=[], expires_at=now,
+    ))
+    session.commit()
+    statements.clear()
+    session.statements = statements
+    return session
+
+
+def _client(session):
+    app = FastAPI(default_response_class=FastJSONResponse)
+    app.include_router(advertisements_router)
+    app.include_router(vehicles_router)
+    queries = SQLAlchemyCatalogQueryRepository(session)
+    app.dependency_overrides[get_list_advertisements_uc] = lambda: ListAdvertisementsUseCase(queries)
+    app.dependency_overrides[get_list_vehicles_by_store_uc] = lambda: ListVehiclesByStoreUseCase(queries)
+    return TestClient(app)
+
+
+def test_projection_selects_only_requested_columns(session):
+    rows = SQLAlchemyCatalogQueryRepository(session).advertisements(("id", "title", "thumbnail"))
+
+    sql = session.statements[0]
+    assert "description" not in sql
+    assert "advertisements.title" in sql
+    assert [row["title"] for row in rows] == ["Volvo FH 0", "Volvo FH 2", "Volvo FH 1"]
+    assert rows[0]["thumbnail"] == "ads/0/capa.jpg"
+    assert set(rows[0]) == {"id", "title", "thumbnail"}
+
+
+def test_active_filter_runs_against_stored_statuses(session):
+    vehicle_id = session.query(VehicleModel.id).first()[0]
+    for title, status, expires_at in (
+        ("Rascunho", AdvertisementStatus.DRAFT.value, None),
+        ("Pausado", AdvertisementStatus.PAUSED.value, None),
+        ("Vendido", AdvertisementStatus.SOLD.value, None),
+        ("Legado", "active", None),  # valor em inglês não é o que o domínio grava
+        ("Vale por mais 30 dias", AdvertisementStatus.ACTIVE.value, datetime.utcnow() + timedelta(days=30)),
+    ):
+        session.add(AdvertisementModel(
+            id=uuid.uuid4(), store_id=STORE, vehicle_id=vehicle_id, title=title, description="",
+            price_amount=Decimal("1"), status=status, images=[], videos=[], expires_at=expires_at,
+            created_at=datetime(2025, 1, 1),
+        ))
+    session.commit()
+    queries = SQLAlchemyCatalogQueryRepository(session)
+
+    active = queries.advertisements(("title", "status"))
+    drafts = queries.advertisements(("title",), status=AdvertisementStatus.DRAFT.value)
+    everything = queries.advertisements(("title",), status=None)
+
+    assert [row["title"] for row in active] == ["Volvo FH 0", "Volvo FH 2", "Volvo FH 1", "Vale por mais 30 dias"]
+    assert {row["status"] for row in active} == {"ativo"}
+    assert [row["title"] for row in drafts] == ["Rascunho"]
+    assert len(everything) == 9  # inclui o vencido e os demais status
+    assert len(queries.advertisements(("title",), store_id=str(uuid.uuid4()))) == 0
+
+
+def test_list_advertisements_fields(session):
+    client = _client(session)
+
+    items = client.get("/advertisements/", params={"fields": "title,description"}).json()
+
+    assert len(items) == 3
+    assert set(items[0]) == {"id", "title", "description"}
+    assert items[0]["description"].startswith("Descrição longa")
+    assert "description" not in client.get("/advertisements/").json()[0]
+
+
+def test_unknown_field_is_rejected(session):
+    response = _client(session).get("/advertisements/", params={"fields": "title,senha"})
+
+    assert response.status_code == 400
+    assert response.json()["detail"]["message"] == "Campos inválidos: senha"
+    assert "title" in response.json()["detail"]["allowed"]
+    assert session.statements == []
+
+
+def test_list_vehicles_by_store_fields(session):
+    client = _client(session)
+
+    default = client.get(f"/stores/{STORE}/vehicles").json()
+    sparse = client.get(f"/stores/{STORE}/vehicles", params={"fields": "plate"}).json()
+
+    assert set(default[0]) == {"id", "store_id", "brand", "model", "year", "plate", "created_at"}
+    assert [item["plate"] for item in sparse] == ["ABC1D22", "ABC1D21", "ABC1D20"]
+    assert set(sparse[0]) == {"id", "plate"}
+    assert "vehicles.description" not in session.statements[-1]
@@ -0,0 +1,455 @@
+# tests/unit/billing/test_payment_gateways.py
+import asyncio
+import json
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+
+from brasiltransporta.application.billing.services.payment_gateway import WebhookEvent, WebhookSignatureError
+from brasiltransporta.application.billing.use_cases.process_payment_notification import (
+    ProcessPaymentNotificationUseCase,
+)
+from brasiltransporta.application.billing.use_cases.reconcile_payments import ReconcilePaymentsUseCase
+from brasiltransporta.domain.entities.transaction import PaymentMethod, Transaction, TransactionStatus
+from brasiltransporta.infrastructure.external.payments.base import hmac_sha256
+from brasiltransporta.infrastructure.external.payments.mercadopago_gateway import MercadoPagoPaymentGateway
+from brasiltransporta.infrastructure.external.payments.pix_gateway import PixPaymentGateway
+from brasiltransporta.infrastructure.external.payments.stripe_gateway import StripePaymentGateway
+from brasiltransporta.infrastructure.persistence.sqlalchemy.models.transaction import TransactionModel
+from brasiltransporta.infrastructure.persistence.sqlalchemy.repositories.transaction_repository import (
+    SQLAlchemyTransactionRepository,
+)
+from brasiltransporta.presentation.api.controllers.payments import (
+    get_payment_webhook_queue,
+    get_webhook_gateways,
+    router,
+)
+
+SECRET = "whsec_test"
+
+
+@compiles(postgresql.UUID, "sqlite")
+def _uuid_as_char(type_, compiler, **kw):
+    return "CHAR(32)"
+
+
+class FakeGatewayState:
+    def __init__(self):
+        self.payments = {}  # id -> status
+        self.idempotency = {}  # chave -> id
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+
+def _handler(state: FakeGatewayState):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def _reply(self, code, payload):
+            body = json.dumps(payload).encode()
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self):
+            raw = self.rfile.read(int(self.headers.get("Content-Length", 0))).decode()
+            state.requests.append(("POST", self.path, dict(self.headers), raw))
+            if self.path == "/v1/payment_intents":
+                key = self.headers.get("Idempotency-Key")
+                form = {k: v[0] for k, v in parse_qs(raw).items()}
+                payment_id = state.idempotency.setdefault(key, f"pi_{len(state.idempotency) + 1}")
+                state.payments.setdefault(payment_id, "requires_payment_method")
+                return self._reply(200, {"id": payment_id, "status": state.payments[payment_id],
+                                         "client_secret": f"{payment_id}_secret", "amount": int(form["amount"])})
+            if self.path == "/v1/payments":
+                key = self.headers.get("X-Idempotency-Key")
+                payment_id = state.idempotency.setdefault(key, str(1000 + len(state.idempotency)))
+                state.payments.setdefault(payment_id, "pending")
+                return self._reply(201, {
+                    "id": int(payment_id), "status": state.payments[payment_id],
+                    "point_of_interaction": {"transaction_data": {"qr_code": "000201..."}},
+                })
+            self._reply(404, {"error": "not found"})
+
+        def do_GET(self):
+            state.requests.append(("GET", self.path, dict(self.headers), ""))
+            with state.lock:
+                state.in_flight += 1
+                state.max_in_flight = max(state.max_in_flight, state.in_flight)
+            try:
+                time.sleep(0.02)
+                payment_id = self.path.rsplit("/", 1)[-1]
+                if payment_id not in state.payments:
+                    return self._reply(404, {"error": "not found"})
+                self._reply(200, {"id": payment_id, "status": state.payments[payment_id]})
+            finally:
+                with state.lock:
+                    state.in_flight -= 1
+
+    return Handler
+
+
+@pytest.fixture
+def fake_gateway():
+    """Servidor HTTP local que emula as rotas usadas do Stripe e do Mercado Pago"""
+    state = FakeGatewayState()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _handler(state))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    state.url = f"http://127.0.0.1:{server.server_address[1]}"
+    yield state
+    server.shutdown()
+    server.server_close()
+
+
+class InMemoryTransactionRepository:
+    def __init__(self, transactions=()):
+        self.items = {tx.id: tx for tx in transactions}
+        self.updates = 0
+        self.reconciled = {}
+
+    def get_by_external_id(self, external_id):
+        return next((tx for tx in self.items.values() if tx.external_payment_id == external_id), None)
+
+    def list_pending_for_reconciliation(self, created_before, limit=100, created_after=None, gateways=None):
+        pending = [tx for tx in self.items.values()
+                   if tx.status == TransactionStatus.PENDING and tx.external_payment_id
+                   and tx.created_at < created_before
+                   and (created_after is None or tx.created_at >= created_after)
+                   and (gateways is None or tx.gateway in gateways)]
+        return sorted(pending, key=lambda tx: (tx.id in self.reconciled, self.reconciled.get(tx.id), tx.created_at))[:limit]
+
+    def mark_reconciled(self, transaction_ids, checked_at):
+        for transaction_id in transaction_ids:
+            self.reconciled[transaction_id] = checked_at
+
+    def update(self, transaction):
+        self.updates += 1
+        self.items[transaction.id] = transaction
+
+
+def _transaction(gateway=None, external_id=None, age_minutes=30):
+    tx = Transaction.create(user_id="u1", plan_id="p1", amount=99.9, payment_method=PaymentMethod.PIX)
+    tx.created_at = datetime.utcnow() - timedelta(minutes=age_minutes)
+    if gateway:
+        tx.attach_payment(gateway, external_id)
+    return tx
+
+
+def _stripe_headers(body: bytes, timestamp=None, secret=SECRET):
+    timestamp = timestamp or int(time.time())
+    signature = hmac_sha256(secret, f"{timestamp}.{body.decode()}")
+    return {"Stripe-Signature": f"t={timestamp},v1={signature}"}
+
+
+def _mercadopago_headers(data_id: str, request_id="req-1", secret=SECRET, ts=None):
+    ts = ts or str(int(time.time()))
+    signature = hmac_sha256(secret, f"id:{data_id};request-id:{request_id};ts:{ts};")
+    return {"x-signature": f"ts={ts},v1={signature}", "x-request-id": request_id}
+
+
+def test_stripe_create_payment_reuses_idempotency_key(fake_gateway):
+    async def scenario():
+        gateway = StripePaymentGateway("sk_test", SECRET, base_url=fake_gateway.url)
+        tx = _transaction()
+        try:
+            first = await gateway.create_payment(tx, "Plano Ouro")
+            second = await gateway.create_payment(tx, "Plano Ouro")
+        finally:
+            await gateway.aclose()
+        return tx, first, second
+
+    tx, first, second = asyncio.run(scenario())
+
+    assert first.external_id == second.external_id == "pi_1"
+    assert first.status == TransactionStatus.PENDING
+    method, path, headers, raw = fake_gateway.requests[0]
+    assert headers["Idempotency-Key"] == tx.id
+    assert headers["Authorization"] == "Bearer sk_test"
+    assert parse_qs(raw)["amount"] == ["9990"]
+
+
+def test_get_payments_queries_concurrently_with_bounded_pool(fake_gateway):
+    fake_gateway.payments.update({f"pi_{i}": "succeeded" for i in range(12)})
+    fake_gateway.payments["pi_0"] = "processing"
+
+    async def scenario():
+        gateway = StripePaymentGateway("sk_test", SECRET, base_url=fake_gateway.url, max_connections=4)
+        try:
+            return await gateway.get_payments([f"pi_{i}" for i in range(12)] + ["pi_inexistente"])
+        finally:
+            await gateway.aclose()
+
+    statuses = asyncio.run(scenario())
+
+    assert statuses["pi_0"] == TransactionStatus.PENDING
+    assert statuses["pi_5"] == TransactionStatus.COMPLETED
+    assert "pi_inexistente" not in statuses
+    assert 1 < fake_gateway.max_in_flight <= 4
+
+
+def test_stripe_webhook_signature():
+    gateway = StripePaymentGateway("sk_test", SECRET)
+    body = json.dumps({"id": "evt_1", "type": "payment_intent.succeeded",
+                       "data": {"object": {"id": "pi_9"}}}).encode()
+
+    events = gateway.verify_webhook(_stripe_headers(body), body)
+    assert events == [WebhookEvent("stripe", "pi_9", TransactionStatus.COMPLETED, event_id="evt_1")]
+
+    with pytest.raises(WebhookSignatureError):
+        gateway.verify_webhook(_stripe_headers(body, secret="outro"), body)
+    with pytest.raises(WebhookSignatureError):
+        gateway.verify_webhook(_stripe_headers(body, timestamp=int(time.time()) - 3600), body)
+
+    refund = json.dumps({"type": "charge.refunded", "data": {"object": {"id": "ch_1", "payment_intent": "pi_9"}}})
+    [event] = gateway.verify_webhook(_stripe_headers(refund.encode()), refund.encode())
+    assert (event.external_id, event.status) == ("pi_9", TransactionStatus.REFUNDED)
+
+    ignored = json.dumps({"type": "customer.created", "data": {"object": {"id": "cus_1"}}}).encode()
+    assert gateway.verify_webhook(_stripe_headers(ignored), ignored) == []
+
+
+def test_mercadopago_webhook_signature():
+    gateway = MercadoPagoPaymentGateway("APP_USR", SECRET)
+    body = json.dumps({"id": 77, "type": "payment", "data": {"id": "1001"}}).encode()
+
+    events = gateway.verify_webhook(_mercadopago_headers("1001"), body)
+    assert events == [WebhookEvent("mercadopago", "1001", None, event_id="77")]
+
+    with pytest.raises(WebhookSignatureError):
+        gateway.verify_webhook(_mercadopago_headers("1002"), body)
+    # `ts` em milissegundos também é aceito; fora da tolerância é replay
+    assert gateway.verify_webhook(_mercadopago_headers("1001", ts=str(int(time.time() * 1000))), body)
+    with pytest.raises(WebhookSignatureError, match="expirada"):
+        gateway.verify_webhook(_mercadopago_headers("1001", ts=str(int(time.time()) - 3600)), body)
+
+
+def test_webhooks_are_rejected_without_secret():
+    stripe_body = json.dumps({"id": "evt_1", "type": "payment_intent.succeeded",
+                              "data": {"object": {"id": "pi_9"}}}).encode()
+    mp_body = json.dumps({"id": 77, "type": "payment", "data": {"id": "1001"}}).encode()
+
+    # Assinado com a chave vazia: seria aceito se o segredo caísse para ""
+    for secret in (None, ""):
+        with pytest.raises(WebhookSignatureError, match="não configurado"):
+            StripePaymentGateway("sk_test", secret).verify_webhook(
+                _stripe_headers(stripe_body, secret=""), stripe_body
+            )
+        with pytest.raises(WebhookSignatureError, match="não configurado"):
+            MercadoPagoPaymentGateway("APP_USR", secret).verify_webhook(
+                _mercadopago_headers("1001", secret=""), mp_body
+            )
+
+
+def test_stripe_webhook_rejects_non_utf8_body():
+    body = b"\xff\xfe{}"
+    headers = {"Stripe-Signature": f"t={int(time.time())},v1={'0' * 64}"}
+
+    with pytest.raises(WebhookSignatureError, match="inválido"):
+        StripePaymentGateway("sk_test", SECRET).verify_webhook(headers, body)
+
+
+def test_apply_gateway_status_is_idempotent():
+    tx = _transaction("stripe", "pi_1")
+
+    assert tx.apply_gateway_status(TransactionStatus.COMPLETED) is True
+    assert tx.apply_gateway_status(TransactionStatus.COMPLETED) is False
+    # Evento atrasado não desfaz a aprovação
+    assert tx.apply_gateway_status(TransactionStatus.FAILED) is False
+    assert tx.status == TransactionStatus.COMPLETED
+    assert [e.name for e in tx.pull_events()] == ["transaction.completed"]
+
+    assert tx.apply_gateway_status(TransactionStatus.REFUNDED) is True
+    assert tx.status == TransactionStatus.REFUNDED
+
+
+def test_process_notification_ignores_duplicates():
+    tx = _transaction("stripe", "pi_1")
+    repo = InMemoryTransactionRepository([tx])
+    use_case = ProcessPaymentNotificationUseCase(repo, {})
+    event = WebhookEvent("stripe", "pi_1", TransactionStatus.COMPLETED, event_id="evt_1")
+
+    first = asyncio.run(use_case.execute(event))
+    second = asyncio.run(use_case.execute(event))
+    unknown = asyncio.run(use_case.execute(WebhookEvent("stripe", "pi_x", TransactionStatus.COMPLETED)))
+
+    assert (first.changed, first.status) == (True, "completed")
+    assert second.changed is False
+    assert unknown.transaction_id is None
+    assert repo.updates == 1
+
+
+def test_process_notification_fetches_status_when_missing(fake_gateway):
+    fake_gateway.payments["1001"] = "approved"
+    tx = _transaction("mercadopago", "1001")
+    repo = InMemoryTransactionRepository([tx])
+
+    async def scenario():
+        gateway = MercadoPagoPaymentGateway("APP_USR", SECRET, base_url=fake_gateway.url)
+        try:
+            return await ProcessPaymentNotificationUseCase(repo, {"mercadopago": gateway}).execute(
+                WebhookEvent("mercadopago", "1001")
+            )
+        finally:
+            await gateway.aclose()
+
+    output = asyncio.run(scenario())
+
+    assert output.changed is True
+    assert repo.items[tx.id].status == TransactionStatus.COMPLETED
+    assert fake_gateway.requests[-1][1] == "/v1/payments/1001"
+
+
+def test_reconcile_updates_only_stale_pending(fake_gateway):
+    fake_gateway.payments.update({"pi_1": "succeeded", "pi_2": "processing", "1001": "rejected"})
+    paid = _transaction("stripe", "pi_1")
+    waiting = _transaction("stripe", "pi_2")
+    rejected = _transaction("mercadopago", "1001")
+    recent = _transaction("stripe", "pi_3", age_minutes=1)
+    repo = InMemoryTransactionRepository([paid, waiting, rejected, recent])
+
+    async def scenario():
+        gateways = {
+            "stripe": StripePaymentGateway("sk_test", SECRET, base_url=fake_gateway.url),
+            "mercadopago": MercadoPagoPaymentGateway("APP_USR", SECRET, base_url=fake_gateway.url),
+        }
+        try:
+            return await ReconcilePaymentsUseCase(repo, gateways).execute(older_than=timedelta(minutes=15))
+        finally:
+            for gateway in gateways.values():
+                await gateway.aclose()
+
+    report = asyncio.run(scenario())
+
+    assert (report.checked, report.updated) == (3, 2)
+    assert report.by_status == {"completed": 1, "failed": 1}
+    assert repo.items[paid.id].status == TransactionStatus.COMPLETED
+    assert repo.items[waiting.id].status == TransactionStatus.PENDING
+    assert repo.items[rejected.id].status == TransactionStatus.FAILED
+    assert all("pi_3" not in path for _, path, _, _ in fake_gateway.requests)
+
+
+def test_reconcile_rotates_unresolved_and_skips_unqueryable(fake_gateway):
+    fake_gateway.payments.update({f"pi_{i}": "processing" for i in range(4)})
+    # Abandonadas: o Stripe continua informando "processing"
+    stuck = [_transaction("stripe", f"pi_{i}", age_minutes=60 - i) for i in range(3)]
+    newer = _transaction("stripe", "pi_3", age_minutes=20)
+    pix = _transaction("pix", "txid1", age_minutes=90)
+    too_old = _transaction("stripe", "pi_old", age_minutes=5 * 24 * 60)
+    repo = InMemoryTransactionRepository([*stuck, newer, pix, too_old])
+
+    async def scenario():
+        gateways = {
+            "stripe": StripePaymentGateway("sk_test", SECRET, base_url=fake_gateway.url),
+            "pix": PixPaymentGateway("chave", "Loja", "Cidade", SECRET),
+        }
+        use_case = ReconcilePaymentsUseCase(repo, gateways)
+        try:
+            first = await use_case.execute(batch_size=3)
+            second = await use_case.execute(batch_size=3)
+        finally:
+            await gateways["stripe"].aclose()
+        return first, second
+
+    first, second = asyncio.run(scenario())
+
+    assert (first.checked, first.updated) == (3, 0)
+    assert second.checked == 3
+    # A segunda rodada alcança a mais nova em vez de repetir as mesmas três
+    assert newer.id in repo.reconciled
+    assert pix.id not in repo.reconciled and too_old.id not in repo.reconciled
+    paths = [path for _, path, _, _ in fake_gateway.requests]
+    assert "/v1/payment_intents/pi_3" in paths
+    assert all("pi_old" not in path and "txid1" not in path for path in paths)
+
+
+class RecordingQueue:
+    def __init__(self):
+        self.events = []
+
+    def enqueue(self, event):
+        self.events.append(event)
+        return "task-1"
+
+
+def test_webhook_endpoint_validates_and_enqueues():
+    queue = RecordingQueue()
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_webhook_gateways] = lambda: {"stripe": StripePaymentGateway("sk_test", SECRET)}
+    app.dependency_overrides[get_payment_webhook_queue] = lambda: queue
+    client = TestClient(app)
+    body = json.dumps({"id": "evt_1", "type": "payment_intent.payment_failed",
+                       "data": {"object": {"id": "pi_1"}}}).encode()
+
+    accepted = client.post("/payments/webhooks/stripe", content=body, headers=_stripe_headers(body))
+    forged = client.post("/payments/webhooks/stripe", content=body, headers=_stripe_headers(body, secret="x"))
+    unknown = client.post("/payments/webhooks/paypal", content=body)
+
+    assert accepted.status_code == 202
+    assert queue.events == [WebhookEvent("stripe", "pi_1", TransactionStatus.FAILED, event_id="evt_1")]
+    assert forged.status_code == 401
+    assert unknown.status_code == 404
+
+
+def test_transaction_model_round_trip():
+    tx = _transaction("mercadopago", "1001")
+    tx.user_id, tx.plan_id = str(uuid4()), str(uuid4())
+    tx.metadata = {"payer": {"email": "a@b.com"}}
+
+    restored = TransactionModel.from_domain(tx).to_domain()
+
+    assert restored.gateway == "mercadopago"
+    assert restored.external_payment_id == "1001"
+    assert restored.metadata == {"payer": {"email": "a@b.com"}}
+    assert restored.amount.amount == pytest.approx(99.9)
+
+
+def test_reconciliation_queue_orders_by_last_check():
+    engine = create_engine("sqlite://")
+    TransactionModel.__table__.create(engine)
+    session = sessionmaker(bind=engine)()
+    repo = SQLAlchemyTransactionRepository(session)
+    now = datetime.utcnow()
+
+    def add(gateway, external_id, age_minutes):
+        tx = _transaction(gateway, external_id, age_minutes)
+        tx.user_id, tx.plan_id = str(uuid4()), str(uuid4())
+        session.add(TransactionModel.from_domain(tx))
+        return tx
+
+    oldest = add("stripe", "pi_1", 120)
+    older = add("stripe", "pi_2", 90)
+    newest = add("stripe", "pi_3", 30)
+    add("pix", "txid1", 100)
+    add("stripe", "pi_old", 10 * 24 * 60)
+    session.commit()
+
+    def queue(limit=2):
+        pending = repo.list_pending_for_reconciliation(
+            now - timedelta(minutes=15), limit=limit,
+            created_after=now - timedelta(days=3), gateways=["stripe"],
+        )
+        return [tx.external_payment_id for tx in pending]
+
+    assert queue() == ["pi_1", "pi_2"]
+    repo.mark_reconciled([oldest.id, older.id], now)
+    assert queue() == ["pi_3", "pi_1"]
+    repo.mark_reconciled([newest.id], now + timedelta(minutes=10))
+    assert queue(limit=5) == ["pi_1", "pi_2", "pi_3"]
@@ -0,0 +1,307 @@
+# tests/unit/billing/test_pix_charge.py
+import asyncio
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from brasiltransporta.application.billing.services.payment_gateway import WebhookEvent, WebhookSignatureError
+from brasiltransporta.application.billing.services.pix_brcode import (
+    build_pix_payload,
+    crc16_ccitt,
+    is_valid_pix_payload,
+    normalize_txid,
+)
+from brasiltransporta.application.billing.use_cases.process_payment_notification import (
+    ProcessPaymentNotificationUseCase,
+)
+from brasiltransporta.application.transactions.use_cases.create_pix_charge import CreatePixChargeUseCase
+from brasiltransporta.domain.entities.transaction import PaymentMethod, Transaction, TransactionStatus
+from brasiltransporta.domain.errors.errors import ValidationError
+from brasiltransporta.infrastructure.external.payments.base import hmac_sha256
+from brasiltransporta.infrastructure.external.payments.pix_gateway import PixPaymentGateway
+from brasiltransporta.infrastructure.persistence.redis.transaction_events import (
+    RedisTransactionStatusPublisher,
+    RedisTransactionStatusSubscriber,
+)
+from brasiltransporta.presentation.api.controllers.transactions import (
+    get_transaction_status_reader,
+    get_transaction_status_subscriber,
+    router,
+)
+
+SECRET = "pix-secret"
+
+
+def _gateway():
+    return PixPaymentGateway("contato@brasiltransporta.com.br", "BrasilTransporta Ltda", "São Paulo", SECRET)
+
+
+def _transaction(method=PaymentMethod.PIX):
+    return Transaction.create(user_id="u1", plan_id="p1", amount=149.9, payment_method=method)
+
+
+class InMemoryTransactionRepository:
+    def __init__(self, *transactions):
+        self.items = {tx.id: tx for tx in transactions}
+        self.updates = 0
+
+    def get_by_id(self, transaction_id):
+        return self.items.get(transaction_id)
+
+    def get_by_external_id(self, external_id):
+        return next((tx for tx in self.items.values() if tx.external_payment_id == external_id), None)
+
+    def update(self, transaction):
+        self.updates += 1
+
+
+class RecordingNotifier:
+    def __init__(self):
+        self.published = []
+
+    def publish(self, transaction_id, status):
+        self.published.append((transaction_id, status))
+
+
+def test_crc16_matches_reference_value():
+    # Valor de verificação do CRC-16/CCITT-FALSE
+    assert crc16_ccitt("123456789") == "29B1"
+
+
+def test_build_pix_payload():
+    payload = build_pix_payload(
+        "contato@brasiltransporta.com.br", "Transportes São João", "São Paulo",
+        amount=149.9, txid="a1b2-c3d4",
+    )
+
+    assert payload.startswith("000201" "010212" "26")
+    assert "0014br.gov.bcb.pix" in payload
+    assert "5406149.90" in payload
+    assert "5920Transportes Sao Joao" in payload
+    assert "6009Sao Paulo" in payload
+    assert "62120508a1b2c3d4" in payload
+    assert is_valid_pix_payload(payload)
+    assert not is_valid_pix_payload(payload[:-1] + ("0" if payload[-1] != "0" else "1"))
+
+
+def test_normalize_txid_limits_to_25_alphanumerics():
+    assert normalize_txid("1b4e28ba-2fa1-11d2-883f-0016d3cca427") == "1b4e28ba2fa111d2883f0016d"
+    assert normalize_txid("---") == "***"
+
+
+def test_pix_webhook_accepts_several_payments():
+    body = json.dumps({"pix": [
+        {"txid": "abc", "endToEndId": "E1", "valor": "10.00"},
+        {"txid": "def", "endToEndId": "E2", "valor": "20.00"},
+    ]}).encode()
+
+    events = _gateway().verify_webhook({"X-Webhook-Signature": hmac_sha256(SECRET, body.decode())}, body)
+
+    assert events == [
+        WebhookEvent("pix", "abc", TransactionStatus.COMPLETED, event_id="E1", amount="10.00"),
+        WebhookEvent("pix", "def", TransactionStatus.COMPLETED, event_id="E2", amount="20.00"),
+    ]
+    with pytest.raises(WebhookSignatureError):
+        _gateway().verify_webhook({"X-Webhook-Signature": "0" * 64}, body)
+
+
+def test_pix_webhook_requires_secret():
+    body = json.dumps({"pix": [{"txid": "abc", "endToEndId": "E1", "valor": "10.00"}]}).encode()
+    gateway = PixPaymentGateway("contato@brasiltransporta.com.br", "BrasilTransporta Ltda", "São Paulo", None)
+
+    with pytest.raises(WebhookSignatureError, match="não configurado"):
+        gateway.verify_webhook({"X-Webhook-Signature": hmac_sha256("", body.decode())}, body)
+
+
+def test_payment_with_different_amount_is_not_applied():
+    tx = _transaction()
+    tx.attach_payment("pix", "abc")
+    repo = InMemoryTransactionRepository(tx)
+    use_case = ProcessPaymentNotificationUseCase(repo, {})
+
+    underpaid = asyncio.run(use_case.execute(
+        WebhookEvent("pix", "abc", TransactionStatus.COMPLETED, amount="0.01")
+    ))
+    assert (underpaid.status, underpaid.changed) == ("pending", False)
+    assert repo.updates == 0
+
+    paid = asyncio.run(use_case.execute(
+        WebhookEvent("pix", "abc", TransactionStatus.COMPLETED, amount="149.90")
+    ))
+    assert (paid.status, paid.changed) == ("completed", True)
+
+
+def test_create_pix_charge_is_repeatable():
+    tx = _transaction()
+    repo = InMemoryTransactionRepository(tx)
+    use_case = CreatePixChargeUseCase(repo, _gateway())
+
+    first = asyncio.run(use_case.execute(tx.id))
+    second = asyncio.run(use_case.execute(tx.id))
+
+    assert first.brcode == second.brcode
+    assert is_valid_pix_payload(first.brcode)
+    assert first.txid == normalize_txid(tx.id)
+    assert (tx.gateway, tx.external_payment_id) == ("pix", first.txid)
+    assert tx.metadata["pix_brcode"] == first.brcode
+    assert repo.updates == 1
+
+
+def test_create_pix_charge_rejects_card_transactions():
+    tx = _transaction(PaymentMethod.CREDIT_CARD)
+
+    with pytest.raises(ValidationError):
+        asyncio.run(CreatePixChargeUseCase(InMemoryTransactionRepository(tx), _gateway()).execute(tx.id))
+
+
+def test_confirmed_payment_is_published():
+    tx = _transaction()
+    tx.attach_payment("pix", "abc")
+    notifier = RecordingNotifier()
+    use_case = ProcessPaymentNotificationUseCase(InMemoryTransactionRepository(tx), {}, notifier)
+    event = WebhookEvent("pix", "abc", TransactionStatus.COMPLETED)
+
+    asyncio.run(use_case.execute(event))
+    asyncio.run(use_case.execute(event))
+
+    assert notifier.published == [(tx.id, "completed")]
+
+
+def test_status_publisher_uses_transaction_channel():
+    class FakeRedis:
+        def __init__(self):
+            self.messages = []
+
+        def publish(self, channel, message):
+            self.messages.append((channel, json.loads(message)))
+
+    fake = FakeRedis()
+    RedisTransactionStatusPublisher(fake).publish("tx-1", "completed")
+
+    channel, message = fake.messages[0]
+    assert channel == "transactions:tx-1"
+    assert (message["transaction_id"], message["status"]) == ("tx-1", "completed")
+
+
+class FakeSubscriber:
+    def __init__(self, messages):
+        self.messages = messages
+        self.closed = False
+
+    async def listen(self, transaction_id, poll_timeout=1.0):
+        try:
+            yield None  # assinatura ativa
+            for message in self.messages:
+                yield message
+        finally:
+            self.closed = True
+
+
+def _client(tx, subscriber):
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_transaction_status_reader] = (
+        lambda: lambda transaction_id: tx.status.value if tx and tx.id == transaction_id else None
+    )
+    app.dependency_overrides[get_transaction_status_subscriber] = lambda: subscriber
+    return TestClient(app)
+
+
+def _events(text):
+    return [json.loads(line[len("data: "):]) for line in text.splitlines() if line.startswith("data: ")]
+
+
+def test_event_stream_pushes_status_until_completed():
+    tx = _transaction()
+    subscriber = FakeSubscriber([None, {"status": "pending"}, {"status": "completed"}, {"status": "refunded"}])
+
+    response = _client(tx, subscriber).get(f"/transactions/{tx.id}/events")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert [e["status"] for e in _events(response.text)] == ["pending", "completed"]
+    assert subscriber.closed
+
+
+def test_event_stream_closes_immediately_for_final_status():
+    tx = _transaction()
+    tx.mark_completed("abc")
+
+    response = _client(tx, FakeSubscriber([{"status": "refunded"}])).get(f"/transactions/{tx.id}/events")
+
+    assert [e["status"] for e in _events(response.text)] == ["completed"]
+
+
+def test_event_stream_unknown_transaction():
+    response = _client(None, FakeSubscriber([])).get("/transactions/nao-existe/events")
+
+    assert response.status_code == 404
+
+
+def test_status_reader_closes_its_session(monkeypatch):
+    from brasiltransporta.presentation.api.controllers import transactions
+
+    tx = _transaction()
+    sessions = []
+
+    class FakeSession:
+        closed = False
+
+        def __enter__(self):
+            sessions.append(self)
+            return self
+
+        def __exit__(self, *exc):
+            self.closed = True
+
+    class FakeRepository:
+        def __init__(self, session):
+            assert not session.closed
+
+        def get_by_id(self, transaction_id):
+            return tx if transaction_id == tx.id else None
+
+    monkeypatch.setattr(transactions, "get_session", FakeSession)
+    monkeypatch.setattr(transactions, "SQLAlchemyTransactionRepository", FakeRepository)
+    read = get_transaction_status_reader()
+
+    assert read(tx.id) == "pending"
+    assert read("outra") is None
+    assert len(sessions) == 2 and all(session.closed for session in sessions)
+
+
+def test_subscriber_closes_pubsub_on_redis_py_4():
+    class PubSub4:
+        """PubSub do redis-py 4.x: sem aclose(), close() assíncrono"""
+
+        def __init__(self):
+            self.closed = False
+
+        async def subscribe(self, channel):
+            self.channel = channel
+
+        async def get_message(self, timeout):
+            return {"data": json.dumps({"status": "completed"})}
+
+        async def unsubscribe(self):
+            pass
+
+        async def close(self):
+            self.closed = True
+
+    pubsub = PubSub4()
+    redis_client = type("FakeAsyncRedis", (), {"pubsub": lambda self, **kwargs: pubsub})()
+
+    async def first_message():
+        messages = RedisTransactionStatusSubscriber(redis_client).listen("tx-1")
+        try:
+            assert await messages.__anext__() is None
+            return await messages.__anext__()
+        finally:
+            await messages.aclose()
+
+    assert asyncio.run(first_message()) == {"status": "completed"}
+    assert pubsub.channel == "transactions:tx-1"
+    assert pubsub.closed
@@ -0,0 +1,166 @@
+# tests/unit/events/test_outbox_relay.py
+from dataclasses import replace
+
+import pytest
+from kombu import Connection, Exchange, Queue
+from sqlalchemy import create_engine, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+
+from brasiltransporta.domain.entities.advertisement import Advertisement
+from brasiltransporta.domain.entities.transaction import PaymentMethod, Transaction
+from brasiltransporta.domain.entities.user import User
+from brasiltransporta.infrastructure.messaging.outbox_relay import (
+    KombuEventPublisher,
+    OutboxRelay,
+    pending_stats,
+)
+from brasiltransporta.infrastructure.persistence.redis.idempotency import RedisIdempotencyStore
+from brasiltransporta.infrastructure.persistence.sqlalchemy.models.outbox import OutboxModel
+from brasiltransporta.infrastructure.persistence.sqlalchemy.outbox import stage_events
+
+
+@compiles(postgresql.UUID, "sqlite")
+def _uuid_as_char(type_, compiler, **kw):
+    # O relay roda em Postgres; no teste basta o SQLite guardar o UUID como texto
+    return "CHAR(32)"
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine("sqlite://")
+    OutboxModel.__table__.create(engine)
+    return sessionmaker(bind=engine)
+
+
+def _advertisement():
+    return Advertisement.create(
+        store_id="s1", vehicle_id="v1", title="Caminhão Volvo",
+        description="Caminhão revisado", price_amount=250000,
+    )
+
+
+def _stage(session_factory, *entities):
+    session = session_factory()
+    for entity in entities:
+        stage_events(session, entity)
+    session.commit()
+    session.close()
+
+
+class RecordingPublisher:
+    def __init__(self, fail_on=None):
+        self.fail_on = fail_on
+        self.messages = []
+
+    def publish(self, message):
+        if message.event_type == self.fail_on:
+            raise ConnectionError("broker indisponível")
+        self.messages.append(message)
+
+
+class TestDomainEvents:
+    def test_aggregates_record_events(self):
+        ad = _advertisement()
+        ad.publish()
+        user = User.create(name="Ana", email="ana@example.com", password_hash="x")
+        tx = Transaction.create(user_id=user.id, plan_id="p1", amount=99.9, payment_method=PaymentMethod.PIX)
+        tx.mark_completed("ext-1")
+
+        assert [e.name for e in ad.pending_events] == ["advertisement.published"]
+        assert user.pending_events[0].payload["email"] == "ana@example.com"
+        assert tx.pending_events[0].payload["amount"] == "99.9"
+        assert tx.pending_events[0].aggregate_type == "transaction"
+
+    def test_events_do_not_change_entity_equality(self):
+        ad = _advertisement()
+        copy = replace(ad)
+        ad.record_event("advertisement.viewed")
+
+        assert ad == copy
+        assert [e.name for e in ad.pull_events()] == ["advertisement.viewed"]
+        assert ad.pending_events == []
+
+
+class TestOutboxRelay:
+    def test_publishes_in_order_and_marks_rows(self, session_factory):
+        ads = [_advertisement() for _ in range(3)]
+        for ad in ads:
+            ad.publish()
+        _stage(session_factory, *ads)
+
+        publisher = RecordingPublisher()
+        relay = OutboxRelay(session_factory, publisher, batch_size=2)
+        assert relay.relay_batch() == 2
+        assert relay.relay_batch() == 1
+        assert relay.relay_batch() == 0
+
+        assert [m.aggregate_id for m in publisher.messages] == [ad.id for ad in ads]
+        assert pending_stats(session_factory()) == (0, None)
+        assert relay.metrics.snapshot()["published_total"] == 3
+
+    def test_failure_keeps_event_pending_with_error(self, session_factory):
+        ad = _advertisement()
+        ad.publish()
+        tx = Transaction.create(user_id="u1", plan_id="p1", amount=10, payment_method=PaymentMethod.PIX)
+        tx.mark_completed("ext-1")
+        _stage(session_factory, ad, tx)
+
+        relay = OutboxRelay(session_factory, RecordingPublisher(fail_on="transaction.completed"))
+        assert relay.relay_batch() == 1
+
+        session = session_factory()
+        row = session.execute(select(OutboxModel).where(OutboxModel.published_at.is_(None))).scalar_one()
+        assert row.event_type == "transaction.completed"
+        assert (row.attempts, row.last_error) == (1, "broker indisponível")
+        assert relay.metrics.failed_total == 1
+
+    def test_batch_query_skips_locked_rows(self, session_factory):
+        relay = OutboxRelay(session_factory, RecordingPublisher(), batch_size=50)
+        sql = str(relay._select_batch().compile(dialect=postgresql.dialect()))
+        assert "FOR UPDATE SKIP LOCKED" in sql
+        assert "published_at IS NULL" in sql
+
+
+class TestKombuEventPublisher:
+    def test_message_carries_idempotency_key_and_routing_key(self, session_factory):
+        ad = _advertisement()
+        ad.publish()
+        event_id = ad.pending_events[0].id
+        _stage(session_factory, ad)
+
+        broker_url = "memory://outbox-test"
+        queue = Queue("ads", Exchange("domain_events", type="topic"), routing_key="advertisement.#")
+        with Connection(broker_url) as conn:
+            queue(conn.default_channel).declare()
+
+            publisher = KombuEventPublisher(broker_url)
+            OutboxRelay(session_factory, publisher).relay_batch()
+
+            message = queue(conn.default_channel).get(no_ack=True)
+            assert message is not None
+            assert message.properties["message_id"] == event_id
+            assert message.headers["idempotency_key"] == event_id
+            assert message.payload["type"] == "advertisement.published"
+            assert message.payload["aggregate_id"] == ad.id
+            publisher.close()
+
+
+class TestIdempotencyStore:
+    def test_claim_only_once(self):
+        class FakeRedis(dict):
+            def set(self, key, value, nx=False, ex=None):
+                if nx and key in self:
+                    return None
+                self[key] = value
+                return True
+
+            def delete(self, key):
+                self.pop(key, None)
+
+        store = RedisIdempotencyStore(FakeRedis())
+        assert store.claim("evt-1") is True
+        assert store.claim("evt-1") is False
+        store.release("evt-1")
+        assert store.claim("evt-1") is True
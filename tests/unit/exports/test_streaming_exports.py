@@ -0,0 +1,184 @@
+# tests/unit/exports/test_streaming_exports.py
+import csv
+import gzip
+import io
+import json
+import uuid
+import zlib
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from brasiltransporta.infrastructure.persistence.sqlalchemy.models.advertisement import AdvertisementModel
+from brasiltransporta.infrastructure.persistence.sqlalchemy.models.store import StoreModel
+from brasiltransporta.infrastructure.persistence.sqlalchemy.models.vehicle import VehicleModel
+from brasiltransporta.infrastructure.persistence.sqlalchemy.repositories.export_repository import (
+    SQLAlchemyExportRepository,
+)
+from brasiltransporta.presentation.api.controllers.exports import get_export_session, router
+from brasiltransporta.presentation.api.dependencies import authz
+from brasiltransporta.presentation.api.streaming import (
+    STREAM_CHUNK_SIZE,
+    accepts_gzip,
+    csv_chunks,
+    gzip_chunks,
+    ndjson_chunks,
+)
+
+STORE = uuid.UUID("5f0c1d2e-3a4b-4c5d-8e6f-708192a3b4c5")
+OWNER = uuid.UUID("1c2d3e4f-5a6b-4c7d-8e9f-0a1b2c3d4e5f")
+
+
+@compiles(postgresql.UUID, "sqlite")
+def _uuid_as_char(type_, compiler, **kw):
+    return "CHAR(32)"
+
+
+@pytest.fixture
+def session_factory():
+    # StaticPool: o streaming roda em outra thread e precisa da mesma base em memória
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    for model in (StoreModel, VehicleModel, AdvertisementModel):
+        model.__table__.create(engine)
+    factory = sessionmaker(bind=engine)
+    session = factory()
+    session.add(StoreModel(id=STORE, owner_id=OWNER, name="Pesados do Sul"))
+    for i in range(5):
+        session.add(VehicleModel(
+            id=uuid.uuid4(), store_id=STORE, brand="volvo", model=f"FH {i}", year=2020 + i,
+            plate=f"ABC1D2{i}", price=Decimal("450000.50"), created_at=datetime(2026, 1, 1 + i),
+        ))
+    session.add(VehicleModel(id=uuid.uuid4(), store_id=uuid.uuid4(), brand="scania", model="R450",
+                             year=2020, plate="XYZ9K87", created_at=datetime(2026, 1, 1)))
+    session.add(AdvertisementModel(
+        id=uuid.uuid4(), store_id=STORE, vehicle_id=uuid.uuid4(), title="Volvo FH, revisado",
+        description="Cavalo mecânico", price_amount=Decimal("450000.00"), status="ativo",
+        is_featured=True, views=3, images=[], videos=[],
+    ))
+    session.commit()
+    session.close()
+    return factory
+
+
+class TrackingSession:
+    def __init__(self, session):
+        self.session = session
+        self.closed = False
+
+    def execute(self, *args, **kwargs):
+        return self.session.execute(*args, **kwargs)
+
+    def close(self):
+        self.closed = True
+        self.session.close()
+
+
+def _client(session, user_id=str(OWNER), roles=("seller",)):
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_export_session] = lambda: session
+    app.dependency_overrides[authz.get_current_user] = lambda: {"id": user_id, "roles": list(roles)}
+    return TestClient(app)
+
+
+def test_export_vehicles_as_gzipped_ndjson(session_factory):
+    session = TrackingSession(session_factory())
+
+    response = _client(session).get(f"/exports/stores/{STORE}/vehicles", headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert f'filename="vehicles-{STORE}.ndjson"' in response.headers["content-disposition"]
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [r["model"] for r in rows] == [f"FH {i}" for i in range(5)]
+    assert rows[0]["price"] == "450000.50" and rows[0]["store_id"] == str(STORE)
+    assert session.closed
+
+
+def test_export_advertisements_as_csv(session_factory):
+    session = TrackingSession(session_factory())
+
+    response = _client(session).get(f"/exports/stores/{STORE}/advertisements?format=csv",
+                                    headers={"Accept-Encoding": "identity"})
+
+    assert "content-encoding" not in response.headers
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == 1
+    assert (rows[0]["title"], rows[0]["is_featured"], rows[0]["expires_at"]) == ("Volvo FH, revisado", "true", "")
+
+
+def test_seller_cannot_export_another_sellers_store(session_factory):
+    session = TrackingSession(session_factory())
+
+    response = _client(session, user_id=str(uuid.uuid4())).get(f"/exports/stores/{STORE}/vehicles")
+    missing = _client(TrackingSession(session_factory())).get(f"/exports/stores/{uuid.uuid4()}/advertisements")
+
+    assert response.status_code == 404
+    assert missing.status_code == 404
+    assert session.closed
+
+
+def test_admin_exports_any_store(session_factory):
+    response = _client(TrackingSession(session_factory()), user_id="admin-1", roles=("admin",)).get(
+        f"/exports/stores/{STORE}/advertisements"
+    )
+
+    assert response.status_code == 200
+    assert json.loads(response.text.splitlines()[0])["price_amount"] == "450000.00"
+
+
+def test_transactions_export_requires_admin(session_factory):
+    response = _client(TrackingSession(session_factory())).get("/exports/transactions")
+
+    assert response.status_code == 403
+
+
+def test_repository_uses_server_side_cursor():
+    class Executed(Exception):
+        pass
+
+    class RecordingSession:
+        def __init__(self):
+            self.statements = []
+
+        def execute(self, stmt):
+            self.statements.append(stmt)
+            raise Executed
+
+    session = RecordingSession()
+    with pytest.raises(Executed):
+        next(SQLAlchemyExportRepository(session, fetch_size=500).transactions(created_from=datetime(2026, 1, 1)))
+
+    stmt = session.statements[0]
+    assert stmt.get_execution_options()["yield_per"] == 500
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "transactions.created_at >= " in sql and "ORDER BY transactions.created_at" in sql
+
+
+def test_chunks_are_bounded_and_gzip_round_trips():
+    rows = ((i, f"modelo {i}", None) for i in range(20000))
+
+    chunks = list(ndjson_chunks(("id", "model", "color"), rows))
+
+    assert len(chunks) > 1
+    assert all(len(c) < STREAM_CHUNK_SIZE + 200 for c in chunks)
+    compressed = b"".join(gzip_chunks(iter(chunks)))
+    assert gzip.decompress(compressed) == b"".join(chunks)
+    assert zlib.decompress(compressed, 16 + zlib.MAX_WBITS).count(b"\n") == 20000
+
+    assert b"".join(csv_chunks(("a", "b"), [(1, None)])) == b"a,b\r\n1,\r\n"
+
+
+def test_accepts_gzip():
+    assert accepts_gzip("br, gzip;q=0.8")
+    assert not accepts_gzip("gzip;q=0")
+    assert not accepts_gzip("identity")
@@ -0,0 +1,220 @@
+# tests/unit/media/test_transcode_video.py
+import shutil
+import subprocess
+import time
+from pathlib import Path
+
+import pytest
+
+from brasiltransporta.application.storage.use_cases.transcode_video import (
+    TranscodeVideoUseCase,
+    TranscodeVideoRequest,
+)
+from brasiltransporta.domain.entities.media_asset import MediaAsset
+from brasiltransporta.infrastructure.external.media.ffmpeg_transcoder import (
+    DEFAULT_LADDER,
+    FFmpegTranscoder,
+    Rendition,
+    TranscodeError,
+    VideoProbe,
+    parse_progress_line,
+    select_renditions,
+)
+from brasiltransporta.infrastructure.external.storage.media_probe import IsoBmffProbe
+
+
+class FakeRepository:
+    def __init__(self, *assets):
+        self.assets = {a.key: a for a in assets}
+        self.saved = []
+
+    def get_by_key(self, key):
+        return self.assets.get(key)
+
+    def save(self, asset):
+        self.saved.append(asset)
+        return asset
+
+
+class LocalStorage:
+    """Storage falso apoiado em um diretório local"""
+
+    def __init__(self, root: Path):
+        self.root = root
+
+    def download_to_path(self, file_key, local_path):
+        source = self.root / file_key
+        if not source.exists():
+            return False
+        shutil.copy(source, local_path)
+        return True
+
+    def upload_from_path(self, local_path, file_key, content_type=None):
+        target = self.root / file_key
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy(local_path, target)
+        return True
+
+
+class FakeTranscoder:
+    def __init__(self, height=720, fail_on=None):
+        self.height = height
+        self.fail_on = fail_on
+
+    def probe(self, source_path):
+        return VideoProbe(duration=12.5, width=self.height * 16 // 9, height=self.height)
+
+    def transcode(self, source_path, output_path, rendition, duration=0, on_progress=None):
+        if rendition.name == self.fail_on:
+            raise TranscodeError("ffmpeg falhou")
+        for fraction in (0.25, 0.5, 1.0):
+            on_progress(fraction)
+        Path(output_path).write_bytes(b"mp4")
+
+    def extract_poster(self, source_path, output_path, at_seconds=1.0, height=720):
+        Path(output_path).write_bytes(b"jpg")
+
+
+class RecordingProgress:
+    def __init__(self):
+        self.events = []
+
+    def start(self, job_id, stage=""):
+        self.events.append(("start", stage))
+
+    def update(self, job_id, progress, stage=None):
+        self.events.append(("update", round(progress), stage))
+
+    def complete(self, job_id, result=None):
+        self.events.append(("complete", result))
+
+    def fail(self, job_id, error):
+        self.events.append(("fail", error))
+
+
+def _video(key="ads/ad1/videos/caminhao.mov"):
+    return MediaAsset.create(key=key, ad_id="ad1", file_type="video", mime_type="video/quicktime", size=1000)
+
+
+class TestFFmpegHelpers:
+    def test_parse_progress_line(self):
+        assert parse_progress_line("out_time_us=5000000\n", 10) == pytest.approx(0.5)
+        assert parse_progress_line("out_time_ms=20000000", 10) == 1.0
+        assert parse_progress_line("frame=12", 10) is None
+        assert parse_progress_line("out_time_us=N/A", 10) is None
+
+    def test_ladder_never_upscales_but_keeps_smallest_per_codec(self):
+        names = [r.name for r in select_renditions(360)]
+        assert sorted(names) == ["h264_480p", "h265_720p"]
+        assert [r.name for r in select_renditions(1080)] == [r.name for r in DEFAULT_LADDER]
+
+
+class TestFFmpegProcess:
+    """ffmpeg substituído por um script: prazo e stderr sem depender do binário real"""
+
+    @staticmethod
+    def _fake_ffmpeg(tmp_path, body):
+        script = tmp_path / "ffmpeg"
+        script.write_text("#!/bin/sh\n" + body)
+        script.chmod(0o755)
+        return FFmpegTranscoder(ffmpeg_path=str(script), timeout=0.5)
+
+    def test_deadline_kills_a_stalled_ffmpeg(self, tmp_path):
+        transcoder = self._fake_ffmpeg(tmp_path, "echo out_time_us=1000000\nexec sleep 30\n")
+        fractions = []
+        start = time.monotonic()
+
+        with pytest.raises(TranscodeError, match="excedeu"):
+            transcoder.transcode("in.mov", "out.mp4", DEFAULT_LADDER[0], 10, on_progress=fractions.append)
+
+        assert time.monotonic() - start < 5
+        assert fractions == [pytest.approx(0.1)]
+
+    def test_large_stderr_does_not_block_progress(self, tmp_path):
+        # 256 KiB em stderr: mais que o buffer de um pipe
+        transcoder = self._fake_ffmpeg(
+            tmp_path, "head -c 262144 /dev/zero | tr '\\0' x >&2\necho erro final >&2\nexit 1\n"
+        )
+
+        with pytest.raises(TranscodeError, match="erro final"):
+            transcoder.transcode("in.mov", "out.mp4", DEFAULT_LADDER[0], 10)
+
+
+class TestTranscodeVideoUseCase:
+    def test_generates_variants_poster_and_updates_index(self, tmp_path):
+        asset = _video()
+        (tmp_path / "ads/ad1/videos").mkdir(parents=True)
+        (tmp_path / asset.key).write_bytes(b"mov")
+        repo, progress = FakeRepository(asset), RecordingProgress()
+
+        result = TranscodeVideoUseCase(
+            repo, LocalStorage(tmp_path), FakeTranscoder(), progress_store=progress
+        ).execute(TranscodeVideoRequest(file_key=asset.key, job_id="job-1"))
+
+        assert result.success
+        assert result.variants["poster"] == "ads/ad1/videos/posters/caminhao.jpg"
+        assert result.variants["h264_720p"] == "ads/ad1/videos/renditions/caminhao_h264_720p.mp4"
+        assert (tmp_path / result.variants["h265_720p"]).exists()
+        saved = repo.saved[-1]
+        assert (saved.duration, saved.height) == (12.5, 720)
+
+        percents = [e[1] for e in progress.events if e[0] == "update"]
+        assert percents == sorted(percents)
+        assert progress.events[-1][0] == "complete"
+
+    def test_failure_is_reported_and_index_untouched(self, tmp_path):
+        asset = _video()
+        (tmp_path / "ads/ad1/videos").mkdir(parents=True)
+        (tmp_path / asset.key).write_bytes(b"mov")
+        repo, progress = FakeRepository(asset), RecordingProgress()
+
+        result = TranscodeVideoUseCase(
+            repo, LocalStorage(tmp_path), FakeTranscoder(fail_on="h264_480p"), progress_store=progress
+        ).execute(TranscodeVideoRequest(file_key=asset.key, job_id="job-1"))
+
+        assert not result.success
+        assert repo.saved == []
+        assert progress.events[-1] == ("fail", "ffmpeg falhou")
+
+    def test_unknown_video(self, tmp_path):
+        result = TranscodeVideoUseCase(
+            FakeRepository(), LocalStorage(tmp_path), FakeTranscoder()
+        ).execute(TranscodeVideoRequest(file_key="ads/x/videos/nada.mp4"))
+        assert not result.success
+
+
+@pytest.mark.skipif(not FFmpegTranscoder.is_available(), reason="ffmpeg não instalado")
+class TestFFmpegTranscoderIntegration:
+    @pytest.fixture
+    def clip(self, tmp_path):
+        # Clipe sintético de 2s (testsrc + tom), sem depender de arquivos de mídia no repositório
+        path = tmp_path / "clip.mov"
+        subprocess.run([
+            "ffmpeg", "-y", "-v", "error",
+            "-f", "lavfi", "-i", "testsrc=duration=2:size=320x240:rate=15",
+            "-f", "lavfi", "-i", "sine=frequency=440:duration=2",
+            "-c:v", "mpeg4", "-c:a", "aac", "-shortest", str(path),
+        ], check=True)
+        return path
+
+    def test_transcode_produces_faststart_mp4_and_poster(self, clip, tmp_path):
+        transcoder = FFmpegTranscoder()
+        probe = transcoder.probe(str(clip))
+        assert probe.duration == pytest.approx(2, abs=0.2)
+        assert (probe.width, probe.height) == (320, 240)
+
+        output = tmp_path / "out.mp4"
+        fractions = []
+        transcoder.transcode(
+            str(clip), str(output), Rendition("h264_240p", "h264", 240, crf=30, preset="ultrafast"),
+            probe.duration, on_progress=fractions.append
+        )
+        mp4 = IsoBmffProbe()
+        mp4.feed(output.read_bytes())
+        mp4.finish()
+        assert mp4.faststart is True
+        assert fractions and fractions[-1] == pytest.approx(1.0, abs=0.1)
+
+        poster = tmp_path / "poster.jpg"
+        transcoder.extract_poster(str(clip), str(poster), at_seconds=1.0)
+        assert poster.read_bytes()[:3] == b"\xff\xd8\xff"
@@ -0,0 +1,168 @@
+# tests/unit/notifications/test_notification_dispatcher.py
+import asyncio
+import json
+import random
+import threading
+import time
+
+import httpx
+import pytest
+
+from brasiltransporta.application.auth.use_case.phone_auth_inputs import SendPhoneVerificationCodeCommand
+from brasiltransporta.application.auth.use_case.phone_auth_use_cases import SendPhoneVerificationUseCase
+from brasiltransporta.application.notifications import (
+    EMAIL,
+    SMS,
+    DeliveryResult,
+    Notification,
+    NotificationDispatcher,
+    RetryPolicy,
+)
+from brasiltransporta.infrastructure.external.email.sendgrid_service import SendGridEmailProvider
+from brasiltransporta.infrastructure.external.notifications import FakeNotificationProvider
+from brasiltransporta.infrastructure.external.sms.sms_service import TwilioSMSProvider
+from brasiltransporta.infrastructure.messaging.tasks import notifications as notification_tasks
+from brasiltransporta.worker.celery_app import celery_app
+
+
+def _sms(i=0):
+    return Notification(channel=SMS, to=f"+55119999900{i:02d}", body=f"código {i}")
+
+
+def _email(to, body="Bem-vindo!"):
+    return Notification(channel=EMAIL, to=to, subject="Cadastro", body=body)
+
+
+class SlowProvider:
+    """Registra quantos lotes estavam em andamento ao mesmo tempo"""
+    name, channel = "slow", SMS
+
+    def __init__(self, max_concurrency):
+        self.max_batch_size = 1
+        self.max_concurrency = max_concurrency
+        self.in_flight = self.peak = 0
+        self._lock = threading.Lock()
+
+    def send_batch(self, notifications):
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(0.02)
+        with self._lock:
+            self.in_flight -= 1
+        return [DeliveryResult.ok(n.id) for n in notifications]
+
+
+class TestNotificationDispatcher:
+    def test_chunks_by_provider_batch_size(self):
+        sms = FakeNotificationProvider(SMS, max_batch_size=2)
+        report = NotificationDispatcher([sms]).dispatch([_sms(i) for i in range(5)])
+
+        assert (report.sent, report.failed) == (5, 0)
+        assert sms.calls == 3
+
+    def test_transient_failures_are_retried_with_jittered_backoff(self):
+        sms = FakeNotificationProvider(SMS, fail_times=2)
+        delays = []
+        dispatcher = NotificationDispatcher(
+            [sms], RetryPolicy(max_attempts=4, base_delay=1.0), sleep=delays.append, rng=random.Random(7)
+        )
+
+        report = dispatcher.dispatch([_sms()])
+
+        assert (report.sent, report.retries) == (1, 2)
+        assert 0 <= delays[0] <= 1.0 and 0 <= delays[1] <= 2.0
+        assert len(set(delays)) == 2
+
+    def test_gives_up_after_max_attempts(self):
+        sms = FakeNotificationProvider(SMS, fail_times=10)
+        report = NotificationDispatcher([sms], RetryPolicy(max_attempts=3), sleep=lambda _: None).dispatch([_sms()])
+        assert (report.sent, report.failed) == (0, 1)
+        assert sms.calls == 3
+
+    def test_respects_provider_concurrency_limit(self):
+        provider = SlowProvider(max_concurrency=2)
+        NotificationDispatcher([provider]).dispatch([_sms(i) for i in range(8)])
+        assert provider.peak == 2
+
+    def test_unknown_channel_fails_without_provider_call(self):
+        report = NotificationDispatcher([FakeNotificationProvider(SMS)]).dispatch([_email("a@b.com")])
+        assert report.failed == 1
+
+
+class TestProviders:
+    def test_sendgrid_groups_same_content_into_one_request(self):
+        requests = []
+
+        def handler(request):
+            requests.append(json.loads(request.content))
+            return httpx.Response(202, headers={"X-Message-Id": "sg-1"})
+
+        provider = SendGridEmailProvider("key", "noreply@bt.com", client=httpx.Client(transport=httpx.MockTransport(handler)))
+        results = provider.send_batch([_email("a@x.com"), _email("b@x.com"), _email("c@x.com", body="Outro")])
+
+        assert all(r.success for r in results)
+        assert len(requests) == 2
+        assert [p["to"][0]["email"] for p in requests[0]["personalizations"]] == ["a@x.com", "b@x.com"]
+
+    @pytest.mark.parametrize("status, retryable", [(429, True), (503, True), (400, False)])
+    def test_sendgrid_error_classification(self, status, retryable):
+        client = httpx.Client(transport=httpx.MockTransport(lambda r: httpx.Response(status, text="erro")))
+        result = SendGridEmailProvider("key", "noreply@bt.com", client=client).send_batch([_email("a@x.com")])[0]
+        assert (result.success, result.retryable) == (False, retryable)
+
+    def test_twilio_sends_each_message(self):
+        bodies = []
+
+        def handler(request):
+            bodies.append(request.content.decode())
+            return httpx.Response(201, json={"sid": f"SM{len(bodies)}"})
+
+        provider = TwilioSMSProvider("AC1", "token", "+15550000000", client=httpx.Client(transport=httpx.MockTransport(handler)))
+        results = provider.send_batch([_sms(1), _sms(2)])
+
+        assert [r.provider_message_id for r in results] == ["SM1", "SM2"]
+        assert "To=%2B5511999990001" in bodies[0]
+
+
+class RecordingQueue:
+    def __init__(self):
+        self.items = []
+
+    def enqueue_one(self, notification):
+        self.items.append(notification)
+        return "job-1"
+
+
+class FakeVerificationRepo:
+    def __init__(self):
+        self.saved = []
+
+    def delete_by_phone(self, phone):
+        pass
+
+    def save(self, verification):
+        self.saved.append(verification)
+
+
+class TestPhoneVerificationIsQueued:
+    def test_use_case_only_enqueues(self):
+        queue, repo = RecordingQueue(), FakeVerificationRepo()
+        ok = asyncio.run(SendPhoneVerificationUseCase(repo, queue).execute(
+            SendPhoneVerificationCodeCommand(phone="+5511999990000")
+        ))
+
+        assert ok
+        assert queue.items[0].channel == SMS
+        assert repo.saved[0].code in queue.items[0].body
+
+    def test_eager_task_delivers_through_fake_provider(self, monkeypatch):
+        sms = FakeNotificationProvider(SMS)
+        monkeypatch.setattr(notification_tasks, "get_dispatcher", lambda: NotificationDispatcher([sms]))
+        celery_app.conf.update(task_always_eager=True, task_eager_propagates=True)
+        try:
+            notification_tasks.NotificationQueue().enqueue([_sms(1), _sms(2)])
+        finally:
+            celery_app.conf.update(task_always_eager=False, task_eager_propagates=False)
+
+        assert [n.to for n in sms.sent] == [_sms(1).to, _sms(2).to]
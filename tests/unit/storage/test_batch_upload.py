@@ -0,0 +1,111 @@
+# tests/unit/storage/test_batch_upload.py
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from brasiltransporta.application.storage.services.file_storage_service import UploadResult
+from brasiltransporta.application.storage.use_cases.batch_upload_files import (
+    BatchUploadFilesUseCase,
+    BatchUploadItem,
+)
+from brasiltransporta.application.storage.use_cases.upload_file import UploadFileUseCase, UploadFileRequest
+from brasiltransporta.infrastructure.external.storage.file_validator import FileValidator
+from brasiltransporta.infrastructure.external.storage.media_probe import MediaInfo
+
+
+class SlowStorage:
+    """Storage falso que simula a latência do PUT e mede a concorrência"""
+
+    def __init__(self, delay: float = 0.05, fail: set = frozenset()):
+        self.delay = delay
+        self.fail = fail
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def upload_image(self, file_content, filename, mime_type, ad_id, metadata=None):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        if filename in self.fail:
+            return UploadResult(success=False, error_message="Falha no upload para S3")
+        key = f"ads/{ad_id}/images/{filename}"
+        return UploadResult(success=True, file_url=f"https://s3.test/{key}", file_key=key, file_size=len(file_content))
+
+
+def _item(name: str) -> BatchUploadItem:
+    return BatchUploadItem(filename=name, request=UploadFileRequest(
+        file_content=b"x" * 10, filename=name, mime_type="image/jpeg", ad_id="ad1",
+        file_type="image", media_info=MediaInfo("jpeg", "image/jpeg", 100, 100)
+    ))
+
+
+def _repo(count: int = 0):
+    repo = Mock()
+    repo.count_by_ad.return_value = count
+    repo.saved_threads = []
+    repo.save.side_effect = lambda asset: repo.saved_threads.append(threading.get_ident())
+    return repo
+
+
+@pytest.mark.asyncio
+async def test_uploads_in_parallel_with_bounded_concurrency():
+    storage, repo = SlowStorage(delay=0.05), _repo()
+    use_case = BatchUploadFilesUseCase(UploadFileUseCase(storage, media_repository=repo), max_concurrency=4, media_repository=repo)
+
+    started = time.perf_counter()
+    result = await use_case.execute("ad1", "image", [_item(f"{i}.jpg") for i in range(8)])
+    elapsed = time.perf_counter() - started
+
+    assert result.uploaded == 8
+    assert storage.max_in_flight == 4
+    assert elapsed < 8 * 0.05
+    # Índice gravado na thread do chamador (sessão do banco não é thread-safe)
+    assert set(repo.saved_threads) == {threading.get_ident()}
+
+
+@pytest.mark.asyncio
+async def test_reports_partial_failures_per_file():
+    storage = SlowStorage(delay=0, fail={"b.jpg"})
+    invalid = BatchUploadItem(filename="c.png", error_message="Dimensões da imagem excedem o limite")
+    use_case = BatchUploadFilesUseCase(UploadFileUseCase(storage), media_repository=_repo())
+
+    result = await use_case.execute("ad1", "image", [_item("a.jpg"), _item("b.jpg"), invalid])
+
+    assert result.success
+    assert (result.uploaded, result.failed) == (1, 2)
+    assert [r.filename for r in result.results] == ["a.jpg", "b.jpg", "c.png"]
+    assert result.results[2].error_message.startswith("Dimensões")
+
+
+@pytest.mark.asyncio
+async def test_quantity_is_checked_once_for_whole_batch():
+    storage = SlowStorage(delay=0)
+    repo = _repo(count=8)
+    use_case = BatchUploadFilesUseCase(UploadFileUseCase(storage), FileValidator(), media_repository=repo)
+
+    result = await use_case.execute("ad1", "image", [_item(f"{i}.jpg") for i in range(3)])
+
+    assert not result.success
+    assert "Máximo de 10" in result.error_message
+    assert storage.max_in_flight == 0
+    repo.count_by_ad.assert_called_once_with("ad1", "image")
+
+
+@pytest.mark.asyncio
+async def test_rejected_files_do_not_count_against_quantity():
+    storage = SlowStorage(delay=0)
+    repo = _repo(count=8)
+    use_case = BatchUploadFilesUseCase(UploadFileUseCase(storage), FileValidator(), media_repository=repo)
+    rejected = [BatchUploadItem(filename=f"bad{i}.gif", error_message="Tipo não permitido") for i in range(3)]
+
+    result = await use_case.execute("ad1", "image", [_item("0.jpg"), _item("1.jpg")] + rejected)
+
+    assert result.success
+    assert result.uploaded == 2
+    assert result.failed == 3
@@ -0,0 +1,134 @@
+# tests/unit/storage/test_file_validator.py
+import struct
+
+import pytest
+
+from brasiltransporta.infrastructure.external.storage.file_validator import (
+    FileValidator,
+    FileValidationError,
+)
+from brasiltransporta.infrastructure.external.storage.media_probe import sniff_format
+from brasiltransporta.infrastructure.external.storage.storage_config import FileValidationConfig
+
+
+# ----------------- Geradores de cabeçalhos sintéticos -----------------
+def _png(width: int, height: int, body: int = 100) -> bytes:
+    ihdr = struct.pack(">II", width, height) + b"\x08\x02\x00\x00\x00"
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + struct.pack(">I", len(ihdr)) + b"IHDR" + ihdr + b"\x00" * 4
+        + b"\x00" * body
+    )
+
+
+def _jpeg(width: int, height: int, exif_size: int = 0) -> bytes:
+    data = b"\xff\xd8"
+    if exif_size:
+        data += b"\xff\xe1" + struct.pack(">H", exif_size + 2) + b"\x00" * exif_size
+    sof = struct.pack(">BHHB", 8, height, width, 3) + b"\x00" * 9
+    data += b"\xff\xc0" + struct.pack(">H", len(sof) + 2) + sof
+    return data + b"\xff\xda" + b"\x00" * 50 + b"\xff\xd9"
+
+
+def _webp_vp8x(width: int, height: int) -> bytes:
+    payload = b"\x00" * 4 + (width - 1).to_bytes(3, "little") + (height - 1).to_bytes(3, "little")
+    chunk = b"VP8X" + struct.pack("<I", len(payload)) + payload
+    return b"RIFF" + struct.pack("<I", 4 + len(chunk)) + b"WEBP" + chunk
+
+
+def _box(box_type: bytes, payload: bytes) -> bytes:
+    return struct.pack(">I", 8 + len(payload)) + box_type + payload
+
+
+def _mp4(width: int, height: int, seconds: int, moov_first: bool = False, mdat_size: int = 4096) -> bytes:
+    mvhd = b"\x00" * 4 + struct.pack(">III", 0, 0, 1000) + struct.pack(">I", seconds * 1000) + b"\x00" * 80
+    tkhd = b"\x00" * 4 + b"\x00" * 20 + b"\x00" * 52 + struct.pack(">II", width << 16, height << 16)
+    moov = _box(b"moov", _box(b"mvhd", mvhd) + _box(b"trak", _box(b"tkhd", tkhd)))
+    ftyp = _box(b"ftyp", b"isom" + b"\x00" * 4 + b"isomiso2")
+    mdat = _box(b"mdat", b"\x00" * mdat_size)
+    return ftyp + (moov + mdat if moov_first else mdat + moov)
+
+
+def _chunks(data: bytes, size: int):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class TestMediaSniffing:
+    def test_sniff_known_formats(self):
+        assert sniff_format(_png(10, 10)) == "png"
+        assert sniff_format(_jpeg(10, 10)) == "jpeg"
+        assert sniff_format(_webp_vp8x(10, 10)) == "webp"
+        assert sniff_format(_mp4(640, 360, 5)) == "mp4"
+        assert sniff_format(b"not a media file at all") is None
+
+    @pytest.mark.parametrize("data,expected", [
+        (_png(1920, 1080), (1920, 1080)),
+        (_jpeg(1280, 720, exif_size=2000), (1280, 720)),
+        (_webp_vp8x(800, 600), (800, 600)),
+    ])
+    def test_reads_image_dimensions(self, data, expected):
+        info = FileValidator().inspect([data], "image", "foto", None)
+        assert (info.width, info.height) == expected
+
+
+class TestStreamingFileValidator:
+    def test_rejects_content_that_does_not_match_declared_type(self):
+        validator = FileValidator()
+        with pytest.raises(FileValidationError, match="não corresponde"):
+            validator.inspect([_png(10, 10)], "image", "foto.jpg", "image/jpeg")
+
+    def test_rejects_unknown_content(self):
+        with pytest.raises(FileValidationError, match="não reconhecido"):
+            FileValidator().inspect([b"x" * 64], "image", "foto.jpg", "image/jpeg")
+
+    def test_rejects_oversized_dimensions_on_first_chunk(self):
+        config = FileValidationConfig()
+        config.max_image_width = 4000
+        stream = FileValidator(config).create_stream_validator("image", "foto.png", "image/png")
+
+        data = _png(5000, 100, body=100_000)
+        with pytest.raises(FileValidationError, match="Dimensões"):
+            stream.feed(data[:1024])
+        assert stream.bytes_received == 1024
+
+    def test_rejects_size_before_reading_everything(self):
+        config = FileValidationConfig()
+        config.max_image_size = 4096
+        stream = FileValidator(config).create_stream_validator("image", "foto.png", "image/png")
+
+        fed = 0
+        with pytest.raises(FileValidationError, match="muito grande"):
+            for chunk in _chunks(_png(10, 10, body=100_000), 1024):
+                stream.feed(chunk)
+                fed += len(chunk)
+        assert fed < 100_000
+
+    def test_mp4_metadata_parsed_incrementally_with_moov_at_end(self):
+        stream = FileValidator().create_stream_validator("video", "video.mp4", "video/mp4")
+        for chunk in _chunks(_mp4(1280, 720, 42), 7):
+            stream.feed(chunk)
+        info = stream.finalize()
+
+        assert info.format == "mp4"
+        assert (info.width, info.height) == (1280, 720)
+        assert info.duration == pytest.approx(42)
+        assert info.faststart is False
+
+    def test_mp4_faststart_rejects_long_video_early(self):
+        config = FileValidationConfig()
+        config.max_video_duration = 60
+        stream = FileValidator(config).create_stream_validator("video", "video.mp4", "video/mp4")
+
+        data = _mp4(1280, 720, 600, moov_first=True, mdat_size=1_000_000)
+        with pytest.raises(FileValidationError, match="muito longo"):
+            for chunk in _chunks(data, 64 * 1024):
+                stream.feed(chunk)
+        assert stream.bytes_received == 64 * 1024
+
+    def test_validate_image_keeps_tuple_contract(self):
+        ok, message = FileValidator().validate_image(_jpeg(100, 100), "foto.jpg", "image/jpeg")
+        assert ok is True
+
+        ok, message = FileValidator().validate_image(b"fake image content", "foto.jpg", "image/jpeg")
+        assert ok is False
+        assert "não reconhecido" in message
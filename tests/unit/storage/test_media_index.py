@@ -0,0 +1,149 @@
+# tests/unit/storage/test_media_index.py
+from typing import Dict, List, Optional
+from unittest.mock import Mock
+
+from brasiltransporta.application.storage.services.file_storage_service import UploadResult
+from brasiltransporta.application.storage.use_cases.delete_file import DeleteFileUseCase, DeleteFileRequest
+from brasiltransporta.application.storage.use_cases.list_ad_files import ListAdFilesUseCase
+from brasiltransporta.application.storage.use_cases.reconcile_media_index import ReconcileMediaIndexUseCase
+from brasiltransporta.application.storage.use_cases.upload_file import UploadFileUseCase, UploadFileRequest
+from brasiltransporta.domain.entities.media_asset import MediaAsset
+from brasiltransporta.infrastructure.external.storage.media_probe import MediaInfo
+
+
+class InMemoryMediaAssetRepository:
+    def __init__(self):
+        self.assets: Dict[str, MediaAsset] = {}
+
+    def save(self, asset: MediaAsset) -> MediaAsset:
+        self.assets[asset.key] = asset
+        return asset
+
+    def get_by_key(self, key: str) -> Optional[MediaAsset]:
+        return self.assets.get(key)
+
+    def list_by_ad(self, ad_id: str, file_type: Optional[str] = None) -> List[MediaAsset]:
+        return sorted(
+            (a for a in self.assets.values()
+             if a.ad_id == ad_id and (file_type is None or a.file_type == file_type)),
+            key=lambda a: a.created_at,
+        )
+
+    def count_by_ad(self, ad_id: str, file_type: Optional[str] = None) -> int:
+        return len(self.list_by_ad(ad_id, file_type))
+
+    def delete_by_key(self, key: str) -> bool:
+        return self.assets.pop(key, None) is not None
+
+    def iter_keys(self, batch_size: int = 1000):
+        return iter(list(self.assets))
+
+
+class DictCache:
+    def __init__(self):
+        self.data = {}
+        self.invalidated = []
+
+    def get(self, ad_id):
+        return self.data.get(ad_id)
+
+    def set(self, ad_id, items):
+        self.data[ad_id] = items
+
+    def invalidate(self, ad_id):
+        self.invalidated.append(ad_id)
+        self.data.pop(ad_id, None)
+
+
+def _storage():
+    storage = Mock()
+    storage.get_file_url.side_effect = lambda key: f"https://cdn.test/{key}"
+    return storage
+
+
+def _asset(key, ad_id="ad1", file_type="image"):
+    return MediaAsset.create(key=key, ad_id=ad_id, file_type=file_type, mime_type="image/png", size=10)
+
+
+class TestUploadIndexing:
+    def test_successful_upload_is_indexed_and_cache_invalidated(self):
+        storage = _storage()
+        storage.upload_image.return_value = UploadResult(
+            success=True, file_url="https://cdn.test/ads/ad1/images/x.png",
+            file_key="ads/ad1/images/x.png", file_size=3
+        )
+        validator = Mock()
+        repo, cache = InMemoryMediaAssetRepository(), DictCache()
+
+        use_case = UploadFileUseCase(storage, validator, repo, cache)
+        response = use_case.execute(UploadFileRequest(
+            file_content=b"abc", filename="x.png", mime_type="image/png", ad_id="ad1",
+            file_type="image", media_info=MediaInfo("png", "image/png", width=800, height=600)
+        ))
+
+        assert response.success
+        asset = repo.get_by_key("ads/ad1/images/x.png")
+        assert (asset.width, asset.height) == (800, 600)
+        assert asset.content_hash == "ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad"
+        assert cache.invalidated == ["ad1"]
+
+    def test_delete_removes_index_row(self):
+        storage = _storage()
+        storage.delete_file.return_value = True
+        repo, cache = InMemoryMediaAssetRepository(), DictCache()
+        repo.save(_asset("ads/ad1/images/a.png"))
+
+        result = DeleteFileUseCase(storage, repo, cache).execute(DeleteFileRequest("ads/ad1/images/a.png"))
+
+        assert result.success
+        assert repo.assets == {}
+        assert cache.invalidated == ["ad1"]
+
+
+class TestListAdFiles:
+    def test_lists_from_index_without_touching_s3_listing(self):
+        storage = _storage()
+        repo, cache = InMemoryMediaAssetRepository(), DictCache()
+        repo.save(_asset("ads/ad1/images/a.png"))
+        repo.save(_asset("ads/ad2/images/b.png", ad_id="ad2"))
+
+        files = ListAdFilesUseCase(repo, storage, cache).execute("ad1")
+
+        assert [f.file_key for f in files] == ["ads/ad1/images/a.png"]
+        assert files[0].file_url == "https://cdn.test/ads/ad1/images/a.png"
+        storage.list_files.assert_not_called()
+        assert cache.data["ad1"][0]["file_key"] == "ads/ad1/images/a.png"
+
+    def test_cache_hit_skips_repository(self):
+        repo = Mock()
+        cache = DictCache()
+        cache.set("ad1", [{
+            "file_key": "k", "file_url": "u", "file_type": "image", "file_size": 1
+        }])
+
+        files = ListAdFilesUseCase(repo, _storage(), cache).execute("ad1")
+
+        assert files[0].file_key == "k"
+        repo.list_by_ad.assert_not_called()
+
+
+class TestReconcileMediaIndex:
+    def test_adds_missing_and_removes_orphans(self):
+        storage = _storage()
+        storage.list_files.return_value = iter([
+            {"key": "ads/ad1/images/a.png", "size": 10},
+            {"key": "ads/ad1/videos/new.mp4", "size": 2048},
+            {"key": "ads/lixo.txt", "size": 1},
+        ])
+        storage.get_file_info.return_value = {"size": 2048, "content_type": "video/mp4"}
+        repo, cache = InMemoryMediaAssetRepository(), DictCache()
+        repo.save(_asset("ads/ad1/images/a.png"))
+        repo.save(_asset("ads/ad9/images/gone.png", ad_id="ad9"))
+
+        result = ReconcileMediaIndexUseCase(storage, repo, cache).execute()
+
+        assert (result.scanned, result.added, result.removed, result.skipped) == (3, 1, 1, 1)
+        new = repo.get_by_key("ads/ad1/videos/new.mp4")
+        assert new.file_type == "video" and new.mime_type == "video/mp4"
+        assert repo.get_by_key("ads/ad9/images/gone.png") is None
+        assert sorted(cache.invalidated) == ["ad1", "ad9"]
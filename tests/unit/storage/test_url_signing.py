@@ -0,0 +1,178 @@
+# tests/unit/storage/test_url_signing.py
+from unittest.mock import Mock
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from brasiltransporta.application.storage.services.file_storage_service import S3FileStorageService
+from brasiltransporta.application.storage.use_cases.generate_ad_media_urls import (
+    GenerateAdMediaUrlsUseCase,
+    GenerateAdMediaUrlsRequest,
+)
+from brasiltransporta.domain.entities.media_asset import MediaAsset
+from brasiltransporta.infrastructure.external.storage.storage_config import S3Config
+from brasiltransporta.infrastructure.external.storage.url_signing import (
+    CloudFrontUrlSigner,
+    PresignedUrlCache,
+)
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _service(cache=None, signer=None):
+    service = S3FileStorageService(S3Config("key", "secret"), url_cache=cache, cdn_signer=signer)
+    service.s3_client = Mock()
+    service.s3_client.generate_presigned_url.side_effect = (
+        lambda key, op, exp: f"https://s3.test/{key}?op={op}&n={service.s3_client.generate_presigned_url.call_count}"
+    )
+    return service
+
+
+class TestPresignedUrlCache:
+    def test_reuses_url_within_expiry_bucket(self):
+        clock = FakeClock()
+        service = _service(PresignedUrlCache(clock=clock))
+
+        first = service.generate_presigned_url("ads/1/images/a.jpg", expires_in=3600)
+        clock.now += 60
+        second = service.generate_presigned_url("ads/1/images/a.jpg", expires_in=3600)
+
+        assert first.url == second.url
+        assert service.s3_client.generate_presigned_url.call_count == 1
+
+    def test_operation_and_expiry_are_part_of_key(self):
+        service = _service(PresignedUrlCache(clock=FakeClock()))
+
+        service.generate_presigned_url("k", "get_object", 3600)
+        service.generate_presigned_url("k", "put_object", 3600)
+        service.generate_presigned_url("k", "get_object", 600)
+
+        assert service.s3_client.generate_presigned_url.call_count == 3
+
+    def test_resigns_after_bucket_rolls_over(self):
+        clock = FakeClock(0)
+        service = _service(PresignedUrlCache(clock=clock))
+
+        first = service.generate_presigned_url("k", expires_in=3600)
+        clock.now += 1800  # metade da validade
+        second = service.generate_presigned_url("k", expires_in=3600)
+
+        assert first.url != second.url
+
+    def test_evicts_least_recently_used(self):
+        cache = PresignedUrlCache(max_entries=2, clock=FakeClock())
+        for key in ("a", "b", "c"):
+            cache.get_or_create(key, "get_object", 3600, lambda: key)
+        assert len(cache) == 2
+        assert cache.get_or_create("a", "get_object", 3600, lambda: "novo") == "novo"
+
+    def test_failures_are_not_cached(self):
+        cache = PresignedUrlCache(clock=FakeClock())
+        assert cache.get_or_create("k", "get_object", 60, lambda: None) is None
+        assert cache.get_or_create("k", "get_object", 60, lambda: "ok") == "ok"
+
+
+class TestCloudFrontUrlSigner:
+    @pytest.fixture
+    def signer(self, tmp_path):
+        rsa = pytest.importorskip("rsa")
+        public_key, private_key = rsa.newkeys(512)
+        key_path = tmp_path / "cf.pem"
+        key_path.write_bytes(private_key.save_pkcs1())
+        return CloudFrontUrlSigner("cdn.test", "KPID", str(key_path)), public_key
+
+    def test_signed_url_is_local_and_verifiable(self, signer):
+        cf_signer, _ = signer
+        url = cf_signer.generate_signed_url("ads/1/images/a.jpg", 600)
+
+        parsed = urlparse(url)
+        params = parse_qs(parsed.query)
+        assert parsed.netloc == "cdn.test"
+        assert params["Key-Pair-Id"] == ["KPID"]
+        assert "Signature" in params and "Expires" in params
+
+    def test_signed_cookies_cover_prefix(self, signer):
+        cf_signer, public_key = signer
+        rsa = pytest.importorskip("rsa")
+        import base64
+
+        cookies = cf_signer.generate_signed_cookies("ads/1", 600)
+
+        def decode(value):
+            return base64.b64decode(value.replace("-", "+").replace("_", "=").replace("~", "/"))
+
+        policy = decode(cookies["CloudFront-Policy"])
+        assert b"https://cdn.test/ads/1/*" in policy
+        assert rsa.verify(policy, decode(cookies["CloudFront-Signature"]), public_key) == "SHA-1"
+        assert cookies["CloudFront-Key-Pair-Id"] == "KPID"
+
+    def test_loads_pkcs8_keys(self, tmp_path):
+        rsa = pytest.importorskip("rsa")
+        from pyasn1.codec.der import encoder
+        from pyasn1.type import univ
+
+        public_key, private_key = rsa.newkeys(512)
+        algorithm = univ.Sequence()
+        algorithm.setComponentByPosition(0, univ.ObjectIdentifier("1.2.840.113549.1.1.1"))
+        algorithm.setComponentByPosition(1, univ.Null(""))
+        info = univ.Sequence()
+        info.setComponentByPosition(0, univ.Integer(0))
+        info.setComponentByPosition(1, algorithm)
+        info.setComponentByPosition(2, univ.OctetString(private_key.save_pkcs1("DER")))
+        key_path = tmp_path / "cf8.pem"
+        key_path.write_bytes(rsa.pem.save_pem(encoder.encode(info), "PRIVATE KEY"))
+
+        cf_signer = CloudFrontUrlSigner("cdn.test", "KPID", str(key_path))
+
+        assert rsa.verify(b"policy", cf_signer._signer.rsa_signer(b"policy"), public_key) == "SHA-1"
+
+    def test_cookies_carry_configured_domain(self, tmp_path):
+        rsa = pytest.importorskip("rsa")
+        _, private_key = rsa.newkeys(512)
+        key_path = tmp_path / "cf.pem"
+        key_path.write_bytes(private_key.save_pkcs1())
+        cf_signer = CloudFrontUrlSigner(
+            "media.brasiltransporta.test", "KPID", str(key_path), cookie_domain=".brasiltransporta.test"
+        )
+        repo = Mock()
+        repo.list_by_ad.return_value = []
+        use_case = GenerateAdMediaUrlsUseCase(repo, _service(signer=cf_signer))
+
+        result = use_case.execute(GenerateAdMediaUrlsRequest(ad_id="1", include_cookies=True))
+
+        assert result.success and result.cookies
+        assert result.cookie_domain == ".brasiltransporta.test"
+
+    def test_storage_service_prefers_cdn_for_downloads(self, signer):
+        cf_signer, _ = signer
+        service = _service(signer=cf_signer)
+
+        download = service.generate_presigned_url("ads/1/images/a.jpg", "get_object")
+        upload = service.generate_presigned_url("ads/1/images/a.jpg", "put_object")
+
+        assert download.url.startswith("https://cdn.test/")
+        assert upload.url.startswith("https://s3.test/")
+
+
+class TestGenerateAdMediaUrls:
+    def test_signs_all_media_of_ad_in_one_call(self):
+        repo = Mock()
+        repo.list_by_ad.return_value = [
+            MediaAsset.create(f"ads/1/images/{i}.jpg", "1", "image", "image/jpeg", 10) for i in range(10)
+        ]
+        service = _service(PresignedUrlCache(clock=FakeClock()))
+        use_case = GenerateAdMediaUrlsUseCase(repo, service)
+
+        first = use_case.execute(GenerateAdMediaUrlsRequest(ad_id="1"))
+        second = use_case.execute(GenerateAdMediaUrlsRequest(ad_id="1"))
+
+        assert first.success and len(first.urls) == 10
+        assert [u.url for u in first.urls] == [u.url for u in second.urls]
+        # Segunda visualização da página não assina nada novamente
+        assert service.s3_client.generate_presigned_url.call_count == 10
@@ -0,0 +1,295 @@
+# tests/unit/subscriptions/test_entitlements.py
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+import redis
+from sqlalchemy.dialects import postgresql
+
+from brasiltransporta.application.advertisements.use_cases.create_advertisement import (
+    CreateAdvertisementInput,
+    CreateAdvertisementUseCase,
+)
+from brasiltransporta.application.advertisements.use_cases.set_featured import (
+    SetAdvertisementFeaturedUseCase,
+    SetFeaturedInput,
+)
+from brasiltransporta.application.subscriptions import (
+    EntitlementService,
+    QuotaCheck,
+    QuotaCounterUnavailable,
+    free_plan_limits,
+)
+from brasiltransporta.domain.entities.advertisement import Advertisement
+from brasiltransporta.domain.entities.plan import BillingCycle, Plan, PlanType
+from brasiltransporta.domain.entities.subscription import QuotaResource, Subscription, SubscriptionStatus
+from brasiltransporta.domain.errors.errors import QuotaExceededError
+from brasiltransporta.infrastructure.persistence.redis.quota_counter import RedisQuotaCounter
+from brasiltransporta.infrastructure.persistence.sqlalchemy.repositories.subscription_repository import (
+    SQLAlchemySubscriptionRepository,
+)
+
+STORE = "5f0c1d2e-3a4b-4c5d-8e6f-708192a3b4c5"
+
+
+def _plan(max_ads=2, max_featured_ads=1, cycle=BillingCycle.MONTHLY):
+    return Plan.create("Plano Loja", "", PlanType.BASIC, cycle, 99.0,
+                       max_ads=max_ads, max_featured_ads=max_featured_ads)
+
+
+class InMemoryCounter:
+    """Mesma semântica dos scripts Lua do RedisQuotaCounter"""
+
+    def __init__(self):
+        self.stores = {}
+        self.down = False
+
+    def _check(self):
+        if self.down:
+            raise QuotaCounterUnavailable("redis fora do ar")
+
+    def try_acquire(self, store_id, resource, amount=1):
+        self._check()
+        if store_id not in self.stores:
+            return QuotaCheck(allowed=None)
+        entry = self.stores[store_id]
+        limit, used = entry["limit"][resource], entry["used"][resource]
+        if limit >= 0 and used + amount > limit:
+            return QuotaCheck(allowed=False, used=used, limit=limit)
+        entry["used"][resource] = used + amount
+        return QuotaCheck(allowed=True, used=used + amount, limit=limit)
+
+    def release(self, store_id, resource, amount=1):
+        self._check()
+        if store_id in self.stores:
+            used = self.stores[store_id]["used"]
+            used[resource] = max(0, used[resource] - amount)
+
+    def prime(self, store_id, limits, usage, overwrite=False):
+        self._check()
+        if not overwrite and store_id in self.stores:
+            return False
+        self.stores[store_id] = {
+            "limit": {r: limits.get(r, 0) for r in QuotaResource},
+            "used": {r: usage.get(r, 0) for r in QuotaResource},
+        }
+        return True
+
+    def invalidate(self, store_id):
+        self.stores.pop(store_id, None)
+
+
+class InMemorySubscriptionRepository:
+    def __init__(self, *subscriptions, usage=None):
+        self.items = {s.id: s for s in subscriptions}
+        self.usage = usage or {}
+        self.count_calls = 0
+
+    def get_active_by_store(self, store_id, now):
+        return next((s for s in self.items.values() if s.store_id == store_id and s.is_active(now)), None)
+
+    def list_active(self, now, limit=500, after_id=None):
+        active = sorted((s for s in self.items.values() if s.is_active(now)), key=lambda s: s.id)
+        if after_id is not None:
+            active = [s for s in active if s.id > after_id]
+        return active[:limit]
+
+    def count_usage(self, store_ids):
+        self.count_calls += 1
+        return {s: dict(self.usage.get(s, {})) for s in store_ids}
+
+
+def _service(*subscriptions, usage=None, counter=None, default_limits=None):
+    repo = InMemorySubscriptionRepository(*subscriptions, usage=usage)
+    return EntitlementService(repo, counter or InMemoryCounter(), default_limits=default_limits), repo
+
+
+def test_subscription_snapshots_plan_limits():
+    starts = datetime(2026, 1, 1)
+    sub = Subscription.create(STORE, "u1", _plan(max_ads=5, cycle=BillingCycle.QUARTERLY), starts_at=starts)
+
+    assert sub.ends_at == starts + timedelta(days=90)
+    assert sub.limits() == {QuotaResource.ADS: 5, QuotaResource.FEATURED: 1}
+    assert sub.is_active(starts) and not sub.is_active(sub.ends_at)
+    sub.cancel()
+    assert sub.status == SubscriptionStatus.CANCELLED and not sub.is_active(starts)
+
+
+def test_acquire_loads_counter_once_and_enforces_limit():
+    sub = Subscription.create(STORE, "u1", _plan(max_ads=2))
+    service, repo = _service(sub, usage={STORE: {QuotaResource.ADS: 1}})
+
+    assert service.acquire(STORE, QuotaResource.ADS) == 2
+    with pytest.raises(QuotaExceededError) as exc:
+        service.acquire(STORE, QuotaResource.ADS)
+
+    assert exc.value.limit == 2 and exc.value.resource == "ads"
+    assert repo.count_calls == 1
+
+    service.release(STORE, QuotaResource.ADS)
+    assert service.acquire(STORE, QuotaResource.ADS) == 2
+
+
+def test_store_without_subscription_has_no_quota_without_free_plan():
+    service, _ = _service()
+
+    with pytest.raises(QuotaExceededError):
+        service.acquire(STORE, QuotaResource.ADS)
+
+
+def test_store_without_subscription_uses_free_plan_limits():
+    counter = InMemoryCounter()
+    service, _ = _service(
+        usage={STORE: {QuotaResource.ADS: 1}},
+        counter=counter,
+        default_limits=free_plan_limits(max_ads=2, max_featured_ads=0),
+    )
+
+    assert service.acquire(STORE, QuotaResource.ADS) == 2
+    with pytest.raises(QuotaExceededError) as exc:
+        service.acquire(STORE, QuotaResource.ADS)
+    assert exc.value.limit == 2
+    with pytest.raises(QuotaExceededError):
+        service.acquire(STORE, QuotaResource.FEATURED)
+
+    # Fallback no banco aplica o mesmo plano
+    counter.down = True
+    with pytest.raises(QuotaExceededError):
+        service.acquire(STORE, QuotaResource.FEATURED)
+
+
+def test_free_plan_can_be_unlimited():
+    counter = InMemoryCounter()
+    counter.down = True
+    service, _ = _service(
+        usage={STORE: {QuotaResource.ADS: 500}},
+        counter=counter,
+        default_limits=free_plan_limits(max_ads=-1, max_featured_ads=0),
+    )
+
+    assert service.acquire(STORE, QuotaResource.ADS) == 501
+
+
+def test_counter_outage_falls_back_to_database_count():
+    counter = InMemoryCounter()
+    counter.down = True
+    sub = Subscription.create(STORE, "u1", _plan(max_featured_ads=1))
+    service, _ = _service(sub, usage={STORE: {QuotaResource.FEATURED: 0}}, counter=counter)
+
+    assert service.acquire(STORE, QuotaResource.FEATURED) == 1
+    service.release(STORE, QuotaResource.FEATURED)  # não propaga a falha
+
+
+def test_reconcile_overwrites_counters_in_batches():
+    subs = [Subscription.create(f"store-{i}", "u1", _plan()) for i in range(5)]
+    counter = InMemoryCounter()
+    counter.prime("store-0", {QuotaResource.ADS: 2}, {QuotaResource.ADS: 2})
+    service, repo = _service(*subs, usage={"store-0": {QuotaResource.ADS: 1}}, counter=counter)
+
+    assert service.reconcile(batch_size=2) == 5
+    assert repo.count_calls == 3
+    assert counter.stores["store-0"]["used"][QuotaResource.ADS] == 1
+    assert set(counter.stores) == {s.store_id for s in subs}
+
+
+class InMemoryAdRepository:
+    def __init__(self, *ads, fail=False):
+        self.items = {ad.id: ad for ad in ads}
+        self.fail = fail
+        self.updates = 0
+
+    def add(self, ad):
+        if self.fail:
+            raise RuntimeError("db fora do ar")
+        self.items[ad.id] = ad
+
+    async def get_by_id(self, advertisement_id):
+        return self.items.get(advertisement_id)
+
+    async def update(self, ad):
+        self.updates += 1
+
+
+class AnyRepository:
+    def get_by_id(self, _id):
+        return object()
+
+
+def _ad_input():
+    return CreateAdvertisementInput(store_id=STORE, vehicle_id="v1", title="Scania R450 2020",
+                                    description="Cavalo mecânico revisado", price_amount=450000.0)
+
+
+def test_create_advertisement_consumes_quota_and_releases_on_failure():
+    sub = Subscription.create(STORE, "u1", _plan(max_ads=1))
+    service, _ = _service(sub)
+
+    with pytest.raises(RuntimeError):
+        CreateAdvertisementUseCase(InMemoryAdRepository(fail=True), AnyRepository(), AnyRepository(), service).execute(_ad_input())
+
+    use_case = CreateAdvertisementUseCase(InMemoryAdRepository(), AnyRepository(), AnyRepository(), service)
+    use_case.execute(_ad_input())
+    with pytest.raises(QuotaExceededError):
+        use_case.execute(_ad_input())
+
+
+def test_set_featured_is_idempotent():
+    sub = Subscription.create(STORE, "u1", _plan(max_featured_ads=1))
+    service, _ = _service(sub)
+    ads = [Advertisement.create(STORE, "v1", f"Volvo FH 540 {i}", "Cavalo mecânico 6x4", 500000.0) for i in range(2)]
+    repo = InMemoryAdRepository(*ads)
+    use_case = SetAdvertisementFeaturedUseCase(repo, service)
+
+    asyncio.run(use_case.execute(SetFeaturedInput(ads[0].id, True)))
+    asyncio.run(use_case.execute(SetFeaturedInput(ads[0].id, True)))
+    with pytest.raises(QuotaExceededError):
+        asyncio.run(use_case.execute(SetFeaturedInput(ads[1].id, True)))
+
+    asyncio.run(use_case.execute(SetFeaturedInput(ads[0].id, False)))
+    result = asyncio.run(use_case.execute(SetFeaturedInput(ads[1].id, True)))
+
+    assert result.is_featured and not ads[0].is_featured
+    assert repo.updates == 3
+
+
+def test_redis_counter_maps_script_results_and_errors():
+    class FakeRedis:
+        def __init__(self, result):
+            self.result = result
+            self.calls = []
+
+        def register_script(self, script):
+            def run(keys, args):
+                self.calls.append((keys, args))
+                if isinstance(self.result, Exception):
+                    raise self.result
+                return self.result
+            return run
+
+    fake = FakeRedis([0, 3, 3])
+    check = RedisQuotaCounter(fake).try_acquire(STORE, QuotaResource.ADS)
+
+    assert check == QuotaCheck(allowed=False, used=3, limit=3)
+    assert fake.calls == [([f"quota:{STORE}"], ["ads", 1])]
+    assert RedisQuotaCounter(FakeRedis([-1, 0, 0])).try_acquire(STORE, QuotaResource.ADS).allowed is None
+    with pytest.raises(QuotaCounterUnavailable):
+        RedisQuotaCounter(FakeRedis(redis.ConnectionError("down"))).try_acquire(STORE, QuotaResource.ADS)
+
+
+def test_count_usage_is_a_single_grouped_query():
+    class RecordingSession:
+        def __init__(self):
+            self.statements = []
+
+        def execute(self, stmt):
+            self.statements.append(stmt)
+            return []
+
+    session = RecordingSession()
+    usage = SQLAlchemySubscriptionRepository(session).count_usage([STORE])
+
+    assert usage == {STORE: {QuotaResource.ADS: 0, QuotaResource.FEATURED: 0}}
+    assert len(session.statements) == 1
+    sql = str(session.statements[0].compile(dialect=postgresql.dialect()))
+    assert "GROUP BY advertisements.store_id" in sql
+    assert "FILTER (WHERE advertisements.is_featured IS true)" in sql
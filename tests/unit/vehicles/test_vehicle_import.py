@@ -0,0 +1,249 @@
+# tests/unit/vehicles/test_vehicle_import.py
+import asyncio
+import io
+import json
+from decimal import Decimal
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+
+from brasiltransporta.application.vehicles.services.vehicle_import import (
+    CSV_FORMAT,
+    NDJSON_FORMAT,
+    _parse_decimal,
+    build_vehicle,
+    detect_format,
+    read_rows,
+)
+from brasiltransporta.application.vehicles.use_cases.import_vehicles import ImportVehiclesUseCase
+from brasiltransporta.domain.entities.enums import VehicleBrand, VehicleCondition, VehicleType
+from brasiltransporta.domain.errors.errors import ValidationError
+from brasiltransporta.infrastructure.messaging.tasks.imports import run_import
+from brasiltransporta.infrastructure.persistence.sqlalchemy.repositories.vehicle_repository import (
+    SQLAlchemyVehicleRepository,
+)
+from brasiltransporta.presentation.api.controllers.vehicles import router
+from brasiltransporta.presentation.api.di.get_store_repo import get_store_repo
+from brasiltransporta.presentation.api.di.get_vehicle_import_queue import get_vehicle_import_queue
+
+STORE = "5f0c1d2e-3a4b-4c5d-8e6f-708192a3b4c5"
+
+CSV = (
+    "﻿Brand;Model;Year;Plate;Vehicle_Type;Condition;Price;Mileage\n"
+    "Volvo;FH 540;2021;abc-1d23;caminhao_trator;usado;\"485.000,00\";120000\n"
+    "Mercedes-Benz;Actros 2651;2022;DEF2G34;TRACTOR_TRUCK;novo;690000;\n"
+    "Tesla;Semi;2023;GHI3J45;caminhao_trator;novo;900000;\n"
+    "Scania;R450;2020;ABC1D23;caminhao_trator;usado;450000;\n"
+    ";;;;;;;\n"
+)
+
+
+def _rows(text, fmt=CSV_FORMAT):
+    return list(read_rows(io.BytesIO(text.encode("utf-8")), fmt))
+
+
+class InMemoryVehicleRepository:
+    def __init__(self, existing=()):
+        self.plates = set(existing)
+        self.batches = []
+
+    async def bulk_insert(self, vehicles):
+        self.batches.append(len(vehicles))
+        inserted = [v.plate for v in vehicles if v.plate not in self.plates]
+        self.plates.update(inserted)
+        return inserted
+
+
+class InMemoryStoreRepository:
+    def __init__(self, *store_ids):
+        self.store_ids = {str(s) for s in store_ids}
+
+    async def get_by_id(self, store_id):
+        return object() if str(store_id) in self.store_ids else None
+
+
+def test_detect_format():
+    assert detect_format("frota.CSV") == CSV_FORMAT
+    assert detect_format("frota.jsonl") == NDJSON_FORMAT
+    assert detect_format("upload", "application/x-ndjson") == NDJSON_FORMAT
+    with pytest.raises(ValidationError):
+        detect_format("frota.xlsx", "application/octet-stream")
+
+
+def test_csv_rows_are_validated_with_vehicle_rules():
+    rows = _rows(CSV)
+
+    assert [r.line for r in rows] == [2, 3, 4, 5]
+    vehicle = build_vehicle(STORE, rows[0].data)
+    assert (vehicle.brand, vehicle.plate, vehicle.price, vehicle.mileage) == (
+        VehicleBrand.VOLVO, "ABC1D23", Decimal("485000.00"), 120000,
+    )
+    vehicle = build_vehicle(STORE, rows[1].data)
+    assert (vehicle.brand, vehicle.vehicle_type, vehicle.condition) == (
+        VehicleBrand.MERCEDES_BENZ, VehicleType.TRACTOR_TRUCK, VehicleCondition.NEW,
+    )
+    with pytest.raises(ValueError, match="brand"):
+        build_vehicle(STORE, rows[2].data)
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("450.000", Decimal("450000")),
+    ("1.250.000", Decimal("1250000")),
+    ("R$ 485.000,00", Decimal("485000.00")),
+    ("450,000.50", Decimal("450000.50")),
+    ("450000.50", Decimal("450000.50")),
+    ("450.5", Decimal("450.5")),
+    (450000, Decimal("450000")),
+])
+def test_parse_decimal_reads_pt_br_thousands(value, expected):
+    assert _parse_decimal(value, "price") == expected
+
+
+def test_import_rejects_unknown_or_malformed_store():
+    stores = InMemoryStoreRepository(STORE)
+    repo = InMemoryVehicleRepository()
+
+    with pytest.raises(ValidationError, match="store_id inválido"):
+        asyncio.run(ImportVehiclesUseCase(repo, stores).execute("loja-1", _rows(CSV)))
+    with pytest.raises(ValidationError, match="não encontrada"):
+        asyncio.run(ImportVehiclesUseCase(repo, stores).execute(
+            "00000000-0000-4000-8000-000000000000", _rows(CSV)
+        ))
+    assert repo.batches == []  # nenhuma linha chegou ao banco
+
+    report = asyncio.run(ImportVehiclesUseCase(repo, stores).execute(STORE, _rows(CSV)))
+    assert report.inserted == 2
+
+
+def test_import_reports_invalid_and_duplicate_rows():
+    repo = InMemoryVehicleRepository(existing={"DEF2G34"})
+    batches = []
+
+    report = asyncio.run(
+        ImportVehiclesUseCase(repo, batch_size=1).execute(STORE, _rows(CSV), on_batch=lambda r: batches.append(r.inserted))
+    )
+
+    assert (report.total, report.inserted, report.duplicates, report.invalid) == (4, 1, 2, 1)
+    assert [(e.line, e.message) for e in report.errors] == [
+        (3, "Placa já cadastrada"),
+        (4, "Valor inválido para brand: Tesla"),
+        (5, "Placa repetida no arquivo"),
+    ]
+    assert repo.batches == [1, 1]
+    assert batches == [1, 1]
+
+
+def test_ndjson_rows_and_parse_errors():
+    lines = [
+        json.dumps({"brand": "scania", "model": "R450", "year": 2020, "plate": "ABC1D23",
+                    "vehicle_type": "caminhao_trator", "condition": "usado", "price": 450000.5}),
+        "{quebrado",
+        "[1, 2]",
+        json.dumps({"brand": "scania", "model": "R450", "year": 1800, "plate": "XYZ9K87",
+                    "vehicle_type": "caminhao_trator", "condition": "usado", "price": 1}),
+    ]
+    repo = InMemoryVehicleRepository()
+
+    report = asyncio.run(ImportVehiclesUseCase(repo).execute(STORE, _rows("\n".join(lines), NDJSON_FORMAT)))
+
+    assert (report.inserted, report.invalid) == (1, 3)
+    assert [e.line for e in report.errors] == [2, 3, 4]
+    assert report.to_dict()["errors"][2] == {"line": 4, "plate": "XYZ9K87", "message": "Invalid year"}
+
+
+def test_bulk_insert_is_a_single_upsert():
+    class RecordingSession:
+        def __init__(self):
+            self.statements = []
+
+        def execute(self, stmt):
+            self.statements.append(stmt)
+            return type("Result", (), {"scalars": lambda self: iter(["ABC1D23"])})()
+
+        def commit(self):
+            pass
+
+    session = RecordingSession()
+    vehicles = [build_vehicle(STORE, row.data) for row in _rows(CSV)[:2]]
+
+    plates = asyncio.run(SQLAlchemyVehicleRepository(session).bulk_insert(vehicles))
+
+    assert plates == ["ABC1D23"]
+    sql = str(session.statements[0].compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (plate) DO NOTHING RETURNING vehicles.plate" in sql
+
+
+class RecordingProgress:
+    def __init__(self):
+        self.events = []
+
+    def start(self, job_id, stage=""):
+        self.events.append(("start", stage))
+
+    def update(self, job_id, progress, stage=None):
+        self.events.append(("update", progress))
+
+    def complete(self, job_id, result=None):
+        self.events.append(("complete", result))
+
+    def fail(self, job_id, error):
+        self.events.append(("fail", error))
+
+
+def test_run_import_publishes_progress_and_report(tmp_path):
+    path = tmp_path / "frota.csv"
+    path.write_text(CSV, encoding="utf-8")
+    progress = RecordingProgress()
+
+    result = run_import(
+        {"job_id": "job-1", "store_id": STORE, "format": CSV_FORMAT},
+        str(path), InMemoryVehicleRepository(), progress,
+    )
+
+    assert result["inserted"] == 2
+    assert progress.events[0] == ("start", "importing")
+    assert progress.events[-1] == ("complete", result)
+
+
+class FakeImportQueue:
+    def __init__(self):
+        self.jobs = []
+
+    def enqueue(self, store_id, local_path, fmt):
+        with open(local_path, "rb") as f:
+            self.jobs.append((store_id, fmt, f.read()))
+        return "job-1"
+
+
+def test_import_endpoint_enqueues_job():
+    queue = FakeImportQueue()
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_vehicle_import_queue] = lambda: queue
+    app.dependency_overrides[get_store_repo] = lambda: InMemoryStoreRepository(STORE)
+    client = TestClient(app)
+
+    response = client.post(f"/stores/{STORE}/vehicles/import", files={"file": ("frota.csv", CSV.encode(), "text/csv")})
+
+    assert response.status_code == 202
+    assert response.json() == {"job_id": "job-1", "status_url": "/api/v1/storage/jobs/job-1"}
+    assert queue.jobs == [(STORE, CSV_FORMAT, CSV.encode())]
+
+    response = client.post(f"/stores/{STORE}/vehicles/import", files={"file": ("frota.xls", b"x", "application/vnd.ms-excel")})
+    assert response.status_code == 422
+
+
+def test_import_endpoint_rejects_unknown_store():
+    queue = FakeImportQueue()
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_vehicle_import_queue] = lambda: queue
+    app.dependency_overrides[get_store_repo] = lambda: InMemoryStoreRepository()
+    client = TestClient(app)
+
+    response = client.post(f"/stores/{STORE}/vehicles/import", files={"file": ("frota.csv", CSV.encode(), "text/csv")})
+
+    assert response.status_code == 404
+    assert queue.jobs == []
@@ -0,0 +1,72 @@
+# tests/unit/worker/test_celery_app.py
+from unittest.mock import Mock
+
+import pytest
+
+from brasiltransporta.infrastructure.config.settings import CelerySettings
+from brasiltransporta.infrastructure.messaging.tasks import media
+from brasiltransporta.worker.celery_app import (
+    QUEUE_PROFILES,
+    celery_app,
+    create_celery_app,
+    worker_argv,
+)
+
+
+@pytest.fixture
+def eager():
+    celery_app.conf.update(task_always_eager=True, task_eager_propagates=True)
+    yield celery_app
+    celery_app.conf.update(task_always_eager=False, task_eager_propagates=False)
+
+
+class TestCeleryConfig:
+    def test_queues_and_routes(self):
+        queues = {q.name for q in celery_app.conf.task_queues}
+        assert queues == {"media", "notifications", "billing", "imports", "maintenance"}
+
+        route = celery_app.amqp.router.route({}, "media.transcode_video")
+        assert route["queue"].name == "media"
+        route = celery_app.amqp.router.route({}, "billing.reconcile_payments")
+        assert route["queue"].name == "billing"
+
+    def test_tasks_ack_late_with_queue_time_limits(self):
+        task = celery_app.tasks["media.transcode_video"]
+        assert task.acks_late and task.reject_on_worker_lost
+        assert task.time_limit == QUEUE_PROFILES["media"].time_limit
+        assert celery_app.conf.worker_prefetch_multiplier == 1
+
+    def test_worker_profiles(self):
+        argv = worker_argv("media")
+        assert argv[argv.index("-P") + 1] == "prefork"
+        assert argv[argv.index("--prefetch-multiplier") + 1] == "1"
+        assert "--max-tasks-per-child" in argv
+
+        argv = worker_argv("notifications")
+        assert argv[argv.index("-P") + 1] == "threads"
+        assert "--max-tasks-per-child" not in argv
+
+    def test_eager_settings_use_in_memory_broker(self):
+        app = create_celery_app(CelerySettings(task_always_eager=True))
+        assert app.conf.broker_url == "memory://"
+        assert app.conf.task_always_eager is True
+
+
+class TestMediaTasks:
+    def test_enqueue_runs_transcode_in_eager_mode(self, eager, monkeypatch):
+        limiter = Mock()
+        limiter.try_acquire.return_value = "token"
+        monkeypatch.setattr(media, "node_limiter", lambda client, limit: limiter)
+        monkeypatch.setattr(
+            "brasiltransporta.infrastructure.persistence.redis.client.get_redis_client", lambda: Mock()
+        )
+        run = Mock(return_value=True)
+        monkeypatch.setattr(media, "run_transcode_job", run)
+        progress = Mock()
+        progress.create.return_value = "job-1"
+
+        job_id = media.MediaJobQueue(progress).enqueue_transcode("ads/1/videos/v.mov", "1")
+
+        assert job_id == "job-1"
+        run.assert_called_once_with({"job_id": "job-1", "file_key": "ads/1/videos/v.mov", "ad_id": "1"})
+        limiter.release.assert_called_once_with("token")